@@ -1,17 +1,17 @@
-"""Study addon namespace."""
+"""Study addon namespace.
+
+pydicom, websockets (aiohttp), service exceptions and models
+are imported by methods which use them: import of api
+should not load them.
+"""
 
 from contextlib import suppress
 from pathlib import Path
 from time import monotonic
 from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-import pydicom
 from box import Box
 
-from ambra_sdk.exceptions.service import NotFound
-from ambra_sdk.models import Study as StudyModel
-from ambra_sdk.service.ws import WSManager
-
 
 class UploadedImageParams(NamedTuple):
     """Image object."""
@@ -95,6 +95,8 @@ class Study:
         if first_dicom is None:
             raise ValueError('study_dir is empty')
 
+        import pydicom  # NOQA:WPS433
+
         ds = pydicom.dcmread(str(first_dicom))
         patient_name = ds.PatientName
         study_uid = ds.StudyInstanceUID
@@ -148,8 +150,11 @@ class Study:
         :raises TimeoutError: if study not ready by timeout
         :return: Study box object
         """
+        from ambra_sdk.exceptions.service import NotFound  # NOQA:WPS433
+        from ambra_sdk.service.ws import WSManager  # NOQA:WPS433
+
         ws_url = self._api.ws_url
-        ws_manager = WSManager(ws_url)
+        ws_manager = WSManager(ws_url, self._api.json_backend)
         study = None
         start = monotonic()
 
@@ -225,6 +230,8 @@ class Study:
 
         :return: duplicated study
         """
+        from ambra_sdk.models import Study as StudyModel  # NOQA:WPS433
+
         include_attachments_int = int(include_attachments)
 
         from_study_uid = self._api.Study \
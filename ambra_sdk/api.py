@@ -1,65 +1,69 @@
 """Ambra storage and service API."""
 
 import logging
-from typing import Callable, NamedTuple, Optional
+from threading import RLock
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 import requests
 from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util import Retry
 
 from ambra_sdk import __version__
 from ambra_sdk.addon.addon import Addon
-from ambra_sdk.exceptions.service import AuthorizationRequired
+from ambra_sdk.deadline import (
+    DEFAULT_CONNECT_TIMEOUT,
+    Deadline,
+    deadline_scope,
+)
 from ambra_sdk.exceptions.storage import PermissionDenied
-from ambra_sdk.service.entrypoints import (
-    Account,
-    Activity,
-    Analytics,
-    Annotation,
-    Appointment,
-    Audit,
-    Case,
-    Customcode,
-    Customfield,
-    Destination,
-    Dicomdata,
-    Dictionary,
-    Filter,
-    Group,
-    Help,
-    Hl7,
-    Keyimage,
-    Link,
-    Location,
-    Meeting,
-    Message,
-    Namespace,
-    Node,
-    Npi,
-    Order,
-    Patient,
-    Purge,
-    Radreport,
-    Radreportmacro,
-    Report,
-    Role,
-    Route,
-    Rsna,
-    Session,
-    Setting,
-    Study,
-    Tag,
-    Terminology,
-    Training,
-    User,
-    Validate,
-    Webhook,
+from ambra_sdk.json_backend import JsonBackend, get_json_backend
+from ambra_sdk.lazy import LazyNamespace
+from ambra_sdk.metrics import (
+    Metrics,
+    RequestEvent,
+    body_size,
+    response_size,
+)
+from ambra_sdk.retry import RetryBudget, RetryPolicy
+from ambra_sdk.service import entrypoints
+from ambra_sdk.service.auto_only import AutoOnly
+from ambra_sdk.service.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchResult,
+    execute_batch,
+)
+from ambra_sdk.service.cache import (
+    DEFAULT_CACHE_SIZE,
+    BaseResponseCache,
+    ResponseCache,
+)
+from ambra_sdk.service.coalescing import (
+    DEFAULT_COALESCE_BATCH,
+    DEFAULT_COALESCE_WINDOW,
+    BaseCoalescer,
+    Coalescer,
+)
+from ambra_sdk.service.session_refresher import (
+    DEFAULT_REFRESH_MARGIN,
+    SessionRefresher,
 )
 from ambra_sdk.storage.storage import Storage
 
 logger = logging.getLogger(__name__)
 DEFAULT_SDK_CLIENT_NAME = 'Ambra SDK default client'
 
+ApiType = TypeVar('ApiType', bound='BaseApi')
+
 
 class Credentials(NamedTuple):
     """Credentials."""
@@ -68,8 +72,59 @@ class Credentials(NamedTuple):
     password: str
 
 
-class Api:  # NOQA:WPS214,WPS230
-    """Ambra API."""
+class BaseApi:  # NOQA:WPS214
+    """Base Ambra API.
+
+    Common part of sync and async APIs.
+
+    Namespaces are created (and their modules are imported)
+    on first access.
+    """
+
+    Account = LazyNamespace()
+    Activity = LazyNamespace()
+    Analytics = LazyNamespace()
+    Annotation = LazyNamespace()
+    Appointment = LazyNamespace()
+    Audit = LazyNamespace()
+    Case = LazyNamespace()
+    Customcode = LazyNamespace()
+    Customfield = LazyNamespace()
+    Destination = LazyNamespace()
+    Dicomdata = LazyNamespace()
+    Dictionary = LazyNamespace()
+    Filter = LazyNamespace()
+    Group = LazyNamespace()
+    Help = LazyNamespace()
+    Hl7 = LazyNamespace()
+    Keyimage = LazyNamespace()
+    Link = LazyNamespace()
+    Location = LazyNamespace()
+    Meeting = LazyNamespace()
+    Message = LazyNamespace()
+    Namespace = LazyNamespace()
+    Node = LazyNamespace()
+    Npi = LazyNamespace()
+    Order = LazyNamespace()
+    Patient = LazyNamespace()
+    Purge = LazyNamespace()
+    Radreport = LazyNamespace()
+    Radreportmacro = LazyNamespace()
+    Report = LazyNamespace()
+    Role = LazyNamespace()
+    Route = LazyNamespace()
+    Rsna = LazyNamespace()
+    Session = LazyNamespace()
+    Setting = LazyNamespace()
+    Study = LazyNamespace()
+    Tag = LazyNamespace()
+    Terminology = LazyNamespace()
+    Training = LazyNamespace()
+    User = LazyNamespace()
+    Validate = LazyNamespace()
+    Webhook = LazyNamespace()
+    # Missing fields of auto only rows are requested by sync requests
+    auto_only_supported = False
 
     def __init__(  # NOQA:WPS211
         self,
@@ -97,27 +152,32 @@ class Api:  # NOQA:WPS214,WPS230
         }
         if username is not None and password is not None:
             self._creds = Credentials(username=username, password=password)
-        self._service_session: Optional[requests.Session] = None
-        self._storage_session: Optional[requests.Session] = None
+        # Number of sid refreshes (logins) and number of refresh
+        # requests served by a refresh of another caller.
+        self._sid_refreshes = 0
+        self._sid_refreshes_coalesced = 0
+        # Per endpoint metrics and request hooks
+        self.metrics = Metrics()
+        # Decoder of response bodies (orjson, ujson or json)
+        self.json_backend: JsonBackend = get_json_backend()
+        # Coalescer of concurrent get queries (see enable_coalescing)
+        self.coalescer: Optional[BaseCoalescer] = None
+        # Cache of read-mostly methods (see enable_response_cache)
+        self.response_cache: Optional[BaseResponseCache] = None
+        # Profiles of automatic only fields (see enable_auto_only)
+        self.auto_only: Optional[AutoOnly] = None
         self._init_request_params()
-        self._init_service_entrypoints()
-
-        # Init storage api namespace
-        self.Storage = Storage(self)
-
-        # Init addon namespace
-        self.Addon = Addon(self)
 
         # prepare ws
         self.ws_url = '{url}/channel/websocket'.format(url=url)
 
     @classmethod
     def with_sid(
-        cls,
+        cls: Type[ApiType],
         url: str,
         sid: str,
         client_name: str = DEFAULT_SDK_CLIENT_NAME,
-    ) -> 'Api':
+    ) -> ApiType:
         """Create Api with sid.
 
         :param url: api url
@@ -134,12 +194,12 @@ class Api:  # NOQA:WPS214,WPS230
 
     @classmethod
     def with_creds(
-        cls,
+        cls: Type[ApiType],
         url: str,
         username: str,
         password: str,
         client_name: str = DEFAULT_SDK_CLIENT_NAME,
-    ) -> 'Api':
+    ) -> ApiType:
         """Create Api with (username, password) credentials.
 
         :param url: api url
@@ -156,6 +216,279 @@ class Api:  # NOQA:WPS214,WPS230
             client_name=client_name,
         )
 
+    @property
+    def sid_refreshes(self) -> int:
+        """Number of sid refreshes.
+
+        :return: number of logins made for getting new sid
+        """
+        return self._sid_refreshes
+
+    @property
+    def sid_refreshes_coalesced(self) -> int:
+        """Number of coalesced sid refreshes.
+
+        Refresh is coalesced, if caller waited for
+        refresh of another caller and reused its sid.
+
+        :return: number of coalesced sid refreshes
+        """
+        return self._sid_refreshes_coalesced
+
+    def enable_coalescing(
+        self,
+        window: float = DEFAULT_COALESCE_WINDOW,
+        max_batch: int = DEFAULT_COALESCE_BATCH,
+        batch: bool = False,
+    ) -> BaseCoalescer:
+        """Coalesce concurrent get queries.
+
+        Concurrent queries of read methods with the same request data
+        share one request. With batch gets of methods with list variant
+        (like Study.get(uuid=...)) are collected during window
+        and requested by one list query with in filter,
+        so returned objects have fields of list method
+        (see ambra_sdk.service.coalescing).
+
+        :param window: time of collecting gets of batch (seconds)
+        :param max_batch: maximum number of gets in batch (0 - no batches)
+        :param batch: request gets by list queries
+        :return: coalescer
+        """
+        self.coalescer = self.coalescer_class(  # type: ignore
+            window,
+            max_batch,
+            batch,
+        )
+        return self.coalescer
+
+    def disable_coalescing(self):
+        """Stop coalescing of get queries."""
+        self.coalescer = None
+
+    def enable_response_cache(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_size: int = DEFAULT_CACHE_SIZE,
+    ) -> BaseResponseCache:
+        """Cache responses of read-mostly methods.
+
+        By default responses of methods of DEFAULT_CACHE_TTLS are cached
+        (like Namespace.engine_fqdn or Session.user).
+        Mutation methods are not cached and invalidate cached responses
+        of their resources (see ambra_sdk.service.cache).
+
+        :param ttls: additional ttls of methods by url (seconds)
+        :param max_size: maximum number of cached responses
+        :return: response cache
+        """
+        self.response_cache = self.response_cache_class(  # type: ignore
+            ttls,
+            max_size,
+        )
+        return self.response_cache
+
+    def disable_response_cache(self):
+        """Stop caching of responses."""
+        self.response_cache = None
+
+    def enable_auto_only(self) -> AutoOnly:
+        """Request only fields used by callers of list scans.
+
+        Fields accessed in rows of list are recorded per call site
+        (or query template), the next pages and scans of the call site
+        request only these fields. Missing fields are requested
+        on access (see ambra_sdk.service.auto_only).
+
+        :return: profiles of call sites
+        :raises NotImplementedError: Api doesn't support auto only fields
+        """
+        if not self.auto_only_supported:
+            raise NotImplementedError(
+                'Auto only fields are not supported by {api}'.format(
+                    api=type(self).__name__,
+                ),
+            )
+        self.auto_only = AutoOnly()
+        return self.auto_only
+
+    def disable_auto_only(self):
+        """Stop automatic only fields."""
+        self.auto_only = None
+
+    def service_full_url(self, url: str) -> str:
+        """Full service method url.
+
+        :param url: method url
+        :return: full url
+        """
+        return '{base_url}{entrypoint_url}'.format(
+            base_url=self._api_url,
+            entrypoint_url=url,
+        )
+
+    def service_timeout_for(self, url: str) -> Optional[float]:
+        """Default time budget of service method.
+
+        :param url: method url
+        :return: seconds (None - without deadline)
+        """
+        return self.service_timeouts.get(url, self.service_timeout)
+
+    def storage_timeout_for(
+        self,
+        url_template: Optional[str],
+    ) -> Optional[float]:
+        """Default time budget of storage method.
+
+        :param url_template: method url template
+        :return: seconds (None - without deadline)
+        """
+        if url_template is None:
+            return self.storage_timeout
+        return self.storage_timeouts.get(url_template, self.storage_timeout)
+
+    def retry_policy(self, retry_params: Dict[str, Any]) -> RetryPolicy:
+        """Create retry policy.
+
+        :param retry_params: service_retry_params or storage_retry_params
+        :return: retry policy
+        """
+        return self.retry_policy_class(
+            budget=self.retry_budget,
+            **retry_params,
+        )
+
+    def _is_sid_refreshed(self, stale_sid: Optional[str]) -> bool:
+        """Check that sid was refreshed after stale sid was used.
+
+        :param stale_sid: sid used by failed request
+        :return: True if another caller already got new sid
+        """
+        if self._sid is not None and self._sid != stale_sid:
+            self._sid_refreshes_coalesced += 1
+            return True
+        return False
+
+    def _service_namespace(self, name: str) -> Any:
+        """Create service namespace.
+
+        :param name: namespace name (see entrypoints.__all__)
+        :raises NotImplementedError: Implemented in subclasses
+        """
+        raise NotImplementedError
+
+    def _init_request_params(self):
+        method_whitelist = [
+            'HEAD',
+            'TRACE',
+            'GET',
+            'PUT',
+            'OPTIONS',
+            'DELETE',
+            'POST',
+        ]
+        # https://urllib3.readthedocs.io/en/latest/reference/urllib3.util.html#module-urllib3.util.retry
+        self.service_retry_params = {
+            'total': 10,
+            'connect': 5,
+            'read': 5,
+            'status': 5,
+            'status_forcelist': [429, 500, 502, 503, 504],
+            'backoff_factor': 0.1,
+            'method_whitelist': method_whitelist,
+        }
+        # Merge studies
+        # /study/{namespace}/{studyUid}/merge?sid={sid}&secondary_study_uid={secondary_study_uid}&delete_secondary_study={0,1}
+        # Can return 500 and its ok .....
+        self.storage_retry_params = {
+            'total': 10,
+            'connect': 5,
+            'read': 5,
+            'status': 5,
+            'status_forcelist': [429, 502, 503, 504],
+            'backoff_factor': 0.1,
+            'method_whitelist': method_whitelist,
+        }
+        # Retry policy is created from retry params.
+        # Budget is shared by all service and storage requests.
+        self.retry_policy_class: Type[RetryPolicy] = RetryPolicy
+        self.retry_budget: Optional[RetryBudget] = RetryBudget()
+        # https://requests.readthedocs.io/en/master/api/#requests.adapters.HTTPAdapter
+        # pool_maxsize limits number of reused connections per host,
+        # set it not less than number of threads using api.
+        self.service_pool_params = {
+            'pool_connections': 10,
+            'pool_maxsize': 32,
+        }
+        self.storage_pool_params = {
+            'pool_connections': 10,
+            'pool_maxsize': 32,
+        }
+        # Time budgets (seconds) of requests with all their retries.
+        # Used if query or prepared request has no own deadline.
+        # None - request without deadline.
+        self.connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+        self.service_timeout: Optional[float] = 120
+        # Method url -> time budget
+        self.service_timeouts: Dict[str, Optional[float]] = {
+            '/session/login': 30,
+            '/session/ttl': 15,
+            '/session/user': 15,
+            '/study/get': 15,
+            '/user/get': 15,
+        }
+        self.storage_timeout: Optional[float] = 300
+        # Method url template -> time budget
+        self.storage_timeouts: Dict[str, Optional[float]] = {
+            '/study/{namespace}/{study_uid}/schema': 60,
+            '/study/{namespace}/{study_uid}/download': 3600,
+            '/study/{namespace}/{study_uid}/image/{image_uid}/version/{image_version}/video': 3600,  # NOQA:E501
+            '/study/{namespace}/{study_uid}/attachment': 1800,
+            '/namespace/{namespace}/image': 1800,
+            '/namespace/{namespace}/wrap': 1800,
+        }
+
+
+class Api(BaseApi):  # NOQA:WPS214,WPS230
+    """Ambra API."""
+
+    Storage = LazyNamespace(Storage)
+    Addon = LazyNamespace(Addon)
+    coalescer_class = Coalescer
+    response_cache_class = ResponseCache
+    auto_only_supported = True
+
+    def __init__(  # NOQA:WPS211
+        self,
+        url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        sid: Optional[str] = None,
+        client_name: str = DEFAULT_SDK_CLIENT_NAME,
+    ):
+        """Init api.
+
+        :param url: api url
+        :param sid: session id
+        :param username: username credential
+        :param password: password credential
+        :param client_name: user defined client name
+        """
+        self._service_session: Optional[requests.Session] = None
+        self._storage_session: Optional[requests.Session] = None
+        # Sid is shared between threads. Only one thread gets new sid,
+        # other threads wait for it and use the new sid.
+        self._sid_lock = RLock()
+        self._session_refresher: Optional[SessionRefresher] = None
+        super().__init__(
+            url=url,
+            username=username,
+            password=password,
+            sid=sid,
+            client_name=client_name,
+        )
+
     @property
     def service_session(self) -> requests.Session:
         """Service session.
@@ -164,8 +497,11 @@ class Api:  # NOQA:WPS214,WPS230
         """
         if self._service_session is None:
             self._service_session = requests.Session()
-            retries = Retry(**self.service_retry_params)
-            adapter = HTTPAdapter(max_retries=retries)
+            retries = self.retry_policy(self.service_retry_params)
+            adapter = HTTPAdapter(
+                max_retries=retries,
+                **self.service_pool_params,
+            )
             self._service_session.mount('http://', adapter)
             self._service_session.mount('https://', adapter)
             self._service_session.headers.update(self._default_headers)
@@ -179,8 +515,11 @@ class Api:  # NOQA:WPS214,WPS230
         """
         if self._storage_session is None:
             self._storage_session = requests.Session()
-            retries = Retry(**self.storage_retry_params)
-            adapter = HTTPAdapter(max_retries=retries)
+            retries = self.retry_policy(self.storage_retry_params)
+            adapter = HTTPAdapter(
+                max_retries=retries,
+                **self.storage_pool_params,
+            )
             self._storage_session.mount('http://', adapter)
             self._storage_session.mount('https://', adapter)
             self._storage_session.headers.update(self._default_headers)
@@ -190,12 +529,16 @@ class Api:  # NOQA:WPS214,WPS230
         self,
         url: str,
         required_sid: bool,
+        deadline: Optional[Deadline] = None,
+        url_template: Optional[str] = None,
         **kwargs,
     ) -> requests.Response:
         """Get from storage.
 
         :param url: url
         :param required_sid: is this method required sid
+        :param deadline: request deadline
+        :param url_template: storage method url template (for metrics)
         :param kwargs: request arguments
         :return: response obj
         """
@@ -205,18 +548,29 @@ class Api:  # NOQA:WPS214,WPS230
             # Get or create new sid
             request_params['sid'] = self.sid
             kwargs['params'] = request_params
-        return self.storage_session.get(url=url, **kwargs)
+        return self._send(
+            self.storage_session,
+            'GET',
+            url,
+            deadline,
+            url_template,
+            **kwargs,
+        )
 
     def storage_delete(
         self,
         url: str,
         required_sid: bool,
+        deadline: Optional[Deadline] = None,
+        url_template: Optional[str] = None,
         **kwargs,
     ) -> requests.Response:
         """Delete from storage.
 
         :param url: url
         :param required_sid: is this method required sid
+        :param deadline: request deadline
+        :param url_template: storage method url template (for metrics)
         :param kwargs: request arguments
         :return: response obj
         """
@@ -226,18 +580,29 @@ class Api:  # NOQA:WPS214,WPS230
             # Delete or create new sid
             request_params['sid'] = self.sid
             kwargs['params'] = request_params
-        return self.storage_session.delete(url=url, **kwargs)
+        return self._send(
+            self.storage_session,
+            'DELETE',
+            url,
+            deadline,
+            url_template,
+            **kwargs,
+        )
 
     def storage_post(
         self,
         url: str,
         required_sid: bool,
+        deadline: Optional[Deadline] = None,
+        url_template: Optional[str] = None,
         **kwargs,
     ) -> requests.Response:
         """Post to storage.
 
         :param url: url
         :param required_sid: is this method required sid
+        :param deadline: request deadline
+        :param url_template: storage method url template (for metrics)
         :param kwargs: request arguments
         :return: response obj
         """
@@ -247,38 +612,44 @@ class Api:  # NOQA:WPS214,WPS230
             # Post or create new sid
             request_params['sid'] = self.sid
             kwargs['params'] = request_params
-        return self.storage_session.post(url=url, **kwargs)
-
-    def service_full_url(self, url: str) -> str:
-        """Full service method url.
-
-        :param url: method url
-        :return: full url
-        """
-        return '{base_url}{entrypoint_url}'.format(
-            base_url=self._api_url,
-            entrypoint_url=url,
+        return self._send(
+            self.storage_session,
+            'POST',
+            url,
+            deadline,
+            url_template,
+            **kwargs,
         )
 
     def service_post(
         self,
         url: str,
         required_sid: bool,
+        deadline: Optional[Deadline] = None,
         **kwargs,
     ) -> requests.Response:
         """Post data to url.
 
         :param url: method url
         :param required_sid: is this method required sid
+        :param deadline: request deadline
         :param kwargs: request arguments
         :return: response
         """
         full_url = self.service_full_url(url)
         if required_sid is True:
-            request_data = kwargs.pop('data')
+            # Request data of caller (query) is not changed
+            request_data = dict(kwargs.pop('data'))
             request_data['sid'] = self.sid
             kwargs['data'] = request_data
-        return self.service_session.post(url=full_url, **kwargs)
+        return self._send(
+            self.service_session,
+            'POST',
+            full_url,
+            deadline,
+            url,
+            **kwargs,
+        )
 
     @property
     def sid(self) -> str:
@@ -286,14 +657,20 @@ class Api:  # NOQA:WPS214,WPS230
 
         :return: sid
         """
-        if self._sid is None:
-            return self.get_new_sid()
-        return self._sid
+        sid = self._sid
+        if sid is None:
+            with self._sid_lock:
+                if self._sid is None:
+                    return self.get_new_sid()
+                return self._sid
+        return sid
 
     def logout(self):
         """Logout."""
+        self.stop_session_refresher()
         self.Session.logout()
-        self._sid = None
+        with self._sid_lock:
+            self._sid = None
 
     def get_new_sid(self) -> str:
         """Get new sid.
@@ -303,102 +680,187 @@ class Api:  # NOQA:WPS214,WPS230
         """
         if self._creds is None:
             raise RuntimeError('Missed credentials')
-        new_sid: str = self.Session.get_sid(
-            self._creds.username,
-            self._creds.password,
-        )
-        self._sid = new_sid
+        with self._sid_lock:
+            new_sid: str = self.Session.get_sid(
+                self._creds.username,
+                self._creds.password,
+            )
+            self._sid = new_sid
+            self._sid_refreshes += 1
+            self.metrics.record_sid_refresh()
         return new_sid
 
+    @property
+    def session_refresher(self) -> Optional[SessionRefresher]:
+        """Background session refresher.
+
+        :return: refresher or None if it is not started
+        """
+        return self._session_refresher
+
+    @property
+    def next_sid_refresh(self) -> Optional[float]:
+        """Time of the next session ttl check or refresh.
+
+        :return: unix timestamp or None if refresher is not running
+        """
+        if self._session_refresher is None:
+            return None
+        return self._session_refresher.next_refresh_time
+
+    def start_session_refresher(
+        self,
+        margin: float = DEFAULT_REFRESH_MARGIN,
+        **kwargs,
+    ) -> SessionRefresher:
+        """Start background session refresher.
+
+        Refresher renews session or gets new sid
+        before the session expires.
+
+        :param margin: renew session if ttl (seconds) less than margin
+        :param kwargs: other SessionRefresher arguments
+        :return: session refresher
+        """
+        if self._session_refresher is not None:
+            self._session_refresher.stop()
+        self._session_refresher = SessionRefresher(self, margin, **kwargs)
+        self._session_refresher.start()
+        return self._session_refresher
+
+    def stop_session_refresher(self):
+        """Stop background session refresher."""
+        if self._session_refresher is not None:
+            self._session_refresher.stop()
+            self._session_refresher = None
+
+    def refresh_sid(self, stale_sid: Optional[str]) -> str:
+        """Refresh stale sid.
+
+        Only one caller gets new sid. Concurrent callers with
+        the same stale sid wait for it and reuse the new sid.
+
+        :param stale_sid: sid used by failed request
+        :return: new sid
+        """
+        with self._sid_lock:
+            if self._is_sid_refreshed(stale_sid):
+                return self._sid  # type: ignore
+            return self.get_new_sid()
+
     def retry_with_new_sid(
         self,
         fn: Callable,
+        deadline: Optional[Deadline] = None,
     ):
         """Retry with new sid.
 
         :param fn: callable method
+        :param deadline: deadline of fn (checked before retry)
         :return: fn result
         """
+        # Service exceptions are imported with service namespaces
+        from ambra_sdk.exceptions.service import (  # NOQA:WPS433
+            AuthorizationRequired,
+        )
+
+        stale_sid = self._sid
         try:
             return fn()
         except (AuthorizationRequired, PermissionDenied):
-            self.get_new_sid()
+            self.refresh_sid(stale_sid)
+            if deadline is not None:
+                deadline.check()
             return fn()
 
-    def _init_request_params(self):
-        method_whitelist = [
-            'HEAD',
-            'TRACE',
-            'GET',
-            'PUT',
-            'OPTIONS',
-            'DELETE',
-            'POST',
-        ]
-        # https://urllib3.readthedocs.io/en/latest/reference/urllib3.util.html#module-urllib3.util.retry
-        self.service_retry_params = {
-            'total': 10,
-            'connect': 5,
-            'read': 5,
-            'status': 5,
-            'status_forcelist': [500, 502, 503, 504],
-            'backoff_factor': 0.1,
-            'method_whitelist': method_whitelist,
-        }
-        # Merge studies
-        # /study/{namespace}/{studyUid}/merge?sid={sid}&secondary_study_uid={secondary_study_uid}&delete_secondary_study={0,1}
-        # Can return 500 and its ok .....
-        self.storage_retry_params = {
-            'total': 10,
-            'connect': 5,
-            'read': 5,
-            'status': 5,
-            'status_forcelist': [502, 503, 504],
-            'backoff_factor': 0.1,
-            'method_whitelist': method_whitelist,
-        }
+    def batch(
+        self,
+        queries: Iterable[Any],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult]:
+        """Execute independent queries in parallel.
+
+        Queries share service session connection pool
+        (see service_pool_params). Exception of query is returned
+        in its result and does not stop other queries.
+
+        :Example:
+
+        >>> queries = [api.Study.get(uuid=uuid) for uuid in uuids]
+        >>> for batch_result in api.batch(queries, concurrency=16):
+        >>>     if batch_result.ok:
+        >>>         print(batch_result.result.uuid)
+
+        :param queries: query objects
+        :param concurrency: number of parallel requests
+        :param ordered: yield results in order of queries
+                        (or in order of completion)
+        :return: iterator of batch results
+        """
+        return execute_batch(queries, concurrency, ordered)
+
+    def _send(  # NOQA:WPS211
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        url_template: Optional[str],
+        **kwargs,
+    ) -> requests.Response:
+        """Send request.
+
+        :param session: http session
+        :param method: http method
+        :param url: full url
+        :param deadline: request deadline
+        :param url_template: method url template (for metrics)
+        :param kwargs: request arguments
+        :return: response
+        """
+        if deadline is not None:
+            kwargs['timeout'] = deadline.request_timeout(self.connect_timeout)
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+        event = RequestEvent(method=method, url=url, url_template=url_template)
+        self.metrics.on_request(event)
+        start = monotonic()
+        try:
+            with deadline_scope(deadline):
+                response = session.request(method, url=url, **kwargs)
+        except Exception as exc:
+            self.metrics.on_error(
+                event._replace(exception=exc, latency=monotonic() - start),
+            )
+            raise
+        retries = getattr(response.raw, 'retries', None)
+        self.metrics.on_response(
+            event._replace(
+                response=response,
+                latency=monotonic() - start,
+                retries=len(retries.history) if retries is not None else 0,
+            ),
+            request_bytes=_request_size(response),
+            response_bytes=response_size(response, kwargs.get('stream')),
+        )
+        return response
+
+    def _service_namespace(self, name: str) -> Any:
+        """Create service namespace.
+
+        :param name: namespace name (see entrypoints.__all__)
+        :return: namespace
+        """
+        return getattr(entrypoints, name)(self)
+
+
+def _request_size(response: requests.Response) -> int:
+    """Get request body size.
 
-    def _init_service_entrypoints(self):
-        """Init service entrypoint namespaces."""
-        self.Account = Account(self)
-        self.Activity = Activity(self)
-        self.Analytics = Analytics(self)
-        self.Annotation = Annotation(self)
-        self.Appointment = Appointment(self)
-        self.Audit = Audit(self)
-        self.Case = Case(self)
-        self.Customcode = Customcode(self)
-        self.Customfield = Customfield(self)
-        self.Destination = Destination(self)
-        self.Dicomdata = Dicomdata(self)
-        self.Dictionary = Dictionary(self)
-        self.Filter = Filter(self)
-        self.Group = Group(self)
-        self.Help = Help(self)
-        self.Hl7 = Hl7(self)
-        self.Keyimage = Keyimage(self)
-        self.Link = Link(self)
-        self.Location = Location(self)
-        self.Meeting = Meeting(self)
-        self.Message = Message(self)
-        self.Namespace = Namespace(self)
-        self.Node = Node(self)
-        self.Npi = Npi(self)
-        self.Order = Order(self)
-        self.Patient = Patient(self)
-        self.Purge = Purge(self)
-        self.Radreportmacro = Radreportmacro(self)
-        self.Radreport = Radreport(self)
-        self.Report = Report(self)
-        self.Role = Role(self)
-        self.Route = Route(self)
-        self.Rsna = Rsna(self)
-        self.Session = Session(self)
-        self.Setting = Setting(self)
-        self.Study = Study(self)
-        self.Tag = Tag(self)
-        self.Terminology = Terminology(self)
-        self.Training = Training(self)
-        self.User = User(self)
-        self.Validate = Validate(self)
-        self.Webhook = Webhook(self)
+    :param response: response
+    :return: size in bytes
+    """
+    if response.request is None:
+        return 0
+    return body_size(response.request.body)
@@ -0,0 +1,706 @@
+"""Ambra asyncio storage and service API."""
+
+import asyncio
+import logging
+import os
+from functools import wraps
+from tempfile import SpooledTemporaryFile
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlencode
+
+import aiohttp
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from ambra_sdk.api import DEFAULT_SDK_CLIENT_NAME, BaseApi
+from ambra_sdk.deadline import Deadline
+from ambra_sdk.exceptions.base import DeadlineExceeded
+from ambra_sdk.exceptions.service import AuthorizationRequired
+from ambra_sdk.exceptions.storage import PermissionDenied
+from ambra_sdk.lazy import LazyNamespace
+from ambra_sdk.metrics import RequestEvent, body_size, response_size
+from ambra_sdk.service import entrypoints
+from ambra_sdk.service.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchResult,
+    execute_async_batch,
+)
+from ambra_sdk.service.cache import AsyncResponseCache
+from ambra_sdk.service.coalescing import AsyncCoalescer
+from ambra_sdk.service.partition import ScanResponse
+from ambra_sdk.service.query import Query, to_async_query
+from ambra_sdk.storage.storage import AsyncStorage
+
+logger = logging.getLogger(__name__)
+
+# Streamed response bodies are kept in memory up to this size,
+# bigger bodies are written to temporary file
+STREAM_SPOOL_SIZE = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class AsyncNamespace:
+    """Async service namespace.
+
+    Wrapper around service namespace.
+    All namespace methods return async query objects.
+    """
+
+    def __init__(self, namespace):
+        """Init.
+
+        :param namespace: service namespace
+        """
+        self._namespace = namespace
+
+    def __getattr__(self, name: str):
+        """Get namespace attribute.
+
+        :param name: attribute name
+        :return: attribute (methods return async queries)
+        """
+        attr = getattr(self._namespace, name)
+        if not callable(attr):
+            return attr
+
+        @wraps(attr)
+        def query_method(*args, **kwargs):  # NOQA:WPS430
+            query = attr(*args, **kwargs)
+            if isinstance(query, Query):
+                return to_async_query(query)
+            if isinstance(query, ScanResponse):
+                return query.to_async()
+            return query
+        return query_method
+
+
+class AsyncSession(AsyncNamespace):
+    """Async session namespace."""
+
+    async def get_sid(self, username: str, password: str) -> str:
+        """Get sid from credentials.
+
+        :param username: user name
+        :param password: user password
+        :return: sid
+        """
+        response = await self.login(  # NOQA:WPS221
+            login=username,
+            password=password,
+        ).get_once()
+        sid: str = response.sid
+        return sid  # NOQA: WPS331
+
+
+class AsyncApi(BaseApi):  # NOQA:WPS214
+    """Ambra asyncio API.
+
+    Api have the same service and storage namespaces as sync Api,
+    but all queries and storage requests are awaitables.
+
+    :Example:
+
+    >>> async with AsyncApi.with_creds(url, username, password) as api:
+    >>>     user = await api.Session.user().get()
+    >>>     async for study in api.Study.list().all():
+    >>>         print(study.uuid)
+    """
+
+    Storage = LazyNamespace(AsyncStorage)
+    coalescer_class = AsyncCoalescer
+    response_cache_class = AsyncResponseCache
+
+    def __init__(  # NOQA:WPS211
+        self,
+        url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        sid: Optional[str] = None,
+        client_name: str = DEFAULT_SDK_CLIENT_NAME,
+    ):
+        """Init api.
+
+        :param url: api url
+        :param sid: session id
+        :param username: username credential
+        :param password: password credential
+        :param client_name: user defined client name
+        """
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Lock is created in running loop
+        self._sid_lock: Optional[asyncio.Lock] = None
+        super().__init__(
+            url=url,
+            username=username,
+            password=password,
+            sid=sid,
+            client_name=client_name,
+        )
+
+    async def __aenter__(self) -> 'AsyncApi':
+        """Enter to api context.
+
+        :return: api
+        """
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Exit from api context and close http session.
+
+        :param exc_info: exception info
+        """
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Http session.
+
+        Session is shared between service and storage requests.
+        Session should be created in running event loop.
+
+        :return: aiohttp session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._default_headers,
+            )
+        return self._session
+
+    async def close(self):
+        """Close http session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def storage_get(
+        self,
+        url: str,
+        required_sid: bool,
+        deadline: Optional[Deadline] = None,
+        url_template: Optional[str] = None,
+        **kwargs,
+    ) -> Response:
+        """Get from storage.
+
+        :param url: url
+        :param required_sid: is this method required sid
+        :param deadline: request deadline
+        :param url_template: storage method url template (for metrics)
+        :param kwargs: request arguments
+        :return: response obj
+        """
+        if required_sid:
+            kwargs['params'] = await self._params_with_sid(kwargs)
+        return await self._request(
+            'GET',
+            url,
+            self.storage_retry_params,
+            deadline,
+            url_template,
+            **kwargs,
+        )
+
+    async def storage_delete(
+        self,
+        url: str,
+        required_sid: bool,
+        deadline: Optional[Deadline] = None,
+        url_template: Optional[str] = None,
+        **kwargs,
+    ) -> Response:
+        """Delete from storage.
+
+        :param url: url
+        :param required_sid: is this method required sid
+        :param deadline: request deadline
+        :param url_template: storage method url template (for metrics)
+        :param kwargs: request arguments
+        :return: response obj
+        """
+        if required_sid:
+            kwargs['params'] = await self._params_with_sid(kwargs)
+        return await self._request(
+            'DELETE',
+            url,
+            self.storage_retry_params,
+            deadline,
+            url_template,
+            **kwargs,
+        )
+
+    async def storage_post(
+        self,
+        url: str,
+        required_sid: bool,
+        deadline: Optional[Deadline] = None,
+        url_template: Optional[str] = None,
+        **kwargs,
+    ) -> Response:
+        """Post to storage.
+
+        :param url: url
+        :param required_sid: is this method required sid
+        :param deadline: request deadline
+        :param url_template: storage method url template (for metrics)
+        :param kwargs: request arguments
+        :return: response obj
+        """
+        if required_sid:
+            kwargs['params'] = await self._params_with_sid(kwargs)
+        return await self._request(
+            'POST',
+            url,
+            self.storage_retry_params,
+            deadline,
+            url_template,
+            **kwargs,
+        )
+
+    async def service_post(
+        self,
+        url: str,
+        required_sid: bool,
+        deadline: Optional[Deadline] = None,
+        **kwargs,
+    ) -> Response:
+        """Post data to url.
+
+        :param url: method url
+        :param required_sid: is this method required sid
+        :param deadline: request deadline
+        :param kwargs: request arguments
+        :return: response
+        """
+        full_url = self.service_full_url(url)
+        if required_sid is True:
+            # Request data of caller (query) is not changed
+            request_data = dict(kwargs.pop('data'))
+            request_data['sid'] = await self.get_sid()
+            kwargs['data'] = request_data
+        return await self._request(
+            'POST',
+            full_url,
+            self.service_retry_params,
+            deadline,
+            url,
+            **kwargs,
+        )
+
+    async def get_sid(self) -> str:
+        """Get or create new sid.
+
+        :return: sid
+        """
+        sid = self._sid
+        if sid is None:
+            async with self.sid_lock:
+                if self._sid is None:
+                    return await self._login()
+                return self._sid
+        return sid
+
+    @property
+    def sid_lock(self) -> asyncio.Lock:
+        """Sid refresh lock.
+
+        :return: lock
+        """
+        if self._sid_lock is None:
+            self._sid_lock = asyncio.Lock()
+        return self._sid_lock
+
+    async def logout(self):
+        """Logout."""
+        await self.Session.logout().get()
+        self._sid = None
+
+    async def get_new_sid(self) -> str:
+        """Get new sid.
+
+        :return: sid
+        """
+        async with self.sid_lock:
+            return await self._login()
+
+    async def refresh_sid(self, stale_sid: Optional[str]) -> str:
+        """Refresh stale sid.
+
+        Only one caller gets new sid. Concurrent callers with
+        the same stale sid wait for it and reuse the new sid.
+
+        :param stale_sid: sid used by failed request
+        :return: new sid
+        """
+        async with self.sid_lock:
+            if self._is_sid_refreshed(stale_sid):
+                return self._sid  # type: ignore
+            return await self._login()
+
+    async def retry_with_new_sid(
+        self,
+        fn: Callable,
+        deadline: Optional[Deadline] = None,
+    ):
+        """Retry with new sid.
+
+        :param fn: callable method returning awaitable
+        :param deadline: deadline of fn (checked before retry)
+        :return: fn result
+        """
+        stale_sid = self._sid
+        try:
+            return await fn()
+        except (AuthorizationRequired, PermissionDenied):
+            await self.refresh_sid(stale_sid)
+            if deadline is not None:
+                deadline.check()
+            return await fn()
+
+    def batch(
+        self,
+        queries: Iterable[Any],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+    ) -> AsyncIterator[BatchResult]:
+        """Execute independent queries concurrently.
+
+        :Example:
+
+        >>> queries = [api.Study.get(uuid=uuid) for uuid in uuids]
+        >>> async for batch_result in api.batch(queries, concurrency=16):
+        >>>     if batch_result.ok:
+        >>>         print(batch_result.result.uuid)
+
+        :param queries: async query objects
+        :param concurrency: number of parallel requests
+        :param ordered: yield results in order of queries
+                        (or in order of completion)
+        :return: async iterator of batch results
+        """
+        return execute_async_batch(queries, concurrency, ordered)
+
+    def _service_namespace(self, name: str) -> AsyncNamespace:
+        """Create async service namespace.
+
+        :param name: namespace name (see entrypoints.__all__)
+        :return: async namespace
+        """
+        namespace = getattr(entrypoints, name)(self)
+        if name == 'Session':
+            return AsyncSession(namespace)
+        return AsyncNamespace(namespace)
+
+    async def _login(self) -> str:
+        """Get new sid (caller should hold sid lock).
+
+        :raises RuntimeError: Missined credentials
+        :return: sid
+        """
+        if self._creds is None:
+            raise RuntimeError('Missed credentials')
+        new_sid: str = await self.Session.get_sid(
+            self._creds.username,
+            self._creds.password,
+        )
+        self._sid = new_sid
+        self._sid_refreshes += 1
+        self.metrics.record_sid_refresh()
+        return new_sid
+
+    async def _params_with_sid(self, kwargs) -> Dict[str, Any]:
+        # Sid passed always in url params (?sid=...)
+        request_params = dict(kwargs.pop('params'))
+        request_params['sid'] = await self.get_sid()
+        return request_params
+
+    async def _request(  # NOQA:WPS211
+        self,
+        method: str,
+        url: str,
+        retry_params: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        url_template: Optional[str] = None,
+        **kwargs,
+    ) -> Response:
+        """Send request with retries and record metrics.
+
+        :param method: http method
+        :param url: full url
+        :param retry_params: retry parameters
+        :param deadline: request deadline
+        :param url_template: method url template (for metrics)
+        :param kwargs: requests like arguments
+        :return: response
+        """
+        event = RequestEvent(method=method, url=url, url_template=url_template)
+        self.metrics.on_request(event)
+        start = monotonic()
+        retries: List[int] = []
+        try:
+            response = await self._request_with_retries(
+                method,
+                url,
+                retry_params,
+                deadline,
+                retries,
+                **kwargs,
+            )
+        except Exception as exc:
+            self.metrics.on_error(
+                event._replace(
+                    exception=exc,
+                    latency=monotonic() - start,
+                    retries=len(retries),
+                ),
+            )
+            raise
+        self.metrics.on_response(
+            event._replace(
+                response=response,
+                latency=monotonic() - start,
+                retries=len(retries),
+            ),
+            request_bytes=_request_size(kwargs),
+            response_bytes=response_size(response, kwargs.get('stream')),
+        )
+        return response
+
+    async def _request_with_retries(  # NOQA:WPS210,WPS211,WPS231
+        self,
+        method: str,
+        url: str,
+        retry_params: Dict[str, Any],
+        deadline: Optional[Deadline],
+        retries: List[int],
+        **kwargs,
+    ) -> Response:
+        """Send request with retries.
+
+        Retries follow the same retry policy as sync api.
+        All attempts and backoff sleeps are bounded by deadline.
+
+        :param method: http method
+        :param url: full url
+        :param retry_params: retry parameters
+        :param deadline: request deadline
+        :param retries: list for retry numbers (for metrics)
+        :param kwargs: requests like arguments
+        :return: response
+        :raises DeadlineExceeded: Deadline exceeded
+        """
+        request_kwargs = _aiohttp_kwargs(kwargs)
+        policy = self.retry_policy(retry_params)
+        total = policy.total
+        connect = policy.connect
+        read = policy.read
+        status = policy.status
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+        retry_number = 0
+        while True:
+            if deadline is not None:
+                deadline.check()
+                request_kwargs['timeout'] = aiohttp.ClientTimeout(
+                    total=deadline.remaining,
+                    connect=min(self.connect_timeout, deadline.remaining),
+                )
+            try:
+                async with self.session.request(
+                    method,
+                    url,
+                    **request_kwargs,
+                ) as aio_response:
+                    response = await _to_response(
+                        aio_response,
+                        stream=bool(kwargs.get('stream')),
+                    )
+            except (
+                aiohttp.ClientConnectionError,
+                asyncio.TimeoutError,
+            ) as exc:
+                if deadline is not None and deadline.expired:
+                    raise DeadlineExceeded(deadline.timeout)
+                # Request was not sent
+                connect_error = isinstance(exc, aiohttp.ClientConnectorError)
+                if connect_error:
+                    connect = _decrement(connect)
+                else:
+                    read = _decrement(read)
+                total = _decrement(total)
+                if _exhausted(total, connect, read) or not policy.can_retry(
+                    method,
+                    url,
+                    connect_error=connect_error,
+                ):
+                    raise
+                sleep_time = policy.backoff_time(retry_number + 1)
+            else:
+                if response.status_code not in policy.status_forcelist:
+                    return response
+                status = _decrement(status)
+                total = _decrement(total)
+                if _exhausted(total, status) or not policy.can_retry(
+                    method,
+                    url,
+                    response=response,
+                ):
+                    return response
+                sleep_time = policy.retry_after(response)  # type: ignore
+                if sleep_time is None:
+                    sleep_time = policy.backoff_time(retry_number + 1)
+            retry_number += 1
+            retries.append(retry_number)
+            if deadline is not None and deadline.remaining <= sleep_time:
+                raise DeadlineExceeded(deadline.timeout)
+            logger.debug('Retry %s %s (%s)', method, url, retry_number)
+            await asyncio.sleep(sleep_time)
+
+
+def _decrement(counter: Optional[int]) -> Optional[int]:
+    """Decrement retry counter.
+
+    :param counter: counter (None - unlimited)
+    :return: new counter
+    """
+    if counter is None:
+        return None
+    return counter - 1
+
+
+def _exhausted(*counters: Optional[int]) -> bool:
+    """Check that retries are exhausted.
+
+    :param counters: retry counters
+    :return: True if some counter is exhausted
+    """
+    return any(
+        counter is not None and counter < 0
+        for counter in counters
+    )
+
+
+def _form_fields(form_data: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Get form fields like requests do it.
+
+    None values are skipped, sequences are sent as repeated fields.
+
+    :param form_data: form data
+    :return: list of fields
+    """
+    fields = []
+    for field_name, field_value in form_data.items():
+        if field_value is None:
+            continue
+        if isinstance(field_value, (list, tuple)):
+            fields.extend(
+                (field_name, str(list_value))
+                for list_value in field_value
+                if list_value is not None
+            )
+        else:
+            fields.append((field_name, str(field_value)))
+    return fields
+
+
+def _request_size(kwargs: Dict[str, Any]) -> int:
+    """Get request body size like sync api measures it.
+
+    Form is measured url encoded (as it is sent).
+
+    :param kwargs: requests arguments
+    :return: size in bytes (0 if it is unknown)
+    """
+    request_data = kwargs.get('data')
+    if kwargs.get('files') is not None:
+        # Multipart body is built by aiohttp
+        return 0
+    if isinstance(request_data, dict):
+        return len(urlencode(_form_fields(request_data)))
+    return body_size(request_data)
+
+
+def _aiohttp_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert requests arguments to aiohttp arguments.
+
+    :param kwargs: requests arguments
+    :return: aiohttp arguments
+    """
+    aiohttp_kwargs: Dict[str, Any] = {}
+    if kwargs.get('headers') is not None:
+        aiohttp_kwargs['headers'] = kwargs['headers']
+    if kwargs.get('params') is not None:
+        aiohttp_kwargs['params'] = _form_fields(kwargs['params'])
+    if kwargs.get('timeout') is not None:
+        aiohttp_kwargs['timeout'] = aiohttp.ClientTimeout(
+            total=kwargs['timeout'],
+        )
+
+    request_data = kwargs.get('data')
+    files = kwargs.get('files')
+    if files is not None:
+        form = aiohttp.FormData()
+        if isinstance(request_data, dict):
+            for field_name, field_value in _form_fields(request_data):
+                form.add_field(field_name, field_value)
+        for file_field, opened_file in files.items():
+            form.add_field(
+                file_field,
+                opened_file,
+                filename=os.path.basename(
+                    getattr(opened_file, 'name', file_field),
+                ),
+            )
+        aiohttp_kwargs['data'] = form
+    elif isinstance(request_data, dict):
+        aiohttp_kwargs['data'] = aiohttp.FormData(_form_fields(request_data))
+    elif request_data is not None:
+        aiohttp_kwargs['data'] = request_data
+    return aiohttp_kwargs
+
+
+async def _to_response(
+    aio_response: aiohttp.ClientResponse,
+    stream: bool = False,
+) -> Response:
+    """Read aiohttp response into requests response.
+
+    This allows sync and async api to share response checks
+    and response objects.
+
+    Streamed body (storage downloads) is not held in memory:
+    it is copied by chunks to spooled temporary file
+    which is response.raw, so it is read by response.iter_content
+    like body of sync streamed response.
+
+    :param aio_response: aiohttp response
+    :param stream: is response streamed
+    :return: requests response
+    """
+    response = Response()
+    if stream:
+        body = SpooledTemporaryFile(max_size=STREAM_SPOOL_SIZE)
+        async for chunk in aio_response.content.iter_chunked(
+            STREAM_CHUNK_SIZE,
+        ):
+            body.write(chunk)
+        body.seek(0)
+        response.raw = body
+    else:
+        response._content = await aio_response.read()  # NOQA:WPS437
+    response.status_code = aio_response.status
+    response.headers = CaseInsensitiveDict(aio_response.headers)
+    response.url = str(aio_response.url)
+    response.reason = aio_response.reason
+    response.encoding = aio_response.charset
+    return response
+
@@ -0,0 +1,180 @@
+"""Request deadlines.
+
+Deadline is a time budget of one logical request:
+all its attempts (transport retries, retries with new sid)
+should be done before the deadline.
+Sleeps between transport retries are bounded by deadline too
+(retry policy gets deadline of current request by current_deadline).
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Iterator, Optional, Union
+
+from requests.packages.urllib3.util.timeout import Timeout
+
+from ambra_sdk.exceptions.base import DeadlineExceeded
+
+# Max time for establishing connection in one attempt (seconds)
+DEFAULT_CONNECT_TIMEOUT = 10
+
+
+class Deadline:
+    """Deadline of request.
+
+    :Example:
+
+    >>> deadline = Deadline(30)
+    >>> study = api.Study.get(uuid=uuid).set_deadline(deadline).get()
+    >>> schema = api.Storage.Study.schema(
+    >>>     engine_fqdn=engine_fqdn,
+    >>>     namespace=namespace,
+    >>>     study_uid=study.study_uid,
+    >>>     only_prepare=True,
+    >>> ).with_deadline(deadline).execute()
+    """
+
+    def __init__(self, timeout: float):
+        """Init.
+
+        :param timeout: time budget in seconds
+        """
+        self.timeout = timeout
+        self._expires_at = monotonic() + timeout
+
+    def __repr__(self) -> str:
+        """Representation.
+
+        :return: representation
+        """
+        return '{cls_name}(timeout={timeout}, remaining={remaining:.3f})' \
+            .format(
+                cls_name=type(self).__name__,
+                timeout=self.timeout,
+                remaining=self.remaining,
+            )
+
+    @property
+    def remaining(self) -> float:
+        """Remaining time.
+
+        :return: seconds before deadline
+        """
+        return max(self._expires_at - monotonic(), 0)
+
+    @property
+    def expired(self) -> bool:
+        """Is deadline expired.
+
+        :return: expired flag
+        """
+        return self.remaining <= 0
+
+    def check(self):
+        """Check deadline.
+
+        :raises DeadlineExceeded: Deadline is expired
+        """
+        if self.expired:
+            raise DeadlineExceeded(self.timeout)
+
+    def request_timeout(
+        self,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    ) -> 'DeadlineTimeout':
+        """Get timeout for requests.
+
+        :param connect_timeout: max connect timeout of one attempt
+        :return: timeout object
+        """
+        return DeadlineTimeout(self, connect_timeout)
+
+
+class DeadlineTimeout(Timeout):
+    """Urllib3 timeout bounded by deadline.
+
+    Urllib3 clones timeout object before every attempt
+    (including retries by urllib3 Retry). The clone gets
+    remaining time of the deadline, so retries can not
+    exceed the deadline.
+    """
+
+    def __init__(self, deadline: Deadline, connect_timeout: float):
+        """Init.
+
+        :param deadline: request deadline
+        :param connect_timeout: max connect timeout of one attempt
+
+        :raises DeadlineExceeded: Deadline is expired
+        """
+        remaining = deadline.remaining
+        if remaining <= 0:
+            raise DeadlineExceeded(deadline.timeout)
+        super().__init__(
+            total=remaining,
+            connect=min(connect_timeout, remaining),
+            read=remaining,
+        )
+        self._deadline = deadline
+        self._connect_timeout = connect_timeout
+
+    def clone(self) -> 'DeadlineTimeout':
+        """Create timeout for the next attempt.
+
+        :return: timeout object
+        """
+        return self._deadline.request_timeout(self._connect_timeout)
+
+
+DeadlineType = Union[float, Deadline]
+
+# Deadline of request which is sent in current thread (or task)
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    'current_deadline',
+    default=None,
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get deadline of current request.
+
+    :return: deadline (None - request without deadline)
+    """
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[None]:
+    """Set deadline of current request.
+
+    :param deadline: request deadline
+    :yields: nothing
+    """
+    token = _current_deadline.set(deadline)
+    try:  # NOQA:WPS501
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+def to_deadline(
+    deadline: Optional[DeadlineType],
+    default_timeout: Optional[float] = None,
+) -> Optional[Deadline]:
+    """Get deadline object.
+
+    Number is a time budget (seconds) of a new deadline,
+    Deadline object is used as is (and can be shared between requests).
+
+    :param deadline: deadline or time budget
+    :param default_timeout: time budget if deadline is not set
+    :return: deadline object (None - request without deadline)
+    """
+    if isinstance(deadline, Deadline):
+        return deadline
+    if deadline is None:
+        deadline = default_timeout
+    if deadline is None:
+        return None
+    return Deadline(deadline)
@@ -21,3 +21,19 @@ class AmbraResponseException(AmbraException):
         super().__init__(message)
         self.code = code
         self.description = description
+
+
+class DeadlineExceeded(AmbraException):
+    """Request deadline exceeded."""
+
+    def __init__(self, timeout):
+        """Init.
+
+        :param timeout: time budget of request (seconds)
+        """
+        super().__init__(
+            'Deadline exceeded. Time budget: {timeout}s'.format(
+                timeout=timeout,
+            ),
+        )
+        self.timeout = timeout
@@ -1,6 +1,6 @@
 """Ambra storage exceptions."""
 
-from ambra_sdk.exceptions.base import AmbraResponseException
+from ambra_sdk.exceptions.base import AmbraException, AmbraResponseException
 
 
 class PermissionDenied(AmbraResponseException):
@@ -85,3 +85,21 @@ class EntityTooLarge(AmbraResponseException):
         if description is None:
             description = 'Entity too large.'
         super().__init__(code, description)
+
+
+class EngineUnavailable(AmbraException):
+    """Storage engine is unavailable (circuit breaker is open)."""
+
+    def __init__(self, engine_fqdn, retry_after=None):
+        """Init.
+
+        :param engine_fqdn: engine
+        :param retry_after: seconds before probe requests
+        """
+        super().__init__(
+            'Storage engine {engine_fqdn} is unavailable'.format(
+                engine_fqdn=engine_fqdn,
+            ),
+        )
+        self.engine_fqdn = engine_fqdn
+        self.retry_after = retry_after
@@ -0,0 +1,83 @@
+"""JSON backends.
+
+Responses are decoded by api.json_backend.
+By default it is the fastest installed backend:
+orjson, ujson or stdlib json.
+
+:Example:
+
+>>> api.json_backend = get_json_backend('json')
+"""
+
+import json
+from contextlib import suppress
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+JsonBody = Union[bytes, str]
+
+# Backends in order of preference
+JSON_BACKENDS_ORDER = ('orjson', 'ujson', 'json')
+
+
+class JsonBackend(NamedTuple):
+    """JSON backend."""
+
+    name: str
+    loads: Callable[[JsonBody], Any]
+    dumps: Callable[[Any], str]
+
+
+def _orjson_backend() -> JsonBackend:
+    import orjson  # NOQA:WPS433
+
+    def dumps(obj: Any) -> str:  # NOQA:WPS430
+        return orjson.dumps(obj).decode('utf-8')
+
+    return JsonBackend(name='orjson', loads=orjson.loads, dumps=dumps)
+
+
+def _ujson_backend() -> JsonBackend:
+    import ujson  # NOQA:WPS433
+
+    return JsonBackend(name='ujson', loads=ujson.loads, dumps=ujson.dumps)
+
+
+def _json_backend() -> JsonBackend:
+    return JsonBackend(name='json', loads=json.loads, dumps=json.dumps)
+
+
+_BACKEND_FACTORIES: Dict[str, Callable[[], JsonBackend]] = {
+    'orjson': _orjson_backend,
+    'ujson': _ujson_backend,
+    'json': _json_backend,
+}
+
+
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """Get JSON backend.
+
+    :param name: orjson, ujson or json (None - fastest installed backend)
+    :return: JSON backend
+    :raises ValueError: Unknown backend
+    """
+    if name is not None:
+        factory = _BACKEND_FACTORIES.get(name)
+        if factory is None:
+            raise ValueError(
+                'Unknown JSON backend {name}'.format(name=name),
+            )
+        return factory()
+    for backend_name in JSON_BACKENDS_ORDER:
+        with suppress(ImportError):
+            return _BACKEND_FACTORIES[backend_name]()
+    return _json_backend()
+
+
+def decode_response(response: Any, backend: JsonBackend) -> Any:
+    """Decode response body.
+
+    :param response: requests response
+    :param backend: JSON backend
+    :return: response json
+    """
+    return backend.loads(response.content)
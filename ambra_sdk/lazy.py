@@ -0,0 +1,61 @@
+"""Lazy api namespaces.
+
+Namespace is created on first attribute access and
+cached in instance (next accesses are usual attribute lookups).
+"""
+
+from threading import RLock
+from typing import Any, Callable, Optional
+
+# Namespace can create other namespaces in its constructor
+_namespaces_lock = RLock()
+
+
+class LazyNamespace:
+    """Namespace created on first access.
+
+    :Example:
+
+    >>> class Api:
+    >>>     Storage = LazyNamespace(Storage)
+    >>>     # Created by api._service_namespace('Study')
+    >>>     Study = LazyNamespace()
+    """
+
+    def __init__(self, factory: Optional[Callable[[Any], Any]] = None):
+        """Init.
+
+        :param factory: namespace factory with instance argument
+                        (None - instance._service_namespace(name))
+        """
+        self._factory = factory
+        self._name = ''
+
+    def __set_name__(self, owner: Any, name: str):
+        """Set attribute name.
+
+        :param owner: owner class
+        :param name: attribute name
+        """
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        """Get or create namespace.
+
+        :param instance: owner instance
+        :param owner: owner class
+        :return: namespace
+        """
+        if instance is None:
+            return self
+        with _namespaces_lock:
+            namespace = instance.__dict__.get(self._name)
+            if namespace is None:
+                namespace = self._create(instance)
+                instance.__dict__[self._name] = namespace
+        return namespace
+
+    def _create(self, instance: Any) -> Any:
+        if self._factory is None:
+            return instance._service_namespace(self._name)  # NOQA:WPS437
+        return self._factory(instance)
@@ -0,0 +1,358 @@
+"""Api metrics and hooks.
+
+Metrics are collected per url template of method
+(service method url like /study/get or storage url template
+like /study/{namespace}/{study_uid}/schema).
+
+:Example:
+
+>>> api.metrics.add_hook('on_error', lambda event: print(event.exception))
+>>> api.Study.list().all()[:1000]
+>>> api.metrics.snapshot()['endpoints']['/study/list']['latency']['p95']
+"""
+
+import logging
+from bisect import bisect_left
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets (seconds)
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    300,
+)
+
+HOOK_EVENTS = frozenset(('on_request', 'on_response', 'on_error'))
+
+
+class RequestEvent(NamedTuple):
+    """Request event for hooks."""
+
+    method: str
+    url: str
+    # Method url or storage url template
+    url_template: Optional[str]
+    # Response (on_response event)
+    response: Any = None
+    # Exception (on_error event)
+    exception: Optional[BaseException] = None
+    # Request time with all retries (seconds)
+    latency: Optional[float] = None
+    retries: int = 0
+
+
+class Histogram:
+    """Histogram with fixed buckets."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        """Init.
+
+        :param buckets: upper bounds of buckets
+        """
+        self._buckets = tuple(buckets)
+        # Last bucket is +Inf
+        self._counts = [0] * (len(self._buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None  # NOQA:WPS125
+        self.max: Optional[float] = None  # NOQA:WPS125
+
+    def observe(self, value: float):
+        """Add value.
+
+        :param value: observed value
+        """
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """Approximate quantile (upper bound of bucket).
+
+        :param quantile: quantile (0..1)
+        :return: value or None for empty histogram
+        """
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        accumulated = 0
+        for bucket_index, bucket_count in enumerate(self._counts):
+            accumulated += bucket_count
+            if accumulated >= rank and bucket_count:
+                if bucket_index == len(self._buckets):
+                    return self.max
+                return min(self._buckets[bucket_index], self.max)  # type: ignore
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get histogram values.
+
+        :return: histogram dict
+        """
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min,
+            'max': self.max,
+            'avg': self.total / self.count if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': dict(
+                zip(self._buckets + (float('inf'),), self._counts),
+            ),
+        }
+
+
+class EndpointMetrics:
+    """Metrics of one endpoint."""
+
+    def __init__(self):
+        """Init."""
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency = Histogram()
+        self.json_decode = Histogram()
+        self.box = Histogram()
+        # Last page size chosen by adaptive pagination
+        self.page_rows: Optional[int] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get metrics values.
+
+        :return: metrics dict
+        """
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'latency': self.latency.snapshot(),
+            'json_decode': self.json_decode.snapshot(),
+            'box': self.box.snapshot(),
+            'page_rows': self.page_rows,
+        }
+
+
+class Metrics:
+    """Api metrics and hooks.
+
+    Metrics are thread safe.
+    """
+
+    def __init__(self):
+        """Init."""
+        self.enabled = True
+        self._lock = Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._sid_refreshes = 0
+        self._hooks: Dict[str, List[Callable[[RequestEvent], Any]]] = {
+            event_name: [] for event_name in HOOK_EVENTS
+        }
+
+    def add_hook(self, event_name: str, hook: Callable[[RequestEvent], Any]):
+        """Add hook.
+
+        Hook exceptions are logged and don't break requests.
+
+        :param event_name: on_request, on_response or on_error
+        :param hook: callable with RequestEvent argument
+        :raises ValueError: Unknown event
+        """
+        if event_name not in HOOK_EVENTS:
+            raise ValueError(
+                'Unknown event {event_name}'.format(event_name=event_name),
+            )
+        self._hooks[event_name].append(hook)
+
+    def remove_hook(
+        self,
+        event_name: str,
+        hook: Callable[[RequestEvent], Any],
+    ):
+        """Remove hook.
+
+        :param event_name: on_request, on_response or on_error
+        :param hook: hook
+        """
+        self._hooks[event_name].remove(hook)
+
+    def on_request(self, event: RequestEvent):
+        """Request is started.
+
+        :param event: request event
+        """
+        self._call_hooks('on_request', event)
+
+    def on_response(
+        self,
+        event: RequestEvent,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ):
+        """Response is received.
+
+        :param event: request event
+        :param request_bytes: request body size
+        :param response_bytes: response body size
+        """
+        if self.enabled:
+            with self._lock:
+                endpoint = self._endpoint(event.url_template)
+                endpoint.requests += 1
+                endpoint.retries += event.retries
+                endpoint.request_bytes += request_bytes
+                endpoint.response_bytes += response_bytes
+                endpoint.latency.observe(event.latency or 0)
+        self._call_hooks('on_response', event)
+
+    def on_error(self, event: RequestEvent):
+        """Request is failed.
+
+        :param event: request event
+        """
+        if self.enabled:
+            with self._lock:
+                endpoint = self._endpoint(event.url_template)
+                endpoint.requests += 1
+                endpoint.errors += 1
+                endpoint.retries += event.retries
+                endpoint.latency.observe(event.latency or 0)
+        self._call_hooks('on_error', event)
+
+    def record_json_decode(self, url_template: Optional[str], seconds: float):
+        """Record json decode time.
+
+        :param url_template: url template
+        :param seconds: decode time
+        """
+        if self.enabled:
+            with self._lock:
+                self._endpoint(url_template).json_decode.observe(seconds)
+
+    def record_box(self, url_template: Optional[str], seconds: float):
+        """Record construction time of response object (Box).
+
+        :param url_template: url template
+        :param seconds: construction time
+        """
+        if self.enabled:
+            with self._lock:
+                self._endpoint(url_template).box.observe(seconds)
+
+    def record_page_rows(self, url_template: Optional[str], rows: int):
+        """Record page size chosen by adaptive pagination.
+
+        :param url_template: url template
+        :param rows: rows in page
+        """
+        if self.enabled:
+            with self._lock:
+                self._endpoint(url_template).page_rows = rows
+
+    def record_sid_refresh(self):
+        """Record sid refresh."""
+        with self._lock:
+            self._sid_refreshes += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get metrics values.
+
+        :return: metrics dict
+        """
+        with self._lock:
+            return {
+                'sid_refreshes': self._sid_refreshes,
+                'endpoints': {
+                    url_template: endpoint.snapshot()
+                    for url_template, endpoint in self._endpoints.items()
+                },
+            }
+
+    def reset(self):
+        """Reset metrics values."""
+        with self._lock:
+            self._endpoints.clear()
+            self._sid_refreshes = 0
+
+    def _endpoint(self, url_template: Optional[str]) -> EndpointMetrics:
+        endpoint_key = url_template or 'unknown'
+        endpoint = self._endpoints.get(endpoint_key)
+        if endpoint is None:
+            endpoint = EndpointMetrics()
+            self._endpoints[endpoint_key] = endpoint
+        return endpoint
+
+    def _call_hooks(self, event_name: str, event: RequestEvent):
+        for hook in self._hooks[event_name]:
+            try:
+                hook(event)
+            except Exception:  # NOQA:B902
+                logger.exception('Error in %s hook', event_name)
+
+
+def body_size(body: Any) -> int:
+    """Get size of request or response body.
+
+    :param body: body (bytes, str or file like object)
+    :return: size in bytes (0 if it is unknown)
+    """
+    if body is None or isinstance(body, Mapping):
+        # Not encoded form
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    try:
+        return len(body)
+    except TypeError:
+        return 0
+
+
+def response_size(response: Any, stream: Optional[bool]) -> int:
+    """Get response body size.
+
+    Streamed response body is not read.
+
+    :param response: requests response
+    :param stream: is response streamed
+    :return: size in bytes
+    """
+    if stream:
+        try:
+            return int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            return 0
+    return len(response.content or b'')
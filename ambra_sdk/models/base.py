@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Type
 
 from ambra_sdk.service.filtering import Filter, FilterCondition
 from ambra_sdk.service.sorting import Sorter, SortingOrder
+from ambra_sdk.service.template import Bind
 
 
 class BaseField(ABC):
@@ -163,7 +164,11 @@ class WithFiltering:  # NOQA:WPS214
         condition,
         full_name=False,
     ):
-        value = self._field.for_request(value)
+        if isinstance(value, Bind):
+            # Bound value is converted on bind
+            value = value._replace(convert=self._field.for_request)
+        else:
+            value = self._field.for_request(value)
         field_name = self._full_name if full_name is True else self._name
         return Filter(
             field_name=field_name,
@@ -172,10 +177,16 @@ class WithFiltering:  # NOQA:WPS214
         )
 
     def _filter_with_seq(self, values, condition, full_name=False):
+        field_name = self._full_name if full_name is True else self._name
+        if isinstance(values, Bind):
+            return Filter(
+                field_name=field_name,
+                condition=condition,
+                value=values._replace(convert=json.dumps),
+            )
         # check value type
         if not isinstance(values, Iterable):
             raise ValueError('Value is not iterable')
-        field_name = self._full_name if full_name is True else self._name
         return Filter(
             field_name=field_name,
             condition=condition,
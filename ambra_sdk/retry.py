@@ -0,0 +1,412 @@
+"""Retry policy.
+
+Policy is a urllib3 Retry with:
+
+- full jitter exponential backoff (clients don't retry in lockstep)
+- Retry-After header support (with upper bound)
+- retry budget shared by all requests of api
+- retries of read errors and bad statuses only for idempotent methods
+- no retry if its wait doesn't fit into the request deadline
+"""
+
+import random
+from itertools import takewhile
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from requests.packages.urllib3.exceptions import MaxRetryError, ResponseError
+from requests.packages.urllib3.util import Retry
+
+from ambra_sdk.deadline import current_deadline
+from ambra_sdk.exceptions.base import DeadlineExceeded
+
+# Idempotent http methods
+IDEMPOTENT_METHODS = frozenset(
+    ('HEAD', 'TRACE', 'GET', 'PUT', 'OPTIONS', 'DELETE'),
+)
+
+# Service methods are POST requests.
+# Methods without side effects. Every url is classified explicitly:
+# actions like status or settings also set values (/order/sps/status).
+# Not listed methods are not retried on read errors and bad statuses.
+READ_SERVICE_URLS = frozenset((
+    '/account/can/share/list',
+    '/account/get',
+    '/account/list',
+    '/account/settings',
+    '/account/user/get',
+    '/account/user/list',
+    '/activity/get',
+    '/activity/list',
+    '/activity/list/count',
+    '/annotation/get',
+    '/annotation/list',
+    '/appointment/get',
+    '/appointment/list',
+    '/audit/user',
+    '/case/get',
+    '/case/list',
+    '/customcode/deploy/get',
+    '/customcode/deploy/list',
+    '/customcode/get',
+    '/customcode/list',
+    '/customfield/get',
+    '/customfield/list',
+    '/customfield/lookup',
+    '/customfield/search',
+    '/destination/get',
+    '/destination/list',
+    '/dicomdata/get',
+    '/dicomdata/list',
+    '/dictionary/get',
+    '/dictionary/list',
+    '/filter/get',
+    '/filter/list',
+    '/filter/share/list',
+    '/group/get',
+    '/group/list',
+    '/group/user/list',
+    '/help/get',
+    '/hl7/get',
+    '/hl7/list',
+    '/hl7/template/get',
+    '/hl7/template/list',
+    '/hl7/transform/get',
+    '/hl7/transform/list',
+    '/keyimage/get',
+    '/keyimage/list',
+    '/link/get',
+    '/link/list',
+    '/link/status',
+    '/location/get',
+    '/location/list',
+    '/location/user/list',
+    '/meeting/get',
+    '/message/count',
+    '/message/get',
+    '/message/list',
+    '/namespace/engine/fqdn',
+    '/namespace/permissions',
+    '/node/get',
+    '/node/list',
+    '/node/progress/get',
+    '/node/progress/list',
+    '/npi/find',
+    '/order/get',
+    '/order/list',
+    '/order/sps/find',
+    '/patient/get',
+    '/patient/list',
+    '/patient/portal/find',
+    '/patient/portal/list',
+    '/patient/study/list',
+    '/purge/get',
+    '/purge/list',
+    '/radreport/get',
+    '/radreport/template/get',
+    '/radreport/template/list',
+    '/radreport/user/list',
+    '/radreportmacro/get',
+    '/radreportmacro/list',
+    '/report/status',
+    '/role/default/permissions',
+    '/role/get',
+    '/role/list',
+    '/route/get',
+    '/route/list',
+    '/session/permissions',
+    '/session/ttl',
+    '/session/user',
+    '/session/uuid',
+    '/setting/get',
+    '/setting/get/all',
+    '/study/comment/get',
+    '/study/count',
+    '/study/exists',
+    '/study/get',
+    '/study/list',
+    '/study/permissions',
+    '/study/share/list',
+    '/study/status/history',
+    '/study/status/locks',
+    '/study/viewer/settings',
+    '/study/viewer3/settings',
+    '/tag/list',
+    '/terminology/list',
+    '/user/get',
+    '/user/join/list',
+    '/user/namespace/list',
+    '/validate/get',
+    '/validate/list',
+    '/webhook/get',
+    '/webhook/list',
+))
+
+# Max number of parts of service method url
+MAX_URL_SEGMENTS = max(url.count('/') for url in READ_SERVICE_URLS)
+# Max backoff (seconds)
+DEFAULT_BACKOFF_MAX = 30
+# Do not retry if server asks to wait more than this number of seconds
+DEFAULT_MAX_RETRY_AFTER = 60
+# Retries per request
+DEFAULT_RETRY_RATIO = 0.2
+# Retries which are always allowed
+DEFAULT_MIN_RETRIES_PER_SECOND = 10
+
+
+class RetryBudget:
+    """Retry budget.
+
+    Every request deposits ratio of retry, every retry withdraws one retry.
+    Also budget is refilled by min_retries_per_second.
+    So retries can not amplify load on server more than (1 + ratio) times.
+    Budget is thread safe and can be shared by several sessions.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_RETRY_RATIO,
+        min_retries_per_second: float = DEFAULT_MIN_RETRIES_PER_SECOND,
+        max_balance: Optional[float] = None,
+    ):
+        """Init.
+
+        :param ratio: retries per request
+        :param min_retries_per_second: retries which are always allowed
+        :param max_balance: max number of accumulated retries
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        if max_balance is None:
+            max_balance = max(min_retries_per_second, 1) * 10
+        self.max_balance = max_balance
+        self._balance = float(max_balance)
+        self._refilled_at = monotonic()
+        self._lock = Lock()
+        self.requests = 0
+        self.retries = 0
+        self.rejected = 0
+
+    def deposit(self):
+        """Register new request."""
+        with self._lock:
+            self.requests += 1
+            self._add(self.ratio)
+
+    def withdraw(self) -> bool:
+        """Try to get one retry.
+
+        :return: True if retry is allowed
+        """
+        with self._lock:
+            now = monotonic()
+            self._add((now - self._refilled_at) * self.min_retries_per_second)
+            self._refilled_at = now
+            if self._balance < 1:
+                self.rejected += 1
+                return False
+            self._balance -= 1
+            self.retries += 1
+            return True
+
+    def _add(self, retries: float):
+        self._balance = min(self._balance + retries, self.max_balance)
+
+
+class RetryPolicy(Retry):
+    """Retry policy.
+
+    If policy gives up, request returns last response
+    (or raises last error).
+    """
+
+    BACKOFF_MAX = DEFAULT_BACKOFF_MAX
+    READ_SERVICE_URLS = READ_SERVICE_URLS
+
+    def __init__(
+        self,
+        *args,
+        budget: Optional[RetryBudget] = None,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+        **kwargs,
+    ):
+        """Init.
+
+        :param args: urllib3 Retry args
+        :param budget: retry budget (None - without budget)
+        :param max_retry_after: max accepted Retry-After (seconds)
+        :param kwargs: urllib3 Retry kwargs
+        """
+        kwargs.setdefault('raise_on_status', False)
+        super().__init__(*args, **kwargs)
+        self.budget = budget
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kwargs) -> 'RetryPolicy':
+        """Create retry object for the next attempt.
+
+        :param kwargs: changed parameters
+        :return: retry policy
+        """
+        kwargs.setdefault('budget', self.budget)
+        kwargs.setdefault('max_retry_after', self.max_retry_after)
+        new_retry: 'RetryPolicy' = super().new(**kwargs)
+        return new_retry  # NOQA:WPS331
+
+    def is_idempotent(self, method: Optional[str], url: Optional[str]) -> bool:
+        """Can request be sent twice.
+
+        :param method: http method
+        :param url: request url
+        :return: True for idempotent requests
+        """
+        if method is None:
+            return False
+        method = method.upper()
+        if method in IDEMPOTENT_METHODS:
+            return True
+        if method != 'POST' or not url:
+            return False
+        # Method url is the end of path (/api/v3/study/get -> /study/get)
+        path_parts = urlparse(url).path.rstrip('/').split('/')
+        return any(
+            '/'.join(['', *path_parts[-segments:]]) in self.READ_SERVICE_URLS
+            for segments in range(2, MAX_URL_SEGMENTS + 1)
+        )
+
+    def backoff_time(self, retry_number: int) -> float:
+        """Full jitter exponential backoff.
+
+        :param retry_number: number of consecutive retry
+        :return: seconds
+        """
+        if retry_number <= 0:
+            return 0
+        max_backoff = min(
+            self.BACKOFF_MAX,
+            self.backoff_factor * (2 ** retry_number),
+        )
+        return random.uniform(0, max_backoff)  # NOQA:S311
+
+    def get_backoff_time(self) -> float:
+        """Backoff time for urllib3.
+
+        :return: seconds
+        """
+        consecutive_errors = len(list(takewhile(
+            lambda history: history.redirect_location is None,
+            reversed(self.history),
+        )))
+        return self.backoff_time(consecutive_errors)
+
+    def retry_after(self, response: Any) -> Optional[float]:
+        """Get Retry-After of response.
+
+        :param response: urllib3, requests or aiohttp response
+        :return: seconds or None
+        """
+        if not self.respect_retry_after_header:
+            return None
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None:
+            return None
+        try:
+            return float(self.parse_retry_after(retry_after))
+        except Exception:  # NOQA:B902
+            return None
+
+    def sleep(self, response: Any = None):
+        """Sleep before retry (Retry-After or backoff).
+
+        :param response: urllib3 response (None for errors)
+        :raises DeadlineExceeded: Retry can't be sent before deadline
+        """
+        wait = None
+        if response is not None:
+            wait = self.retry_after(response)
+        if wait is None:
+            wait = self.get_backoff_time()
+        deadline = current_deadline()
+        if deadline is not None and deadline.remaining <= wait:
+            raise DeadlineExceeded(deadline.timeout)
+        if wait > 0:
+            sleep(wait)
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        """Get Retry-After for urllib3.
+
+        :param response: urllib3 response
+        :return: seconds or None
+        """
+        return self.retry_after(response)
+
+    def can_retry(
+        self,
+        method: Optional[str],
+        url: Optional[str],
+        response: Any = None,
+        connect_error: bool = False,
+    ) -> bool:
+        """Check that request can be retried.
+
+        Connection errors (request was not sent) can be
+        retried for all methods.
+
+        :param method: http method
+        :param url: request url
+        :param response: response (None for errors)
+        :param connect_error: request failed before sending
+        :return: True if retry is allowed
+        """
+        if not connect_error and not self.is_idempotent(method, url):
+            return False
+        if response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None and \
+               retry_after > self.max_retry_after:
+                return False
+        return self.budget is None or self.budget.withdraw()
+
+    def increment(  # NOQA:WPS211
+        self,
+        method=None,
+        url=None,
+        response=None,
+        error=None,
+        _pool=None,
+        _stacktrace=None,
+    ) -> 'RetryPolicy':
+        """Get retry object for the next attempt.
+
+        :param method: http method
+        :param url: request url
+        :param response: urllib3 response
+        :param error: request error
+        :param _pool: connection pool
+        :param _stacktrace: error stacktrace
+        :return: retry policy
+        :raises MaxRetryError: Policy gives up
+        """
+        new_retry: 'RetryPolicy' = super().increment(
+            method=method,
+            url=url,
+            response=response,
+            error=error,
+            _pool=_pool,
+            _stacktrace=_stacktrace,
+        )
+        if response is not None and response.get_redirect_location():
+            return new_retry
+        connect_error = error is not None and \
+            self._is_connection_error(error)
+        if self.can_retry(method, url, response, connect_error):
+            return new_retry
+        if error is not None:
+            raise error.with_traceback(_stacktrace)
+        raise MaxRetryError(
+            _pool,
+            url,
+            ResponseError('Retry is not allowed by policy'),
+        )
@@ -0,0 +1,299 @@
+"""Automatic only fields of list scans.
+
+Rows of lists are tracked: accessed fields are recorded
+in profile of the call site (file and line of the first not sdk frame,
+or query template). When rows of the profile were seen,
+the next pages and the next scans of the call site request
+only recorded fields (and key field).
+
+If a row of projected page is asked for not requested field,
+full rows of the page are requested by key filter
+(filter.uuid.in), the row is filled and the field is requested
+by the next pages.
+Iteration over keys of projected rows (keys, items, to_dict)
+gives only requested fields.
+
+Only lists of Box rows (Box, StudyBox...) with filtering by uuid
+and without only fields of query are tracked.
+
+:Example:
+
+>>> api.enable_auto_only()
+>>> for study in api.Study.list().all():
+>>>     process(study.uuid, study.study_uid)
+"""
+
+import json
+import sys
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from box import Box
+
+# Rows of profile are found by key field
+AUTO_ONLY_KEY = 'uuid'
+# Row attributes with tracked page and filled flag
+TRACKED_PAGE_ATTR = '_auto_only_page'
+FILLED_ATTR = '_auto_only_filled'
+SDK_MODULE = 'ambra_sdk'
+
+SiteKey = Tuple[str, Any]
+
+
+def caller_site() -> Tuple[str, int]:
+    """Call site of the first not sdk frame.
+
+    :return: file name and line number
+    """
+    frame = sys._getframe(1)  # NOQA:WPS437
+    while frame.f_back is not None and \
+            frame.f_globals.get('__name__', '').startswith(SDK_MODULE):
+        frame = frame.f_back
+    return frame.f_code.co_filename, frame.f_lineno
+
+
+class AutoOnlyProfile:
+    """Fields accessed in rows of call site."""
+
+    def __init__(self, url: str, site: Any):
+        """Init.
+
+        :param url: list url
+        :param site: call site or template key
+        """
+        self.url = url
+        self.site = site
+        self.fields: Set[str] = set()
+        # Rows have no key field, pages are not projected
+        self.disabled = False
+        self.projected_pages = 0
+        # Requests of full rows of projected pages
+        self.fallbacks = 0
+        self._lock = Lock()
+
+    def projection(self) -> Optional[List[str]]:
+        """Fields of the next page.
+
+        :return: sorted fields (None - all fields)
+        """
+        with self._lock:
+            if not self.fields or self.disabled:
+                return None
+            self.projected_pages += 1
+            return sorted(self.fields | {AUTO_ONLY_KEY})
+
+    def record(self, field: str):
+        """Record accessed field.
+
+        :param field: field name
+        """
+        if field not in self.fields:
+            with self._lock:
+                self.fields.add(field)
+
+    def observe(self, rows: List[Dict[str, Any]]):
+        """Observe rows of not projected page.
+
+        :param rows: page rows
+        """
+        if any(AUTO_ONLY_KEY not in row for row in rows):
+            with self._lock:
+                self.disabled = True
+
+
+class PageRow(dict):  # NOQA:WPS600
+    """Row json of tracked page."""
+
+    __slots__ = ('page',)
+
+    def __init__(self, row: Dict[str, Any], page: 'TrackedPage'):
+        """Init.
+
+        :param row: row json
+        :param page: page of row
+        """
+        super().__init__(row)
+        self.page = page
+
+
+def full_rows_request_data(
+    request_data: Dict[str, Any],
+    keys: List[Any],
+) -> Dict[str, Any]:
+    """Request data of full rows of page.
+
+    :param request_data: query request data
+    :param keys: key values of rows
+    :return: request data
+    """
+    full_request_data = dict(request_data)
+    full_request_data.update({
+        'filter.{key}.in'.format(key=AUTO_ONLY_KEY): json.dumps(keys),
+        'page.rows': len(keys),
+        'page.number': 1,
+    })
+    return full_request_data
+
+
+class TrackedPage:
+    """Rows of one page."""
+
+    def __init__(
+        self,
+        response,
+        profile: AutoOnlyProfile,
+        fields: Optional[List[str]],
+        keys: List[Any],
+    ):
+        """Init.
+
+        :param response: iterable response
+        :param profile: profile of rows
+        :param fields: requested fields (None - all fields)
+        :param keys: key values of page rows
+        """
+        self.response = response
+        self.profile = profile
+        self.fields = None if fields is None else frozenset(fields)
+        self.keys = keys
+        self._full_rows: Optional[Dict[Any, Dict[str, Any]]] = None
+        self._lock = Lock()
+
+    def is_missing(self, field: str) -> bool:
+        """Check that field was not requested.
+
+        :param field: field name
+        :return: True if field was not requested
+        """
+        return self.fields is not None and field not in self.fields
+
+    def full_row(self, key_value: Any) -> Dict[str, Any]:
+        """Full row of page (all rows are requested once).
+
+        :param key_value: key value of row
+        :return: row json (empty if row is not found)
+        """
+        with self._lock:
+            if self._full_rows is None:
+                self.profile.fallbacks += 1
+                self._full_rows = self.response.full_rows(self.keys)
+        return self._full_rows.get(key_value, {})
+
+
+class AutoOnlyRow:
+    """Box row recording accessed fields."""
+
+    def __getitem__(self, item, *args, **kwargs):  # NOQA:WPS110
+        """Get item and record field.
+
+        :param item: key
+        :param args: Box args
+        :param kwargs: Box kwargs
+        :return: value
+        """
+        self._track(item)
+        return super().__getitem__(item, *args, **kwargs)  # type: ignore
+
+    def get(self, key, default=None):
+        """Get item and record field.
+
+        :param key: key
+        :param default: default value
+        :return: value
+        """
+        self._track(key)
+        return super().get(key, default)  # type: ignore
+
+    def _track(self, key):
+        """Record field and fill row if field was not requested.
+
+        :param key: key
+        """
+        page: Optional[TrackedPage] = self.__dict__.get(  # NOQA:WPS609
+            TRACKED_PAGE_ATTR,
+        )
+        if page is None or not isinstance(key, str) or key.startswith('_'):
+            # Nested rows and Box internals
+            return
+        if dict.__contains__(self, key):  # type: ignore
+            page.profile.record(key)
+            return
+        row_attrs = self.__dict__  # NOQA:WPS609
+        if not page.is_missing(key) or row_attrs.get(FILLED_ATTR):
+            return
+        row_attrs[FILLED_ATTR] = True
+        key_value = dict.get(self, AUTO_ONLY_KEY)  # type: ignore
+        for field, field_value in page.full_row(key_value).items():
+            if not dict.__contains__(self, field):  # type: ignore
+                self[field] = field_value  # type: ignore
+        if dict.__contains__(self, key):  # type: ignore
+            page.profile.record(key)
+
+
+_TRACKED_CLASSES: Dict[type, type] = {}
+
+
+def tracked_class(row_class: Type[Box]) -> type:
+    """Tracked variant of Box class.
+
+    :param row_class: Box class of rows
+    :return: class with AutoOnlyRow mixin
+    """
+    tracked = _TRACKED_CLASSES.get(row_class)
+    if tracked is None:
+        tracked = type(
+            'AutoOnly{name}'.format(name=row_class.__name__),
+            (AutoOnlyRow, row_class),
+            {},
+        )
+        _TRACKED_CLASSES[row_class] = tracked
+    return tracked
+
+
+def tracked_row(row_class: Type[Box], row: Dict[str, Any], page: TrackedPage):
+    """Create tracked row object.
+
+    :param row_class: Box class of rows
+    :param row: row json
+    :param page: page of row
+    :return: row object
+    """
+    row_object = tracked_class(row_class)(row)
+    object.__setattr__(row_object, TRACKED_PAGE_ATTR, page)  # NOQA:WPS609
+    return row_object
+
+
+class AutoOnly:
+    """Profiles of call sites."""
+
+    def __init__(self):
+        """Init."""
+        self._profiles: Dict[SiteKey, AutoOnlyProfile] = {}
+        self._lock = Lock()
+
+    @property
+    def profiles(self) -> List[AutoOnlyProfile]:
+        """Profiles of call sites.
+
+        :return: profiles
+        """
+        return list(self._profiles.values())
+
+    def profile(self, url: str, site: Any) -> AutoOnlyProfile:
+        """Profile of call site.
+
+        :param url: list url
+        :param site: call site or template key
+        :return: profile
+        """
+        with self._lock:
+            profile = self._profiles.get((url, site))
+            if profile is None:
+                profile = AutoOnlyProfile(url, site)
+                self._profiles[(url, site)] = profile
+        return profile
+
+    def reset(self):
+        """Forget recorded fields."""
+        with self._lock:
+            self._profiles = {}
@@ -0,0 +1,114 @@
+"""Batch execution of service queries."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, AsyncIterator, Iterable, Iterator, NamedTuple, Optional
+
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+class BatchResult(NamedTuple):
+    """Result of one query in batch."""
+
+    # Position of query in batch
+    index: int
+    query: Any
+    result: Any = None
+    exception: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Query executed without errors.
+
+        :return: ok flag
+        """
+        return self.exception is None
+
+
+def _execute(index: int, query) -> BatchResult:
+    """Execute query and catch its exception.
+
+    :param index: index of query in batch
+    :param query: query object
+    :return: batch result
+    """
+    try:
+        query_result = query.get()
+    except Exception as exc:  # NOQA:B902
+        return BatchResult(index=index, query=query, exception=exc)
+    return BatchResult(index=index, query=query, result=query_result)
+
+
+def execute_batch(
+    queries: Iterable[Any],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """Execute queries in thread pool.
+
+    Every query is executed with query.get(), so sid problems
+    are handled by api.retry_with_new_sid.
+    Exceptions are collected in results and don't stop the batch.
+
+    :param queries: query objects
+    :param concurrency: number of parallel requests
+    :param ordered: yield results in order of queries
+                    (or in order of completion)
+    :yields: batch results
+
+    :raises ValueError: Wrong concurrency
+    """
+    if concurrency < 1:
+        raise ValueError('Concurrency should be positive')
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(_execute, index, query)
+            for index, query in enumerate(queries)
+        ]
+        completed = futures if ordered else as_completed(futures)
+        try:
+            for future in completed:
+                yield future.result()
+        finally:
+            for not_completed in futures:
+                not_completed.cancel()
+
+
+async def execute_async_batch(
+    queries: Iterable[Any],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ordered: bool = True,
+) -> AsyncIterator[BatchResult]:
+    """Execute async queries concurrently.
+
+    :param queries: async query objects
+    :param concurrency: number of parallel requests
+    :param ordered: yield results in order of queries
+                    (or in order of completion)
+    :yields: batch results
+
+    :raises ValueError: Wrong concurrency
+    """
+    if concurrency < 1:
+        raise ValueError('Concurrency should be positive')
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _execute_async(index, query):  # NOQA:WPS430
+        async with semaphore:
+            try:
+                query_result = await query.get()
+            except Exception as exc:  # NOQA:B902
+                return BatchResult(index=index, query=query, exception=exc)
+            return BatchResult(index=index, query=query, result=query_result)
+
+    tasks = [
+        asyncio.ensure_future(_execute_async(index, query))
+        for index, query in enumerate(queries)
+    ]
+    completed = tasks if ordered else asyncio.as_completed(tasks)
+    try:
+        for task in completed:
+            yield await task
+    finally:
+        for not_completed in tasks:
+            not_completed.cancel()
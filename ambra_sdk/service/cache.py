@@ -0,0 +1,272 @@
+"""Response cache of read-mostly service methods.
+
+Responses of methods with ttl (see DEFAULT_CACHE_TTLS) are cached
+by url and request data (without sid). Expired responses are requested
+again, least recently used responses are evicted if cache is full.
+
+Mutation methods (not in ambra_sdk.retry.READ_SERVICE_URLS)
+are never cached. Successful mutation query invalidates cached responses
+of its resource (for example /role/set invalidates /role/get)
+and reads of other resources depending on it (see RELATED_READ_URLS,
+for example /user/set invalidates /session/user).
+Cached objects are copied, so changes of returned response object
+don't change cached response.
+
+:Example:
+
+>>> api.enable_response_cache(ttls={'/study/get': 10})
+>>> fqdn = api.Namespace.engine_fqdn(namespace_id=namespace_id).get()
+>>> api.response_cache.invalidate('/namespace/engine/fqdn')
+"""
+
+import json
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from ambra_sdk.service.coalescing import is_read_url
+
+DEFAULT_CACHE_SIZE = 1024
+# Time to live of cached responses (seconds)
+DEFAULT_CACHE_TTLS = {  # NOQA:WPS407
+    '/namespace/engine/fqdn': 3600,
+    '/role/get': 300,
+    '/session/permissions': 300,
+    '/session/user': 300,
+    '/setting/get/all': 300,
+    '/terminology/list': 3600,
+}
+# Reads of other resources invalidated by mutations of resource
+RELATED_READ_URLS = {  # NOQA:WPS407
+    '/account/': ('/session/permissions',),
+    '/group/': ('/session/permissions',),
+    '/location/': ('/session/permissions',),
+    '/role/': ('/session/permissions',),
+    # Session user has user settings
+    '/setting/': ('/session/user',),
+    '/user/': ('/session/permissions', '/session/user'),
+}
+# Params of request data which are not a part of cache key
+NOT_KEY_PARAMS = frozenset(('sid',))
+
+CacheKey = Tuple[str, str]
+
+
+class CacheStats(NamedTuple):
+    """Response cache counters."""
+
+    hits: int
+    misses: int
+    # Least recently used responses removed from full cache
+    evictions: int
+    # Responses removed by invalidate or by mutation queries
+    invalidations: int
+    size: int
+
+
+class _Missing:
+    """Not cached response."""
+
+
+MISSING = _Missing()
+
+
+class _Entry(NamedTuple):
+    """Cached response."""
+
+    expires: float
+    response_object: Any
+
+
+class BaseResponseCache:
+    """TTL and LRU response cache."""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """Init.
+
+        :param ttls: ttls of methods by url, added to DEFAULT_CACHE_TTLS
+                     (0 - do not cache method)
+        :param max_size: maximum number of cached responses
+        :raises ValueError: Wrong ttl or size
+        """
+        if max_size <= 0:
+            raise ValueError('Cache size should be positive')
+        self.ttls = dict(DEFAULT_CACHE_TTLS)
+        self.ttls.update(ttls or {})
+        for url, ttl in self.ttls.items():
+            if ttl < 0:
+                raise ValueError('Ttl should not be negative')
+            if ttl and not is_read_url(url):
+                raise ValueError(
+                    'Mutation method {url} can not be cached'.format(url=url),
+                )
+        self.max_size = max_size
+        self._entries: 'OrderedDict[CacheKey, _Entry]' = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Cache counters.
+
+        :return: stats
+        """
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+        )
+
+    def key(
+        self,
+        url: str,
+        request_data: Dict[str, Any],
+    ) -> Optional[CacheKey]:
+        """Key of cached response.
+
+        :param url: method url
+        :param request_data: request data
+        :return: url and encoded request data (None if method is not cached)
+        """
+        if not self.ttls.get(url):
+            return None
+        key_data = {
+            param: param_value
+            for param, param_value in request_data.items()
+            if param_value is not None and param not in NOT_KEY_PARAMS
+        }
+        return url, json.dumps(key_data, sort_keys=True, default=str)
+
+    def invalidate(
+        self,
+        url: Optional[str] = None,
+        request_data: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Remove cached responses.
+
+        :param url: method url (None - all methods)
+        :param request_data: request data (None - any request data)
+        :return: number of removed responses
+        """
+        with self._lock:
+            if url is not None and request_data is not None:
+                keys = [self.key(url, request_data)]
+            else:
+                keys = [
+                    key for key in self._entries
+                    if url is None or key[0] == url
+                ]
+            removed = 0
+            for key in keys:
+                if self._entries.pop(key, None) is not None:  # type: ignore
+                    removed += 1
+            self._invalidations += removed
+        return removed
+
+    def clear(self):
+        """Remove all cached responses."""
+        self.invalidate()
+
+    def _lookup(self, query) -> Tuple[Optional[CacheKey], Any]:
+        """Find cached response of query.
+
+        :param query: query
+        :return: cache key (None if not cached) and response or MISSING
+        """
+        key = self.key(query.url, query.request_data)
+        if key is None:
+            return None, MISSING
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= monotonic():
+                self._entries.pop(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return key, MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return key, deepcopy(entry.response_object)
+
+    def _update(self, query, key: Optional[CacheKey], response_object: Any):
+        """Cache response of query or invalidate resource of mutation.
+
+        :param query: query
+        :param key: cache key (None if not cached)
+        :param response_object: response object
+        """
+        if key is None:
+            if not is_read_url(query.url):
+                self._invalidate_resource(query.url)
+            return
+        entry = _Entry(
+            expires=monotonic() + self.ttls[query.url],
+            response_object=deepcopy(response_object),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _invalidate_resource(self, url: str):
+        """Remove cached responses of resource.
+
+        :param url: mutation method url
+        """
+        resource = '/{resource}/'.format(resource=url.strip('/').split('/')[0])
+        related_urls = RELATED_READ_URLS.get(resource, ())
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if key[0].startswith(resource) or key[0] in related_urls
+            ]
+            for key in keys:
+                self._entries.pop(key)
+            self._invalidations += len(keys)
+
+
+class ResponseCache(BaseResponseCache):
+    """Response cache of api."""
+
+    def get(self, query):
+        """Get cached or requested response object.
+
+        :param query: query
+        :return: response object
+        """
+        key, response_object = self._lookup(query)
+        if response_object is not MISSING:
+            return response_object
+        response_object = query.get(cache=False)
+        self._update(query, key, response_object)
+        return response_object
+
+
+class AsyncResponseCache(BaseResponseCache):
+    """Response cache of async api."""
+
+    async def get(self, query):
+        """Get cached or requested response object.
+
+        :param query: async query
+        :return: response object
+        """
+        key, response_object = self._lookup(query)
+        if response_object is not MISSING:
+            return response_object
+        response_object = await query.get(cache=False)
+        self._update(query, key, response_object)
+        return response_object
@@ -0,0 +1,399 @@
+"""Coalescing of concurrent get queries.
+
+Concurrent queries of read methods with the same url and request data
+share one request (single flight).
+
+With batch enabled (it is opt-in), get queries of methods
+with list variant (BATCH_METHODS) which have only key field
+in request data are collected during a short window
+and requested by one list query with filter.{key}.in.
+Rows of list have fields of list method, not fields of get method.
+Keys not found by list query (or all keys if list query fails)
+are requested by get method
+(so get errors like NotFound are raised as without coalescing).
+
+:Example:
+
+>>> api.enable_coalescing(window=0.005, batch=True)
+>>> # In concurrent threads
+>>> study = api.Study.get(uuid=uuid).get()
+"""
+
+import asyncio
+import json
+import logging
+from concurrent.futures import Future
+from copy import copy
+from threading import Lock
+from time import sleep
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from ambra_sdk.retry import READ_SERVICE_URLS
+
+logger = logging.getLogger(__name__)
+
+# Time of collecting keys of batch (seconds)
+DEFAULT_COALESCE_WINDOW = 0.005
+DEFAULT_COALESCE_BATCH = 100
+
+
+def is_read_url(url: str) -> bool:
+    """Check that service method only reads data.
+
+    :param url: method url
+    :return: True for read methods
+    """
+    return url in READ_SERVICE_URLS
+
+
+class BatchMethod(NamedTuple):
+    """List variant of get method."""
+
+    list_url: str
+    key_field: str
+    paginated_field: str
+
+
+BATCH_METHODS = {  # NOQA:WPS407
+    '/study/get': BatchMethod('/study/list', 'uuid', 'studies'),
+}
+
+
+class CoalescingStats(NamedTuple):
+    """Coalescing counters."""
+
+    # Coalesced get queries
+    queries: int
+    # Queries served by request of other query
+    shared: int
+    # Queries served by list requests
+    batched: int
+    # List requests
+    batches: int
+
+
+def request_key(query) -> Tuple[str, str]:
+    """Key of query request.
+
+    :param query: query
+    :return: url and encoded request data
+    """
+    request_data = {
+        param: param_value
+        for param, param_value in query.request_data.items()
+        if param_value is not None
+    }
+    return query.url, json.dumps(request_data, sort_keys=True, default=str)
+
+
+class _Batch:
+    """Keys of batch."""
+
+    def __init__(self, query, method: BatchMethod):
+        """Init.
+
+        :param query: the first get query of batch
+        :param method: batch method
+        """
+        self.query = query
+        self.method = method
+        self.results: Dict[Hashable, Any] = {}
+        self.closed = False
+
+
+class BaseCoalescer:
+    """Coalescing of concurrent get queries."""
+
+    def __init__(
+        self,
+        window: float = DEFAULT_COALESCE_WINDOW,
+        max_batch: int = DEFAULT_COALESCE_BATCH,
+        batch: bool = False,
+    ):
+        """Init.
+
+        :param window: time of collecting keys of batch (seconds)
+        :param max_batch: maximum number of keys in batch (0 - no batches)
+        :param batch: request gets by list queries (rows have list fields)
+        :raises ValueError: Wrong window or batch size
+        """
+        if window < 0 or max_batch < 0:
+            raise ValueError('Window and batch size should not be negative')
+        self.window = window
+        self.max_batch = max_batch if batch else 0
+        self._in_flight: Dict[Tuple[str, str], Any] = {}
+        self._batches: Dict[str, _Batch] = {}
+        self._queries = 0
+        self._shared = 0
+        self._batched = 0
+        self._batch_requests = 0
+
+    @property
+    def stats(self) -> CoalescingStats:
+        """Coalescing counters.
+
+        :return: stats
+        """
+        return CoalescingStats(
+            queries=self._queries,
+            shared=self._shared,
+            batched=self._batched,
+            batches=self._batch_requests,
+        )
+
+    def accepts(self, query) -> bool:
+        """Check that query can be coalesced.
+
+        :param query: query
+        :return: True for queries of read methods
+        """
+        return is_read_url(query.url)
+
+    def _batch_key(self, query) -> Optional[Hashable]:
+        """Key of batched query.
+
+        :param query: get query
+        :return: key value or None if query can't be batched
+        """
+        method = BATCH_METHODS.get(query.url)
+        if method is None or not self.max_batch:
+            return None
+        request_data = {
+            param: param_value
+            for param, param_value in query.request_data.items()
+            if param_value is not None
+        }
+        if list(request_data) != [method.key_field]:
+            return None
+        key_value = request_data[method.key_field]
+        if not isinstance(key_value, Hashable):
+            return None
+        return key_value
+
+    def _close(self, batch: _Batch):
+        """Stop adding keys to batch.
+
+        :param batch: batch
+        """
+        batch.closed = True
+        if self._batches.get(batch.query.url) is batch:
+            self._batches.pop(batch.query.url)
+
+    def _list_query(self, batch: _Batch):
+        """List query of batch.
+
+        :param batch: closed batch
+        :return: query with raw json response
+        """
+        list_query = copy(batch.query)
+        list_query.url = batch.method.list_url
+        list_query.return_constructor = dict
+        list_query.request_data = {
+            'filter.{field}.in'.format(field=batch.method.key_field):
+                json.dumps(list(batch.results)),
+            'page.rows': len(batch.results),
+            'page.number': 1,
+        }
+        return list_query
+
+    def _batch_rows(self, batch: _Batch, response_json) -> Dict[Any, Any]:
+        """Rows of batch list response by key value.
+
+        :param batch: batch
+        :param response_json: list response json
+        :return: response objects of found keys
+        """
+        key_field = batch.method.key_field
+        return {
+            row[key_field]: batch.query.return_constructor(row)
+            for row in response_json[batch.method.paginated_field]
+            if row.get(key_field) in batch.results
+        }
+
+
+class Coalescer(BaseCoalescer):
+    """Coalescing of get queries of concurrent threads."""
+
+    def __init__(self, *args, **kwargs):
+        """Init.
+
+        :param args: BaseCoalescer args
+        :param kwargs: BaseCoalescer kwargs
+        """
+        super().__init__(*args, **kwargs)
+        self._lock = Lock()
+
+    def get(self, query):
+        """Get response object of query.
+
+        :param query: query
+        :return: response object
+        :raises Exception: Query error
+        """
+        key = request_key(query)
+        with self._lock:
+            self._queries += 1
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._shared += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                leader = True
+        if not leader:
+            return future.result()
+        try:
+            query_result = self._get(query)
+        except BaseException as exc:  # NOQA:B902
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(query_result)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key)
+        return query_result
+
+    def _get(self, query):
+        """Get response object by batch or by query.
+
+        :param query: query
+        :return: response object
+        """
+        key_value = self._batch_key(query)
+        if key_value is None:
+            return query.get(coalesce=False, cache=False)
+        with self._lock:
+            batch = self._batches.get(query.url)
+            batch_leader = batch is None
+            if batch_leader:
+                batch = _Batch(query, BATCH_METHODS[query.url])
+                self._batches[query.url] = batch
+            future: Future = Future()
+            batch.results[key_value] = future  # type: ignore
+            if len(batch.results) >= self.max_batch:  # type: ignore
+                self._close(batch)  # type: ignore
+        if batch_leader:
+            sleep(self.window)
+            with self._lock:
+                self._close(batch)  # type: ignore
+            self._execute(batch)  # type: ignore
+        batch_result = future.result()
+        if batch_result is None:
+            # Not found by list
+            return query.get(coalesce=False, cache=False)
+        return batch_result
+
+    def _execute(self, batch: _Batch):
+        """Request rows of batch.
+
+        :param batch: closed batch
+        """
+        rows: Dict[Any, Any] = {}
+        try:
+            rows = self._batch_rows(
+                batch,
+                self._list_query(batch).get(coalesce=False, cache=False),
+            )
+        except Exception:  # NOQA:B902
+            # Keys are requested by get
+            logger.warning(
+                'Batch request of %s failed, keys are requested by get',
+                batch.method.list_url,
+                exc_info=True,
+            )
+        finally:
+            with self._lock:
+                self._batch_requests += 1
+                self._batched += len(rows)
+            for key_value, future in batch.results.items():
+                future.set_result(rows.get(key_value))
+
+
+class AsyncCoalescer(BaseCoalescer):
+    """Coalescing of get queries of concurrent tasks."""
+
+    async def get(self, query):
+        """Get response object of query.
+
+        :param query: async query
+        :return: response object
+        :raises Exception: Query error
+        """
+        key = request_key(query)
+        self._queries += 1
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._shared += 1
+            return await asyncio.shield(future)
+        future = asyncio.get_event_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            query_result = await self._get(query)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:  # NOQA:B902
+            future.set_exception(exc)
+            # Exception is retrieved by leader
+            future.exception()
+            raise
+        else:
+            future.set_result(query_result)
+        finally:
+            self._in_flight.pop(key)
+        return query_result
+
+    async def _get(self, query):
+        """Get response object by batch or by query.
+
+        :param query: async query
+        :return: response object
+        """
+        key_value = self._batch_key(query)
+        if key_value is None:
+            return await query.get(coalesce=False, cache=False)
+        batch = self._batches.get(query.url)
+        batch_leader = batch is None
+        if batch_leader:
+            batch = _Batch(query, BATCH_METHODS[query.url])
+            self._batches[query.url] = batch
+        future = asyncio.get_event_loop().create_future()
+        batch.results[key_value] = future  # type: ignore
+        if len(batch.results) >= self.max_batch:  # type: ignore
+            self._close(batch)  # type: ignore
+        if batch_leader:
+            await asyncio.sleep(self.window)
+            self._close(batch)  # type: ignore
+            await self._execute(batch)  # type: ignore
+        batch_result = await future
+        if batch_result is None:
+            # Not found by list
+            return await query.get(coalesce=False, cache=False)
+        return batch_result
+
+    async def _execute(self, batch: _Batch):
+        """Request rows of batch.
+
+        :param batch: closed batch
+        """
+        rows: Dict[Any, Any] = {}
+        try:
+            rows = self._batch_rows(
+                batch,
+                await self._list_query(batch).get(coalesce=False, cache=False),
+            )
+        except Exception:  # NOQA:B902
+            # Keys are requested by get
+            logger.warning(
+                'Batch request of %s failed, keys are requested by get',
+                batch.method.list_url,
+                exc_info=True,
+            )
+        finally:
+            self._batch_requests += 1
+            self._batched += len(rows)
+            for key_value, future in batch.results.items():
+                if not future.done():
+                    future.set_result(rows.get(key_value))
@@ -0,0 +1,306 @@
+"""Service namespaces built from endpoint specs.
+
+Generated namespace modules contain specs of service methods
+(url, params, query class, pagination field and errors)
+instead of python code of every method.
+Specs are tuples of constants (see Endpoint and Param fields),
+so they are loaded with module bytecode without any execution.
+Methods of namespace ENDPOINTS are created on first access.
+They have usual signatures and docstrings,
+stubs (.pyi) of generated modules describe them for static analysis.
+"""
+
+from inspect import Parameter, Signature
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from ambra_sdk.exceptions import service as service_exceptions
+from ambra_sdk.service import query as service_query
+
+
+class Param(NamedTuple):
+    """Parameter of service method."""
+
+    # Argument name
+    name: str
+    description: str = ''
+    optional: bool = False
+    # Name in request data (default is argument name)
+    request_name: Optional[str] = None
+    # Dict argument is sent as {prefix}{key}=value params
+    prefix: Optional[str] = None
+
+
+class Error(NamedTuple):
+    """Error of service method."""
+
+    error_type: str
+    error_subtype: Optional[str]
+    # Name of exception class (ambra_sdk.exceptions.service)
+    exception: str
+    description: str
+
+
+class Endpoint(NamedTuple):
+    """Spec of service method."""
+
+    name: str
+    url: str
+    # Name of query class (QueryO, QueryOPSF... of ambra_sdk.service.query)
+    query_class: str
+    # The first line of docstring
+    doc: str
+    # Param fields
+    params: Tuple[Tuple[Any, ...], ...] = ()
+    notes: Tuple[str, ...] = ()
+    # Error fields
+    errors: Tuple[Tuple[Any, ...], ...] = ()
+    required_sid: bool = False
+    paginated_field: Optional[str] = None
+
+
+def endpoint_params(endpoint: Endpoint) -> Tuple[Param, ...]:
+    """Params of method.
+
+    :param endpoint: endpoint spec
+    :return: params
+    """
+    return tuple(Param(*param_fields) for param_fields in endpoint.params)
+
+
+def errors_mapping(endpoint: Endpoint) -> MappingProxyType:
+    """Errors mapping of method queries.
+
+    :param endpoint: endpoint spec
+    :return: (error_type, error_subtype) => (exception class, description)
+    """
+    mapping = {}
+    for error_fields in endpoint.errors:
+        error = Error(*error_fields)
+        mapping[(error.error_type, error.error_subtype)] = (
+            getattr(service_exceptions, error.exception),
+            error.description,
+        )
+    return MappingProxyType(mapping)
+
+
+def endpoint_doc(endpoint: Endpoint, params: Tuple[Param, ...]) -> str:
+    """Docstring of method.
+
+    :param endpoint: endpoint spec
+    :param params: method params
+    :return: docstring
+    """
+    lines = [endpoint.doc]
+    if params:
+        lines.append('')
+        lines.extend(
+            ':param {name}: {description}'.format(
+                name=param.name,
+                description=param.description,
+            )
+            for param in params
+        )
+    if endpoint.notes:
+        lines.extend(('', 'Notes:'))
+        lines.extend(endpoint.notes)
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def endpoint_signature(params: Tuple[Param, ...]) -> Signature:
+    """Signature of method.
+
+    :param params: method params
+    :return: signature
+    """
+    parameters = [Parameter('self', Parameter.POSITIONAL_OR_KEYWORD)]
+    parameters.extend(
+        Parameter(
+            param.name,
+            Parameter.POSITIONAL_OR_KEYWORD,
+            default=None if param.optional else Parameter.empty,
+        )
+        for param in params
+    )
+    return Signature(parameters)
+
+
+def bind_arguments(  # NOQA:WPS231
+    endpoint: Endpoint,
+    params: Tuple[Param, ...],
+    param_names: FrozenSet[str],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Bind method arguments to param names.
+
+    :param endpoint: endpoint spec
+    :param params: method params
+    :param param_names: names of method params
+    :param args: positional arguments
+    :param kwargs: keyword arguments
+    :return: arguments by param name
+    :raises TypeError: Wrong arguments
+    """
+    if len(args) > len(params):
+        raise TypeError(
+            '{name}() takes {params} positional arguments '
+            'but {args} were given'.format(
+                name=endpoint.name,
+                params=len(params),
+                args=len(args),
+            ),
+        )
+    arguments = {
+        param.name: arg_value
+        for param, arg_value in zip(params, args)
+    }
+    for arg_name, arg_value in kwargs.items():
+        if arg_name not in param_names:
+            raise TypeError(
+                '{name}() got an unexpected keyword argument {arg!r}'.format(
+                    name=endpoint.name,
+                    arg=arg_name,
+                ),
+            )
+        if arg_name in arguments:
+            raise TypeError(
+                '{name}() got multiple values for argument {arg!r}'.format(
+                    name=endpoint.name,
+                    arg=arg_name,
+                ),
+            )
+        arguments[arg_name] = arg_value
+    missing = [
+        param.name for param in params
+        if not param.optional and param.name not in arguments
+    ]
+    if missing:
+        raise TypeError(
+            '{name}() missing required arguments: {args}'.format(
+                name=endpoint.name,
+                args=', '.join(repr(arg_name) for arg_name in missing),
+            ),
+        )
+    return arguments
+
+
+def endpoint_method(endpoint: Endpoint) -> Callable[..., Any]:
+    """Create method of endpoint.
+
+    :param endpoint: endpoint spec
+    :return: namespace method returning query
+    """
+    params = endpoint_params(endpoint)
+    # Request data is ordered by names of request params
+    usual_params = sorted(
+        (param.request_name or param.name, param.name)
+        for param in params
+        if param.prefix is None
+    )
+    dict_params = sorted(
+        (param.name, param.prefix)
+        for param in params
+        if param.prefix is not None
+    )
+    param_names = frozenset(param.name for param in params)
+    query_class = getattr(service_query, endpoint.query_class)
+    query_errors = errors_mapping(endpoint)
+
+    def method(self, *args, **kwargs):  # NOQA:WPS430
+        arguments = bind_arguments(
+            endpoint,
+            params,
+            param_names,
+            args,
+            kwargs,
+        )
+        request_data = {
+            request_name: arguments.get(arg_name)
+            for request_name, arg_name in usual_params
+        }
+        for arg_name, prefix in dict_params:
+            dict_value = arguments.get(arg_name)
+            if dict_value is not None:
+                request_data.update(
+                    (
+                        '{prefix}{key}'.format(prefix=prefix, key=key),
+                        param_value,
+                    )
+                    for key, param_value in dict_value.items()
+                )
+        query_data = {
+            'api': self._api,
+            'url': endpoint.url,
+            'request_data': request_data,
+            'errors_mapping': query_errors,
+            'required_sid': endpoint.required_sid,
+        }
+        if endpoint.paginated_field is not None:
+            query_data['paginated_field'] = endpoint.paginated_field
+        return query_class(**query_data)
+
+    method.__name__ = endpoint.name
+    method.__doc__ = endpoint_doc(endpoint, params)
+    method.__signature__ = endpoint_signature(params)  # type: ignore
+    return method
+
+
+class LazyMethod:
+    """Method of endpoint created on first access.
+
+    Created method replaces this descriptor in namespace class.
+    """
+
+    def __init__(self, endpoint: Endpoint, namespace_class: type):
+        """Init.
+
+        :param endpoint: endpoint spec
+        :param namespace_class: namespace class of method
+        """
+        self.endpoint = endpoint
+        self.namespace_class = namespace_class
+
+    def __get__(self, instance, owner=None):
+        """Create method.
+
+        :param instance: namespace
+        :param owner: namespace class
+        :return: method
+        """
+        method = endpoint_method(self.endpoint)
+        method.__module__ = self.namespace_class.__module__
+        method.__qualname__ = '{cls}.{name}'.format(
+            cls=self.namespace_class.__qualname__,
+            name=self.endpoint.name,
+        )
+        setattr(self.namespace_class, self.endpoint.name, method)
+        return method.__get__(instance, owner)
+
+
+class Namespace:
+    """Service namespace.
+
+    Subclasses define ENDPOINTS, methods are created from them.
+    """
+
+    # Endpoint fields
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...] = ()
+
+    def __init__(self, api):
+        """Init.
+
+        :param api: api
+        """
+        self._api = api
+
+    def __init_subclass__(cls, **kwargs):
+        """Add methods of endpoints.
+
+        :param kwargs: class kwargs
+        """
+        super().__init_subclass__(**kwargs)
+        for endpoint_fields in cls.__dict__.get('ENDPOINTS', ()):
+            endpoint = Endpoint(*endpoint_fields)
+            setattr(cls, endpoint.name, LazyMethod(endpoint, cls))
@@ -1,46 +1,58 @@
+"""Service entrypoint namespaces.
 
-from ambra_sdk.service.entrypoints.account import Account
-from ambra_sdk.service.entrypoints.activity import Activity
-from ambra_sdk.service.entrypoints.analytics import Analytics
-from ambra_sdk.service.entrypoints.annotation import Annotation
-from ambra_sdk.service.entrypoints.appointment import Appointment
-from ambra_sdk.service.entrypoints.audit import Audit
-from ambra_sdk.service.entrypoints.case import Case
-from ambra_sdk.service.entrypoints.customcode import Customcode
-from ambra_sdk.service.entrypoints.customfield import Customfield
-from ambra_sdk.service.entrypoints.destination import Destination
-from ambra_sdk.service.entrypoints.dicomdata import Dicomdata
-from ambra_sdk.service.entrypoints.dictionary import Dictionary
-from ambra_sdk.service.entrypoints.filter import Filter
-from ambra_sdk.service.entrypoints.group import Group
-from ambra_sdk.service.entrypoints.help import Help
-from ambra_sdk.service.entrypoints.hl7 import Hl7
-from ambra_sdk.service.entrypoints.keyimage import Keyimage
-from ambra_sdk.service.entrypoints.link import Link
-from ambra_sdk.service.entrypoints.location import Location
-from ambra_sdk.service.entrypoints.meeting import Meeting
-from ambra_sdk.service.entrypoints.message import Message
-from ambra_sdk.service.entrypoints.namespace import Namespace
-from ambra_sdk.service.entrypoints.node import Node
-from ambra_sdk.service.entrypoints.npi import Npi
-from ambra_sdk.service.entrypoints.order import Order
-from ambra_sdk.service.entrypoints.patient import Patient
-from ambra_sdk.service.entrypoints.purge import Purge
-from ambra_sdk.service.entrypoints.radreport import Radreport
-from ambra_sdk.service.entrypoints.radreportmacro import Radreportmacro
-from ambra_sdk.service.entrypoints.report import Report
-from ambra_sdk.service.entrypoints.role import Role
-from ambra_sdk.service.entrypoints.route import Route
-from ambra_sdk.service.entrypoints.rsna import Rsna
-from ambra_sdk.service.entrypoints.session import Session
-from ambra_sdk.service.entrypoints.setting import Setting
-from ambra_sdk.service.entrypoints.study import Study
-from ambra_sdk.service.entrypoints.tag import Tag
-from ambra_sdk.service.entrypoints.terminology import Terminology
-from ambra_sdk.service.entrypoints.training import Training
-from ambra_sdk.service.entrypoints.user import User
-from ambra_sdk.service.entrypoints.validate import Validate
-from ambra_sdk.service.entrypoints.webhook import Webhook
+Namespace classes are imported on first access:
+every namespace imports its big generated module.
+"""
+
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Namespace -> module of namespace
+NAMESPACE_MODULES = {
+    'Account': 'account',
+    'Activity': 'activity',
+    'Analytics': 'analytics',
+    'Annotation': 'annotation',
+    'Appointment': 'appointment',
+    'Audit': 'audit',
+    'Case': 'case',
+    'Customcode': 'customcode',
+    'Customfield': 'customfield',
+    'Destination': 'destination',
+    'Dicomdata': 'dicomdata',
+    'Dictionary': 'dictionary',
+    'Filter': 'filter',
+    'Group': 'group',
+    'Help': 'help',
+    'Hl7': 'hl7',
+    'Keyimage': 'keyimage',
+    'Link': 'link',
+    'Location': 'location',
+    'Meeting': 'meeting',
+    'Message': 'message',
+    'Namespace': 'namespace',
+    'Node': 'node',
+    'Npi': 'npi',
+    'Order': 'order',
+    'Patient': 'patient',
+    'Purge': 'purge',
+    'Radreport': 'radreport',
+    'Radreportmacro': 'radreportmacro',
+    'Report': 'report',
+    'Role': 'role',
+    'Route': 'route',
+    'Rsna': 'rsna',
+    'Session': 'session',
+    'Setting': 'setting',
+    'Study': 'study',
+    'Tag': 'tag',
+    'Terminology': 'terminology',
+    'Training': 'training',
+    'User': 'user',
+    'Validate': 'validate',
+    'Webhook': 'webhook',
+}
 
 __all__ = [
     'Session',
@@ -86,3 +98,78 @@ __all__ = [
     'Rsna',
     'Npi',
 ]
+
+if TYPE_CHECKING or sys.version_info < (3, 7):  # pragma: no cover
+    # Module __getattr__ is not supported (PEP 562)
+    from ambra_sdk.service.entrypoints.account import Account
+    from ambra_sdk.service.entrypoints.activity import Activity
+    from ambra_sdk.service.entrypoints.analytics import Analytics
+    from ambra_sdk.service.entrypoints.annotation import Annotation
+    from ambra_sdk.service.entrypoints.appointment import Appointment
+    from ambra_sdk.service.entrypoints.audit import Audit
+    from ambra_sdk.service.entrypoints.case import Case
+    from ambra_sdk.service.entrypoints.customcode import Customcode
+    from ambra_sdk.service.entrypoints.customfield import Customfield
+    from ambra_sdk.service.entrypoints.destination import Destination
+    from ambra_sdk.service.entrypoints.dicomdata import Dicomdata
+    from ambra_sdk.service.entrypoints.dictionary import Dictionary
+    from ambra_sdk.service.entrypoints.filter import Filter
+    from ambra_sdk.service.entrypoints.group import Group
+    from ambra_sdk.service.entrypoints.help import Help
+    from ambra_sdk.service.entrypoints.hl7 import Hl7
+    from ambra_sdk.service.entrypoints.keyimage import Keyimage
+    from ambra_sdk.service.entrypoints.link import Link
+    from ambra_sdk.service.entrypoints.location import Location
+    from ambra_sdk.service.entrypoints.meeting import Meeting
+    from ambra_sdk.service.entrypoints.message import Message
+    from ambra_sdk.service.entrypoints.namespace import Namespace
+    from ambra_sdk.service.entrypoints.node import Node
+    from ambra_sdk.service.entrypoints.npi import Npi
+    from ambra_sdk.service.entrypoints.order import Order
+    from ambra_sdk.service.entrypoints.patient import Patient
+    from ambra_sdk.service.entrypoints.purge import Purge
+    from ambra_sdk.service.entrypoints.radreport import Radreport
+    from ambra_sdk.service.entrypoints.radreportmacro import Radreportmacro
+    from ambra_sdk.service.entrypoints.report import Report
+    from ambra_sdk.service.entrypoints.role import Role
+    from ambra_sdk.service.entrypoints.route import Route
+    from ambra_sdk.service.entrypoints.rsna import Rsna
+    from ambra_sdk.service.entrypoints.session import Session
+    from ambra_sdk.service.entrypoints.setting import Setting
+    from ambra_sdk.service.entrypoints.study import Study
+    from ambra_sdk.service.entrypoints.tag import Tag
+    from ambra_sdk.service.entrypoints.terminology import Terminology
+    from ambra_sdk.service.entrypoints.training import Training
+    from ambra_sdk.service.entrypoints.user import User
+    from ambra_sdk.service.entrypoints.validate import Validate
+    from ambra_sdk.service.entrypoints.webhook import Webhook
+else:
+
+    def __getattr__(name: str):
+        """Import namespace class.
+
+        :param name: namespace name
+        :return: namespace class
+        :raises AttributeError: Unknown namespace
+        """
+        module_name = NAMESPACE_MODULES.get(name)
+        if module_name is None:
+            raise AttributeError(
+                'module {module} has no attribute {name}'.format(
+                    module=__name__,
+                    name=name,
+                ),
+            )
+        module = import_module(
+            '{package}.{module}'.format(package=__name__, module=module_name),
+        )
+        namespace_cls = getattr(module, name)
+        globals()[name] = namespace_cls
+        return namespace_cls
+
+    def __dir__():
+        """Module attributes.
+
+        :return: attribute names
+        """
+        return sorted(set(globals()) | set(__all__))
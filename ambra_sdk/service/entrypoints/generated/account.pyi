@@ -0,0 +1,385 @@
+""" Account.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Account(Namespace):
+    """Account."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        permissions: Any = None,
+    ) -> QueryOPSF:
+        """List.
+
+        :param permissions: Flag to return the users role and permissions in the accounts (optional)
+        """
+
+    def set(
+        self,
+        can_request: Any,
+        uuid: Any,
+        css: Any = None,
+        customfield_param: Any = None,
+        hl7_template: Any = None,
+        must_approve: Any = None,
+        must_approve_harvest: Any = None,
+        must_approve_move: Any = None,
+        must_approve_upload: Any = None,
+        name: Any = None,
+        no_share: Any = None,
+        password_expire: Any = None,
+        role_id: Any = None,
+        search_threshold: Any = None,
+        session_expire: Any = None,
+        setting_param: Any = None,
+        settings: Any = None,
+        share_code: Any = None,
+        share_description: Any = None,
+        share_settings: Any = None,
+        share_via_gateway: Any = None,
+        vanity: Any = None,
+        vendor: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param can_request: Flag if user can request to join the account
+        :param uuid: The account uuid
+        :param css: Custom CSS for the account (optional)
+        :param customfield_param: Custom field(s) (optional)
+        :param hl7_template: The HL7 reporting template for the account (optional)
+        :param must_approve: Flag if shared studies must be approved for the account namespace (optional)
+        :param must_approve_harvest: Flag if harvested studies must be approved (optional)
+        :param must_approve_move: Flag if moved studies must be approved (optional)
+        :param must_approve_upload: Flag if uploaded studies must be approved (optional)
+        :param name: Name of the account (optional)
+        :param no_share: Flag if studies can not be shared with this account (optional). Studies can still be shared with locations, groups and users in the account.
+        :param password_expire: Number of days before account passwords expire. No expiration if zero. (optional)
+        :param role_id: Id for the default role for the account (optional)
+        :param search_threshold: The number of studies record in the namespace to switch the UI from list to search mode (optional)
+        :param session_expire: Number of minutes before an idle session expires. (optional)
+        :param setting_param: Set an individual setting. This is an alternative to the settings hash for easier use in the API tester (optional)
+        :param settings: A hash of the account settings (optional)
+        :param share_code: The share code of the account (optional)
+        :param share_description: The share description of the account (optional)
+        :param share_settings: Share settings JSON structure of the share display settings (optional)
+        :param share_via_gateway: Flag if a gateway share is allowed (optional)
+        :param vanity: Vanity host name for the account. Multiple host names can be specified in a comma separate list (optional)
+        :param vendor: Vendor name (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+        brand_settings: Any = None,
+        permissions: Any = None,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The account uuid
+        :param brand_settings: A comma delimited list of the settings from /brand/get for this vanity to return (optional)
+        :param permissions: Flag to return the users role and permissions in the accounts (optional)
+        """
+
+    def user_add(
+        self,
+        uuid: Any,
+        account_alias: Any = None,
+        account_email: Any = None,
+        account_login: Any = None,
+        account_password: Any = None,
+        email: Any = None,
+        event_approve: Any = None,
+        event_case_assignment: Any = None,
+        event_harvest: Any = None,
+        event_join: Any = None,
+        event_link: Any = None,
+        event_link_mine: Any = None,
+        event_message: Any = None,
+        event_new_report: Any = None,
+        event_node: Any = None,
+        event_purge: Any = None,
+        event_report_remove: Any = None,
+        event_share: Any = None,
+        event_status_change: Any = None,
+        event_study_comment: Any = None,
+        event_thin_study_fail: Any = None,
+        event_thin_study_success: Any = None,
+        event_upload: Any = None,
+        event_upload_fail: Any = None,
+        global_param: Any = None,
+        max_sessions: Any = None,
+        password_reset: Any = None,
+        role_id: Any = None,
+        session_expire: Any = None,
+        setting_param: Any = None,
+        settings: Any = None,
+        user_id: Any = None,
+    ) -> QueryO:
+        """User add.
+
+        :param uuid: The account uuid
+        :param account_alias: Users alias in the account. (optional).
+        :param account_email: Users account_email. Only set this if it is different than the users login email (optional).
+        :param account_login: Users login name in the account. (optional).
+        :param account_password: Password for the account_password. (optional).
+        :param email: email
+        :param event_approve: Notify the user on a approval needed into the account namespace (optional)
+        :param event_case_assignment: Notify the user when they are assigned a case as a medical or admin user (optional)
+        :param event_harvest: Notify the user on a harvest into the account namespace (optional)
+        :param event_join: Notify the user on a join request for the account (optional)
+        :param event_link: Notify the user when an anonymous link is hit in the namespace (optional)
+        :param event_link_mine: Notify the user when an anonymous link created by the user is hit in the namespace (optional)
+        :param event_message: Notify the user when a message is sent to the account namespace (optional)
+        :param event_new_report: Notify the user when a report is attached in the account namespace (optional)
+        :param event_node: Notify the user when an account node sends an event (optional)
+        :param event_purge: Notify the user the results of a purge job for the account (optional)
+        :param event_report_remove: Notify the user when a report is removed in the account namespace (optional)
+        :param event_share: Notify the user on a share into the account namespace (optional)
+        :param event_status_change: Notify the user when the status of a study is changed (optional)
+        :param event_study_comment: Notify the user when a comment is attached to a study in the namespace (optional)
+        :param event_thin_study_fail: Notify the user when a thin study retrieval they initiated fails (optional)
+        :param event_thin_study_success: Notify the user when a thin study retrieval they initiated succeeds (optional)
+        :param event_upload: Notify the user on an upload into the account namespace (optional)
+        :param event_upload_fail: Notify the user on a failed upload into the account namespace (optional)
+        :param global_param: Flag if this is a global user. (optional).
+        :param max_sessions: Over-ride value for the max number of simultaneous sessions the user can have. (optional).
+        :param password_reset: Flag if the password needs to be reset. (optional).
+        :param role_id: uuid of the users role in the account (optional).
+        :param session_expire: Number of minutes before an idle session expires. (optional)
+        :param setting_param: Set an individual setting. This is an alternative to the settings hash for easier use in the API tester (optional)
+        :param settings: A hash of the account settings that the user can override (optional)
+        :param user_id: user_id
+
+        Notes:
+        (email OR user_id) - The email address or uuid of the user to add
+        """
+
+    def user_set(
+        self,
+        user_id: Any,
+        uuid: Any,
+        account_alias: Any = None,
+        account_email: Any = None,
+        account_login: Any = None,
+        account_password: Any = None,
+        customfield_param: Any = None,
+        event_approve: Any = None,
+        event_case_assignment: Any = None,
+        event_harvest: Any = None,
+        event_join: Any = None,
+        event_link: Any = None,
+        event_link_mine: Any = None,
+        event_message: Any = None,
+        event_new_report: Any = None,
+        event_node: Any = None,
+        event_purge: Any = None,
+        event_report_remove: Any = None,
+        event_share: Any = None,
+        event_status_change: Any = None,
+        event_study_comment: Any = None,
+        event_thin_study_fail: Any = None,
+        event_thin_study_success: Any = None,
+        event_upload: Any = None,
+        event_upload_fail: Any = None,
+        global_param: Any = None,
+        max_sessions: Any = None,
+        password_reset: Any = None,
+        role_id: Any = None,
+        session_expire: Any = None,
+        setting_param: Any = None,
+        settings: Any = None,
+    ) -> QueryO:
+        """User set.
+
+        :param user_id: The users uuid
+        :param uuid: The account uuid
+        :param account_alias: Users alias in the account. (optional).
+        :param account_email: Users account_email. Only set this if it is different than the users login email (optional).
+        :param account_login: Users login name in the account. (optional).
+        :param account_password: Password for the account_password. (optional).
+        :param customfield_param: Custom field(s) (optional)
+        :param event_approve: Notify the user on a approval needed into the account namespace (optional)
+        :param event_case_assignment: Notify the user when they are assigned a case as a medical or admin user (optional)
+        :param event_harvest: Notify the user on a harvest into the account namespace (optional)
+        :param event_join: Notify the user on a join request for the account (optional)
+        :param event_link: Notify the user when an anonymous link is hit in the namespace (optional)
+        :param event_link_mine: Notify the user when an anonymous link created by the user is hit in the namespace (optional)
+        :param event_message: Notify the user when a message is sent to the account namespace (optional)
+        :param event_new_report: Notify the user when a report is attached in the account namespace (optional)
+        :param event_node: Notify the user when an account node sends an event (optional)
+        :param event_purge: Notify the user the results of a purge job for the account (optional)
+        :param event_report_remove: Notify the user when a report is removed in the account namespace (optional)
+        :param event_share: Notify the user on a share into the account namespace (optional)
+        :param event_status_change: Notify the user when the status of a study is changed (optional)
+        :param event_study_comment: Notify the user when a comment is attached to a study in the namespace (optional)
+        :param event_thin_study_fail: Notify the user when a thin study retrieval they initiated fails (optional)
+        :param event_thin_study_success: Notify the user when a thin study retrieval they initiated succeeds (optional)
+        :param event_upload: Notify the user on an upload into the account namespace (optional)
+        :param event_upload_fail: Notify the user on a failed upload into the account namespace (optional)
+        :param global_param: Flag if this is a global user. (optional).
+        :param max_sessions: Over-ride value for the max number of simultaneous sessions the user can have. (optional).
+        :param password_reset: Flag if the password needs to be reset. (optional).
+        :param role_id: uuid of the users role in the account (optional).
+        :param session_expire: Number of minutes before an idle session expires. (optional)
+        :param setting_param: Set an individual setting. This is an alternative to the settings hash for easier use in the API tester (optional)
+        :param settings: A hash of the account settings that the user can override (optional)
+        """
+
+    def user_get(
+        self,
+        user_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """User get.
+
+        :param user_id: The users uuid
+        :param uuid: The account uuid
+        """
+
+    def user_delete(
+        self,
+        user_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """User delete.
+
+        :param user_id: The user uuid
+        :param uuid: The account uuid
+        """
+
+    def user_list(
+        self,
+        uuid: Any,
+    ) -> QueryOPSF:
+        """User list.
+
+        :param uuid: The account uuid
+        """
+
+    def user_report_login(
+        self,
+        uuid: Any,
+        user_id: Any = None,
+    ) -> QueryO:
+        """User report login.
+
+        :param uuid: The account uuid
+        :param user_id: Limit to this user_id (optional)
+        """
+
+    def can_share(
+        self,
+        account_id: Any,
+        by_id: Any,
+        by_type: Any,
+        with_id: Any,
+        with_type: Any,
+    ) -> QueryO:
+        """Can share.
+
+        :param account_id: The account id
+        :param by_id: The uuid of the object that can share
+        :param by_type: The type of object that can share. (user|account|group|location)
+        :param with_id: The uuid of the object that they can share with
+        :param with_type: The type of object that they can share with (user|account|group|location)
+        """
+
+    def can_share_stop(
+        self,
+        account_id: Any,
+        by_id: Any,
+        by_type: Any,
+        with_id: Any,
+        with_type: Any,
+    ) -> QueryO:
+        """Can share stop.
+
+        :param account_id: The account id
+        :param by_id: The uuid of the object that can share
+        :param by_type: The type of object that can share. (user|account|group|location)
+        :param with_id: The uuid of the object that they can share with
+        :param with_type: The type of object that they can share with (user|account|group|location)
+        """
+
+    def can_share_list(
+        self,
+        account_id: Any,
+    ) -> QueryO:
+        """Can share list.
+
+        :param account_id: The account id
+        """
+
+    def css(
+        self,
+        account_id: Any = None,
+        vanity: Any = None,
+    ) -> QueryO:
+        """Css.
+
+        :param account_id: account_id
+        :param vanity: vanity
+
+        Notes:
+        (account_id OR vanity) - The account_id or vanity name to get the css for (optional)
+        """
+
+    def settings(
+        self,
+        account_id: Any = None,
+        brand_settings: Any = None,
+        namespace_id: Any = None,
+        settings: Any = None,
+        vanity: Any = None,
+    ) -> QueryO:
+        """Settings.
+
+        :param account_id: account_id
+        :param brand_settings: A comma delimited list of the settings from /brand/get for this vanity to return (optional)
+        :param namespace_id: Apply overrides for the namespace (optional)
+        :param settings: A comma delimited list of the settings to return (optional)
+        :param vanity: vanity
+
+        Notes:
+        (account_id OR vanity) - The account_id or vanity name to get the settings for
+        """
+
+    def connect(
+        self,
+        code: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Connect.
+
+        :param code: The OAuth code
+        :param uuid: The account_id
+        """
+
+    def md5_counter(
+        self,
+        md5: Any,
+        uuid: Any,
+        node_id: Any = None,
+        serial_no: Any = None,
+    ) -> QueryO:
+        """Md5 counter.
+
+        :param md5: The MD5 value
+        :param uuid: UUID of the account (only needed for sid authentication)
+        :param node_id: node_id
+        :param serial_no: serial_no
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either a sid or the node id and serial number
+        """
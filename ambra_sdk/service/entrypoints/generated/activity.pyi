@@ -0,0 +1,56 @@
+""" Activity.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOF
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Activity(Namespace):
+    """Activity."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+        strict_account_filter: Any = None,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: Limit to activities in this account and the personal activities
+        :param strict_account_filter: Flag to apply the account_id to personal activites as well (optional)
+        """
+
+    def list_count(
+        self,
+        account_id: Any,
+    ) -> QueryOF:
+        """List count.
+
+        :param account_id: Limit to activities in this account and the personal activities
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The activity uuid
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The activity uuid
+        """
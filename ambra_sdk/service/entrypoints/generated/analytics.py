@@ -3,143 +3,90 @@
 Do not edit this file by hand.
 This is generated by parsing api.html service doc.
 """
-from ambra_sdk.exceptions.service import InvalidCount
-from ambra_sdk.exceptions.service import InvalidEndDate
-from ambra_sdk.exceptions.service import InvalidParameters
-from ambra_sdk.exceptions.service import InvalidPeriod
-from ambra_sdk.exceptions.service import MissingFields
-from ambra_sdk.exceptions.service import NotFound
-from ambra_sdk.exceptions.service import NotPermitted
-from ambra_sdk.service.query import QueryO
 
-class Analytics:
-    """Analytics."""
+from ambra_sdk.service.endpoint import Namespace
 
-    def __init__(self, api):
-        self._api = api
 
-    
-    def study(
-        self,
-        count,
-        period,
-        account_id=None,
-        end_date=None,
-        namespace_id=None,
-    ):
-        """Study.
-        :param count: The number of periods to get
-        :param period: The time period (day|week|month|year)
-        :param account_id: account_id
-        :param end_date: The end date, default is today if not passed (optional)
-        :param namespace_id: namespace_id
+class Analytics(Namespace):
+    """Analytics."""
 
-        Notes:
-        (account_id OR namespace_id) - The account or namespace to get the analytics for
-        """
-        request_data = {
-           'account_id': account_id,
-           'count': count,
-           'end_date': end_date,
-           'namespace_id': namespace_id,
-           'period': period,
-        }
-	
-        errors_mapping = {}
-        errors_mapping[('INVALID_COUNT', None)] = InvalidCount('Invalid or excessive count value')
-        errors_mapping[('INVALID_END_DATE', None)] = InvalidEndDate('An invalid period')
-        errors_mapping[('INVALID_PARAMETERS', None)] = InvalidParameters('Only pass a account_id or namespace_id')
-        errors_mapping[('INVALID_PERIOD', None)] = InvalidPeriod('An invalid period')
-        errors_mapping[('MISSING_FIELDS', None)] = MissingFields('A required field is missing or does not have data in it. The error_subtype holds a array of all the missing fields')
-        errors_mapping[('NOT_FOUND', None)] = NotFound('The account or namespace can not be found')
-        errors_mapping[('NOT_PERMITTED', None)] = NotPermitted('You are not permitted to view analytics for this account or namespace')
-        query_data = {
-            'api': self._api,
-            'url': '/analytics/study',
-            'request_data': request_data,
-            'errors_mapping': errors_mapping,
-            'required_sid': True,
-        }
-        return QueryO(**query_data)
-    
-    def patient_portal(
-        self,
-        account_id,
-        count,
-        period,
-        end_date=None,
-        patient_id=None,
-    ):
-        """Patient portal.
-        :param account_id: The account id
-        :param count: The number of periods to get
-        :param period: The time period (day|week|month|year)
-        :param end_date: The end date, default is today if not passed (optional)
-        :param patient_id: Patient filter (optional)
-        """
-        request_data = {
-           'account_id': account_id,
-           'count': count,
-           'end_date': end_date,
-           'patient_id': patient_id,
-           'period': period,
-        }
-	
-        errors_mapping = {}
-        errors_mapping[('INVALID_COUNT', None)] = InvalidCount('Invalid or excessive count value')
-        errors_mapping[('INVALID_END_DATE', None)] = InvalidEndDate('An invalid period')
-        errors_mapping[('INVALID_PERIOD', None)] = InvalidPeriod('An invalid period')
-        errors_mapping[('MISSING_FIELDS', None)] = MissingFields('A required field is missing or does not have data in it. The error_subtype holds a array of all the missing fields')
-        errors_mapping[('NOT_FOUND', None)] = NotFound('The account or patient can not be found')
-        errors_mapping[('NOT_PERMITTED', None)] = NotPermitted('You are not permitted to view analytics for this account or namespace')
-        query_data = {
-            'api': self._api,
-            'url': '/analytics/patient/portal',
-            'request_data': request_data,
-            'errors_mapping': errors_mapping,
-            'required_sid': True,
-        }
-        return QueryO(**query_data)
-    
-    def radreport(
-        self,
-        account_id,
-        count,
-        period,
-        end_date=None,
-        namespace_id=None,
-        user_id=None,
-    ):
-        """Radreport.
-        :param account_id: The account id
-        :param count: The number of periods to get
-        :param period: The time period (day|week|month|year)
-        :param end_date: The end date, default is today if not passed (optional)
-        :param namespace_id: Namespace filter (optional)
-        :param user_id: User filter (optional)
-        """
-        request_data = {
-           'account_id': account_id,
-           'count': count,
-           'end_date': end_date,
-           'namespace_id': namespace_id,
-           'period': period,
-           'user_id': user_id,
-        }
-	
-        errors_mapping = {}
-        errors_mapping[('INVALID_COUNT', None)] = InvalidCount('Invalid or excessive count value')
-        errors_mapping[('INVALID_END_DATE', None)] = InvalidEndDate('An invalid period')
-        errors_mapping[('INVALID_PERIOD', None)] = InvalidPeriod('An invalid period')
-        errors_mapping[('MISSING_FIELDS', None)] = MissingFields('A required field is missing or does not have data in it. The error_subtype holds a array of all the missing fields')
-        errors_mapping[('NOT_FOUND', None)] = NotFound('The account or patient can not be found')
-        errors_mapping[('NOT_PERMITTED', None)] = NotPermitted('You are not permitted to view analytics for this account or namespace')
-        query_data = {
-            'api': self._api,
-            'url': '/analytics/radreport',
-            'request_data': request_data,
-            'errors_mapping': errors_mapping,
-            'required_sid': True,
-        }
-        return QueryO(**query_data)
-    
\ No newline at end of file
+    # name, url, query class, doc, params, notes, errors,
+    # required sid, paginated field (see ambra_sdk.service.endpoint)
+    ENDPOINTS = (
+        (
+            'study',
+            '/analytics/study',
+            'QueryO',
+            'Study.',
+            (
+                ('count', 'The number of periods to get', False, None, None),
+                ('period', 'The time period (day|week|month|year)', False, None, None),
+                ('account_id', 'account_id', True, None, None),
+                ('end_date', 'The end date, default is today if not passed (optional)', True, None, None),
+                ('namespace_id', 'namespace_id', True, None, None),
+            ),
+            (
+                '(account_id OR namespace_id) - The account or namespace to get the analytics for',
+            ),
+            (
+                ('INVALID_COUNT', None, 'InvalidCount', 'Invalid or excessive count value'),
+                ('INVALID_END_DATE', None, 'InvalidEndDate', 'An invalid period'),
+                ('INVALID_PARAMETERS', None, 'InvalidParameters', 'Only pass a account_id or namespace_id'),
+                ('INVALID_PERIOD', None, 'InvalidPeriod', 'An invalid period'),
+                ('MISSING_FIELDS', None, 'MissingFields', 'A required field is missing or does not have data in it. The error_subtype holds a array of all the missing fields'),
+                ('NOT_FOUND', None, 'NotFound', 'The account or namespace can not be found'),
+                ('NOT_PERMITTED', None, 'NotPermitted', 'You are not permitted to view analytics for this account or namespace'),
+            ),
+            True,
+            None,
+        ),
+        (
+            'patient_portal',
+            '/analytics/patient/portal',
+            'QueryO',
+            'Patient portal.',
+            (
+                ('account_id', 'The account id', False, None, None),
+                ('count', 'The number of periods to get', False, None, None),
+                ('period', 'The time period (day|week|month|year)', False, None, None),
+                ('end_date', 'The end date, default is today if not passed (optional)', True, None, None),
+                ('patient_id', 'Patient filter (optional)', True, None, None),
+            ),
+            (),
+            (
+                ('INVALID_COUNT', None, 'InvalidCount', 'Invalid or excessive count value'),
+                ('INVALID_END_DATE', None, 'InvalidEndDate', 'An invalid period'),
+                ('INVALID_PERIOD', None, 'InvalidPeriod', 'An invalid period'),
+                ('MISSING_FIELDS', None, 'MissingFields', 'A required field is missing or does not have data in it. The error_subtype holds a array of all the missing fields'),
+                ('NOT_FOUND', None, 'NotFound', 'The account or patient can not be found'),
+                ('NOT_PERMITTED', None, 'NotPermitted', 'You are not permitted to view analytics for this account or namespace'),
+            ),
+            True,
+            None,
+        ),
+        (
+            'radreport',
+            '/analytics/radreport',
+            'QueryO',
+            'Radreport.',
+            (
+                ('account_id', 'The account id', False, None, None),
+                ('count', 'The number of periods to get', False, None, None),
+                ('period', 'The time period (day|week|month|year)', False, None, None),
+                ('end_date', 'The end date, default is today if not passed (optional)', True, None, None),
+                ('namespace_id', 'Namespace filter (optional)', True, None, None),
+                ('user_id', 'User filter (optional)', True, None, None),
+            ),
+            (),
+            (
+                ('INVALID_COUNT', None, 'InvalidCount', 'Invalid or excessive count value'),
+                ('INVALID_END_DATE', None, 'InvalidEndDate', 'An invalid period'),
+                ('INVALID_PERIOD', None, 'InvalidPeriod', 'An invalid period'),
+                ('MISSING_FIELDS', None, 'MissingFields', 'A required field is missing or does not have data in it. The error_subtype holds a array of all the missing fields'),
+                ('NOT_FOUND', None, 'NotFound', 'The account or patient can not be found'),
+                ('NOT_PERMITTED', None, 'NotPermitted', 'You are not permitted to view analytics for this account or namespace'),
+            ),
+            True,
+            None,
+        ),
+    )
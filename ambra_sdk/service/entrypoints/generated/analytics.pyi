@@ -0,0 +1,72 @@
+""" Analytics.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Analytics(Namespace):
+    """Analytics."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def study(
+        self,
+        count: Any,
+        period: Any,
+        account_id: Any = None,
+        end_date: Any = None,
+        namespace_id: Any = None,
+    ) -> QueryO:
+        """Study.
+
+        :param count: The number of periods to get
+        :param period: The time period (day|week|month|year)
+        :param account_id: account_id
+        :param end_date: The end date, default is today if not passed (optional)
+        :param namespace_id: namespace_id
+
+        Notes:
+        (account_id OR namespace_id) - The account or namespace to get the analytics for
+        """
+
+    def patient_portal(
+        self,
+        account_id: Any,
+        count: Any,
+        period: Any,
+        end_date: Any = None,
+        patient_id: Any = None,
+    ) -> QueryO:
+        """Patient portal.
+
+        :param account_id: The account id
+        :param count: The number of periods to get
+        :param period: The time period (day|week|month|year)
+        :param end_date: The end date, default is today if not passed (optional)
+        :param patient_id: Patient filter (optional)
+        """
+
+    def radreport(
+        self,
+        account_id: Any,
+        count: Any,
+        period: Any,
+        end_date: Any = None,
+        namespace_id: Any = None,
+        user_id: Any = None,
+    ) -> QueryO:
+        """Radreport.
+
+        :param account_id: The account id
+        :param count: The number of periods to get
+        :param period: The time period (day|week|month|year)
+        :param end_date: The end date, default is today if not passed (optional)
+        :param namespace_id: Namespace filter (optional)
+        :param user_id: User filter (optional)
+        """
@@ -0,0 +1,92 @@
+""" Annotation.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Annotation(Namespace):
+    """Annotation."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        phi_namespace: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """List.
+
+        :param phi_namespace: phi_namespace
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+
+        Notes:
+        (study_id OR study_uid AND storage_namespace AND phi_namespace) The uuid of the study or the storage triplet
+        """
+
+    def add(
+        self,
+        frame_number: Any,
+        instance_uid: Any,
+        series_uid: Any,
+        json: Any = None,
+        phi_namespace: Any = None,
+        stamp: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param frame_number: The frame number
+        :param instance_uid: The instance uid
+        :param series_uid: The series uid
+        :param json: json
+        :param phi_namespace: phi_namespace
+        :param stamp: stamp
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+
+        Notes:
+        (json OR stamp) - The JSON annotation data structure or the stamp flag
+        (study_id OR study_uid AND storage_namespace AND phi_namespace) The uuid of the study or the storage triplet
+        """
+
+    def set(
+        self,
+        json: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Set.
+
+        :param json: The JSON annotation data structure
+        :param uuid: Id of the annotation
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: Id of the annotation
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: Id of the annotation
+        """
@@ -0,0 +1,84 @@
+""" Appointment.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Appointment(Namespace):
+    """Appointment."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def add(
+        self,
+        account_id: Any,
+        end_time: Any,
+        patient_id: Any,
+        start_time: Any,
+        customfield_param: Any = None,
+        description: Any = None,
+        user_id: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account to add them to
+        :param end_time: End date and time of the appointment
+        :param patient_id: Id of the patient to create the appointment for
+        :param start_time: Start date and time of the appointment
+        :param customfield_param: Custom field(s) (optional)
+        :param description: Description of the appointment (optional)
+        :param user_id: Id of the user to create the appointment for (optional defaults to current user)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The appointment uuid
+        """
+
+    def set(
+        self,
+        customfields: Any,
+        description: Any,
+        end_time: Any,
+        start_time: Any,
+        user_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Set.
+
+        :param customfields: An array of the custom fields associated with this appointment. Each object has the following fields (This is only returned if the group has custom fields)
+        :param description: Description of the appointment
+        :param end_time: End date and time of the appointment
+        :param start_time: Start date and time of the appointment
+        :param user_id: Id of the user
+        :param uuid: The appointment uuid
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The appointment uuid
+        """
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
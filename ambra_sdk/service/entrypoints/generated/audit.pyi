@@ -0,0 +1,94 @@
+""" Audit.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOP
+from ambra_sdk.service.query import QueryOPF
+
+
+class Audit(Namespace):
+    """Audit."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def object(
+        self,
+        uuid: Any,
+        customfield_detail: Any = None,
+        download: Any = None,
+        reverse: Any = None,
+    ) -> QueryOPF:
+        """Object.
+
+        :param uuid: The uuid of the object to audit
+        :param customfield_detail: Flag to include the customfield name in the detail (optional)
+        :param download: Flag to create a zipped CSV file. A report_id will be returned and the file can be accessed via /report/status and /report/zip (optional)
+        :param reverse: Flag to reverse the default sort order (optional)
+        """
+
+    def user(
+        self,
+        account_id: Any,
+        user_id: Any,
+        download: Any = None,
+        reverse: Any = None,
+    ) -> QueryOP:
+        """User.
+
+        :param account_id: The id of the account
+        :param user_id: The id of the user to audit
+        :param download: Flag to create a zipped CSV file. A report_id will be returned and the file can be accessed via /report/status and /report/zip (optional)
+        :param reverse: Flag to reverse the default sort order (optional)
+        """
+
+    def account(
+        self,
+        account_id: Any,
+        download: Any = None,
+        reverse: Any = None,
+    ) -> QueryOPF:
+        """Account.
+
+        :param account_id: The id of the account
+        :param download: Flag to create a zipped CSV file. A report_id will be returned and the file can be accessed via /report/status and /report/zip (optional)
+        :param reverse: Flag to reverse the default sort order (optional)
+        """
+
+    def deleted(
+        self,
+        account_id: Any,
+        type: Any,
+    ) -> QueryOP:
+        """Deleted.
+
+        :param account_id: The id of the account
+        :param type: The type of the object (Study|User etc.)
+        """
+
+    def log(
+        self,
+        bucket: Any,
+        logged_params: Any,
+    ) -> QueryO:
+        """Log.
+
+        :param bucket: Name of the bucket to log to
+        :param logged_params: Dict of parameters. They are logged to a message in the bucket
+        """
+
+    def failedlogins(
+        self,
+        account_id: Any,
+        from_time: Any = None,
+    ) -> QueryO:
+        """Failedlogins.
+
+        :param account_id: The id of the account
+        :param from_time: Only return events after the epoch time (optional)
+        """
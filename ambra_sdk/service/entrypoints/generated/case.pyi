@@ -0,0 +1,107 @@
+""" Case.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Case(Namespace):
+    """Case."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The case uuid
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        assigned_admin_id: Any = None,
+        assigned_medical_id: Any = None,
+        case_status: Any = None,
+        closed: Any = None,
+        completed: Any = None,
+        customfield_param: Any = None,
+        name: Any = None,
+        submitted: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: The case uuid
+        :param assigned_admin_id: Id of the admin user assigned to the case (optional)
+        :param assigned_medical_id: Id of the medical user assigned to the case (optional)
+        :param case_status: The case status (optional)
+        :param closed: Flag if the case is closed (optional)
+        :param completed: Flag if the case is completed (optional)
+        :param customfield_param: Custom field(s) (optional)
+        :param name: case name (optional)
+        :param submitted: Flag if the case is submitted (optional)
+
+        Notes:
+        The rest of the fields can not be set by the case owner
+        """
+
+    def return_method(
+        self,
+        reason: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Return.
+
+        :param reason: The reason the case was returned
+        :param uuid: The case uuid
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The case uuid
+        """
+
+    def list(
+        self,
+        account_id: Any = None,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account (optional)
+        """
+
+    def attach(
+        self,
+        study_id: Any,
+        uuid: Any,
+        detach: Any = None,
+    ) -> QueryO:
+        """Attach.
+
+        :param study_id: Study uuid
+        :param uuid: Case uuid
+        :param detach: Flag to detach the study from the case (optional)
+        """
+
+    def price(
+        self,
+        share_code: Any,
+        customfield_param: Any = None,
+    ) -> QueryO:
+        """Price.
+
+        :param share_code: The share code of the second opinion namespace.
+        :param customfield_param: Custom field(s) defined for the case objects with values stated in the second opinion wizard (optional)
+        """
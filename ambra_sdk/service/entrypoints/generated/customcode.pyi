@@ -0,0 +1,132 @@
+""" Customcode.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Customcode(Namespace):
+    """Customcode."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def add(
+        self,
+        code: Any,
+        language: Any,
+        name: Any,
+        type: Any,
+        settings: Any = None,
+        zip: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param code: The code
+        :param language: Language of code (PYTHON)
+        :param name: The name of the code
+        :param type: Type of code (AI_CUSTOM_VALIDATION_CODE)
+        :param settings: JSON hash of settings (optional)
+        :param zip: Base64 encoded ZIP file (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The code uuid
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        code: Any = None,
+        name: Any = None,
+        settings: Any = None,
+        zip: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: The code uuid
+        :param code: The code (optional)
+        :param name: The name of the code (optional)
+        :param settings: JSON hash of settings (optional)
+        :param zip: Base64 encoded ZIP file (optional)
+        """
+
+    def zip(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Zip.
+
+        :param uuid: The code uuid
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The code uuid
+        """
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def deploy(
+        self,
+        namespace_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Deploy.
+
+        :param namespace_id: uuid of the namespace
+        :param uuid: uuid of the customcode
+        """
+
+    def undeploy(
+        self,
+        deployment_id: Any,
+    ) -> QueryO:
+        """Undeploy.
+
+        :param deployment_id: Deployment uuid
+        """
+
+    def deploy_get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Deploy get.
+
+        :param uuid: uuid of customcode deployment
+        """
+
+    def deploy_list(
+        self,
+        customcode_id: Any = None,
+        namespace_id: Any = None,
+    ) -> QueryOPSF:
+        """Deploy list.
+
+        :param customcode_id: customcode_id
+        :param namespace_id: namespace_id
+
+        Notes:
+        (namespace_id OR customcode_id) - uuid of either the namespace or customcode to show the deployments for
+        """
@@ -0,0 +1,152 @@
+""" Customfield.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Customfield(Namespace):
+    """Customfield."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        capture_on_share_code: Any,
+        display_order: Any,
+        name: Any,
+        object: Any,
+        required: Any,
+        type: Any,
+        wrapped_dicom_only: Any,
+        dicom_tag: Any = None,
+        dicom_tag_ignore_empty: Any = None,
+        hl7_component: Any = None,
+        hl7_field: Any = None,
+        hl7_segment: Any = None,
+        load_dicom_tag: Any = None,
+        load_from_sr: Any = None,
+        load_hl7: Any = None,
+        load_hl7_filter: Any = None,
+        options: Any = None,
+        other_dicom_tags: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account
+        :param capture_on_share_code: Flag if the field should be captured during a share code exchange (only applicable to study fields)
+        :param display_order: Integer to order how the fields should be displayed
+        :param name: Name of the customfield
+        :param object: The object to associate the customfield with (Study|User_account|Group|Location|Account|Patient|Case|Order|Appointment|Dicomdata)
+        :param required: Flag if the field is required
+        :param type: Type of the custom field (text|number|date|memo|select|multiselect|radio|checkbox|search)
+        :param wrapped_dicom_only: Only capture for wrapped DICOM uploads during a share code exchange
+        :param dicom_tag: DICOM tag to map this field to. Format should be of form (1234,1234). (only applicable to study fields) (optional)
+        :param dicom_tag_ignore_empty: Flag to not map an empty custom field to the DICOM tag. (only applicable if a dicom_tag is specified) (optional)
+        :param hl7_component: Component number to map  this field to in HL7 ORM messages. Valid values are 1 to 64. (only applicable to study fields) (optional)
+        :param hl7_field: Segment field number to map  this field to in HL7 ORM messages. Valid values are 1 to 64. (only applicable to study fields) (optional)
+        :param hl7_segment: Segment to map this field to in HL7 ORM messages. Valid values are (NTE|PID|PID1|PV1|PV2|OBR|DG1|OBX|CTI|BLG|ORC) (only applicable to study fields) (optional)
+        :param load_dicom_tag: Flag to load the current value from the study into this field. (only applicable if a dicom_tag is specified) (optional)
+        :param load_from_sr: Load the value from the structured reports in the study (only applicable to study fields) .(optional)
+        :param load_hl7: If this is set to a HL7 message type the value of this field will be updated from the hl7_segment, hl7_field and hl7_component from incoming HL7 messages of the matching message type (only applicable to study fields) (optional)
+        :param load_hl7_filter: Filter token for the load_hl7 option (only applicable to study fields) (optional)
+        :param options: Additional options in JSON format (optional)
+        :param other_dicom_tags: JSON array of other DICOM tags to map this field to. (only applicable to study fields) (optional)
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        capture_on_share_code: Any = None,
+        dicom_tag: Any = None,
+        dicom_tag_ignore_empty: Any = None,
+        display_order: Any = None,
+        hl7_component: Any = None,
+        hl7_field: Any = None,
+        hl7_segment: Any = None,
+        load_dicom_tag: Any = None,
+        load_from_sr: Any = None,
+        load_hl7: Any = None,
+        load_hl7_filter: Any = None,
+        name: Any = None,
+        options: Any = None,
+        other_dicom_tags: Any = None,
+        required: Any = None,
+        wrapped_dicom_only: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: uuid of the customfield
+        :param capture_on_share_code: Flag if the study type field should be captured during a share code exchange (optional)
+        :param dicom_tag: Dicom tag to map this field to. Format should be of form (1234,1234). (only applicable to study fields) (optional)
+        :param dicom_tag_ignore_empty: Flag to not map an empty custom field to the DICOM tag. (only applicable if a dicom_tag is specified) (optional)
+        :param display_order: Integer to order how the fields should be displayed (optional)
+        :param hl7_component: Component number to map  this field to in HL7 ORM messages. Valid values are 1 to 64. (only applicable to study fields) (optional)
+        :param hl7_field: Segment field number to map  this field to in HL7 ORM messages. Valid values are 1 to 64. (only applicable to study fields) (optional)
+        :param hl7_segment: Segment to map this field to in HL7 ORM messages. Valid values are (NTE|PID|PID1|PV1|PV2|OBR|DG1|OBX|CTI|BLG|ORC) (only applicable to study fields) (optional)
+        :param load_dicom_tag: Flag to load the current value from the study into this field. (only applicable if a dicom_tag is specified) (optional)
+        :param load_from_sr: Load the value from the structured reports in the study. (only applicable to study fields) .(optional)
+        :param load_hl7: If this is set to a HL7 message type the value of this field will be updated from the hl7_segment, hl7_field and hl7_component from incoming HL7 messages of the matching message type (only applicable to study fields) (optional)
+        :param load_hl7_filter: Filter token for the load_hl7 option (only applicable to study fields) (optional)
+        :param name: Name of the customfield (optional)
+        :param options: Additional options in JSON format (optional)
+        :param other_dicom_tags: JSON array of other DICOM tags to map this field to. (only applicable to study fields) (optional)
+        :param required: Flag if the field is required (optional)
+        :param wrapped_dicom_only: Only capture for wrapped DICOM uploads during a share code exchange (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: uuid of the customfield
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: uuid of the customfield
+        """
+
+    def lookup(
+        self,
+        account_id: Any,
+        name: Any,
+    ) -> QueryO:
+        """Lookup.
+
+        :param account_id: uuid of the account
+        :param name: Name of the customfield
+        """
+
+    def search(
+        self,
+        uuid: Any,
+        search: Any = None,
+    ) -> QueryO:
+        """Search.
+
+        :param uuid: uuid of the customfield
+        :param search: The value to search for (optional)
+        """
@@ -0,0 +1,261 @@
+""" Destination.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Destination(Namespace):
+    """Destination."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+        uuid: Any,
+        node_id: Any = None,
+        serial_no: Any = None,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        :param uuid: uuid of the destination
+        :param node_id: node_id
+        :param serial_no: serial_no
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either the sid or the node uuid and serial number
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        address: Any,
+        aetitle: Any,
+        linked_destination: Any,
+        name: Any,
+        node_id: Any,
+        path: Any,
+        port: Any,
+        c_echo_interval: Any = None,
+        c_echo_schedule: Any = None,
+        can_mwl_search: Any = None,
+        can_query_retrieve: Any = None,
+        can_retrieve_thin: Any = None,
+        can_search: Any = None,
+        cd_burn_info: Any = None,
+        cd_burn_name: Any = None,
+        cd_burn_priority: Any = None,
+        default_query_retrieve_level: Any = None,
+        fire_webhooks: Any = None,
+        gateway_settings: Any = None,
+        hl7_address: Any = None,
+        hl7_fetch_filter: Any = None,
+        hl7_port: Any = None,
+        push_related_studies: Any = None,
+        sort_order: Any = None,
+        sqlch_psh_if_img_unchg: Any = None,
+        sqlch_psh_if_route_hl7: Any = None,
+        type: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account
+        :param address: Address of the destination (required if DICOM type)
+        :param aetitle: Aetitle of the destination (required if DICOM type)
+        :param linked_destination: uuid of the destination for LINKED destinations
+        :param name: Name of the destination
+        :param node_id: uuid of the node that handles the destination
+        :param path: Path of the folder for a FOLDER type of destination (required if FOLDER type)
+        :param port: Port of the destination (required if DICOM type)
+        :param c_echo_interval: Interval in seconds to C echo the destination (optional)
+        :param c_echo_schedule: C echo schedule (optional)
+        :param can_mwl_search: Can this destination support searching a modality work list (optional)
+        :param can_query_retrieve: Can this destination support query retrieve from HL7 messages (optional)
+        :param can_retrieve_thin: Can this destination support retrieving thin studies (optional)
+        :param can_search: Can this destination support searching (optional)
+        :param cd_burn_info: A JSON hash with the CD burning information (optional)
+        :param cd_burn_name: Name for the CD burner software (optional)
+        :param cd_burn_priority: Integer value for the burner priority (optional)
+        :param default_query_retrieve_level: Default query retrieve level this can be either (study|series|image) and defaults to study if not specified (optional)
+        :param fire_webhooks: Fire webhooks for events associated with this destination (optional)
+        :param gateway_settings: Gateway settings (optional)
+        :param hl7_address: Address of an attached HL7 destination (optional except for VIRTUAL destinations)
+        :param hl7_fetch_filter: A transform condition expression (see /transform/add for format) to match against the HL7 message. Only fire a query retrieve if the message matches the condition (optional)
+        :param hl7_port: Port of an attached HL7 destination (optional except for VIRTUAL destinations)
+        :param push_related_studies: Push all the related studies (same MRN/patientid) in the namespace when a study is pushed (optional)
+        :param sort_order: Integer value for sorting (optional)
+        :param sqlch_psh_if_img_unchg: Squelch pushes to the destination if the image count has not changed and the push is by a routing rule (optional)
+        :param sqlch_psh_if_route_hl7: Squelch pushes to the destination if the push was generated by HL7 triggered routing (optional)
+        :param type: Type of the destination either DICOM, FOLDER, ACCELERATOR,VIRTUAL, BURNER, XDS, LINKED or UPLOADER. Defaults to DICOM (optional)
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        address: Any = None,
+        aetitle: Any = None,
+        c_echo_interval: Any = None,
+        c_echo_schedule: Any = None,
+        can_mwl_search: Any = None,
+        can_query_retrieve: Any = None,
+        can_retrieve_thin: Any = None,
+        can_search: Any = None,
+        cd_burn_info: Any = None,
+        cd_burn_name: Any = None,
+        cd_burn_priority: Any = None,
+        default_query_retrieve_level: Any = None,
+        fire_webhooks: Any = None,
+        gateway_settings: Any = None,
+        hl7_address: Any = None,
+        hl7_fetch_filter: Any = None,
+        hl7_port: Any = None,
+        name: Any = None,
+        node_id: Any = None,
+        path: Any = None,
+        port: Any = None,
+        push_related_studies: Any = None,
+        sort_order: Any = None,
+        sqlch_psh_if_img_unchg: Any = None,
+        sqlch_psh_if_route_hl7: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: uuid of the destination
+        :param address: Address of the destination (optional)
+        :param aetitle: Aetitle of the destination (optional)
+        :param c_echo_interval: Interval in seconds to C echo the destination (optional)
+        :param c_echo_schedule: C echo schedule (optional)
+        :param can_mwl_search: Can this destination support searching a modality work list (optional)
+        :param can_query_retrieve: Can this destination support query retrieve from HL7 messages (optional)
+        :param can_retrieve_thin: Can this destination support retrieving thin studies (optional)
+        :param can_search: Can this destination support searching (optional)
+        :param cd_burn_info: A JSON hash with the CD burning information (optional)
+        :param cd_burn_name: Name for the CD burner software (optional)
+        :param cd_burn_priority: Integer value for the burner priority (optional)
+        :param default_query_retrieve_level: Default query retrieve level this can be either (study|series|image) and defaults to study if not specified (optional)
+        :param fire_webhooks: Fire webhooks for events associated with this destination (optional)
+        :param gateway_settings: Gateway settings (optional)
+        :param hl7_address: Address of an attached HL7 destination (optional)
+        :param hl7_fetch_filter: A transform condition expression (see /transform/add for format) to match against the HL7 message. Only fire a query retrieve if the message matches the condition (optional)
+        :param hl7_port: Port of an attached HL7 destination (optional)
+        :param name: Name of the destination (optional)
+        :param node_id: uuid of the node that handles the destination (optional)
+        :param path: Path of the folder (optional)
+        :param port: Port of the destination (optional)
+        :param push_related_studies: Push all the related studies (same MRN/patientid) in the namespace when a study is pushed (optional)
+        :param sort_order: Integer value for sorting (optional)
+        :param sqlch_psh_if_img_unchg: Squelch pushes to the destination if the image count has not changed and the push is by a routing rule (optional)
+        :param sqlch_psh_if_route_hl7: Squelch pushes to the destination if the push was generated by HL7 triggered routing (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: uuid of the destination
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: uuid of the destination
+        """
+
+    def search(
+        self,
+        uuid: Any,
+        accession_number: Any = None,
+        copy_to: Any = None,
+        create_study: Any = None,
+        create_thin: Any = None,
+        end_datetime: Any = None,
+        modality: Any = None,
+        node_id: Any = None,
+        patient_birth_date: Any = None,
+        patient_name: Any = None,
+        patient_sex: Any = None,
+        patientid: Any = None,
+        push_to: Any = None,
+        query_fields: Any = None,
+        referring_physician: Any = None,
+        result_fields: Any = None,
+        serial_no: Any = None,
+        start_datetime: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Search.
+
+        :param uuid: uuid of the destination
+        :param accession_number: Accession number to find (optional)
+        :param copy_to: uuid of a namespace to copy the retrieved or create_thin studies into (optional)
+        :param create_study: The maximum number of studies to retrieve from this search instead of creating an activity for the search results (optional)
+        :param create_thin: The maximum number of thin studies to create from this search instead of creating an activity for the search results (optional)
+        :param end_datetime: DICOM end date time stamp to bound the search (optional)
+        :param modality: Modality (optional)
+        :param node_id: node_id
+        :param patient_birth_date: Birth date to find (optional)
+        :param patient_name: Patient name to find (optional)
+        :param patient_sex: Gender to find (optional)
+        :param patientid: Patient id to find (optional)
+        :param push_to: uuid of a destination to push the retrieved studies to (optional)
+        :param query_fields: A JSON hash of additional query fields (optional)
+        :param referring_physician: Referring physician to find (optional)
+        :param result_fields: A JSON array of DICOM tags that the destination should return (optional)
+        :param serial_no: serial_no
+        :param start_datetime: DICOM start date time stamp to bound the search (optional)
+        :param study_uid: Study uid to find (optional)
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either the sid or the node uuid and serial number
+        The rest of the fields are used for the search
+        """
+
+    def retrieve(
+        self,
+        activity_id: Any,
+    ) -> QueryO:
+        """Retrieve.
+
+        :param activity_id: uuid of the DESTINATION_SEARCH activity to retrieve from
+        """
+
+    def search_mwl(
+        self,
+        study_id: Any,
+        uuid: Any,
+        accession_number: Any = None,
+        order_date: Any = None,
+        order_number: Any = None,
+        patient_birth_date: Any = None,
+        patient_name: Any = None,
+        patient_sex: Any = None,
+        patientid: Any = None,
+    ) -> QueryO:
+        """Search mwl.
+
+        :param study_id: The id of the study we are searching for orders for
+        :param uuid: uuid of the destination
+        :param accession_number: Accession number to find (optional)
+        :param order_date: Order date to find (optional)
+        :param order_number: Order number to find (optional)
+        :param patient_birth_date: Birth date to find (optional)
+        :param patient_name: Patient name to find (optional)
+        :param patient_sex: Gender to find (optional)
+        :param patientid: Patient id to find (optional)
+
+        Notes:
+        The rest of the fields are used for the search
+        """
@@ -0,0 +1,46 @@
+""" Dicomdata.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPF
+
+
+class Dicomdata(Namespace):
+    """Dicomdata."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        dicom_tags: Any = None,
+        namespace_id: Any = None,
+        study_id: Any = None,
+    ) -> QueryOPF:
+        """List.
+
+        :param dicom_tags: A JSON list of the DICOM tags to return (optional)
+        :param namespace_id: namespace_id
+        :param study_id: study_id
+
+        Notes:
+        (study_id OR namespace_id) - uuid of the study or namespace to search
+        """
+
+    def get(
+        self,
+        customfields: Any,
+        uuid: Any,
+        dicom_tags: Any = None,
+    ) -> QueryO:
+        """Get.
+
+        :param customfields: An array of the custom fields associated with this dicomdata. Each object has the following fields (This is only returned if the dicomdata has custom fields)
+        :param uuid: Id of the DICOM data
+        :param dicom_tags: A JSON list of the DICOM tags to return (optional)
+        """
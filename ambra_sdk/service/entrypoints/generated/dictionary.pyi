@@ -0,0 +1,173 @@
+""" Dictionary.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Dictionary(Namespace):
+    """Dictionary."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: The account id
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        case_sensitive: Any,
+        lookup: Any,
+        name: Any,
+        object: Any,
+        replace: Any,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: The account id
+        :param case_sensitive: Flag if the dictionary lookup is case sensitive or not
+        :param lookup: A JSON array of field names that will be concatenated and MD5 hashed for the dictionary lookup value
+        :param name: The dictionary name
+        :param object: Object this is applied against (Study|Order|User_account|Case)
+        :param replace: A JSON array of the field names that will be replaced for a successful lookup
+        """
+
+    def set(
+        self,
+        name: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Set.
+
+        :param name: The dictionary name
+        :param uuid: The dictionary id
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The dictionary id
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The dictionary id
+        """
+
+    def entries(
+        self,
+        uuid: Any,
+        lookup: Any = None,
+    ) -> QueryO:
+        """Entries.
+
+        :param uuid: The dictionary id
+        :param lookup: Only return the entry for the optional lookup entry (optional)
+        """
+
+    def entry_add(
+        self,
+        lookup: Any,
+        replace: Any,
+        uuid: Any,
+        regexp: Any = None,
+    ) -> QueryO:
+        """Entry add.
+
+        :param lookup: The JSON array of the lookup values to add. Alternatively a regular expression if the regexp parameter is passed
+        :param replace: The JSON array of the replacement field values
+        :param uuid: The dictionary id
+        :param regexp: An integer value that indicates that this entry is a regular expression (optional)
+        """
+
+    def entry_delete(
+        self,
+        lookup: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Entry delete.
+
+        :param lookup: The JSON array of the lookup values or the regular expression to delete
+        :param uuid: The dictionary id
+        """
+
+    def attach(
+        self,
+        uuid: Any,
+        account_id: Any = None,
+        add_if_no_match: Any = None,
+        approve_if_match: Any = None,
+        delay: Any = None,
+        namespace_id: Any = None,
+        run_once: Any = None,
+        sequence: Any = None,
+        skip_if_lookup_unchanged: Any = None,
+        skip_if_replace_has_value: Any = None,
+    ) -> QueryO:
+        """Attach.
+
+        :param uuid: The dictionary id
+        :param account_id: account_id
+        :param add_if_no_match: Flag to add the lookup and replace values to the dictionary if no match occurs (optional)
+        :param approve_if_match: Approve the object if there was a match (optional)
+        :param delay: An integer number of seconds to delay the dictionary application (optional)
+        :param namespace_id: namespace_id
+        :param run_once: Flag to make dictionary apply only once per object (optional)
+        :param sequence: An integer value. Attachments are processed from low number to high number (optional)
+        :param skip_if_lookup_unchanged: Flag to skip the lookup if the lookup field(s) are un-changed (optional)
+        :param skip_if_replace_has_value: Flag to skip the lookup if the replace field already has a value (optional)
+
+        Notes:
+        (account_id OR namespace_id) - uuid of the account or namespace to the dictionary to
+        """
+
+    def attach_set(
+        self,
+        uuid: Any,
+        add_if_no_match: Any = None,
+        approve_if_match: Any = None,
+        delay: Any = None,
+        run_once: Any = None,
+        sequence: Any = None,
+        skip_if_lookup_unchanged: Any = None,
+        skip_if_replace_has_value: Any = None,
+    ) -> QueryO:
+        """Attach set.
+
+        :param uuid: The dictionary attach id
+        :param add_if_no_match: Flag to add the lookup and replace values to the dictionary if no match occurs (optional)
+        :param approve_if_match: Approve the object if there was a match (optional)
+        :param delay: An integer number of seconds to delay the dictionary application (optional)
+        :param run_once: Flag to make dictionary apply only once per object (optional)
+        :param sequence: An integer value. Attachments are processed from low number to high number (optional)
+        :param skip_if_lookup_unchanged: Flag to skip the lookup if the lookup field(s) are un-changed (optional)
+        :param skip_if_replace_has_value: Flag to skip the lookup if any of the replace fields already has a value (optional)
+        """
+
+    def detach(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Detach.
+
+        :param uuid: The dictionary attach id
+        """
@@ -0,0 +1,123 @@
+""" Filter.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Filter(Namespace):
+    """Filter."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+        type: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: Limit to global filters and filters within the account namespaces
+        :param type: The type of filter to list
+        """
+
+    def add(
+        self,
+        configuration: Any,
+        name: Any,
+        type: Any,
+    ) -> QueryO:
+        """Add.
+
+        :param configuration: The configuration as a JSON data structure
+        :param name: The name of the filter
+        :param type: The type of the filter
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The filter uuid
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        configuration: Any = None,
+        name: Any = None,
+        type: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: The filter uuid
+        :param configuration: The configuration as a JSON data structure (optional)
+        :param name: The name of the filter (optional)
+        :param type: The type of the filter (optional)
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The filter uuid
+        """
+
+    def share(
+        self,
+        uuid: Any,
+        account_id: Any = None,
+        group_id: Any = None,
+        location_id: Any = None,
+        user_id: Any = None,
+    ) -> QueryO:
+        """Share.
+
+        :param uuid: The filter uuid
+        :param account_id: account_id
+        :param group_id: group_id
+        :param location_id: location_id
+        :param user_id: user_id
+
+        Notes:
+        (account_id OR location_id OR group_id OR user_id) - uuid of the account, location, group or user to share this filter with
+        """
+
+    def share_stop(
+        self,
+        uuid: Any,
+        account_id: Any = None,
+        group_id: Any = None,
+        location_id: Any = None,
+        user_id: Any = None,
+    ) -> QueryO:
+        """Share stop.
+
+        :param uuid: The filter uuid
+        :param account_id: account_id
+        :param group_id: group_id
+        :param location_id: location_id
+        :param user_id: user_id
+
+        Notes:
+        (account_id OR location_id OR group_id OR user_id) - uuid of the account, location, group or user to stop sharing this filter with
+        """
+
+    def share_list(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Share list.
+
+        :param uuid: The filter uuid
+        """
@@ -0,0 +1,36 @@
+""" Help.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Help(Namespace):
+    """Help."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def get(
+        self,
+        key: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param key: The help key
+        """
+
+    def set(
+        self,
+        key: Any,
+        text: Any,
+    ) -> QueryO:
+        """Set.
+
+        :param key: The help key
+        :param text: The help text
+        """
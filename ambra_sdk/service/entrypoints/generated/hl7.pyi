@@ -0,0 +1,246 @@
+""" Hl7.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Hl7(Namespace):
+    """Hl7."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def add(
+        self,
+        message: Any,
+        serial_no: Any,
+        uuid: Any,
+        accession_number: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param message: The HL7 message
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        :param accession_number: Use this accession number instead of the accession number in the HL7 message (optional)
+        """
+
+    def get(
+        self,
+        raw: Any,
+        uuid: Any,
+        node_id: Any = None,
+        phi_namespace: Any = None,
+        serial_no: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Get.
+
+        :param raw: Flag to return the raw HL7 message as well
+        :param uuid: The hl7 uuid
+        :param node_id: node_id
+        :param phi_namespace: phi_namespace
+        :param serial_no: serial_no
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either the sid or the node uuid and serial number
+        (study_id OR study_uid AND storage_namespace AND phi_namespace) - The study uuid or the storage triplet (optional)
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The hl7 uuid
+        """
+
+    def study_report(
+        self,
+        study_id: Any,
+    ) -> QueryO:
+        """Study report.
+
+        :param study_id: The study uuid
+        """
+
+    def extract_report(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Extract report.
+
+        :param uuid: The HL7 uuid
+        """
+
+    def template_list(
+        self,
+        account_id: Any,
+    ) -> QueryO:
+        """Template list.
+
+        :param account_id: The account uuid
+        """
+
+    def template_add(
+        self,
+        account_id: Any,
+        body: Any,
+        name: Any,
+    ) -> QueryO:
+        """Template add.
+
+        :param account_id: The account uuid
+        :param body: The HL7 message with replacement expressions
+        :param name: Name of the template
+        """
+
+    def template_set(
+        self,
+        body: Any,
+        name: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Template set.
+
+        :param body: The HL7 message with replacement expressions
+        :param name: Name of the template
+        :param uuid: The template id
+        """
+
+    def template_get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Template get.
+
+        :param uuid: The template id
+        """
+
+    def template_render(
+        self,
+        hex: Any,
+        hl7_id: Any,
+        study_id: Any,
+        text: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Template render.
+
+        :param hex: Flag if you want a hexdump of the text returned rather than the JSON
+        :param hl7_id: Optional hl7 message
+        :param study_id: The study id
+        :param text: Flag if you want the text returned rather than the JSON
+        :param uuid: The template id
+        """
+
+    def template_delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Template delete.
+
+        :param uuid: The template id
+        """
+
+    def transform_list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """Transform list.
+
+        :param account_id: The account uuid
+        """
+
+    def transform_add(
+        self,
+        account_id: Any,
+        conditions: Any,
+        name: Any,
+        order_by: Any,
+        replacements: Any,
+    ) -> QueryO:
+        """Transform add.
+
+        :param account_id: The account uuid
+        :param conditions: A JSON array of the transform conditions
+        :param name: Name of the transform
+        :param order_by: A numeric ordering value. Transformations are run in this order from lowest to highest
+        :param replacements: A JSON array of the transform replacements
+        """
+
+    def transform_set(
+        self,
+        conditions: Any,
+        name: Any,
+        order_by: Any,
+        replacements: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Transform set.
+
+        :param conditions: A JSON array of the transform conditions
+        :param name: Name of the transform
+        :param order_by: A numeric ordering value. Transformations are run in this order from lowest to highest
+        :param replacements: A JSON array of the transform replacements
+        :param uuid: The transform id
+        """
+
+    def transform_get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Transform get.
+
+        :param uuid: The transform id
+        """
+
+    def transform_delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Transform delete.
+
+        :param uuid: The transform id
+        """
+
+    def transform_test(
+        self,
+        hl7: Any,
+    ) -> QueryO:
+        """Transform test.
+
+        :param hl7: HL7 message to run the transformations on
+        """
+
+    def parse_fields(
+        self,
+        message: Any,
+        fields: Any = None,
+    ) -> QueryO:
+        """Parse fields.
+
+        :param message: HL7 message to parse
+        :param fields: Comma delimited list of the field to return. Use the notation specified in /hl7/transform/add (optional)
+        """
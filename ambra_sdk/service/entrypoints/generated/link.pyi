@@ -0,0 +1,315 @@
+""" Link.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOP
+
+
+class Link(Namespace):
+    """Link."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any = None,
+        study_id: Any = None,
+        user_id: Any = None,
+    ) -> QueryOP:
+        """List.
+
+        :param account_id: account_id
+        :param study_id: study_id
+        :param user_id: user_id
+
+        Notes:
+        (study_id OR user_id OR account_id) - uuid of the study, user or account to get the links for
+        """
+
+    def add(
+        self,
+        action: Any,
+        prompt_for_anonymize: Any,
+        acceptance_required: Any = None,
+        account_id: Any = None,
+        anonymize: Any = None,
+        charge_amount: Any = None,
+        charge_currency: Any = None,
+        charge_description: Any = None,
+        email: Any = None,
+        filter: Any = None,
+        include_priors: Any = None,
+        max_hits: Any = None,
+        meeting_id: Any = None,
+        message: Any = None,
+        minutes_alive: Any = None,
+        mobile_phone: Any = None,
+        namespace_id: Any = None,
+        notify: Any = None,
+        parameters: Any = None,
+        password: Any = None,
+        password_is_dob: Any = None,
+        password_max_attempts: Any = None,
+        pin_auth: Any = None,
+        referer: Any = None,
+        share_code: Any = None,
+        share_on_view: Any = None,
+        skip_email_prompt: Any = None,
+        study_id: Any = None,
+        upload_match: Any = None,
+        upload_study_customfields: Any = None,
+        use_share_code: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param action: Link action (STUDY_LIST|STUDY_VIEW|STUDY_UPLOAD)
+        :param prompt_for_anonymize: Flag to prompt if the anonymization rules should be applied on ingress
+        :param acceptance_required: Flag that acceptance of TOS is required (optional)
+        :param account_id: account_id
+        :param anonymize: Anonymization rules to the applied to any STUDY_UPLOAD done with this link. Rules are formatted as per the rules parameter in /namespace/anonymize  (optional)
+        :param charge_amount: Amount to charge in pennies before the link can be accessed (optional)
+        :param charge_currency: Charge currency (optional)
+        :param charge_description: Charge description (optional)
+        :param email: Email the link to these addresses (optional)
+        :param filter: filter
+        :param include_priors: Include prior studies (optional)
+        :param max_hits: The maximum number of times the link can be used (optional)
+        :param meeting_id: UUID of the meeting to associate the link with (optional)
+        :param message: Message to include in the email (optional)
+        :param minutes_alive: The maximum number of minutes the link will be alive for (optional)
+        :param mobile_phone: Send the link to this phone number (optional)
+        :param namespace_id: namespace_id
+        :param notify: Comma or space separated list of additional emails to notify of link usage (optional)
+        :param parameters: JSON array of parameters to add to the redirect URL or return in /namespace/share_code if an upload (optional)
+        :param password: Link password (optional)
+        :param password_is_dob: Flag that the password is the patient_birth_date for the study (study_id is required) (optional)
+        :param password_max_attempts: The maximum number of failed password attempt (optional)
+        :param pin_auth: An account member email and PIN authentication is required (optional)
+        :param referer: The link can only be accessed from the specified referer. The referer can be a regexp to match multiple referers (optional)
+        :param share_code: share code for a STUDY_UPLOAD (optional)
+        :param share_on_view: Flag to share the study with the email after it is viewed (optional)
+        :param skip_email_prompt: Skip the prompt for email step (optional)
+        :param study_id: study_id
+        :param upload_match: A JSON hash of DICOM tags and regular expressions they must match uploaded against this link (optional)
+        :param upload_study_customfields: A JSON hash of customfields that will be mapped to a study on study upload. A key is a customfield UUID, a value is a value for the field (optional)
+        :param use_share_code: Flag to use the namespace share code settings for a STUDY_UPLOAD (optional)
+
+        Notes:
+        (study_id OR filter AND account_id OR namespace_id) - uuid of the study or a JSON hash of the study filter expression and the account_id or namespace_id if the action is STUDY_UPLOAD
+        """
+
+    def get(
+        self,
+        acceptance_required: Any,
+        account_id: Any,
+        action: Any,
+        anonymize: Any,
+        charge_amount: Any,
+        charge_currency: Any,
+        charge_description: Any,
+        description: Any,
+        email: Any,
+        filter: Any,
+        has_password: Any,
+        include_priors: Any,
+        is_meeting: Any,
+        max_hits: Any,
+        message: Any,
+        minutes_alive: Any,
+        mobile_phone: Any,
+        namespace_id: Any,
+        namespace_name: Any,
+        notify: Any,
+        parameters: Any,
+        password_is_dob: Any,
+        password_max_attempts: Any,
+        pin_auth: Any,
+        prompt_for_anonymize: Any,
+        redirect_url: Any,
+        referer: Any,
+        share_on_view: Any,
+        skip_email_prompt: Any,
+        study_id: Any,
+        upload_match: Any,
+        upload_study_customfields: Any,
+        url: Any,
+        use_share_code: Any,
+        user_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param acceptance_required: Flag that acceptance of TOS is required
+        :param account_id: The account id
+        :param action: Link action
+        :param anonymize: Any anonymization rules
+        :param charge_amount: Amount to charge in pennies before the link can be accessed
+        :param charge_currency: Charge currency
+        :param charge_description: Charge description
+        :param description: Description of the link
+        :param email: Email address the link was sent to
+        :param filter: The filter expression
+        :param has_password: Flag if the link has a password or not
+        :param include_priors: Include prior studies
+        :param is_meeting: Flag if the link is for a meeting
+        :param max_hits: The maximum number of times the link can be used
+        :param message: Message to include in the email
+        :param minutes_alive: The maximum number of minutes the link will be alive for
+        :param mobile_phone: Cellular phone number the link was sent to
+        :param namespace_id: Id of the namespace for upload links
+        :param namespace_name: Name of the namespace for upload links
+        :param notify: Comma or space separated list of additional emails to notify of link usage
+        :param parameters: JSON array parameters to add to the redirect URL
+        :param password_is_dob: Flag that the password is the patient_birth_date for the study
+        :param password_max_attempts: The maximum number of failed password attempt
+        :param pin_auth: An account member email and PIN authentication is required
+        :param prompt_for_anonymize: Flag to prompt if the anonymization rules should be applied on ingress
+        :param redirect_url: URL for the /link/redirect API  which will take you directly to the study viewer or uploader
+        :param referer: The link can only be accessed from the specified referer
+        :param share_on_view: Flag to share the study with the email after it is viewed
+        :param skip_email_prompt: Skip the prompt for email step
+        :param study_id: uuid of the study
+        :param upload_match: A JSON hash of DICOM tags and regular expressions they must match uploaded against this link
+        :param upload_study_customfields: A JSON hash of customfields that will be mapped to a study on study upload
+        :param url: URL for the link which will take you to the UI entry point for links to enter email, password etc.
+        :param use_share_code: Flag to use the namespace share code settings for a STUDY_UPLOAD
+        :param user_id: The user id
+        :param uuid: Id of the link
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: Id of the link
+        """
+
+    def status(
+        self,
+        link_charge_id: Any = None,
+        pin: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Status.
+
+        :param link_charge_id: The uuid of the prior charge against this link (optional)
+        :param pin: pin
+        :param uuid: uuid
+
+        Notes:
+        (uuid OR pin) - Id or PIN of the link
+        """
+
+    def session(
+        self,
+        email_address: Any = None,
+        link_charge_id: Any = None,
+        password: Any = None,
+        pin: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Session.
+
+        :param email_address: The users email (optional)
+        :param link_charge_id: The uuid of the prior charge against this link (optional)
+        :param password: Password if needed (optional)
+        :param pin: pin
+        :param uuid: uuid
+
+        Notes:
+        (uuid OR pin) - Id or PIN of the link
+        """
+
+    def redirect(
+        self,
+        link_charge_id: Any = None,
+        password: Any = None,
+        pin: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Redirect.
+
+        :param link_charge_id: The uuid of the prior charge against this link (optional)
+        :param password: Password if needed (optional)
+        :param pin: pin
+        :param uuid: uuid
+
+        Notes:
+        (uuid OR pin) - Id or PIN of the link
+        """
+
+    def external(
+        self,
+        u: Any,
+        v: Any = None,
+    ) -> QueryO:
+        """External.
+
+        :param u: The uuid of the user_account record to create the guest link as
+        :param v: 
+        A JSON hash with the following keys pairs. The JSON must be encrypted and base64 encoded:
+        filter.*=&gt;Filter field(s) as per the /study/list to specify the study(s) to construct the link for.
+        The include_priors link option value can be passed as a key.
+        Any additional fields will the saved in the study audit trail and the following fields email_address, redirect_url, integration_key and skip_email_prompt will be available in /namespace/share_code if this is an upload link .
+        """
+
+    def sso(
+        self,
+        u: Any,
+        v: Any,
+    ) -> QueryO:
+        """Sso.
+
+        :param u: The uuid of the user_account record
+        :param v: An encrypted JSON hash as per the instructions in the SSO to a PHR account with a study share section of the documentation
+        """
+
+    def sid(
+        self,
+        email: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Sid.
+
+        :param email: Email address to associate with this usage
+        :param uuid: The uuid of the link usage
+        """
+
+    def mail(
+        self,
+        email: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Mail.
+
+        :param email: Email address
+        :param uuid: The uuid of the link
+        """
+
+    def charge(
+        self,
+        charge_token: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Charge.
+
+        :param charge_token: The stripe charge token
+        :param uuid: The uuid of the link
+        """
+
+    def pin(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Pin.
+
+        :param uuid: The uuid of the link
+        """
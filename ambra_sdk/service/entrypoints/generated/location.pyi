@@ -0,0 +1,185 @@
+""" Location.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Location(Namespace):
+    """Location."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        name: Any,
+        customfield_param: Any = None,
+        hl7_template: Any = None,
+        must_approve: Any = None,
+        must_approve_harvest: Any = None,
+        must_approve_move: Any = None,
+        must_approve_upload: Any = None,
+        no_share: Any = None,
+        role_id: Any = None,
+        search_threshold: Any = None,
+        share_code: Any = None,
+        share_description: Any = None,
+        share_settings: Any = None,
+        share_via_gateway: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account
+        :param name: Name of the location
+        :param customfield_param: Custom field(s) (optional)
+        :param hl7_template: The HL7 reporting template for the location (optional)
+        :param must_approve: Flag if shared studies must be approved for the location (optional)
+        :param must_approve_harvest: Flag if harvested studies must be approved (optional)
+        :param must_approve_move: Flag if moved studies must be approved (optional)
+        :param must_approve_upload: Flag if uploaded studies must be approved (optional)
+        :param no_share: Flag if studies can not be shared with this location (optional). Studies can still be shared with users in the location.
+        :param role_id: Id for the default role for the location (optional)
+        :param search_threshold: The number of studies record in the namespace to switch the UI from list to search mode (optional)
+        :param share_code: The share code of the location (optional)
+        :param share_description: The share description of the location (optional)
+        :param share_settings: Share settings JSON structure of the share display settings (optional)
+        :param share_via_gateway: Flag if a gateway share is allowed (optional)
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        customfield_param: Any = None,
+        hl7_template: Any = None,
+        must_approve: Any = None,
+        must_approve_harvest: Any = None,
+        must_approve_move: Any = None,
+        must_approve_upload: Any = None,
+        name: Any = None,
+        no_share: Any = None,
+        role_id: Any = None,
+        search_threshold: Any = None,
+        share_code: Any = None,
+        share_description: Any = None,
+        share_settings: Any = None,
+        share_via_gateway: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: The location uuid
+        :param customfield_param: Custom field(s) (optional)
+        :param hl7_template: The HL7 reporting template for the location (optional)
+        :param must_approve: Flag if shared studies must be approved for the location (optional)
+        :param must_approve_harvest: Flag if harvested studies must be approved (optional)
+        :param must_approve_move: Flag if moved studies must be approved (optional)
+        :param must_approve_upload: Flag if uploaded studies must be approved (optional)
+        :param name: Name of the location (optional)
+        :param no_share: Flag if studies can not be shared with this location (optional). Studies can still be shared with users in the location.
+        :param role_id: Id for the default role for the location (optional)
+        :param search_threshold: The number of studies record in the namespace to switch the UI from list to search mode (optional)
+        :param share_code: The share code of the location (optional)
+        :param share_description: The share description of the location (optional)
+        :param share_settings: Share settings JSON structure of the share display settings (optional)
+        :param share_via_gateway: Flag if a gateway share is allowed (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The location uuid
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The location uuid
+        """
+
+    def user_add(
+        self,
+        event_upload_fail: Any,
+        user_id: Any,
+        uuid: Any,
+        event_approve: Any = None,
+        event_case_assignment: Any = None,
+        event_harvest: Any = None,
+        event_link: Any = None,
+        event_link_mine: Any = None,
+        event_message: Any = None,
+        event_new_report: Any = None,
+        event_node: Any = None,
+        event_report_remove: Any = None,
+        event_share: Any = None,
+        event_status_change: Any = None,
+        event_study_comment: Any = None,
+        event_thin_study_fail: Any = None,
+        event_thin_study_success: Any = None,
+        event_upload: Any = None,
+        no_physician_alias_share: Any = None,
+        role_id: Any = None,
+    ) -> QueryO:
+        """User add.
+
+        :param event_upload_fail: Notify the user on a failed upload into the location namespace
+        :param user_id: Id of the user
+        :param uuid: The location id
+        :param event_approve: Notify the user on a approval needed into the location namespace (optional)
+        :param event_case_assignment: Notify the user when they are assigned a case as a medical or admin user (optional)
+        :param event_harvest: Notify the user on a harvest into the location namespace (optional)
+        :param event_link: Notify the user when an anonymous link is hit in the namespace (optional)
+        :param event_link_mine: Notify the user when an anonymous link created by the user is hit in the namespace (optional)
+        :param event_message: Notify the user when a message is sent to the location namespace (optional)
+        :param event_new_report: Notify the user when a report is attached in the location namespace (optional)
+        :param event_node: Notify the user when a location  node sends an event (optional)
+        :param event_report_remove: Notify the user when a report is removed in the location namespace (optional)
+        :param event_share: Notify the user on a share into the location namespace (optional)
+        :param event_status_change: Notify the user when the status of a study is changed (optional)
+        :param event_study_comment: Notify the user when a comment is attached to a study in the namespace (optional)
+        :param event_thin_study_fail: Notify the user when a thin study retrieval they initiated fails (optional)
+        :param event_thin_study_success: Notify the user when a thin study retrieval they initiated succeeds (optional)
+        :param event_upload: Notify the user on an upload into the location namespace (optional)
+        :param no_physician_alias_share: Flag to exclude this location from a physician alias share (optional)
+        :param role_id: Id of the users role within the location (optional). If not passed the default location role will be assigned
+        """
+
+    def user_delete(
+        self,
+        user_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """User delete.
+
+        :param user_id: The user id
+        :param uuid: The location id
+        """
+
+    def user_list(
+        self,
+        uuid: Any,
+    ) -> QueryOPSF:
+        """User list.
+
+        :param uuid: The location id
+        """
@@ -0,0 +1,127 @@
+""" Meeting.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Meeting(Namespace):
+    """Meeting."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def add(
+        self,
+        name: Any,
+        state: Any,
+        phi_namespace: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param name: Title of the meeting
+        :param state: State of the meeting
+        :param phi_namespace: phi_namespace
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+
+        Notes:
+        (study_id OR study_uid AND storage_namespace AND phi_namespace) The uuid of the study or the storage triplet
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        name: Any = None,
+        state: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: UUID of the meeting
+        :param name: Title of the meeting (optional)
+        :param state: State of the meeting (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: UUID of the meeting
+        """
+
+    def join(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Join.
+
+        :param uuid: UUID of the meeting
+        """
+
+    def leave(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Leave.
+
+        :param uuid: UUID of the meeting
+        """
+
+    def roster(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Roster.
+
+        :param uuid: UUID of the meeting
+        """
+
+    def presenter(
+        self,
+        user_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Presenter.
+
+        :param user_id: UUID of the user to make the presenter
+        :param uuid: UUID of the meeting
+        """
+
+    def ping(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Ping.
+
+        :param uuid: UUID of the meeting
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: UUID of the meeting
+        """
+
+    def events_add(
+        self,
+        event: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Events add.
+
+        :param event: Event to send to the meeting
+        :param uuid: UUID of the meeting
+        """
@@ -0,0 +1,82 @@
+""" Message.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Message(Namespace):
+    """Message."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+    ) -> QueryOPSF:
+        """List.
+        """
+
+    def add(
+        self,
+        body: Any,
+        account_id: Any = None,
+        email: Any = None,
+        group_id: Any = None,
+        location_id: Any = None,
+        namespace_id: Any = None,
+        parent_id: Any = None,
+        share_code: Any = None,
+        study_id: Any = None,
+        subject: Any = None,
+        user_id: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param body: The body of the message
+        :param account_id: account_id
+        :param email: email
+        :param group_id: group_id
+        :param location_id: location_id
+        :param namespace_id: namespace_id
+        :param parent_id: The uuid of the parent message (optional)
+        :param share_code: share_code
+        :param study_id: study_id
+        :param subject: The subject of the message (optional)
+        :param user_id: user_id
+
+        Notes:
+        (namespace_id OR user_id OR group_id OR location_id OR account_id OR email OR share_code OR study_id) - The namespace, entity, email, share code or study to send the message to
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: Id of the message
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: Id of the message
+        """
+
+    def count(
+        self,
+        reset: Any = None,
+    ) -> QueryO:
+        """Count.
+
+        :param reset: Flag to reset counter back to zero (optional)
+        """
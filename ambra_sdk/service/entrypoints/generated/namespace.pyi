@@ -0,0 +1,262 @@
+""" Namespace.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Namespace(Namespace):
+    """Namespace."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def permissions(
+        self,
+        namespace_id: Any = None,
+        oauth: Any = None,
+        phi_namespace: Any = None,
+        serial_no: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Permissions.
+
+        :param namespace_id: namespace_id
+        :param oauth: Flag to return the OAuth token information for the user (optional)
+        :param phi_namespace: phi_namespace
+        :param serial_no: serial_no
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+        :param uuid: uuid
+
+        Notes:
+        (namespace_id OR study_id OR study_uid AND storage_namespace AND phi_namespace) The uuid of the namespace or study or the study_uid/storage_namespace/phi_namespace triplet
+        (sid OR uuid AND serial_no) - Either the sid or the node id and serial number
+        """
+
+    def settings(
+        self,
+        ai_settings: Any,
+        allow_drag_and_drop_in_study_uploader: Any,
+        auto_create_patient: Any,
+        auto_enable_dicom_wrapping: Any,
+        cloud_storage_config: Any,
+        disable_duplicate_study_upload: Any,
+        enable_dicom_wrapping: Any,
+        enable_epic_patient_lookup: Any,
+        enable_multipart_uploader: Any,
+        link_defaults: Any,
+        no_dup_share: Any,
+        pixel_anonymize_color: Any,
+        priority_notifications: Any,
+        single_file_dicom_wrapping: Any,
+        study_field_flags: Any,
+        ui_json: Any,
+        upload_settings: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Settings.
+
+        :param ai_settings: Dict of ai settings
+        :param allow_drag_and_drop_in_study_uploader: Value for the setting
+        :param auto_create_patient: Value for the setting
+        :param auto_enable_dicom_wrapping: Value for the setting
+        :param cloud_storage_config: Value for the setting
+        :param disable_duplicate_study_upload: Value for the setting
+        :param enable_dicom_wrapping: Value for the setting
+        :param enable_epic_patient_lookup: Value for the setting
+        :param enable_multipart_uploader: Value for the setting
+        :param link_defaults: Value for the setting
+        :param no_dup_share: Flag to stop duplicate studies (same study_uid and image count) from getting shared into the namespace
+        :param pixel_anonymize_color: Value for the setting
+        :param priority_notifications: Value for the setting
+        :param single_file_dicom_wrapping: Value for the setting
+        :param study_field_flags: A JSON hash of study_field_* role values to override the role values for studies in the namespace
+        :param ui_json: Value for the setting
+        :param upload_settings: Value for the setting
+        :param uuid: The uuid of the namespace
+
+        Notes:
+        The following account settings can be over-ridden in the namespace
+        """
+
+    def share_code(
+        self,
+        namespace_id: Any = None,
+        serial_no: Any = None,
+        share_code: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Share_code.
+
+        :param namespace_id: namespace_id
+        :param serial_no: serial_no
+        :param share_code: share_code
+        :param uuid: uuid
+
+        Notes:
+        (share_code OR namespace_id) - The share code or namespace id
+        (sid OR uuid AND serial_no) - Either the sid or the node id and serial number (optional)
+        """
+
+    def share_pricing(
+        self,
+        uuid: Any,
+        charge_description: Any = None,
+        currency: Any = None,
+        pricing: Any = None,
+        second_opinion_config: Any = None,
+        second_opinion_share: Any = None,
+    ) -> QueryO:
+        """Share pricing.
+
+        :param uuid: The uuid of the namespace
+        :param charge_description: The description of the charge (optional)
+        :param currency: 3-letter ISO code for currency to charge in (USD|GBP) (optional)
+        :param pricing: Pricing table in JSON format (optional)
+        :param second_opinion_config: JSON configuration for the second opinion workflow (optional)
+        :param second_opinion_share: Flag to enable/disable the second opinion workflow for the share (optional)
+        """
+
+    def case_pricing(
+        self,
+        uuid: Any,
+        case_pricing: Any = None,
+        sum_case_price_matches: Any = None,
+    ) -> QueryO:
+        """Case pricing.
+
+        :param uuid: The uuid of the namespace
+        :param case_pricing: Pricing table in JSON format (optional)
+        :param sum_case_price_matches: Flag to search for all matches in pricing table and to add them up (optional)
+        """
+
+    def anonymize(
+        self,
+        uuid: Any,
+        prompt_for_anonymize: Any = None,
+        rules: Any = None,
+    ) -> QueryO:
+        """Anonymize.
+
+        :param uuid: The uuid of the namespace
+        :param prompt_for_anonymize: Flag to prompt if the anonymization rules should be applied. Only applicable to ingress anonymization. (optional)
+        :param rules: Anonymization rules in JSON format. The format is a hash with the keys the names of the fields to anonymize and the values the regular expressions to apply. (optional)
+        """
+
+    def coverpage(
+        self,
+        uuid: Any,
+        coverpage: Any = None,
+    ) -> QueryO:
+        """Coverpage.
+
+        :param uuid: The uuid of the namespace
+        :param coverpage: The coverpage value. See the notes for formatting details or pass an empty string to remove the current cover page. (optional)
+        """
+
+    def validate_customfields(
+        self,
+        share_code: Any,
+        customfield_param: Any = None,
+    ) -> QueryO:
+        """Validate customfields.
+
+        :param share_code: The share code
+        :param customfield_param: Custom field(s)
+        """
+
+    def event_defaults(
+        self,
+        uuid: Any,
+        event_approve: Any = None,
+        event_case_assignment: Any = None,
+        event_harvest: Any = None,
+        event_link: Any = None,
+        event_link_mine: Any = None,
+        event_message: Any = None,
+        event_new_report: Any = None,
+        event_node: Any = None,
+        event_report_remove: Any = None,
+        event_share: Any = None,
+        event_status_change: Any = None,
+        event_study_comment: Any = None,
+        event_thin_study_fail: Any = None,
+        event_thin_study_success: Any = None,
+        event_upload: Any = None,
+        event_upload_fail: Any = None,
+    ) -> QueryO:
+        """Event defaults.
+
+        :param uuid: The uuid of the namespace
+        :param event_approve: Notify the user on a approval needed into the namespace (optional)
+        :param event_case_assignment: Notify the user when they are assigned a case as a medical or admin user (optional)
+        :param event_harvest: Notify the user on a harvest into the namespace (optional)
+        :param event_link: Notify the user when an anonymous link is hit in the namespace (optional)
+        :param event_link_mine: Notify the user when an anonymous link created by the user is hit in the namespace (optional)
+        :param event_message: Notify the user when a message is sent to the namespace (optional)
+        :param event_new_report: Notify the user when a report is attached in the namespace (optional)
+        :param event_node: Notify the user when a namespace node sends an event (optional)
+        :param event_report_remove: Notify the user when a report is removed in the namespace (optional)
+        :param event_share: Notify the user on a share into the namespace (optional)
+        :param event_status_change: Notify the user when the status of a study is changed (optional)
+        :param event_study_comment: Notify the user when a comment is attached to a study in the namespace (optional)
+        :param event_thin_study_fail: Notify the user when a thin study retrieval they initiated fails (optional)
+        :param event_thin_study_success: Notify the user when a thin study retrieval they initiated succeeds (optional)
+        :param event_upload: Notify the user on an upload into the namespace (optional)
+        :param event_upload_fail: Notify the user on a failed upload into the namespace (optional)
+        """
+
+    def study_defaults(
+        self,
+        uuid: Any,
+        defaults: Any = None,
+    ) -> QueryO:
+        """Study defaults.
+
+        :param uuid: The uuid of the namespace
+        :param defaults: Default values in JSON format. The format is a hash with the keys the names of the fields and the values are the default value. The available field name are as listed in the returned field hash. (optional)
+        """
+
+    def engine_fqdn(
+        self,
+        namespace_id: Any = None,
+        phi_namespace: Any = None,
+        source: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Engine fqdn.
+
+        :param namespace_id: namespace_id
+        :param phi_namespace: phi_namespace
+        :param source: The source of the query (optional)
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+
+        Notes:
+        (namespace_id OR study_id OR study_uid AND storage_namespace AND phi_namespace) - The uuid of the namespace or study or the study_uid/storage_namespace/phi_namespace triplet
+        """
+
+    def removed_user_report(
+        self,
+        account_id: Any,
+        email: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Removed user report.
+
+        :param account_id: The UUID of the account. A report will be produced for group, location and account namespaces of this account
+        :param email: Optional email address to send the report to
+        :param uuid: The UUID of the namespace
+        """
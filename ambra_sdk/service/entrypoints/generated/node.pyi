@@ -0,0 +1,421 @@
+""" Node.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Node(Namespace):
+    """Node."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def public(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """Public.
+
+        :param account_id: The account the user is in
+        """
+
+    def connect(
+        self,
+        account_id: Any,
+        uuid: Any,
+        message: Any = None,
+    ) -> QueryO:
+        """Connect.
+
+        :param account_id: The account the user is in
+        :param uuid: The node id
+        :param message: Message (optional)
+        """
+
+    def add(
+        self,
+        accelerator_id: Any,
+        name: Any,
+        type: Any,
+        account_id: Any = None,
+        category: Any = None,
+        ctc_bucket: Any = None,
+        facility_contact: Any = None,
+        facility_contact_title: Any = None,
+        facility_email: Any = None,
+        facility_name: Any = None,
+        facility_notes: Any = None,
+        facility_zip: Any = None,
+        group_id: Any = None,
+        is_public: Any = None,
+        location_id: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param accelerator_id: uuid of the accelerator if this is an accelerator node
+        :param name: Description of the node
+        :param type: Type of node (STORAGE|HARVESTER|ACCELERATOR|CLEARINGHOUSE|VIRTUAL|UTILITY|XDS)
+        :param account_id: account_id
+        :param category: Node category (ACTIVE|INACTIVE|MIGRATION|TEST|DUPLICATE|INTEGRATED|ACCELERATOR) (optional)
+        :param ctc_bucket: Name of the S3 bucket to use for a cloud to cloud gateway (optional)
+        :param facility_contact: Name of the facility contact (optional)
+        :param facility_contact_title: Title of the facility contact (optional)
+        :param facility_email: Email of the facility contact (optional)
+        :param facility_name: Name of the facility it is installed at (optional)
+        :param facility_notes: Notes about the facility (optional)
+        :param facility_zip: Zip code of the facility it is installed at (optional)
+        :param group_id: group_id
+        :param is_public: Flag if the node is public (optional)
+        :param location_id: location_id
+        :param uuid: uuid of the node (optional, you can use this to explicitly set the UUID)
+
+        Notes:
+        (account_id OR location_id OR group_id) - uuid of the account, location or group to link this node to
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        category: Any = None,
+        configuration: Any = None,
+        ctc_bucket: Any = None,
+        facility_contact: Any = None,
+        facility_contact_title: Any = None,
+        facility_email: Any = None,
+        facility_name: Any = None,
+        facility_notes: Any = None,
+        facility_zip: Any = None,
+        is_public: Any = None,
+        monitor_email: Any = None,
+        monitor_node_last_send: Any = None,
+        monitor_node_last_send_threshold: Any = None,
+        monitor_node_ping: Any = None,
+        monitor_node_slow_push: Any = None,
+        monitor_node_slow_push_threshold: Any = None,
+        monitor_study_create: Any = None,
+        monitor_study_create_threshold: Any = None,
+        name: Any = None,
+        reload_configuration: Any = None,
+        serial_no: Any = None,
+        setting_param: Any = None,
+        settings: Any = None,
+        storage_namespace: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: The node id
+        :param category: Node category (ACTIVE|INACTIVE|MIGRATION|TEST|DUPLICATE|INTEGRATED) (optional)
+        :param configuration: The configuration as a JSON hash of key values pairs (optional)
+        :param ctc_bucket: Name of the S3 bucket to use for a cloud to cloud gateway (optional)
+        :param facility_contact: Name of the facility contact (optional)
+        :param facility_contact_title: Title of the facility contact (optional)
+        :param facility_email: Email of the facility contact (optional)
+        :param facility_name: Name of the facility it is installed at (optional)
+        :param facility_notes: Notes about the facility (optional)
+        :param facility_zip: Zip code of the facility it is installed at (optional)
+        :param is_public: Flag if the node is public (optional)
+        :param monitor_email: Email address(es) to send monitor failure notices (optional)
+        :param monitor_node_last_send: Check if the node has sent a study recently (optional)
+        :param monitor_node_last_send_threshold: Threshold in minutes for triggering the monitor_node_last_send notification (optional)
+        :param monitor_node_ping: Check if the node is pinging (optional)
+        :param monitor_node_slow_push: Check if the node is pushing slowly (optional)
+        :param monitor_node_slow_push_threshold: Threshold in minutes for triggering the monitor_node_slow_push notification (optional)
+        :param monitor_study_create: Check if the node is sending studies normally (optional)
+        :param monitor_study_create_threshold: Threshold in minutes for triggering the monitor_study_create notification (optional)
+        :param name: Description of the node (optional)
+        :param reload_configuration: If this flag is set the node will be instructed to reload it&#39;s configuration on the next ping (optional)
+        :param serial_no: serial_no
+        :param setting_param: Set an individual setting. This is an alternative to the settings hash for easier use in the API tester (optional)
+        :param settings: A hash of the account settings that the node can override (optional)
+        :param storage_namespace: Namespace uuid to attach the node to. This requires a sysadmin sid and must be within the same account (optional)
+
+        Notes:
+        (sid OR serial_no) - The session id or serial number of the node
+        """
+
+    def get(
+        self,
+        uuid: Any,
+        serial_no: Any = None,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The node id
+        :param serial_no: serial_no
+
+        Notes:
+        (sid OR serial_no) - The session id or serial number of the node
+        """
+
+    def ping(
+        self,
+        ack: Any,
+        serial_no: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Ping.
+
+        :param ack: Flag if the gateway wants to use the acknowledge workflow
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        """
+
+    def ping_ack(
+        self,
+        serial_no: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Ping ack.
+
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        """
+
+    def deliver(
+        self,
+        serial_no: Any,
+        status: Any,
+        uuid: Any,
+        ack: Any = None,
+        destination_id: Any = None,
+        email_reason: Any = None,
+        is_local: Any = None,
+        job_id: Any = None,
+        status_reason: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Deliver.
+
+        :param serial_no: The serial number of the node
+        :param status: Status code of the job (S|F|P|B|U) - Success, failure, partial transfer, blocked or uncached
+        :param uuid: The node id
+        :param ack: The HL7 ACK if this was an HL7 job (optional)
+        :param destination_id: The uuid of the destination, required for local pushes (optional)
+        :param email_reason: Email the user this reason for the status change (optional)
+        :param is_local: The flag used to indicate the local push (optional)
+        :param job_id: The uuid of the push job, not used for local pushes (optional)
+        :param status_reason: Detail on the status change (optional)
+        :param study_uid: The study uid of the local push, required for local pushes only (optional)
+        """
+
+    def retrieve(
+        self,
+        job_id: Any,
+        serial_no: Any,
+        status: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Retrieve.
+
+        :param job_id: The uuid of the fetch job
+        :param serial_no: The serial number of the node
+        :param status: Status code of the job (S|F|P) - Success, failure, partial transfer
+        :param uuid: The node id
+        """
+
+    def webhook(
+        self,
+        serial_no: Any,
+        status: Any,
+        uuid: Any,
+        webhook_id: Any,
+        error_message: Any = None,
+    ) -> QueryO:
+        """Webhook.
+
+        :param serial_no: The serial number of the node
+        :param status: Status code of the job (S|F) - Success, failure
+        :param uuid: The node id
+        :param webhook_id: The uuid of the webhook job
+        :param error_message: Detailed error message (optional)
+        """
+
+    def configuration(
+        self,
+        serial_no: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Configuration.
+
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The node id
+        """
+
+    def study_queued(
+        self,
+        serial_no: Any,
+        study_uid: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Study queued.
+
+        :param serial_no: The serial number of the node
+        :param study_uid: The study uid
+        :param uuid: The node id
+        """
+
+    def found(
+        self,
+        search_id: Any,
+        serial_no: Any,
+        studies: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Found.
+
+        :param search_id: The id of the search request
+        :param serial_no: The serial number of the node
+        :param studies: A JSON array of the studies found. Each object has the following fields:
+            study_uid - The study_uid
+            study_date - The study date
+            accession_number - The accession number
+            referring_physician - The referring physician
+            patient_name - Patient name
+            patientid - Patient ID
+            patient_sex - Gender
+            patient_birth_date - Birth date
+            study_description - Study description
+            modality - Modality
+            result_fields - A JSON structure with the answers for the requested result_fields in /destination/search (optional)
+        :param uuid: The node id
+        """
+
+    def found_mwl(
+        self,
+        orders: Any,
+        search_id: Any,
+        serial_no: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Found mwl.
+
+        :param orders: A JSON array of the orders found. Each object has the following fields:
+            patient_name - Patient name
+            patientid - Patient id
+            accession_number - Accession number
+            patient_sex - Gender
+            patient_birth_date - Birth date
+            order_number - Order number
+            order_date - Order date
+        :param search_id: The id of the search request
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        """
+
+    def event(
+        self,
+        destination_id: Any,
+        event: Any,
+        serial_no: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Event.
+
+        :param destination_id: The id of the destination if the event is associated with a destination
+        :param event: The event (c_echo_error)
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        """
+
+    def log(
+        self,
+        end: Any,
+        start: Any,
+        type: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Log.
+
+        :param end: End time stamp in YYYY-MM-DD HH:MM:SS format
+        :param start: Start time stamp in YYYY-MM-DD HH:MM:SS format
+        :param type: Type of log (log|dicom|queue) defaults to log if not passed
+        :param uuid: The node id
+        """
+
+    def metric(
+        self,
+        job_id: Any,
+        metric: Any,
+        serial_no: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Metric.
+
+        :param job_id: The uuid of the push job
+        :param metric: The metric to record
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        """
+
+    def progress_add(
+        self,
+        queue: Any,
+        serial_no: Any,
+        state: Any,
+        uuid: Any,
+        accession_number: Any = None,
+        destination_id: Any = None,
+        detail: Any = None,
+        patientid: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Progress add.
+
+        :param queue: The queue
+        :param serial_no: The serial number of the node
+        :param state: The status
+        :param uuid: The node id
+        :param accession_number: DICOM tag (0008,0050) (optional)
+        :param destination_id: The destination uuid (optional)
+        :param detail: JSON detail (optional)
+        :param patientid: DICOM tag (0010,0020) (optional)
+        :param study_uid: Study uid (optional)
+        """
+
+    def progress_list(
+        self,
+        destination_id: Any = None,
+        node_id: Any = None,
+    ) -> QueryOPSF:
+        """Progress list.
+
+        :param destination_id: destination_id
+        :param node_id: node_id
+
+        Notes:
+        (node_id OR destination_id) - The node or destination id
+        """
+
+    def progress_get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Progress get.
+
+        :param uuid: The node progress uuid
+        """
@@ -0,0 +1,31 @@
+""" Npi.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Npi(Namespace):
+    """Npi."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def find(
+        self,
+        last: Any,
+        state: Any,
+        first: Any = None,
+        zip: Any = None,
+    ) -> QueryO:
+        """Find.
+
+        :param last: Last name
+        :param state: 2 letter state code
+        :param first: First name (optional)
+        :param zip: Zip code (optional)
+        """
@@ -0,0 +1,185 @@
+""" Order.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOF
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Order(Namespace):
+    """Order."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def add(
+        self,
+        accession_number: Any,
+        account_id: Any,
+        patient_birth_date: Any,
+        patient_name: Any,
+        patient_sex: Any,
+        patientid: Any,
+        referring_physician: Any,
+        sending_facility: Any,
+        customfield_param: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param accession_number: Accession number
+        :param account_id: uuid of the account to add them to
+        :param patient_birth_date: DOB
+        :param patient_name: Patient name
+        :param patient_sex: Gender
+        :param patientid: Patient MRN
+        :param referring_physician: Referring physician
+        :param sending_facility: Sending facility
+        :param customfield_param: Custom field(s) (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The order uuid
+        """
+
+    def set(
+        self,
+        accession_number: Any,
+        patient_birth_date: Any,
+        patient_name: Any,
+        patient_sex: Any,
+        patientid: Any,
+        referring_physician: Any,
+        sending_facility: Any,
+        uuid: Any,
+        customfield_param: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param accession_number: Accession number
+        :param patient_birth_date: DOB
+        :param patient_name: Patient name
+        :param patient_sex: Gender
+        :param patientid: Patient MRN
+        :param referring_physician: Referring physician
+        :param sending_facility: Sending facility
+        :param uuid: The order uuid
+        :param customfield_param: Custom field(s) (optional)
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The order uuid
+        """
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def sps_add(
+        self,
+        modality: Any,
+        order_id: Any,
+        requested_procedure_description: Any,
+        requested_procedure_id: Any,
+        scheduled_procedure_step_description: Any,
+        scheduled_procedure_step_id: Any,
+        scheduled_procedure_step_start_date: Any,
+        scheduled_procedure_step_start_time: Any,
+        scheduled_station_aetitle: Any,
+    ) -> QueryO:
+        """Sps add.
+
+        :param modality: Modality
+        :param order_id: uuid of the order
+        :param requested_procedure_description: Procedure description
+        :param requested_procedure_id: Procedure ID
+        :param scheduled_procedure_step_description: Step description
+        :param scheduled_procedure_step_id: Step ID
+        :param scheduled_procedure_step_start_date: Start date
+        :param scheduled_procedure_step_start_time: Start time
+        :param scheduled_station_aetitle: Station AE title
+        """
+
+    def sps_set(
+        self,
+        uuid: Any,
+        modality: Any = None,
+        requested_procedure_description: Any = None,
+        requested_procedure_id: Any = None,
+        scheduled_procedure_step_description: Any = None,
+        scheduled_procedure_step_id: Any = None,
+        scheduled_procedure_step_start_date: Any = None,
+        scheduled_procedure_step_start_time: Any = None,
+        scheduled_station_aetitle: Any = None,
+    ) -> QueryO:
+        """Sps set.
+
+        :param uuid: UUID of the SPS
+        :param modality: Modality (optional)
+        :param requested_procedure_description: Procedure description (optional)
+        :param requested_procedure_id: Procedure ID (optional)
+        :param scheduled_procedure_step_description: Step description (optional)
+        :param scheduled_procedure_step_id: Step ID (optional)
+        :param scheduled_procedure_step_start_date: Start date (optional)
+        :param scheduled_procedure_step_start_time: Start time (optional)
+        :param scheduled_station_aetitle: Station AE title (optional)
+        """
+
+    def sps_delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Sps delete.
+
+        :param uuid: UUID of the SPS
+        """
+
+    def sps_status(
+        self,
+        mpps_status: Any,
+        mpps_uid: Any,
+        serial_no: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Sps status.
+
+        :param mpps_status: The mpps status to set (PENDING|IN_PROGRESS|DISCONTINUED|COMPLETED)
+        :param mpps_uid: The mpps UUID of the SPS
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        """
+
+    def sps_find(
+        self,
+        account_id: Any,
+        node_id: Any = None,
+        serial_no: Any = None,
+    ) -> QueryOF:
+        """Sps find.
+
+        :param account_id: The account uuid if sid authentication is used
+        :param node_id: node_id
+        :param serial_no: serial_no
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either the sid or the node uuid and serial number
+        """
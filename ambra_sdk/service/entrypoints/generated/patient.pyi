@@ -0,0 +1,183 @@
+""" Patient.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPS
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Patient(Namespace):
+    """Patient."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def add(
+        self,
+        account_id: Any,
+        alt_email: Any = None,
+        alt_mobile_phone: Any = None,
+        birth_date: Any = None,
+        customfield_param: Any = None,
+        email: Any = None,
+        event_new_report: Any = None,
+        event_share: Any = None,
+        first: Any = None,
+        last: Any = None,
+        mobile_phone: Any = None,
+        mrn: Any = None,
+        name: Any = None,
+        sex: Any = None,
+        study_id: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account to add them to
+        :param alt_email: Alternate email address (optional)
+        :param alt_mobile_phone: Alternate mobile phone number (optional)
+        :param birth_date: Birth date (optional)
+        :param customfield_param: Custom field(s) (optional)
+        :param email: Email address (optional)
+        :param event_new_report: Notify the patient if a report is attached on the patient portal (optional)
+        :param event_share: Notify the patient if a new study is available on the patient portal (optional)
+        :param first: first
+        :param last: last
+        :param mobile_phone: Mobile phone number (optional)
+        :param mrn: MRN (optional if study_id is used)
+        :param name: name
+        :param sex: Gender (optional)
+        :param study_id: Id of the study to create a patient from (optional)
+
+        Notes:
+        (name OR first AND last) - Patient name as either full name or first and last (optional if study_id is used)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The patient uuid
+        """
+
+    def set(
+        self,
+        birth_date: Any,
+        mrn: Any,
+        sex: Any,
+        uuid: Any,
+        alt_email: Any = None,
+        alt_mobile_phone: Any = None,
+        customfield_param: Any = None,
+        email: Any = None,
+        event_new_report: Any = None,
+        event_share: Any = None,
+        first: Any = None,
+        last: Any = None,
+        mobile_phone: Any = None,
+        name: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param birth_date: Birth date
+        :param mrn: MRN
+        :param sex: Gender
+        :param uuid: The patient uuid
+        :param alt_email: Alternate email address (optional)
+        :param alt_mobile_phone: Alternate mobile phone number (optional)
+        :param customfield_param: Custom field(s) (optional)
+        :param email: Email address (optional)
+        :param event_new_report: Notify the patient if a report is attached on the patient portal (optional)
+        :param event_share: Notify the patient if a new study is available on the patient portal (optional)
+        :param first: first
+        :param last: last
+        :param mobile_phone: Mobile phone number (optional)
+        :param name: name
+
+        Notes:
+        (name OR first AND last) - Patient name as either full name or first and last
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The patient uuid
+        """
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def study_list(
+        self,
+        uuid: Any,
+        viewable_only: Any,
+    ) -> QueryO:
+        """Study list.
+
+        :param uuid: The patient id
+        :param viewable_only: Flag if they only want the studies the user can view
+        """
+
+    def portal_find(
+        self,
+        birth_date: Any,
+        first: Any,
+        last: Any,
+        mrn: Any,
+    ) -> QueryO:
+        """Portal find.
+
+        :param birth_date: Date of birth
+        :param first: The first name
+        :param last: The last name
+        :param mrn: MRN (required if the require_mrn_for_patient_portal account setting is on)
+        """
+
+    def portal_pin(
+        self,
+        alt_email: Any,
+        alt_mobile_phone: Any,
+        email: Any,
+        mobile_phone: Any,
+        patient_id: Any,
+    ) -> QueryO:
+        """Portal pin.
+
+        :param alt_email: Flag if they want the PIN sent via the alt_email
+        :param alt_mobile_phone: Flag if they want the PIN sent via SMS to the alt_mobile_phone
+        :param email: Flag if they want the PIN sent via email
+        :param mobile_phone: Flag if they want the PIN sent via SMS
+        :param patient_id: The patient id
+        """
+
+    def portal_login(
+        self,
+        patient_id: Any,
+        pin: Any,
+    ) -> QueryO:
+        """Portal login.
+
+        :param patient_id: The patient id
+        :param pin: The PIN
+        """
+
+    def portal_list(
+        self,
+    ) -> QueryOPS:
+        """Portal list.
+        """
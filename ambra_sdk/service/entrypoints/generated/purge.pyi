@@ -0,0 +1,142 @@
+""" Purge.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Purge(Namespace):
+    """Purge."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        days_old: Any,
+        days_old_how: Any,
+        name: Any,
+        adults: Any = None,
+        archive: Any = None,
+        global_param: Any = None,
+        max_deletes: Any = None,
+        minors: Any = None,
+        modalities: Any = None,
+        namespaces: Any = None,
+        owned_phr: Any = None,
+        shared_from_phr: Any = None,
+        skinny: Any = None,
+        study_status_tags: Any = None,
+        suspended: Any = None,
+        thin: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account the rule is for
+        :param days_old: Studies greater than or equal to these days old will be purged
+        :param days_old_how: How should the days old value be calculated using the &#39;U&#39;pdated, &#39;C&#39;reated or &#39;S&#39;tudy date
+        :param name: Name of the purge rule
+        :param adults: Apply this rule to adults - flag (optional)
+        :param archive: Archive the studies rather than deleting them - flag (optional)
+        :param global_param: Flag to make this a global purge rule (optional)
+        :param max_deletes: Maximum number of purges per run of the rule (optional)
+        :param minors: Apply this rule to minors - flag (optional)
+        :param modalities: A JSON array of modalities to limit the rule to (optional)
+        :param namespaces: A JSON array of namespace uuid to limit the rule to (optional)
+        :param owned_phr: Apply this rule to owned PHR namespaces - flag (optional)
+        :param shared_from_phr: If a study was shared from a PHR namespace delete the copy in the PHR namespace as well - flag (optional)
+        :param skinny: Make the studies skinny rather than deleting - flag (optional)
+        :param study_status_tags: A comma separated list of study status tags to purge (optional)
+        :param suspended: This rule is suspended and not applied - flag (optional)
+        :param thin: Make the studies thin rather than deleting - flag (optional)
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        adults: Any = None,
+        archive: Any = None,
+        days_old: Any = None,
+        days_old_how: Any = None,
+        global_param: Any = None,
+        max_deletes: Any = None,
+        minors: Any = None,
+        modalities: Any = None,
+        name: Any = None,
+        namespaces: Any = None,
+        owned_phr: Any = None,
+        shared_from_phr: Any = None,
+        skinny: Any = None,
+        study_status_tags: Any = None,
+        suspended: Any = None,
+        thin: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: Id of the purge rule
+        :param adults: Apply this rule to adults - flag (optional)
+        :param archive: Archive the studies rather than deleting them - flag (optional)
+        :param days_old: Studies greater than or equal to these days old will be purged (optional)
+        :param days_old_how: How should the days old value be calculated using the &#39;U&#39;pdated, &#39;C&#39;reated or &#39;S&#39;tudy date (optional)
+        :param global_param: Flag to make this a global purge rule (optional)
+        :param max_deletes: Maximum number of purges per run of the rule (optional)
+        :param minors: Apply this rule to minors - flag (optional)
+        :param modalities: A JSON array of modalities to limit the rule to) (optional)
+        :param name: Name of the purge rule (optional)
+        :param namespaces: A JSON array of namespace uuid to limit the rule to (optional)
+        :param owned_phr: Apply this rule owned PHR namespaces - flag (optional)
+        :param shared_from_phr: If a study was shared from a PHR namespace delete the copy in the PHR namespace as well - flag (optional)
+        :param skinny: Make the studies skinny rather than deleting - flag (optional)
+        :param study_status_tags: A comma separated list of study status tags to purge (optional)
+        :param suspended: This rule is suspended and not applied - flag (optional)
+        :param thin: Make the studies thin rather than deleting - flag (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: Id of the purge rule
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: Id of the purge rule
+        """
+
+    def run(
+        self,
+        dry_run: Any,
+        account_id: Any = None,
+        rule_id: Any = None,
+    ) -> QueryO:
+        """Run.
+
+        :param dry_run: Do a dry run of the rule - flag
+        :param account_id: account_id
+        :param rule_id: rule_id
+
+        Notes:
+        (rule_id OR account_id) - Id of the purge rule or the account id if all purge rules should be run
+        """
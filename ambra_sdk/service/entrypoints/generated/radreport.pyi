@@ -0,0 +1,201 @@
+""" Radreport.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Radreport(Namespace):
+    """Radreport."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def add(
+        self,
+        study_id: Any,
+        type: Any,
+        fields: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param study_id: Id of the study to add the radreport to
+        :param type: The type of the radreport
+        :param fields: A JSON hash of the fields in the report (optional)
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        attachment: Any = None,
+        fields: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: Id of the radreport
+        :param attachment: A JSON hash of the storage attachment information (optional)
+        :param fields: A JSON hash of the fields in the report (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: Id of the radreport
+        """
+
+    def audit(
+        self,
+        action: Any,
+        detail: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Audit.
+
+        :param action: The audit action (SIGNED|MEDICAL_EDIT|ADMIN_EDIT|REPORT_GENERATED)
+        :param detail: Additional information
+        :param uuid: The id of the radreport
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: Id of the radreport
+        """
+
+    def description(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Description.
+
+        :param uuid: Id of the radreport
+        """
+
+    def user_list(
+        self,
+        user_id: Any,
+    ) -> QueryOPSF:
+        """User list.
+
+        :param user_id: The user id
+        """
+
+    def pdf(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Pdf.
+
+        :param uuid: The radreport uuid
+        """
+
+    def fax(
+        self,
+        number: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Fax.
+
+        :param number: The fax number to send the PDF report to
+        :param uuid: The radreport uuid
+        """
+
+    def template_list(
+        self,
+        account_id: Any,
+        active: Any = None,
+        type: Any = None,
+    ) -> QueryOPSF:
+        """Template list.
+
+        :param account_id: uuid of the account
+        :param active: Limit to active templates (optional)
+        :param type: Limit to this type (optional)
+        """
+
+    def template_add(
+        self,
+        account_id: Any,
+        body: Any,
+        name: Any,
+        type: Any,
+        options: Any = None,
+        preview: Any = None,
+    ) -> QueryO:
+        """Template add.
+
+        :param account_id: uuid of the account
+        :param body: Body of the template
+        :param name: Name of the template
+        :param type: Type of radreport
+        :param options: JSON options of the template (optional)
+        :param preview: Preview of the template (optional)
+        """
+
+    def template_set(
+        self,
+        uuid: Any,
+        body: Any = None,
+        name: Any = None,
+        options: Any = None,
+        preview: Any = None,
+        type: Any = None,
+    ) -> QueryO:
+        """Template set.
+
+        :param uuid: uuid of the template
+        :param body: Body of the template (optional)
+        :param name: Name of the template (optional)
+        :param options: JSON options of the template (optional)
+        :param preview: Preview of the template (optional)
+        :param type: Type of radreport (optional)
+        """
+
+    def template_get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Template get.
+
+        :param uuid: uuid of the template
+        """
+
+    def template_get_type(
+        self,
+        account_id: Any,
+        type: Any,
+    ) -> QueryO:
+        """Template get type.
+
+        :param account_id: uuid of the account
+        :param type: Type of the template
+        """
+
+    def template_delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Template delete.
+
+        :param uuid: uuid of the template
+        """
+
+    def template_activate(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Template activate.
+
+        :param uuid: uuid of the template
+        """
@@ -0,0 +1,86 @@
+""" Radreportmacro.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Radreportmacro(Namespace):
+    """Radreportmacro."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+        modality: Any = None,
+        type: Any = None,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        :param modality: Limit to this modality (optional)
+        :param type: Limit to this type (optional)
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        body: Any,
+        modality: Any,
+        name: Any,
+        type: Any,
+        hotkey: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account
+        :param body: JSON body of the macro
+        :param modality: Modality
+        :param name: Name of the macro
+        :param type: Type of radreport
+        :param hotkey: Hotkey of the macro (optional)
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        body: Any = None,
+        hotkey: Any = None,
+        modality: Any = None,
+        name: Any = None,
+        type: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: uuid of the macro
+        :param body: JSON body of the macro (optional)
+        :param hotkey: Hotkey of the macro (optional)
+        :param modality: Modality (optional)
+        :param name: Name of the macro (optional)
+        :param type: Type of radreport (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: uuid of the macro
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: uuid of the macro
+        """
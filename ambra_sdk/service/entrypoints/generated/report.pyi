@@ -0,0 +1,34 @@
+""" Report.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Report(Namespace):
+    """Report."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def status(
+        self,
+        report_id: Any,
+    ) -> QueryO:
+        """Status.
+
+        :param report_id: The report id
+        """
+
+    def zip(
+        self,
+        report_id: Any,
+    ) -> QueryO:
+        """Zip.
+
+        :param report_id: The report id
+        """
@@ -0,0 +1,104 @@
+""" Role.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Role(Namespace):
+    """Role."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        name: Any,
+        for_account: Any = None,
+        for_group: Any = None,
+        for_location: Any = None,
+        permissions: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account
+        :param name: Name of the role
+        :param for_account: A flag that the role can be used in an account, default is on (optional)
+        :param for_group: A flag that the role can be used in a group, default is on (optional)
+        :param for_location: A flag that the role can be used in a location, default is on (optional)
+        :param permissions: A hash of the role permissions (optional)
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        description: Any = None,
+        for_account: Any = None,
+        for_group: Any = None,
+        for_location: Any = None,
+        name: Any = None,
+        permission_param: Any = None,
+        permissions: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: The role uuid
+        :param description: Description of the role (optional)
+        :param for_account: A flag that the role can be used in an account (optional)
+        :param for_group: A flag that the role can be used in a group (optional)
+        :param for_location: A flag that the role can be used in a location (optional)
+        :param name: Name of the role (optional)
+        :param permission_param: Set an individual permission. This is an alternative to the permissions hash for easier use in the API tester (optional)
+        :param permissions: A hash of the role permissions (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The role uuid
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The role uuid
+        """
+
+    def default_permissions(
+        self,
+        account_id: Any = None,
+    ) -> QueryO:
+        """Default permissions.
+
+        :param account_id: The account id (optional)
+        """
+
+    def report_detail(
+        self,
+        account_id: Any,
+    ) -> QueryO:
+        """Report detail.
+
+        :param account_id: The account id
+        """
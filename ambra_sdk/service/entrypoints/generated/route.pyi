@@ -0,0 +1,150 @@
+""" Route.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Route(Namespace):
+    """Route."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def add(
+        self,
+        actions: Any,
+        conditions: Any,
+        name: Any,
+        on_harvest: Any,
+        on_share: Any,
+        account_id: Any = None,
+        delay: Any = None,
+        delay_seconds: Any = None,
+        delay_till_schedule: Any = None,
+        group_id: Any = None,
+        location_id: Any = None,
+        manual_roles: Any = None,
+        namespace_id: Any = None,
+        no_re_run: Any = None,
+        on_manual_route: Any = None,
+        on_thin: Any = None,
+        on_upload: Any = None,
+        options: Any = None,
+        other_namespaces: Any = None,
+        schedule: Any = None,
+        suspended: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param actions: Route actions in JSON format
+        :param conditions: Route conditions in JSON format
+        :param name: Name of the route
+        :param on_harvest: Apply the rule to studies harvested into the namespace
+        :param on_share: Apply the rule to studies shared into the namespace
+        :param account_id: account_id
+        :param delay: Number of minutes to delay running this rule for after it is triggered (optional)
+        :param delay_seconds: Number of seconds to delay running this rule for after it is triggered (optional)
+        :param delay_till_schedule: Delay running this rule after it is triggered until the next scheduled time - flag (optional)
+        :param group_id: group_id
+        :param location_id: location_id
+        :param manual_roles: A comma separated list of the uuid of roles that can run the rule manually (optional)
+        :param namespace_id: namespace_id
+        :param no_re_run: Do not run this rule on a re-notification from storage - flag (optional)
+        :param on_manual_route: Apply this rule for a manually routed study - flag (optional)
+        :param on_thin: Apply this rule to thin studies when they are created - flag (optional)
+        :param on_upload: Apply the rule to studies uploaded into the namespace - flag (optional)
+        :param options: Route options in JSON format (optional)
+        :param other_namespaces: A comma separated list of the uuid of other namespaces to apply this rule to (optional)
+        :param schedule: Route schedule in JSON format (optional)
+        :param suspended: This rule is suspended and not applied - flag (optional)
+
+        Notes:
+        (account_id OR group_id OR location_id OR namespace_id) - uuid of the account, group or location or namespace the route is linked with
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        actions: Any = None,
+        conditions: Any = None,
+        delay: Any = None,
+        delay_seconds: Any = None,
+        delay_till_schedule: Any = None,
+        manual_roles: Any = None,
+        name: Any = None,
+        no_re_run: Any = None,
+        on_harvest: Any = None,
+        on_manual_route: Any = None,
+        on_share: Any = None,
+        on_thin: Any = None,
+        on_upload: Any = None,
+        options: Any = None,
+        other_namespaces: Any = None,
+        schedule: Any = None,
+        suspended: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: The route uuid
+        :param actions: Route actions in JSON format (optional)
+        :param conditions: Route conditions in JSON format (optional)
+        :param delay: Number of minutes to delay running this rule for after it is triggered (optional)
+        :param delay_seconds: Number of seconds to delay running this rule for after it is triggered (optional)
+        :param delay_till_schedule: Delay running this rule after it is triggered until the next scheduled time - flag (optional)
+        :param manual_roles: A comma separated list of the uuid of roles that can run the rule manually (optional)
+        :param name: Name of the route (optional)
+        :param no_re_run: Do not run this rule on a re-notification from storage - flag (optional)
+        :param on_harvest: Apply the rule to studies harvested into the namespace (optional)
+        :param on_manual_route: Apply this rule for a manually routed study- flag (optional)
+        :param on_share: Apply the rule to studies shared into the namespace (optional)
+        :param on_thin: Apply this rule to thin studies when they are created - flag (optional)
+        :param on_upload: Apply the rule to studies uploaded into the namespace - flag (optional)
+        :param options: Route options in JSON format (optional)
+        :param other_namespaces: A comma separated list of the uuid of other namespaces to apply this rule to (optional)
+        :param schedule: Route schedule in JSON format (optional)
+        :param suspended: This rule is suspended and not applied - flag (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: The route uuid
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: The route uuid
+        """
+
+    def physician_alias_match(
+        self,
+        account_id: Any,
+        lv: Any,
+    ) -> QueryO:
+        """Physician alias match.
+
+        :param account_id: The account to test in
+        :param lv: The tag text to match against the PHYSICIAN_ALIAS rule.
+        """
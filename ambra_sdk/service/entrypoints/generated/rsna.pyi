@@ -0,0 +1,35 @@
+""" Rsna.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Rsna(Namespace):
+    """Rsna."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def phr_study(
+        self,
+        access_code: Any,
+        dob: Any,
+        exam_id: Any,
+        namespace: Any,
+        pin: Any,
+        clearinghouse: Any = None,
+    ) -> QueryO:
+        """Phr_study.
+
+        :param access_code: RSNA-generated access code
+        :param dob: Patient&#39;s date of birth YYYYMMDD
+        :param exam_id: RSNA-generated exam ID/token/email (DEPRECATED June 2015 - use access_code)
+        :param namespace: Namespace where retrieved exam will be stored
+        :param pin: RSNA-generated PIN (DEPRECATED June 2015 - use access_code)
+        :param clearinghouse: Clearinghouse to retrieve exam from: test or blank (optional)
+        """
@@ -0,0 +1,137 @@
+""" Session.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Session(Namespace):
+    """Session."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def login(
+        self,
+        login: Any,
+        password: Any,
+        account_login: Any = None,
+        account_name: Any = None,
+        email: Any = None,
+        location: Any = None,
+        new_password: Any = None,
+        validate_session: Any = None,
+        vanity: Any = None,
+    ) -> QueryO:
+        """Login.
+
+        :param login: The user account_login or email address
+        :param password: The password
+        :param account_login: account_login
+        :param account_name: account_name
+        :param email: email
+        :param location: Login location. (optional)
+        :param new_password: Change the password or account password to this. (optional)
+        :param validate_session: If you would like to validate an existing session rather than create a new one pass in the sid of the session to valid in this parameter. It will check if the session is still valid and the credentials are for the session. (optional)
+        :param vanity: The account vanity name. (optional)
+
+        Notes:
+        email OR account_name AND account_login - The users email address or the account name and account_login (DEPRECIATED - Use login and vanity)
+        """
+
+    def user(
+        self,
+        settings: Any = None,
+    ) -> QueryO:
+        """User.
+
+        :param settings: A JSON list of user settings set via /setting/set to return (optional)
+        """
+
+    def permissions(
+        self,
+        account_id: Any = None,
+        namespace_id: Any = None,
+    ) -> QueryO:
+        """Permissions.
+
+        :param account_id: account_id
+        :param namespace_id: namespace_id
+
+        Notes:
+        (account_id OR namespace_id) - Either the account or namespaces to get the users permissions for
+        """
+
+    def logout(
+        self,
+    ) -> QueryO:
+        """Logout.
+        """
+
+    def csrf_enable(
+        self,
+        redirect_uri: Any,
+    ) -> QueryO:
+        """Csrf enable.
+
+        :param redirect_uri: The URL to redirect to
+        """
+
+    def uuid(
+        self,
+    ) -> QueryO:
+        """Uuid.
+        """
+
+    def oauth_start(
+        self,
+    ) -> QueryO:
+        """Oauth start.
+        """
+
+    def oauth(
+        self,
+        code: Any,
+        redirect_uri: Any,
+        vendor: Any,
+    ) -> QueryO:
+        """Oauth.
+
+        :param code: The OAuth code
+        :param redirect_uri: The redirect_uri used to get the code parameter
+        :param vendor: The OAuth vendor (doximity|google|brand)
+        """
+
+    def oauth_token(
+        self,
+        client_id: Any,
+        client_secret: Any,
+        grant_type: Any,
+        duration: Any = None,
+    ) -> QueryO:
+        """Oauth token.
+
+        :param client_id: The users email address
+        :param client_secret: The users password
+        :param grant_type: The grant type, set to client_credentials
+        :param duration: The number of seconds the token is valid for (optional and defaults to 3600 with a maximum value of 86400)
+        """
+
+    def pin(
+        self,
+        pin: Any,
+    ) -> QueryO:
+        """Pin.
+
+        :param pin: The PIN
+        """
+
+    def ttl(
+        self,
+    ) -> QueryO:
+        """Ttl.
+        """
@@ -0,0 +1,46 @@
+""" Setting.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Setting(Namespace):
+    """Setting."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def set(
+        self,
+        key: Any,
+        value: Any,
+        user_id: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param key: The key to store the value under. If the key name begins with temp it is only available for the session.
+        :param value: The value to store
+        :param user_id: A sysadmin user can set the value for a specific user (optional)
+        """
+
+    def get(
+        self,
+        key: Any,
+        user_id: Any = None,
+    ) -> QueryO:
+        """Get.
+
+        :param key: The key to get
+        :param user_id: A sysadmin user can get the value for a specific user (optional)
+        """
+
+    def get_all(
+        self,
+    ) -> QueryO:
+        """Get all.
+        """
@@ -0,0 +1,907 @@
+""" Study.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOF
+from ambra_sdk.service.query import QueryOP
+from ambra_sdk.service.query import QueryOPF
+from ambra_sdk.service.query import QueryOPS
+from ambra_sdk.service.query import QueryOPSF
+from ambra_sdk.service.query import QueryOSF
+
+
+class Study(Namespace):
+    """Study."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def add(
+        self,
+        thin: Any,
+        accession_number: Any = None,
+        attachment_count: Any = None,
+        customfield_param: Any = None,
+        destination_ae_title: Any = None,
+        image_count: Any = None,
+        integration_key: Any = None,
+        medical_record_locator: Any = None,
+        modality: Any = None,
+        node_id: Any = None,
+        patient_additional_history: Any = None,
+        patient_address: Any = None,
+        patient_age: Any = None,
+        patient_birth_date: Any = None,
+        patient_birth_time: Any = None,
+        patient_birthname: Any = None,
+        patient_comments: Any = None,
+        patient_current_location: Any = None,
+        patient_ethnic_group: Any = None,
+        patient_institution_residence: Any = None,
+        patient_mother_birthname: Any = None,
+        patient_name: Any = None,
+        patient_name_other: Any = None,
+        patient_occupation: Any = None,
+        patient_phone: Any = None,
+        patient_religious_preference: Any = None,
+        patient_sex: Any = None,
+        patient_size: Any = None,
+        patient_weight: Any = None,
+        patientid: Any = None,
+        patientid_other: Any = None,
+        phi_namespace: Any = None,
+        referring_physician: Any = None,
+        serial_no: Any = None,
+        source_ae_title: Any = None,
+        storage_namespace: Any = None,
+        study_date: Any = None,
+        study_description: Any = None,
+        study_time: Any = None,
+        study_uid: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param thin: Flag to add this as a thin study
+        :param accession_number: DICOM tag (0008,0050) (optional)
+        :param attachment_count: Attachment count (optional)
+        :param customfield_param: Custom field(s), see notes in /study/add (optional)
+        :param destination_ae_title: The destination aetitle (optional)
+        :param image_count: Images in the study (optional)
+        :param integration_key: Integration key for the study (optional)
+        :param medical_record_locator: DICOM tag (0010,1090) (optional)
+        :param modality: DICOM tag (0008,0060) (optional)
+        :param node_id: If this is a thin study the gateway UUID to retrieve it from can be specified (optional)
+        :param patient_additional_history: DICOM tag (0010,21B0) (optional)
+        :param patient_address: DICOM tag (0010,1040) (optional)
+        :param patient_age: DICOM tag (0010,1010) (optional)
+        :param patient_birth_date: DICOM tag (0010,0030) (optional)
+        :param patient_birth_time: DICOM tag (0010,0032) (optional)
+        :param patient_birthname: DICOM tag (0010,1005) (optional)
+        :param patient_comments: DICOM tag (0010,4000) (optional)
+        :param patient_current_location: DICOM tag (0038,0300) (optional)
+        :param patient_ethnic_group: DICOM tag (0010,2160) (optional)
+        :param patient_institution_residence: DICOM tag (0038,0400) (optional)
+        :param patient_mother_birthname: DICOM tag (0010,1060) (optional)
+        :param patient_name: DICOM tag (0010,0010)(optional)
+        :param patient_name_other: DICOM tag (0010,1001) (optional)
+        :param patient_occupation: DICOM tag (0010,2180) (optional)
+        :param patient_phone: DICOM tag (0010,2154) (optional)
+        :param patient_religious_preference: DICOM tag (0010,21F0) (optional)
+        :param patient_sex: DICOM tag (0010,0040) (optional)
+        :param patient_size: DICOM tag (0010,1020) (optional)
+        :param patient_weight: DICOM tag (0010,1030) (optional)
+        :param patientid: DICOM tag (0010,0020) (optional)
+        :param patientid_other: DICOM tag (0010,1000) (optional)
+        :param phi_namespace: phi_namespace
+        :param referring_physician: DICOM tag (0008,0090) (optional)
+        :param serial_no: serial_no
+        :param source_ae_title: The source aetitle (optional)
+        :param storage_namespace: storage_namespace
+        :param study_date: DICOM tag (0008,0020) (optional)
+        :param study_description: DICOM tag (0008,1030) (optional)
+        :param study_time: DICOM tag (0008,0030) (optional)
+        :param study_uid: study_uid
+        :param uuid: uuid
+
+        Notes:
+        (sid OR uuid AND serial_no) - Either the sid or the node id and serial number
+        (study_uid OR study_uid AND storage_namespace AND phi_namespace) - The study uid if node authentication or the storage triplet if sid authentication
+        customfield-(CUSTOMFIELD_UUID OR DICOM_TAG) - Custom field(s), see notes in /study/add (optional)
+        """
+
+    def set(
+        self,
+        accession_number: Any = None,
+        attachment_count: Any = None,
+        customfield_param: Any = None,
+        destination_ae_title: Any = None,
+        find_order_uuid: Any = None,
+        image_count: Any = None,
+        integration_key: Any = None,
+        medical_record_locator: Any = None,
+        modality: Any = None,
+        node_id: Any = None,
+        patient_additional_history: Any = None,
+        patient_address: Any = None,
+        patient_age: Any = None,
+        patient_birth_date: Any = None,
+        patient_birth_time: Any = None,
+        patient_birthname: Any = None,
+        patient_comments: Any = None,
+        patient_current_location: Any = None,
+        patient_ethnic_group: Any = None,
+        patient_institution_residence: Any = None,
+        patient_mother_birthname: Any = None,
+        patient_name: Any = None,
+        patient_name_other: Any = None,
+        patient_occupation: Any = None,
+        patient_phone: Any = None,
+        patient_religious_preference: Any = None,
+        patient_sex: Any = None,
+        patient_size: Any = None,
+        patient_weight: Any = None,
+        patientid: Any = None,
+        patientid_other: Any = None,
+        phi_namespace: Any = None,
+        referring_physician: Any = None,
+        serial_no: Any = None,
+        source_ae_title: Any = None,
+        storage_namespace: Any = None,
+        study_date: Any = None,
+        study_description: Any = None,
+        study_id: Any = None,
+        study_time: Any = None,
+        study_uid: Any = None,
+        use_upload_permission: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param accession_number: DICOM tag (0008,0050) (optional)
+        :param attachment_count: Attachment count (optional)
+        :param customfield_param: Custom field(s), see notes in /study/add (optional)
+        :param destination_ae_title: The destination aetitle (optional)
+        :param find_order_uuid: UUID of the search record used to modify the study (optional)
+        :param image_count: Images in the study (optional)
+        :param integration_key: Integration key for the study (optional)
+        :param medical_record_locator: DICOM tag (0010,1090) (optional)
+        :param modality: DICOM tag (0008,0060) (optional)
+        :param node_id: If this is a thin study the gateway UUID to retrieve it from can be specified (optional)
+        :param patient_additional_history: DICOM tag (0010,21B0) (optional)
+        :param patient_address: DICOM tag (0010,1040) (optional)
+        :param patient_age: DICOM tag (0010,1010) (optional)
+        :param patient_birth_date: DICOM tag (0010,0030) (optional)
+        :param patient_birth_time: DICOM tag (0010,0032) (optional)
+        :param patient_birthname: DICOM tag (0010,1005) (optional)
+        :param patient_comments: DICOM tag (0010,4000) (optional)
+        :param patient_current_location: DICOM tag (0038,0300) (optional)
+        :param patient_ethnic_group: DICOM tag (0010,2160) (optional)
+        :param patient_institution_residence: DICOM tag (0038,0400) (optional)
+        :param patient_mother_birthname: DICOM tag (0010,1060) (optional)
+        :param patient_name: DICOM tag (0010,0010) (optional)
+        :param patient_name_other: DICOM tag (0010,1001) (optional)
+        :param patient_occupation: DICOM tag (0010,2180) (optional)
+        :param patient_phone: DICOM tag (0010,2154) (optional)
+        :param patient_religious_preference: DICOM tag (0010,21F0) (optional)
+        :param patient_sex: DICOM tag (0010,0040) (optional)
+        :param patient_size: DICOM tag (0010,1020) (optional)
+        :param patient_weight: DICOM tag (0010,1030) (optional)
+        :param patientid: DICOM tag (0010,0020) (optional)
+        :param patientid_other: DICOM tag (0010,1000) (optional)
+        :param phi_namespace: phi_namespace
+        :param referring_physician: DICOM tag (0008,0090) (optional)
+        :param serial_no: serial_no
+        :param source_ae_title: The source aetitle (optional)
+        :param storage_namespace: storage_namespace
+        :param study_date: DICOM tag (0008,0020) (optional)
+        :param study_description: DICOM tag (0008,1030) (optional)
+        :param study_id: study_id
+        :param study_time: DICOM tag (0008,0030) (optional)
+        :param study_uid: study_uid
+        :param use_upload_permission: Flag to use the upload permissions for the permissions check (optional)
+        :param uuid: uuid
+
+        Notes:
+        (sid OR uuid AND serial_no) - Either the sid or the node id and serial number
+        (study_id OR study_uid OR study_uid AND storage_namespace AND phi_namespace) The uuid of the study if sid authentication or the study_uid if node authentication or the storage triplet if you want a future set
+        customfield-(CUSTOMFIELD_UUID OR DICOM_TAG) - Custom field(s), see notes in /study/add (optional)
+        """
+
+    def delete(
+        self,
+        node_id: Any = None,
+        phi_namespace: Any = None,
+        serial_no: Any = None,
+        storage_namespace: Any = None,
+        study_uid: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Delete.
+
+        :param node_id: node_id
+        :param phi_namespace: phi_namespace
+        :param serial_no: serial_no
+        :param storage_namespace: storage_namespace
+        :param study_uid: study_uid
+        :param uuid: uuid
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either the sid or the node id and serial number
+        (uuid OR study_uid AND storage_namespace AND phi_namespace) - The study uuid or the storage triplet
+        """
+
+    def list(
+        self,
+        customfield_h: Any = None,
+        extra: Any = None,
+        fields: Any = None,
+        limit_hl7: Any = None,
+        permissions_diff: Any = None,
+        template: Any = None,
+    ) -> QueryOPSF:
+        """List.
+
+        :param customfield_h: Flag to return a customfield hash as detailed in /study/get (optional)
+        :param extra: Flag to return extra data as detailed in /study/get (optional)
+        :param fields: A JSON list of the study fields to return (optional)
+        :param limit_hl7: Limit the length of Hl7 list to return. Zero means no limit (optional)
+        :param permissions_diff: Flag to return only the permissions that differ from the namespace permissions (optional)
+        :param template: A JSON hash with name, account_id and language of the template to return (optional)
+        """
+
+    def count(
+        self,
+    ) -> QueryOF:
+        """Count.
+        """
+
+    def cfind(
+        self,
+        serial_no: Any,
+        uuid: Any,
+        entire_account: Any = None,
+        is_available: Any = None,
+    ) -> QueryOPF:
+        """Cfind.
+
+        :param serial_no: The serial number of the node
+        :param uuid: The node id
+        :param entire_account: Flag to search the entire account rather than just the nodes namespace. (optional)
+        :param is_available: Flag to limit search to studies that are ready for viewing. (optional)
+        """
+
+    def get(
+        self,
+        customfield_h: Any = None,
+        extra: Any = None,
+        fields: Any = None,
+        full_hl7: Any = None,
+        limit_hl7: Any = None,
+        node_id: Any = None,
+        permissions_diff: Any = None,
+        phi_namespace: Any = None,
+        serial_no: Any = None,
+        storage_namespace: Any = None,
+        study_uid: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Get.
+
+        :param customfield_h: Flag to return a customfield hash as detailed below (optional)
+        :param extra: Flag to return extra data as detailed below (optional)
+        :param fields: A JSON list of the study fields to return (optional)
+        :param full_hl7: Flag to return the full hl7 record instead of just the uuid (optional)
+        :param limit_hl7: Limit the length of Hl7 list to return. Zero means no limit (optional)
+        :param node_id: node_id
+        :param permissions_diff: Flag to return only the permissions that differ from the namespace permissions (optional)
+        :param phi_namespace: phi_namespace
+        :param serial_no: serial_no
+        :param storage_namespace: storage_namespace
+        :param study_uid: study_uid
+        :param uuid: uuid
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either the sid or the node uuid and serial number
+        (uuid OR study_uid AND storage_namespace AND phi_namespace) - The study uuid or the storage triplet
+        """
+
+    def permissions(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Permissions.
+
+        :param uuid: The study uuid
+        """
+
+    def exists(
+        self,
+        account_id: Any = None,
+        phi_namespace: Any = None,
+        storage_namespace: Any = None,
+        study_uid: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Exists.
+
+        :param account_id: account_id
+        :param phi_namespace: phi_namespace
+        :param storage_namespace: storage_namespace
+        :param study_uid: study_uid
+        :param uuid: uuid
+
+        Notes:
+        (uuid OR study_uid AND storage_namespace AND phi_namespace OR study_uid AND account_id) - The study uuid, the storage triplet, or the study uid and account id
+        """
+
+    def push(
+        self,
+        batch_no: Any,
+        destination_id: Any,
+        ping: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Push.
+
+        :param batch_no: The batch number if pushing to a CD burner
+        :param destination_id: The destination to push it to
+        :param ping: Flag to send the ping job back in this call
+        :param uuid: The study uuid
+        """
+
+    def push_hl7(
+        self,
+        destination_id: Any,
+        uuid: Any,
+        hl7_id: Any = None,
+        hl7_template_id: Any = None,
+        once: Any = None,
+    ) -> QueryO:
+        """Push hl7.
+
+        :param destination_id: The destination to push it to
+        :param uuid: The study uuid
+        :param hl7_id: HL7 message to use in the template (optional)
+        :param hl7_template_id: The HL7 template to use (optional)
+        :param once: Flag that this message should only be sent a maximum of one time (optional)
+        """
+
+    def pdf_hl7(
+        self,
+        hl7_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Pdf hl7.
+
+        :param hl7_id: HL7 message to create the PDF report for
+        :param uuid: The study uuid
+        """
+
+    def fax_hl7(
+        self,
+        hl7_id: Any,
+        number: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Fax hl7.
+
+        :param hl7_id: HL7 message to create the PDF report for
+        :param number: The fax number to send the PDF report to
+        :param uuid: The study uuid
+        """
+
+    def cmove(
+        self,
+        aetitle: Any,
+        ping: Any,
+        serial_no: Any,
+        study_uid: Any,
+        uuid: Any,
+        detail: Any = None,
+    ) -> QueryO:
+        """Cmove.
+
+        :param aetitle: The aetitle to send to
+        :param ping: Flag to send the ping job back in this call
+        :param serial_no: The serial number of the node
+        :param study_uid: The study uid
+        :param uuid: The node id
+        :param detail: Additional detail to send on the /node/ping (optional)
+        """
+
+    def node_can_remove(
+        self,
+        serial_no: Any,
+        study_uid: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Node can remove.
+
+        :param serial_no: The serial number of the node
+        :param study_uid: The study uid
+        :param uuid: The node id
+        """
+
+    def share_who(
+        self,
+        type: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Share who.
+
+        :param type: Type of objects you want (account|location|group|user)
+        :param uuid: The study uuid
+        """
+
+    def share(
+        self,
+        account_id: Any = None,
+        charge_authorized: Any = None,
+        charge_modality: Any = None,
+        customfield_param: Any = None,
+        email: Any = None,
+        group_id: Any = None,
+        integration_key: Any = None,
+        location_id: Any = None,
+        masshiway: Any = None,
+        message: Any = None,
+        npi: Any = None,
+        phi_namespace: Any = None,
+        rsna: Any = None,
+        share_code: Any = None,
+        storage_namespace: Any = None,
+        study_uid: Any = None,
+        user_id: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Share.
+
+        :param account_id: account_id
+        :param charge_authorized: Flag that the sender authorized charging for this share (optional)
+        :param charge_modality: Modality of the study the charge was authorized for (optional)
+        :param customfield_param: Custom field(s) to apply to the shared study (optional)
+        :param email: email
+        :param group_id: group_id
+        :param integration_key: Integration key to tag the share with (optional)
+        :param location_id: location_id
+        :param masshiway: masshiway
+        :param message: Message to the recipient (optional)
+        :param npi: npi
+        :param phi_namespace: phi_namespace
+        :param rsna: rsna
+        :param share_code: share_code
+        :param storage_namespace: storage_namespace
+        :param study_uid: study_uid
+        :param user_id: user_id
+        :param uuid: uuid
+
+        Notes:
+        (account_id OR location_id OR group_id OR user_id OR share_code OR email OR masshiway OR rsna OR npi) - uuid of the account, location, group, user or share code, email address(es), RSNA, NPI or masshiway recipient to share this study with
+        (uuid OR study_uid AND storage_namespace AND phi_namespace) - The study uuid or the storage triplet if you want a future share
+        """
+
+    def share_stop(
+        self,
+        uuid: Any,
+        account_id: Any = None,
+        group_id: Any = None,
+        location_id: Any = None,
+        user_id: Any = None,
+        user_invite_share_id: Any = None,
+    ) -> QueryO:
+        """Share stop.
+
+        :param uuid: The study uuid
+        :param account_id: account_id
+        :param group_id: group_id
+        :param location_id: location_id
+        :param user_id: user_id
+        :param user_invite_share_id: user_invite_share_id
+
+        Notes:
+        (account_id OR location_id OR group_id OR user_id OR user_invite_share_id) - uuid of the account, location, group, user or user invitation to stop sharing this study with
+        """
+
+    def share_list(
+        self,
+        uuid: Any,
+        name: Any = None,
+    ) -> QueryO:
+        """Share list.
+
+        :param uuid: The study uuid
+        :param name: Flag to return a hash with both the uuid and name of the object (optional)
+        """
+
+    def approve(
+        self,
+        uuid: Any,
+        delay: Any = None,
+        must_match: Any = None,
+    ) -> QueryO:
+        """Approve.
+
+        :param uuid: The study uuid
+        :param delay: Number of seconds to delay showing the study as approved and running routing and events on it (optional)
+        :param must_match: A JSON hash of study field names and values that must match before showing the study as approved and running routing and events on it (optional)
+        """
+
+    def reject(
+        self,
+        uuid: Any,
+        message: Any = None,
+    ) -> QueryO:
+        """Reject.
+
+        :param uuid: The study uuid
+        :param message: Message to send to the person who shared the study (optional)
+        """
+
+    def audit(
+        self,
+        action: Any,
+        detail: Any,
+        phi_namespace: Any = None,
+        storage_namespace: Any = None,
+        study_uid: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Audit.
+
+        :param action: The audit action (STUDY_VIEW|STUDY_EDIT|STUDY_MERGE|STUDY_SPLIT|REPORT_UPLOAD|REPORT_REMOVE|REPORT_VIEW|IMAGE_ADDED|IMAGE_UPDATED|STUDY_DOWNLOAD|ACCEPTED_NOT_DIAGNOSTIC|CANCELED_NOT_DIAGNOSTIC|AI_ACTION|VIEWER_ACTION)
+        :param detail: Additional information
+        :param phi_namespace: The phi namespace of the study (optional)
+        :param storage_namespace: The storage namespace of the study (optional if uuid is passed)
+        :param study_uid: The v3 storage uid of the study (optional if uuid is passed)
+        :param uuid: The id of the study (optional if study_uid and storage_namespace are passed)
+        """
+
+    def star(
+        self,
+        star: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Star.
+
+        :param star: Star flag set on or off (1|0)
+        :param uuid: The id of the study
+        """
+
+    def report_detail(
+        self,
+        account_id: Any,
+        limit: Any = None,
+    ) -> QueryOSF:
+        """Report detail.
+
+        :param account_id: Limit to studies in the passed account
+        :param limit: Maximum size of the report. The default is 30,000 rows. If the report will be bigger than this an error will be returned (optional)
+        """
+
+    def report_series(
+        self,
+        email: Any,
+        hours: Any,
+        namespace_id: Any,
+        limit: Any = None,
+    ) -> QueryO:
+        """Report series.
+
+        :param email: Send the report to this email address(es) when it is done
+        :param hours: Report on studies acquired within the last number of hours
+        :param namespace_id: Namespace to run the report on
+        :param limit: Maximum size of the report. The default is 30,000 studies. If the report will be bigger than this an error will be returned (optional)
+        """
+
+    def viewer_settings(
+        self,
+        phi_namespace: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Viewer settings.
+
+        :param phi_namespace: phi_namespace
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+
+        Notes:
+        (study_id OR study_uid AND storage_namespace AND phi_namespace) - Either the study uuid or the storage triplet
+        """
+
+    def viewer3_settings(
+        self,
+        phi_namespace: Any = None,
+        settings: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Viewer3 settings.
+
+        :param phi_namespace: phi_namespace
+        :param settings: A JSON list of user settings set via /setting/set to return (optional)
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+
+        Notes:
+        (study_id OR study_uid AND storage_namespace AND phi_namespace) - Either the study uuid or the storage triplet
+        """
+
+    def status_set(
+        self,
+        new: Any,
+        old: Any,
+        study_id: Any,
+    ) -> QueryO:
+        """Status set.
+
+        :param new: The new study status value
+        :param old: The old study status value
+        :param study_id: Study uuid
+        """
+
+    def status_locks(
+        self,
+    ) -> QueryOP:
+        """Status locks.
+        """
+
+    def status_history(
+        self,
+        study_id: Any,
+    ) -> QueryO:
+        """Status history.
+
+        :param study_id: Study uuid
+        """
+
+    def move(
+        self,
+        namespace_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Move.
+
+        :param namespace_id: The namespace id
+        :param uuid: The study id
+        """
+
+    def duplicate(
+        self,
+        include_attachments: Any,
+        namespace_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Duplicate.
+
+        :param include_attachments: Also duplicate attachments
+        :param namespace_id: The namespace id to duplicate it to
+        :param uuid: The study id
+        """
+
+    def split(
+        self,
+        namespace_id: Any,
+        no_split: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Split.
+
+        :param namespace_id: The namespace id to split it into
+        :param no_split: Do not split on the series just create a new study with a study UID
+        :param uuid: The study id
+        """
+
+    def freeze(
+        self,
+        thaw: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Freeze.
+
+        :param thaw: Flag to thaw a frozen study
+        :param uuid: The study id
+        """
+
+    def manual_route(
+        self,
+        route_id: Any,
+        uuid: Any,
+        email: Any = None,
+        message: Any = None,
+    ) -> QueryO:
+        """Manual route.
+
+        :param route_id: The routing rule id
+        :param uuid: The study id
+        :param email: The email to share with if the rule has a share_email action with the USER_ENTRY token (optional)
+        :param message: The share message for the email share (optional)
+        """
+
+    def find_order(
+        self,
+        uuid: Any,
+        accession_number: Any = None,
+        patient_name: Any = None,
+        patientid: Any = None,
+    ) -> QueryOP:
+        """Find order.
+
+        :param uuid: The study id
+        :param accession_number: accession_number
+        :param patient_name: patient_name
+        :param patientid: patientid
+
+        Notes:
+        (accession_number OR patientid OR patient_name) - The full or partial accession number, MRN or patient name to search by. If none are passed the studies accession number will be used (optional)
+        """
+
+    def archive(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Archive.
+
+        :param uuid: The study id
+        """
+
+    def retrieve(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Retrieve.
+
+        :param uuid: The study id
+        """
+
+    def comment_add(
+        self,
+        body: Any,
+        study_id: Any,
+    ) -> QueryO:
+        """Comment add.
+
+        :param body: The comment body
+        :param study_id: The study id
+        """
+
+    def comment_delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Comment delete.
+
+        :param uuid: The comment id
+        """
+
+    def comment_get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Comment get.
+
+        :param uuid: The comment id
+        """
+
+    def validate(
+        self,
+        uuid: Any,
+        validate_id: Any,
+        series: Any = None,
+    ) -> QueryO:
+        """Validate.
+
+        :param uuid: The study id
+        :param validate_id: The validation id
+        :param series: Only validate the specified series (optional)
+        """
+
+    def attach_customfields(
+        self,
+        uuid: Any,
+        report_name: Any = None,
+    ) -> QueryO:
+        """Attach customfields.
+
+        :param uuid: The study id
+        :param report_name: The report name (optional defaults to customfields.txt)
+        """
+
+    def external_viewer(
+        self,
+        redirect: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """External viewer.
+
+        :param redirect: A flag to return an HTTP redirect to the viewer URL rather than the JSON structure
+        :param uuid: The study id
+        """
+
+    def question(
+        self,
+        detail: Any,
+        question: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Question.
+
+        :param detail: Optional detail to pass through to the AI stack
+        :param question: The question to ask or a JSON array of questions to ask
+        :param uuid: The study id
+        """
+
+    def dicomdata_load(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Dicomdata load.
+
+        :param uuid: The study id
+        """
+
+    def timing_event(
+        self,
+        event: Any,
+        storage_namespace: Any,
+        study_uid: Any,
+        node_id: Any = None,
+        serial_no: Any = None,
+        size: Any = None,
+    ) -> QueryO:
+        """Timing event.
+
+        :param event: The event
+        :param storage_namespace: The storage namespace
+        :param study_uid: The study uid
+        :param node_id: node_id
+        :param serial_no: serial_no
+        :param size: The number of bytes associated with the event (optional)
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either the sid or the node uuid and serial number
+        """
+
+    def timing_log(
+        self,
+        uuid: Any,
+    ) -> QueryOPS:
+        """Timing log.
+
+        :param uuid: The study uuid
+        """
+
+    def sync(
+        self,
+        image_count: Any = None,
+        node_id: Any = None,
+        phi_namespace: Any = None,
+        serial_no: Any = None,
+        storage_namespace: Any = None,
+        study_id: Any = None,
+        study_uid: Any = None,
+    ) -> QueryO:
+        """Sync.
+
+        :param image_count: Update the study image count and then sync (optional)
+        :param node_id: node_id
+        :param phi_namespace: phi_namespace
+        :param serial_no: serial_no
+        :param storage_namespace: storage_namespace
+        :param study_id: study_id
+        :param study_uid: study_uid
+
+        Notes:
+        (sid OR node_id AND serial_no) - Either the sid or the node id and serial number
+        (study_id OR study_uid AND storage_namespace AND phi_namespace) - The study id or the study_uid/storage_namespace/phi_namespace triplet
+        """
@@ -0,0 +1,52 @@
+""" Tag.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Tag(Namespace):
+    """Tag."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        object: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param object: Object class (Study|User_account|Group|Location|Account|Patient|Case|Order|Message)
+        """
+
+    def add(
+        self,
+        object: Any,
+        object_id: Any,
+        tag: Any,
+    ) -> QueryO:
+        """Add.
+
+        :param object: Object class to apply it to (Study|User_account|Group|Location|Account|Patient|Case|Order|Message)
+        :param object_id: UUID of the object
+        :param tag: Value of the tag
+        """
+
+    def delete(
+        self,
+        object: Any,
+        object_id: Any,
+        tag: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param object: Object class to apply it to (Study|User_account|Group|Location|Account|Patient|Case|Order)
+        :param object_id: UUID of the object
+        :param tag: Value of the tag
+        """
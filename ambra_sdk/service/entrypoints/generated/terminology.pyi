@@ -0,0 +1,111 @@
+""" Terminology.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Terminology(Namespace):
+    """Terminology."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def account_overrides(
+        self,
+        account_id: Any = None,
+        phi_namespace: Any = None,
+        storage_namespace: Any = None,
+        study_uid: Any = None,
+        vanity: Any = None,
+    ) -> QueryO:
+        """Account overrides.
+
+        :param account_id: account_id
+        :param phi_namespace: phi_namespace
+        :param storage_namespace: storage_namespace
+        :param study_uid: study_uid
+        :param vanity: vanity
+
+        Notes:
+        (account_id OR vanity OR study_uid AND storage_namespace AND phi_namespace) - The uuid or vanity name of the account or study triplet to apply any account overrides for (optional)
+        """
+
+    def tags(
+        self,
+        language: Any,
+        account_id: Any = None,
+        phi_namespace: Any = None,
+        storage_namespace: Any = None,
+        study_uid: Any = None,
+        tags: Any = None,
+        vanity: Any = None,
+    ) -> QueryO:
+        """Tags.
+
+        :param language: The ISO 639-1 language code
+        :param account_id: account_id
+        :param phi_namespace: phi_namespace
+        :param storage_namespace: storage_namespace
+        :param study_uid: study_uid
+        :param tags: A comma separated list of the terminology tags to look up (optional)
+        :param vanity: vanity
+
+        Notes:
+        (account_id OR vanity OR study_uid AND storage_namespace AND phi_namespace) - The uuid or vanity name of the account or study triplet to apply any account overrides for (optional)
+        """
+
+    def set(
+        self,
+        language: Any,
+        tag: Any,
+        value: Any,
+        account_id: Any = None,
+        vanity: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param language: The ISO 639-1 language code
+        :param tag: The tag to set
+        :param value: The value of the tag. If this is empty the tag is deleted
+        :param account_id: The uuid of the account to apply the tag for (optional)
+        :param vanity: Vanity to apply the tag for (optional)
+        """
+
+    def list(
+        self,
+        language: Any,
+        tags: Any,
+        account_id: Any = None,
+        vanity: Any = None,
+    ) -> QueryO:
+        """List.
+
+        :param language: The ISO 639-1 language code
+        :param tags: A comma separated list of the terminology tags to look up
+        :param account_id: account_id
+        :param vanity: vanity
+
+        Notes:
+        (account_id OR vanity) - The uuid or vanity name of the account to apply any account overrides for (optional)
+        """
+
+    def i18next(
+        self,
+        lng: Any,
+        account_id: Any = None,
+        vanity: Any = None,
+    ) -> QueryO:
+        """I18next.
+
+        :param lng: The language code
+        :param account_id: account_id
+        :param vanity: vanity
+
+        Notes:
+        (account_id OR vanity) - The uuid or vanity name of the account to apply any account overrides for (optional)
+        """
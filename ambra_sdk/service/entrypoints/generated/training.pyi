@@ -0,0 +1,35 @@
+""" Training.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Training(Namespace):
+    """Training."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def todo(
+        self,
+    ) -> QueryO:
+        """Todo.
+        """
+
+    def done(
+        self,
+        account_id: Any,
+        additional_parameters: Any,
+        form_number: Any,
+    ) -> QueryO:
+        """Done.
+
+        :param account_id: Id of the account the training is for
+        :param additional_parameters: All additional parameters will be logged as part of the TRAINING_DONE user audit event
+        :param form_number: The formstack id of the form
+        """
@@ -0,0 +1,288 @@
+""" User.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOF
+from ambra_sdk.service.query import QueryOPSF
+
+
+class User(Namespace):
+    """User."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def join(
+        self,
+        email: Any,
+        first: Any,
+        last: Any,
+        password: Any,
+        captcha_response: Any = None,
+        customfield_param: Any = None,
+        share_code: Any = None,
+    ) -> QueryO:
+        """Join.
+
+        :param email: Email
+        :param first: First name
+        :param last: Last name
+        :param password: Password
+        :param captcha_response: Response from captcha (optional)
+        :param customfield_param: Custom field(s) defined in the vanity_registration_customfields account setting (optional)
+        :param share_code: Share code they are joining from (optional)
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        email: Any,
+        first: Any,
+        last: Any,
+        mobile_phone: Any,
+        password: Any,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: Account id to check for the user_edit permission
+        :param email: Email
+        :param first: First name
+        :param last: Last name
+        :param mobile_phone: SMS phone number
+        :param password: Password
+        """
+
+    def get(
+        self,
+        account_id: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Get.
+
+        :param account_id: Account id if you are trying to get a user other than yourself (optional)
+        :param uuid: The users uuid (optional). Uses the session user if not passed
+        """
+
+    def set(
+        self,
+        indicator_md5: Any,
+        privacy_md5: Any,
+        terms_md5: Any,
+        account_id: Any = None,
+        cc_token: Any = None,
+        email: Any = None,
+        first: Any = None,
+        last: Any = None,
+        mobile_phone: Any = None,
+        old_password: Any = None,
+        password: Any = None,
+        pin_required: Any = None,
+        share_code: Any = None,
+        share_description: Any = None,
+        time_zone: Any = None,
+        ui_json: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param indicator_md5: MD5 of the accepted indications of use
+        :param privacy_md5: MD5 of the accepted privacy policy
+        :param terms_md5: MD5 of the accepted terms of service
+        :param account_id: Account id if you are trying to set a user other than yourself (optional)
+        :param cc_token: The credit card token to attach to the users account (optional)
+        :param email: Email (optional)
+        :param first: First name (optional)
+        :param last: Last name (optional)
+        :param mobile_phone: SMS phone number (optional)
+        :param old_password: Previous user password (optional)
+        :param password: User password (optional)
+        :param pin_required: Flag to require a PIN for every login (optional)
+        :param share_code: The share code of the user (optional)
+        :param share_description: The share description of the user (optional)
+        :param time_zone: The users time zone name as per https://www.postgresql.org/docs/9.1/static/view-pg-timezone-names.html (optional)
+        :param ui_json: JSON for UI settings (optional)
+        :param uuid: The users uuid (optional). Uses the session user if not passed
+        """
+
+    def delete(
+        self,
+    ) -> QueryO:
+        """Delete.
+        """
+
+    def password_lost(
+        self,
+        email: Any,
+    ) -> QueryO:
+        """Password lost.
+
+        :param email: The email
+        """
+
+    def password_reset(
+        self,
+        password: Any,
+        token: Any,
+    ) -> QueryO:
+        """Password reset.
+
+        :param password: The new password
+        :param token: The reset token
+        """
+
+    def welcome(
+        self,
+        account_id: Any,
+        email: Any,
+        link: Any,
+    ) -> QueryO:
+        """Welcome.
+
+        :param account_id: Id of the account to welcome them to
+        :param email: The email of the user to welcome
+        :param link: URL to reset the password at. The reset token will be appended to the link
+        """
+
+    def join_list(
+        self,
+    ) -> QueryOPSF:
+        """Join list.
+        """
+
+    def join_request(
+        self,
+        account_id: Any,
+    ) -> QueryO:
+        """Join request.
+
+        :param account_id: Id of the account to request to join
+        """
+
+    def invite(
+        self,
+        account_id: Any,
+        email: Any,
+        link: Any,
+        groups: Any = None,
+        link_already: Any = None,
+        locations: Any = None,
+        role_id: Any = None,
+    ) -> QueryO:
+        """Invite.
+
+        :param account_id: The account to invite the person too
+        :param email: Email address of the person to invite
+        :param link: URL to accept the invitation at. The invitation id will be appended to the link
+        :param groups: A JSON hash with the keys the group uuids to add the user to and the values the role uuid for the group (optional)
+        :param link_already: URL to accept the invitation at for an existing user on the system. The invitation id will be appended to the link (optional)
+        :param locations: A JSON hash with the keys the location uuids to add the user to and the values the role uuid for the location (optional)
+        :param role_id: The role to give the user (optional)
+        """
+
+    def invite_accept(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Invite accept.
+
+        :param uuid: Id of the invitation
+        """
+
+    def namespace_list(
+        self,
+        account_id: Any = None,
+        plus_phr: Any = None,
+    ) -> QueryOF:
+        """Namespace list.
+
+        :param account_id: Only return the namespaces for this account (optional)
+        :param plus_phr: Flag to include the PHR account as well if account_id was specified (optional)
+        """
+
+    def event(
+        self,
+        namespace_id: Any,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Event.
+
+        :param namespace_id: Id of the namespace to set the flags on
+        :param uuid: Return event flags for this user, not current user (optional)
+        """
+
+    def event_set(
+        self,
+        namespace_id: Any,
+        event_approve: Any = None,
+        event_case_assignment: Any = None,
+        event_harvest: Any = None,
+        event_link: Any = None,
+        event_link_mine: Any = None,
+        event_message: Any = None,
+        event_new_report: Any = None,
+        event_report_remove: Any = None,
+        event_share: Any = None,
+        event_status_change: Any = None,
+        event_study_comment: Any = None,
+        event_thin_study_fail: Any = None,
+        event_thin_study_success: Any = None,
+        event_upload: Any = None,
+        event_upload_fail: Any = None,
+        uuid: Any = None,
+    ) -> QueryO:
+        """Event set.
+
+        :param namespace_id: Id of the namespace to set the flags on
+        :param event_approve: Notify the user on a approval needed into the namespace (optional)
+        :param event_case_assignment: Notify the user when they are assigned a case as a medical or admin user (optional)
+        :param event_harvest: Notify the user on a harvest into the namespace (optional)
+        :param event_link: Notify the user when an anonymous link is hit in the namespace (optional)
+        :param event_link_mine: Notify the user when an anonymous link created by the user is hit in the namespace (optional)
+        :param event_message: Notify the user when a message is sent to the namespace (optional)
+        :param event_new_report: Notify the user when a report is attached in the namespace (optional)
+        :param event_report_remove: Notify the user when a report is removed in the namespace (optional)
+        :param event_share: Notify the user on a share into the namespace (optional)
+        :param event_status_change: Notify the user when the status of a study is changed (optional)
+        :param event_study_comment: Notify the user when a comment is attached to a study in the namespace (optional)
+        :param event_thin_study_fail: Notify the user when a thin study retrieval they initiated fails (optional)
+        :param event_thin_study_success: Notify the user when a thin study retrieval they initiated succeeds (optional)
+        :param event_upload: Notify the user on an upload into the namespace (optional)
+        :param event_upload_fail: Notify the user on a failed upload into the namespace (optional)
+        :param uuid: Return event flags for this user, not current user (optional)
+        """
+
+    def token(
+        self,
+        delete: Any,
+        generate: Any,
+    ) -> QueryO:
+        """Token.
+
+        :param delete: Flag to delete the shared secret and disable TOKEN PIN authentication
+        :param generate: Flag to generate the shared secret for a token authenticator and enable TOKEN PIN authentication
+        """
+
+    def signature(
+        self,
+        signature: Any,
+    ) -> QueryO:
+        """Signature.
+
+        :param signature: Set the users signature to this base64 encoded image
+        """
+
+    def enable(
+        self,
+        uuid: Any,
+        disable: Any = None,
+    ) -> QueryO:
+        """Enable.
+
+        :param uuid: User uuid
+        :param disable: A flag indicating whether to disable the user (optional)
+        """
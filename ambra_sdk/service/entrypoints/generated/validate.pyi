@@ -0,0 +1,70 @@
+""" Validate.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+from ambra_sdk.service.query import QueryOPSF
+
+
+class Validate(Namespace):
+    """Validate."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryOPSF:
+        """List.
+
+        :param account_id: The account id
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        conditions: Any,
+        name: Any,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: The account id
+        :param conditions: The validation conditions
+        :param name: The validation rule name
+        """
+
+    def set(
+        self,
+        conditions: Any,
+        name: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Set.
+
+        :param conditions: The validation conditions
+        :param name: The validation rule name
+        :param uuid: The validation id
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: Id of the validate
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: Id of the validation rule
+        """
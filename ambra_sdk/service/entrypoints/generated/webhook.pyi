@@ -0,0 +1,183 @@
+""" Webhook.
+
+Do not edit this file by hand.
+This is generated by parsing api.html service doc.
+"""
+
+from typing import Any, Tuple
+
+from ambra_sdk.service.endpoint import Namespace
+from ambra_sdk.service.query import QueryO
+
+
+class Webhook(Namespace):
+    """Webhook."""
+
+    ENDPOINTS: Tuple[Tuple[Any, ...], ...]
+
+    def list(
+        self,
+        account_id: Any,
+    ) -> QueryO:
+        """List.
+
+        :param account_id: uuid of the account
+        """
+
+    def add(
+        self,
+        account_id: Any,
+        event: Any,
+        method: Any,
+        name: Any,
+        url: Any,
+        auth: Any = None,
+        by_accession_number: Any = None,
+        by_uid: Any = None,
+        cron: Any = None,
+        delay: Any = None,
+        filter_field: Any = None,
+        filter_regexp: Any = None,
+        max_age: Any = None,
+        node_id: Any = None,
+        once: Any = None,
+        parameters: Any = None,
+        retry: Any = None,
+        sid_user_id: Any = None,
+        suspended: Any = None,
+    ) -> QueryO:
+        """Add.
+
+        :param account_id: uuid of the account
+        :param event: Event to call it on (See the notes for the available events)
+        :param method: Method to call it with (POST|GET|POST_JSON|PUT)
+        :param name: Name of the webhook
+        :param url: URL to call
+        :param auth: A JSON hash with the authentication details (optional)
+        :param by_accession_number: Flag to expand the once search to include studies with the same accession_number (optional)
+        :param by_uid: Flag to expand the once search to include studies with the same study_uid (optional)
+        :param cron: Cron timing string for CRON events e.g 0 9 * * mon-fri(optional)
+        :param delay: Number of seconds to delay running this webhook for after it is triggered (optional)
+        :param filter_field: Name of the study field to filter on (optional)
+        :param filter_regexp: Regular expression to match the value of the filter_field against (optional)
+        :param max_age: Ignore studies that are more than this number of days old based on the study_date (optional)
+        :param node_id: uuid of the node to proxy the webhook through (optional)
+        :param once: Flag that this webhook should only be run once for a specific study (optional)
+        :param parameters: A JSON object of the parameter names and values (optional)
+        :param retry: Retry the webhook if it fails (optional)
+        :param sid_user_id: UUID of the user to generate a sid as (optional)
+        :param suspended: This webhook is suspended and not triggered (optional)
+        """
+
+    def set(
+        self,
+        uuid: Any,
+        auth: Any = None,
+        by_accession_number: Any = None,
+        by_uid: Any = None,
+        cron: Any = None,
+        delay: Any = None,
+        event: Any = None,
+        filter_field: Any = None,
+        filter_regexp: Any = None,
+        max_age: Any = None,
+        method: Any = None,
+        name: Any = None,
+        node_id: Any = None,
+        once: Any = None,
+        parameters: Any = None,
+        retry: Any = None,
+        sid_user_id: Any = None,
+        suspended: Any = None,
+        url: Any = None,
+    ) -> QueryO:
+        """Set.
+
+        :param uuid: uuid of the webhook
+        :param auth: A JSON hash with the authentication details (optional)
+        :param by_accession_number: Flag to expand the once search to include studies with the same accession_number (optional)
+        :param by_uid: Flag to expand the once search to include studies with the same study_uid (optional)
+        :param cron: Cron timing string for CRON events (optional)
+        :param delay: Number of seconds to delay running this webhook for after it is triggered (optional)
+        :param event: Event to call it on (optional see add command for options)
+        :param filter_field: Name of the field to filter on (optional)
+        :param filter_regexp: Regular expression to match the value of the filter_field against (optional)
+        :param max_age: Ignore studies that are more than this number of days old based on the study_date (optional)
+        :param method: Method to call it with (optional see add command for options)
+        :param name: Name of the webhook (optional)
+        :param node_id: uuid of the node to proxy the webhook through (optional)
+        :param once: Flag that this webhook should only be run once for a specific study (optional)
+        :param parameters: A JSON object of the parameter names and values (optional see add command for options)
+        :param retry: Retry the webhook if it fails (optional)
+        :param sid_user_id: UUID of the user to generate a sid as (optional)
+        :param suspended: This webhook is suspended and not triggered (optional)
+        :param url: URL to call (optional)
+        """
+
+    def get(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Get.
+
+        :param uuid: uuid of the webhook
+        """
+
+    def delete(
+        self,
+        uuid: Any,
+    ) -> QueryO:
+        """Delete.
+
+        :param uuid: uuid of the webhook
+        """
+
+    def trigger(
+        self,
+        study_id: Any,
+        uuid: Any,
+    ) -> QueryO:
+        """Trigger.
+
+        :param study_id: uuid of the study to fire the webhook for
+        :param uuid: uuid of the webhook
+        """
+
+    def event(
+        self,
+        type: Any,
+        integration_key: Any = None,
+        namespace_id: Any = None,
+        share_code: Any = None,
+        study_count: Any = None,
+    ) -> QueryO:
+        """Event.
+
+        :param type: The type of event (STUDY_UPLOAD_START|STUDY_UPLOAD_END)
+        :param integration_key: The integration key associated with the event (optional)
+        :param namespace_id: namespace_id
+        :param share_code: share_code
+        :param study_count: The number of studies associated with the event (optional)
+
+        Notes:
+        (namespace_id OR share_code) - The namespace or share code for the event
+        """
+
+    def email(
+        self,
+        html: Any,
+        subject: Any,
+        template_id: Any,
+        text: Any,
+        to: Any,
+        webhook_id: Any,
+    ) -> QueryO:
+        """Email.
+
+        :param html: The HTML part of the email
+        :param subject: The subject of the email
+        :param template_id: The email template UUID to be used
+        :param text: The text part of the email
+        :param to: The email address(es) to send the email to
+        :param webhook_id: The uuid of the calling webhook
+        """
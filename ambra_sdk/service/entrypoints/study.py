@@ -1,8 +1,13 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 from box import Box, BoxList
 
 from ambra_sdk.service.entrypoints.generated.study import Study as GStudy
+from ambra_sdk.service.partition import (
+    DEFAULT_IN_CHUNK_SIZE,
+    DEFAULT_PARTITIONS,
+    ChunkedInResponse,
+)
 
 
 class CustomFieldsList(BoxList):
@@ -82,3 +87,29 @@ class Study(GStudy):
         query = super().list(*args, **kwargs)
         query.return_constructor = StudyBox
         return query
+
+    def get_many(
+        self,
+        uuids: Iterable[str],
+        chunk_size: int = DEFAULT_IN_CHUNK_SIZE,
+        workers: int = DEFAULT_PARTITIONS,
+    ) -> ChunkedInResponse:
+        """Get studies by uuids.
+
+        Studies are requested by list method with in filters
+        of chunk_size uuids instead of get request per study,
+        so studies have fields of list method.
+        Not found studies are skipped, studies are yielded
+        in order of arrival.
+
+        :param uuids: study uuids
+        :param chunk_size: maximum number of uuids in one request
+        :param workers: number of concurrent requests
+        :return: iterable response
+        """
+        return self.list().filter_in_chunks(  # type: ignore
+            'uuid',
+            uuids,
+            chunk_size=chunk_size,
+            workers=workers,
+        )
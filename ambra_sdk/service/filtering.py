@@ -27,6 +27,47 @@ class Filter(NamedTuple):
     condition: FilterCondition
     value: Union[str, List[str]]  # NOQA:WPS110
 
+    def __and__(self, other):
+        """Conjunction (see ambra_sdk.service.planner).
+
+        :param other: other filter or predicate
+        :return: predicate
+        """
+        from ambra_sdk.service.planner import And  # NOQA:WPS433
+
+        return And(self, other)
+
+    def __or__(self, other):
+        """Disjunction (see ambra_sdk.service.planner).
+
+        :param other: other filter or predicate
+        :return: predicate
+        """
+        from ambra_sdk.service.planner import Or  # NOQA:WPS433
+
+        return Or(self, other)
+
+    def __invert__(self):
+        """Negation (see ambra_sdk.service.planner).
+
+        :return: predicate
+        """
+        from ambra_sdk.service.planner import Not  # NOQA:WPS433
+
+        return Not(self)
+
+
+def filter_param(filter_obj: Filter) -> str:
+    """Get request parameter name of filter.
+
+    :param filter_obj: filter object
+    :return: parameter name
+    """
+    return 'filter.{filter_name}.{filter_condition}'.format(
+        filter_name=filter_obj.field_name,
+        filter_condition=filter_obj.condition.value,
+    )
+
 
 class WithFilter:
     """With Filter mixin."""
@@ -39,8 +80,5 @@ class WithFilter:
         :param filter_obj: filter object
         :return: Self object
         """
-        self.request_data['filter.{filter_name}.{filter_condition}'.format(
-            filter_name=filter_obj.field_name,
-            filter_condition=filter_obj.condition.value,
-        )] = filter_obj.value
+        self.request_data[filter_param(filter_obj)] = filter_obj.value
         return self
@@ -0,0 +1,207 @@
+"""Keyset (seek) pagination.
+
+Every page is the first page (page.number=1) of the list sorted
+by key fields and filtered by the last seen key, so the cost of a page
+does not depend on scan depth and added or deleted rows don't shift
+next pages.
+
+Keys are (field,) with unique field or (field, unique field),
+for example ('created', 'uuid'). Filters can not express
+field > a or (field = a and unique > b), so for two fields pages are
+requested with field >= a and rows of the last seen key value are skipped.
+If all rows of the page have the same seen key value, rows with this value
+are requested with field = a and unique > b, then field > a.
+Key fields should not be null.
+"""
+
+from enum import Enum
+from typing import Any, Dict, Optional, Sequence, Set
+
+from ambra_sdk.service.filtering import Filter, FilterCondition, filter_param
+from ambra_sdk.service.sorting import Sorter
+
+DEFAULT_KEYSET_FIELDS = ('created', 'uuid')
+
+
+class KeysetMode(Enum):
+    """Filter of the next page."""
+
+    # field >= last value
+    ge = 'ge'
+    # field = last value and unique field > last unique value
+    tie = 'tie'
+    # field > last value
+    gt = 'gt'
+
+
+class Keyset:
+    """Keyset pagination state."""
+
+    def __init__(self, fields: Sequence[str] = DEFAULT_KEYSET_FIELDS):
+        """Init.
+
+        :param fields: (field,) or (field, unique field)
+        :raises ValueError: Wrong number of fields
+        """
+        if len(fields) not in {1, 2}:
+            raise ValueError('Keyset should have one or two fields')
+        self.fields = tuple(fields)
+        self._field = fields[0]
+        self._unique_field = fields[-1]
+        self._last_value: Optional[Any] = None
+        self._last_unique_value: Optional[Any] = None
+        # Unique values of yielded rows with last value
+        self._tie_values: Set[Any] = set()
+        self._mode = KeysetMode.gt if len(fields) == 1 else KeysetMode.ge
+        # New rows of the current page
+        self._new_rows = 0
+
+    @property
+    def started(self) -> bool:
+        """Some rows were seen.
+
+        :return: started flag
+        """
+        return self._last_unique_value is not None
+
+    def request_data(
+        self,
+        request_data: Dict[str, Any],
+        rows_in_page: int,
+    ) -> Dict[str, Any]:
+        """Request data of the next page.
+
+        :param request_data: query request data
+        :param rows_in_page: number of rows in page
+        :return: request data
+        """
+        page_request_data = dict(request_data)
+        page_request_data['sort_by'] = ','.join(
+            str(Sorter(field_name)) for field_name in self.fields
+        )
+        page_request_data['page.rows'] = rows_in_page
+        page_request_data['page.number'] = 1
+        if not self.started:
+            return page_request_data
+        if self._mode == KeysetMode.tie:
+            key_filters = [
+                Filter(self._field, FilterCondition.equals, self._last_value),
+                Filter(
+                    self._unique_field,
+                    FilterCondition.gt,
+                    self._last_unique_value,
+                ),
+            ]
+        else:
+            key_filters = [
+                Filter(
+                    self._field,
+                    FilterCondition(self._mode.value),
+                    self._last_value,
+                ),
+            ]
+        for key_filter in key_filters:
+            page_request_data[filter_param(key_filter)] = key_filter.value
+        return page_request_data
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'Keyset':
+        """Restore keyset from state.
+
+        :param state: keyset state (see state)
+        :return: keyset
+        """
+        keyset = cls(state['fields'])
+        keyset._last_value = state['last_value']  # NOQA:WPS437
+        keyset._last_unique_value = state['last_unique_value']  # NOQA:WPS437
+        keyset._tie_values = set(state['tie_values'])  # NOQA:WPS437
+        keyset._mode = KeysetMode(state['mode'])  # NOQA:WPS437
+        if len(keyset.fields) == 2 and keyset._mode == KeysetMode.gt:
+            # State can be saved in the middle of page
+            keyset._mode = KeysetMode.ge  # NOQA:WPS437
+        return keyset
+
+    def state(self) -> Dict[str, Any]:
+        """Get json serializable state.
+
+        :return: keyset state
+        """
+        return {
+            'fields': list(self.fields),
+            'last_value': self._last_value,
+            'last_unique_value': self._last_unique_value,
+            'tie_values': sorted(self._tie_values),
+            'mode': self._mode.value,
+        }
+
+    def add_row(self, row: Dict[str, Any]) -> bool:
+        """Remember the last key of row.
+
+        :param row: page row
+        :return: False if row was already seen
+        :raises ValueError: Row has no key field
+        """
+        row_value = row.get(self._field)
+        unique_value = row.get(self._unique_field)
+        if row_value is None or unique_value is None:
+            raise ValueError(
+                'Keyset fields {fields} are missing in row'.format(
+                    fields=self.fields,
+                ),
+            )
+        if row_value == self._last_value:
+            if unique_value in self._tie_values:
+                return False
+        else:
+            self._tie_values = set()
+        self._tie_values.add(unique_value)
+        self._last_value = row_value
+        self._last_unique_value = unique_value
+        self._new_rows += 1
+        return True
+
+    def next_page(self, more: bool) -> bool:
+        """Choose filter of the next page.
+
+        :param more: page.more flag of the last page
+        :return: False if there are no more rows
+        """
+        new_rows, self._new_rows = self._new_rows, 0
+        if self._mode == KeysetMode.tie:
+            if not more:
+                # All rows with last value are seen
+                self._mode = KeysetMode.gt
+            return True
+        if not more:
+            return False
+        if len(self.fields) == 1:
+            return True
+        if self._mode == KeysetMode.gt:
+            self._mode = KeysetMode.ge
+        elif new_rows == 0:
+            # Page is full of rows with seen last value
+            self._mode = KeysetMode.tie
+        return True
+
+
+class WithKeyset:
+    """With keyset pagination mixin.
+
+    For paginated queries with sorting and filtering.
+    """
+
+    def all_by_keyset(
+        self,
+        fields: Sequence[str] = DEFAULT_KEYSET_FIELDS,
+    ):
+        """Get iterable response with keyset pagination.
+
+        :Example:
+
+        >>> for study in api.Study.list().all_by_keyset():
+        >>>     process(study)
+
+        :param fields: (field,) with unique field or (field, unique field)
+        :return: iterable response object
+        """
+        return self.all().keyset(fields)  # type: ignore
@@ -0,0 +1,110 @@
+"""Adaptive page size.
+
+Page size is tuned by latency and response size of requested pages:
+it grows while pages are faster and smaller than targets and shrinks
+if a page is slower or bigger than targets. One step changes page size
+not more than twice.
+
+Rows of next pages are requested by page.number, so the new page size
+should divide the number of already requested rows and be in limits,
+otherwise page size is not changed
+(pages with keyset pagination don't have this limit).
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# From api.html: the maximum is 5000
+MAX_ROWS_IN_PAGE = 5000
+MIN_ROWS_IN_PAGE = 10
+# Targets of one page
+DEFAULT_TARGET_PAGE_LATENCY = 1.0
+DEFAULT_TARGET_PAGE_BYTES = 4 * 1024 * 1024
+# Page size is not changed if it differs from the desired size less
+PAGE_SIZE_TOLERANCE = 0.2
+MAX_PAGE_SIZE_STEP = 2
+
+
+class PageSizer:
+    """Adaptive page size."""
+
+    def __init__(  # NOQA:WPS211
+        self,
+        rows_in_page: int,
+        target_latency: float = DEFAULT_TARGET_PAGE_LATENCY,
+        target_bytes: int = DEFAULT_TARGET_PAGE_BYTES,
+        min_rows: int = MIN_ROWS_IN_PAGE,
+        max_rows: int = MAX_ROWS_IN_PAGE,
+    ):
+        """Init.
+
+        :param rows_in_page: initial page size
+        :param target_latency: target page latency (seconds)
+        :param target_bytes: target page response size
+        :param min_rows: minimum page size
+        :param max_rows: maximum page size
+        :raises ValueError: Wrong limits or targets
+        """
+        if not 0 < min_rows <= max_rows <= MAX_ROWS_IN_PAGE:
+            raise ValueError(
+                'Page size limits should be 0 < min_rows <= max_rows <= 5000',
+            )
+        if target_latency <= 0 or target_bytes <= 0:
+            raise ValueError('Page targets should be positive')
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+        self.rows_in_page = min(max(rows_in_page, min_rows), max_rows)
+        self._desired_rows = self.rows_in_page
+
+    def observe(self, rows_in_page: int, latency: float, response_bytes: int):
+        """Observe requested page.
+
+        :param rows_in_page: page size of request
+        :param latency: page latency (seconds)
+        :param response_bytes: page response size
+        """
+        ratio = min(
+            self.target_latency / max(latency, 1e-3),
+            self.target_bytes / max(response_bytes, 1),
+        )
+        ratio = min(max(ratio, 1 / MAX_PAGE_SIZE_STEP), MAX_PAGE_SIZE_STEP)
+        if abs(ratio - 1) < PAGE_SIZE_TOLERANCE:
+            self._desired_rows = rows_in_page
+            return
+        self._desired_rows = min(
+            max(int(rows_in_page * ratio), self.min_rows),
+            self.max_rows,
+        )
+
+    def next_rows_in_page(self, requested_rows: Optional[int] = None) -> int:
+        """Choose page size of the next page.
+
+        :param requested_rows: number of rows in previous pages
+                               (None if pages are not requested by number)
+        :return: page size
+        """
+        rows_in_page = self._desired_rows
+        if requested_rows:
+            # Page number of the next page should be integer.
+            # Page size is not changed if there is no divisor in limits
+            # (requested rows are always divided by current page size)
+            rows_in_page = next(
+                (
+                    divisor
+                    for divisor in range(rows_in_page, self.min_rows - 1, -1)
+                    if requested_rows % divisor == 0
+                ),
+                self.rows_in_page,
+            )
+        if rows_in_page != self.rows_in_page:
+            logger.debug(
+                'Page size is changed from %s to %s',
+                self.rows_in_page,
+                rows_in_page,
+            )
+        self.rows_in_page = rows_in_page
+        return rows_in_page
@@ -0,0 +1,162 @@
+"""Parallel fetching of list pages.
+
+Pages are requested by page.number in a window of parallel requests.
+Total number of rows is not needed: pages after the last page
+(page.more == 0) are not requested, but up to workers - 1 pages
+beyond the end can be requested speculatively.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+DEFAULT_PARALLEL_PAGES = 4
+
+Page = Tuple[int, Any]
+
+
+def is_last_page(page_json: Any) -> bool:
+    """Check that there are no pages after page.
+
+    :param page_json: page response json
+    :return: last page flag
+    """
+    return page_json['page']['more'] == 0
+
+
+def fetch_pages(  # NOQA:WPS231
+    fetch_page: Callable[[int], Any],
+    page_numbers: Iterable[int],
+    workers: int = DEFAULT_PARALLEL_PAGES,
+    ordered: bool = True,
+) -> Iterator[Page]:
+    """Fetch pages in thread pool.
+
+    :param fetch_page: function page number -> page json
+    :param page_numbers: numbers of requested pages (ascending)
+    :param workers: number of parallel requests
+    :param ordered: yield pages in order of numbers
+                    (or in order of completion)
+    :yields: (page number, page json)
+
+    :raises ValueError: Wrong number of workers
+    """
+    if workers < 1:
+        raise ValueError('Number of workers should be positive')
+    numbers = iter(page_numbers)
+    last_page: Optional[int] = None
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending: Dict[Any, int] = {}
+    # Futures in order of page numbers (for ordered pages)
+    queue: Deque[Any] = deque()
+
+    def schedule():  # NOQA:WPS430
+        while len(pending) < workers:
+            page_number = next(numbers, None)
+            if page_number is None or \
+               (last_page is not None and page_number > last_page):
+                return
+            future = executor.submit(fetch_page, page_number)
+            pending[future] = page_number
+            if ordered:
+                queue.append(future)
+
+    try:
+        schedule()
+        while pending:
+            if ordered:
+                done = [queue.popleft()]
+            else:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                page_number = pending.pop(future)
+                if last_page is not None and page_number > last_page:
+                    continue
+                page_json = future.result()
+                if is_last_page(page_json):
+                    last_page = page_number
+                    for next_future, next_page in list(pending.items()):
+                        if next_page > last_page:
+                            next_future.cancel()
+                yield page_number, page_json
+            schedule()
+    finally:
+        for not_completed in pending:
+            not_completed.cancel()
+        executor.shutdown(wait=False)
+
+
+async def fetch_async_pages(  # NOQA:WPS231
+    fetch_page: Callable[[int], Awaitable[Any]],
+    page_numbers: Iterable[int],
+    workers: int = DEFAULT_PARALLEL_PAGES,
+    ordered: bool = True,
+) -> AsyncIterator[Page]:
+    """Fetch pages concurrently.
+
+    :param fetch_page: coroutine function page number -> page json
+    :param page_numbers: numbers of requested pages (ascending)
+    :param workers: number of parallel requests
+    :param ordered: yield pages in order of numbers
+                    (or in order of completion)
+    :yields: (page number, page json)
+
+    :raises ValueError: Wrong number of workers
+    """
+    if workers < 1:
+        raise ValueError('Number of workers should be positive')
+    numbers = iter(page_numbers)
+    last_page: Optional[int] = None
+    pending: Dict[Any, int] = {}
+    # Tasks in order of page numbers (for ordered pages)
+    queue: Deque[Any] = deque()
+
+    def schedule():  # NOQA:WPS430
+        while len(pending) < workers:
+            page_number = next(numbers, None)
+            if page_number is None or \
+               (last_page is not None and page_number > last_page):
+                return
+            task = asyncio.ensure_future(fetch_page(page_number))
+            pending[task] = page_number
+            if ordered:
+                queue.append(task)
+
+    try:
+        schedule()
+        while pending:
+            if ordered:
+                done = [queue.popleft()]
+                await asyncio.wait(done)
+            else:
+                done, _ = await asyncio.wait(
+                    list(pending),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            for task in done:
+                page_number = pending.pop(task)
+                if last_page is not None and page_number > last_page:
+                    continue
+                page_json = task.result()
+                if is_last_page(page_json):
+                    last_page = page_number
+                    for next_task, next_page in list(pending.items()):
+                        if next_page > last_page:
+                            next_task.cancel()
+                yield page_number, page_json
+            schedule()
+    finally:
+        for not_completed in pending:
+            not_completed.cancel()
@@ -0,0 +1,861 @@
+"""Partitioned scans.
+
+List is split into disjoint ranges of a date or number field
+(filter.{field}.ge and filter.{field}.lt) or into chunks of long
+filter.{field}.in list, partitions are scanned
+concurrently (threads for Api, tasks for AsyncApi).
+
+If the list has count method, ranges are balanced by number of rows:
+the range is split into PARTITION_SLICES slices per partition,
+slices are counted and grouped into partitions with equal number of rows.
+Otherwise ranges have equal width.
+
+Rows are yielded in order of arrival or merged in order of sort_by
+of the query (k-way merge of sorted partitions).
+"""
+
+import asyncio
+import heapq
+import json
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from datetime import date, datetime
+from itertools import accumulate
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from box import Box
+
+# Count methods of lists
+COUNT_URLS = {  # NOQA:WPS407
+    '/activity/list': '/activity/list/count',
+    '/message/list': '/message/count',
+    '/study/list': '/study/count',
+}
+DEFAULT_PARTITIONS = 4
+# Counted slices per partition
+PARTITION_SLICES = 4
+# Rows in queue of partition
+PARTITION_BUFFER = 100
+# Values of one filter.{field}.in
+DEFAULT_IN_CHUNK_SIZE = 500
+MAX_IN_FILTER_BYTES = 64 * 1024
+# Polling interval of stopped scan (seconds)
+PARTITION_STOP_INTERVAL = 0.1
+FILTER_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+Bound = Union[int, float, date, datetime]
+SortKey = Callable[[Any], Tuple[Any, ...]]
+# End of partition rows
+_END = object()
+
+
+def split_range(start: Bound, stop: Bound, parts: int) -> List[Bound]:
+    """Split range to parts of equal width.
+
+    :param start: range start
+    :param stop: range stop (not included)
+    :param parts: number of parts
+    :return: bounds of parts (not more than parts + 1 values)
+    :raises ValueError: Empty range or wrong number of parts
+    """
+    if parts < 1:
+        raise ValueError('Number of partitions should be positive')
+    if not start < stop:  # type: ignore
+        raise ValueError('Partitioned range is empty')
+    width = stop - start  # type: ignore
+    bounds: List[Bound] = []
+    for index in range(parts):
+        if isinstance(width, int):
+            bound = start + width * index // parts  # type: ignore
+        else:
+            bound = start + width * index / parts  # type: ignore
+        # Bounds of small ranges can be the same
+        if not bounds or bound > bounds[-1]:  # type: ignore
+            bounds.append(bound)
+    bounds.append(stop)
+    return bounds
+
+
+def balance_bounds(
+    bounds: List[Bound],
+    counts: List[int],
+    parts: int,
+) -> List[Bound]:
+    """Group slices into parts with equal number of rows.
+
+    :param bounds: bounds of slices
+    :param counts: number of rows in slices
+    :param parts: number of parts
+    :return: bounds of parts
+    """
+    parts = min(parts, len(counts))
+    # Rows before bound
+    rows_before = [0, *accumulate(counts)]
+    total = rows_before[-1]
+    cuts = [0]
+    for part in range(1, parts):
+        # Every next part has at least one slice
+        cut_indexes = range(cuts[-1] + 1, len(counts) - parts + part + 1)
+        cuts.append(
+            min(
+                cut_indexes,
+                key=lambda cut: abs(
+                    rows_before[cut] * parts - total * part,
+                ),
+            ),
+        )
+    cuts.append(len(counts))
+    return [bounds[cut] for cut in cuts]
+
+
+def filter_value(bound: Bound) -> Union[int, float, str]:
+    """Get filter value of bound.
+
+    :param bound: bound
+    :return: filter value
+    """
+    if isinstance(bound, datetime):
+        return bound.strftime(FILTER_DATETIME_FORMAT)
+    if isinstance(bound, date):
+        return bound.isoformat()
+    return bound
+
+
+def chunk_values(
+    values: Iterable[Hashable],
+    chunk_size: int = DEFAULT_IN_CHUNK_SIZE,
+    max_bytes: int = MAX_IN_FILTER_BYTES,
+) -> Iterator[List[Hashable]]:
+    """Split unique values into chunks of in filter.
+
+    :param values: values
+    :param chunk_size: maximum number of values in chunk
+    :param max_bytes: maximum size of json encoded chunk
+    :yields: chunk of values
+    :raises ValueError: Wrong chunk size
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive')
+    seen = set()
+    chunk: List[Hashable] = []
+    # Size of json list
+    chunk_bytes = 2
+    for chunk_value in values:
+        if chunk_value in seen:
+            continue
+        seen.add(chunk_value)
+        # Separator and value
+        value_bytes = len(json.dumps(chunk_value)) + 2
+        if chunk and (
+            len(chunk) == chunk_size or chunk_bytes + value_bytes > max_bytes
+        ):
+            yield chunk
+            chunk, chunk_bytes = [], 2
+        if not chunk:
+            value_bytes -= 2
+        chunk.append(chunk_value)
+        chunk_bytes += value_bytes
+    if chunk:
+        yield chunk
+
+
+def merge_key(sort_by: str) -> Tuple[SortKey, bool]:
+    """Get merge key of sorted rows.
+
+    :param sort_by: sort_by value of query (field-asc,field2-asc)
+    :return: key function and reverse flag
+    :raises ValueError: Mixed sorting orders
+    """
+    fields = []
+    orders = set()
+    for sorter in sort_by.split(','):
+        field_name, _, order = sorter.rpartition('-')
+        fields.append(field_name)
+        orders.add(order)
+    if len(orders) > 1:
+        raise ValueError('Rows with mixed sorting orders can not be merged')
+
+    def key(row):  # NOQA:WPS430
+        row_values = (getattr(row, field_name) for field_name in fields)
+        # Null values go first
+        return tuple(
+            (row_value is not None, row_value) for row_value in row_values
+        )
+    return key, orders == {'desc'}
+
+
+class ScanResponse:
+    """Rows of concurrent scan of queries."""
+
+    def __init__(
+        self,
+        query,
+        workers: int,
+        dedupe_field: Optional[str] = None,
+    ):
+        """Init.
+
+        :param query: paginated query
+        :param workers: number of concurrent scans
+        :param dedupe_field: skip rows with seen value of field
+        :raises ValueError: Wrong number of workers
+        """
+        if workers < 1:
+            raise ValueError('Number of workers should be positive')
+        self._query = query
+        self._request_data = dict(query.request_data)
+        self._workers = workers
+        self._dedupe_field = dedupe_field
+        self._merge_key: Optional[Tuple[SortKey, bool]] = None
+
+    def __iter__(self):
+        """Return iterator by rows.
+
+        :yields: response object
+        """
+        responses = [scan_query.all() for scan_query in self._queries()]
+        stop = Event()
+        workers: List[Thread] = []
+        try:
+            if self._merge_key is None:
+                yield from self._dedupe(
+                    self._iter_unordered(responses, stop, workers),
+                )
+            else:
+                yield from self._dedupe(
+                    self._iter_merged(responses, stop, workers),
+                )
+        finally:
+            stop.set()
+            # Workers finish requested pages and don't request new ones
+            for worker in workers:
+                worker.join()
+
+    def to_async(self):
+        """Get async variant of response.
+
+        :return: async response
+        """
+        from ambra_sdk.service.query import (  # NOQA:WPS433
+            to_async_query,
+        )
+        async_response = copy(self)
+        async_response.__class__ = ASYNC_SCAN_RESPONSES[  # NOQA:WPS609
+            type(self)
+        ]
+        async_response._query = to_async_query(  # NOQA:WPS437
+            self._query,
+        )
+        return async_response
+
+    def _queries(self) -> List[Any]:
+        """Queries of scan.
+
+        :raises NotImplementedError: Scan has no queries
+        """
+        raise NotImplementedError
+
+    def _scan_query(self, request_data: Dict[str, Any]):
+        """Copy of query with other request data.
+
+        :param request_data: request data
+        :return: query
+        """
+        scan_query = copy(self._query)
+        scan_query.request_data = request_data
+        return scan_query
+
+    def _iter_unordered(
+        self,
+        responses: List[Any],
+        stop: Event,
+        workers: List[Thread],
+    ):
+        """Rows of responses in order of arrival.
+
+        :param responses: iterable responses
+        :param stop: consumer stopped iteration
+        :param workers: list for started worker threads
+        :return: rows iterator
+        """
+        workers_number = min(self._workers, len(responses))
+        queue: Queue = Queue(maxsize=PARTITION_BUFFER * workers_number)
+        next_responses = iter(responses)
+        lock = Lock()
+        for _ in range(workers_number):
+            workers.append(
+                self._start_worker(next_responses, lock, queue, stop),
+            )
+        return self._queue_rows(queue, stop, workers_number)
+
+    def _iter_merged(
+        self,
+        responses: List[Any],
+        stop: Event,
+        workers: List[Thread],
+    ):
+        """Rows of responses merged in sort order.
+
+        :param responses: sorted iterable responses
+        :param stop: consumer stopped iteration
+        :param workers: list for started worker threads
+        :return: rows iterator
+        """
+        queues = [Queue(maxsize=PARTITION_BUFFER) for _ in responses]
+        for response, queue in zip(responses, queues):
+            workers.append(
+                self._start_worker(iter([response]), Lock(), queue, stop),
+            )
+        key, reverse = self._merge_key  # type: ignore
+        return heapq.merge(
+            *(self._queue_rows(queue, stop) for queue in queues),
+            key=key,
+            reverse=reverse,
+        )
+
+    def _dedupe(self, rows: Iterable[Any]):
+        """Skip rows with seen value of dedupe field.
+
+        :param rows: rows
+        :yields: response object
+        """
+        if self._dedupe_field is None:
+            yield from rows
+            return
+        seen = set()
+        for row in rows:
+            row_id = getattr(row, self._dedupe_field, None)
+            if row_id is not None:
+                if row_id in seen:
+                    continue
+                seen.add(row_id)
+            yield row
+
+    def _start_worker(
+        self,
+        responses: Iterator[Any],
+        lock: Lock,
+        queue: Queue,
+        stop: Event,
+    ) -> Thread:
+        """Start thread putting rows of responses to queue.
+
+        :param responses: iterator by responses (shared by workers)
+        :param lock: lock of responses iterator
+        :param queue: queue of (row, error)
+        :param stop: consumer stopped iteration
+        :return: started thread
+        """
+        worker = Thread(
+            target=self._scan,
+            args=(responses, lock, queue, stop),
+            daemon=True,
+        )
+        worker.start()
+        return worker
+
+    def _scan(
+        self,
+        responses: Iterator[Any],
+        lock: Lock,
+        queue: Queue,
+        stop: Event,
+    ):
+        """Put rows of responses to queue.
+
+        :param responses: iterator by responses (shared by workers)
+        :param lock: lock of responses iterator
+        :param queue: queue of (row, error), row is _END at end
+        :param stop: consumer stopped iteration
+        """
+        try:
+            while not stop.is_set():
+                with lock:
+                    response = next(responses, None)
+                if response is None:
+                    break
+                for row in response:
+                    if not self._put(queue, stop, (row, None)):
+                        return
+        except Exception as exc:  # NOQA:B902
+            self._put(queue, stop, (None, exc))
+            return
+        self._put(queue, stop, (_END, None))
+
+    def _put(self, queue: Queue, stop: Event, item: Tuple[Any, Any]):
+        """Put item to queue (wait for free space).
+
+        :param queue: queue
+        :param stop: consumer stopped iteration
+        :param item: (row, error)
+        :return: False if consumer stopped iteration
+        """
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=PARTITION_STOP_INTERVAL)
+            except Full:
+                continue
+            return True
+        return False
+
+    def _queue_rows(self, queue: Queue, stop: Event, producers: int = 1):
+        """Rows of queue.
+
+        :param queue: queue of (row, error)
+        :param stop: consumer stopped iteration
+        :param producers: number of producers of queue
+        :yields: response object
+        :raises exc: Scan error
+        """
+        while producers:
+            row, exc = queue.get()
+            if exc is not None:
+                stop.set()
+                raise exc
+            if row is _END:
+                producers -= 1
+                continue
+            yield row
+
+
+class PartitionedResponse(ScanResponse):
+    """Rows of partitioned scan.
+
+    :Example:
+
+    >>> from datetime import datetime
+    >>> studies = api.Study.list().partitioned(
+    >>>     'created',
+    >>>     datetime(2020, 1, 1),
+    >>>     datetime(2021, 1, 1),
+    >>>     partitions=8,
+    >>> )
+    >>> for study in studies:
+    >>>     print(study.uuid)
+    """
+
+    def __init__(  # NOQA:WPS211
+        self,
+        query,
+        field: str,
+        start: Bound,
+        stop: Bound,
+        partitions: int = DEFAULT_PARTITIONS,
+        balance: bool = True,
+        merge: bool = False,
+    ):
+        """Init.
+
+        :param query: paginated query with filtering
+        :param field: date or number field
+        :param start: range start
+        :param stop: range stop (not included)
+        :param partitions: number of partitions (concurrent scans)
+        :param balance: balance partitions by count method
+        :param merge: yield rows in order of sort_by
+        """
+        split_range(start, stop, partitions)
+        super().__init__(query, partitions)
+        self._field = field
+        self._start = start
+        self._stop = stop
+        self._partitions = partitions
+        self._count_url: Optional[str] = None
+        if balance:
+            self._count_url = COUNT_URLS.get(query.url)
+        if merge:
+            sort_by = query.request_data.get('sort_by') or \
+                '{field}-asc'.format(field=field)
+            self._merge_key = merge_key(sort_by)
+            self._request_data['sort_by'] = sort_by
+
+    def partitions(self) -> List[Tuple[Bound, Bound]]:
+        """Get ranges of partitions.
+
+        :return: list of (start, stop)
+        """
+        if self._count_url is None:
+            bounds = split_range(self._start, self._stop, self._partitions)
+        else:
+            slice_bounds = self._slice_bounds()
+            with ThreadPoolExecutor(max_workers=self._partitions) as pool:
+                counts = list(
+                    pool.map(
+                        lambda slice_range: self._count_query(
+                            slice_range,
+                        ).get().count,
+                        zip(slice_bounds, slice_bounds[1:]),
+                    ),
+                )
+            bounds = balance_bounds(slice_bounds, counts, self._partitions)
+        return list(zip(bounds, bounds[1:]))
+
+    def _queries(self) -> List[Any]:
+        """Queries of partitions.
+
+        :return: queries
+        """
+        return [
+            self._scan_query(self._range_request_data(bounds))
+            for bounds in self.partitions()
+        ]
+
+    def _slice_bounds(self) -> List[Bound]:
+        """Bounds of counted slices.
+
+        :return: bounds
+        """
+        return split_range(
+            self._start,
+            self._stop,
+            self._partitions * PARTITION_SLICES,
+        )
+
+    def _range_request_data(self, bounds: Tuple[Bound, Bound]):
+        """Request data with range filters.
+
+        :param bounds: (start, stop)
+        :return: request data
+        """
+        range_start, range_stop = bounds
+        request_data = dict(self._request_data)
+        ge_param = 'filter.{field}.ge'.format(field=self._field)
+        lt_param = 'filter.{field}.lt'.format(field=self._field)
+        request_data[ge_param] = filter_value(range_start)
+        request_data[lt_param] = filter_value(range_stop)
+        return request_data
+
+    def _count_query(self, bounds: Tuple[Bound, Bound]):
+        """Count query of range.
+
+        :param bounds: (start, stop)
+        :return: query
+        """
+        count_query = self._scan_query({
+            param: param_value
+            for param, param_value in self._range_request_data(bounds).items()
+            if param.startswith('filter.')
+        })
+        count_query.url = self._count_url
+        count_query.return_constructor = Box
+        return count_query
+
+
+class ChunkedInResponse(ScanResponse):
+    """Rows of in filter with long list of values.
+
+    :Example:
+
+    >>> studies = api.Study.list().filter_in_chunks('study_uid', study_uids)
+    >>> for study in studies:
+    >>>     print(study.uuid)
+    """
+
+    def __init__(  # NOQA:WPS211
+        self,
+        query,
+        field: str,
+        values: Iterable[Hashable],
+        chunk_size: int = DEFAULT_IN_CHUNK_SIZE,
+        workers: int = DEFAULT_PARTITIONS,
+        dedupe_field: Optional[str] = 'uuid',
+    ):
+        """Init.
+
+        :param query: paginated query with filtering
+        :param field: filtered field
+        :param values: values of field
+        :param chunk_size: maximum number of values in one filter
+        :param workers: number of concurrent scans
+        :param dedupe_field: skip rows with seen value of field
+        """
+        super().__init__(query, workers, dedupe_field)
+        self._field = field
+        self._chunks = list(chunk_values(values, chunk_size))
+
+    def _queries(self) -> List[Any]:
+        """Queries of chunks.
+
+        :return: queries
+        """
+        in_param = 'filter.{field}.in'.format(field=self._field)
+        return [
+            self._scan_query(dict(self._request_data, **{
+                in_param: json.dumps(chunk),
+            }))
+            for chunk in self._chunks
+        ]
+
+
+class AsyncScanResponse(ScanResponse):
+    """Rows of concurrent scan of async queries."""
+
+    def __iter__(self):
+        """Sync iteration is not supported.
+
+        :raises TypeError: Use async for
+        """
+        raise TypeError('Use "async for" with async scan response')
+
+    async def __aiter__(self):
+        """Return async iterator by rows.
+
+        :yields: response object
+        """
+        responses = [
+            scan_query.all() for scan_query in await self._aqueries()
+        ]
+        tasks: List[Any] = []
+        try:
+            if self._merge_key is None:
+                rows = self._aiter_unordered(responses, tasks)
+            else:
+                rows = self._aiter_merged(responses, tasks)
+            seen: Optional[set] = None
+            if self._dedupe_field is not None:
+                seen = set()
+            async for row in rows:
+                if seen is not None:
+                    row_id = getattr(row, self._dedupe_field, None)
+                    if row_id in seen:
+                        continue
+                    if row_id is not None:
+                        seen.add(row_id)
+                yield row
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _aqueries(self) -> List[Any]:
+        """Queries of scan.
+
+        :return: queries
+        """
+        return self._queries()
+
+    def _aiter_unordered(self, responses: List[Any], tasks: List[Any]):
+        """Rows of responses in order of arrival.
+
+        :param responses: async iterable responses
+        :param tasks: started scan tasks
+        :return: rows async iterator
+        """
+        workers = min(self._workers, len(responses))
+        queue: asyncio.Queue = asyncio.Queue(PARTITION_BUFFER * workers)
+        next_responses = iter(responses)
+        tasks.extend(
+            asyncio.ensure_future(self._ascan(next_responses, queue))
+            for _ in range(workers)
+        )
+        return self._aqueue_rows(queue, workers)
+
+    async def _aiter_merged(self, responses: List[Any], tasks: List[Any]):
+        """Rows of responses merged in sort order.
+
+        :param responses: sorted async iterable responses
+        :param tasks: started scan tasks
+        :yields: response object
+        """
+        key, reverse = self._merge_key  # type: ignore
+        choose = max if reverse else min
+        queues = [asyncio.Queue(PARTITION_BUFFER) for _ in responses]
+        tasks.extend(
+            asyncio.ensure_future(self._ascan(iter([response]), queue))
+            for response, queue in zip(responses, queues)
+        )
+        partition_rows = [self._aqueue_rows(queue) for queue in queues]
+        heads: Dict[int, Any] = {}
+        for index, rows in enumerate(partition_rows):
+            await self._anext_head(heads, index, rows)
+        while heads:
+            index = choose(heads, key=lambda head: key(heads[head]))
+            yield heads.pop(index)
+            await self._anext_head(heads, index, partition_rows[index])
+
+    async def _anext_head(self, heads: Dict[int, Any], index: int, rows):
+        """Get the next row of partition.
+
+        :param heads: current rows of partitions
+        :param index: partition index
+        :param rows: async iterator by partition rows
+        """
+        try:
+            heads[index] = await rows.__anext__()  # NOQA:WPS609
+        except StopAsyncIteration:
+            return
+
+    async def _ascan(self, responses: Iterator[Any], queue: asyncio.Queue):
+        """Put rows of responses to queue.
+
+        :param responses: iterator by responses (shared by workers)
+        :param queue: queue of (row, error), row is _END at end
+        """
+        try:
+            for response in responses:
+                async for row in response:
+                    await queue.put((row, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # NOQA:B902
+            await queue.put((None, exc))
+            return
+        await queue.put((_END, None))
+
+    async def _aqueue_rows(self, queue: asyncio.Queue, producers: int = 1):
+        """Rows of queue.
+
+        :param queue: queue of (row, error)
+        :param producers: number of producers of queue
+        :yields: response object
+        :raises exc: Scan error
+        """
+        while producers:
+            row, exc = await queue.get()
+            if exc is not None:
+                raise exc
+            if row is _END:
+                producers -= 1
+                continue
+            yield row
+
+
+class AsyncPartitionedResponse(AsyncScanResponse, PartitionedResponse):
+    """Rows of partitioned scan.
+
+    :Example:
+
+    >>> async for study in api.Study.list().partitioned(
+    >>>     'created', datetime(2020, 1, 1), datetime(2021, 1, 1),
+    >>> ):
+    >>>     print(study.uuid)
+    """
+
+    async def apartitions(self) -> List[Tuple[Bound, Bound]]:
+        """Get ranges of partitions.
+
+        :return: list of (start, stop)
+        """
+        if self._count_url is None:
+            bounds = split_range(self._start, self._stop, self._partitions)
+        else:
+            slice_bounds = self._slice_bounds()
+            counted = await asyncio.gather(*(
+                self._count_query(slice_range).get()
+                for slice_range in zip(slice_bounds, slice_bounds[1:])
+            ))
+            bounds = balance_bounds(
+                slice_bounds,
+                [count_response.count for count_response in counted],
+                self._partitions,
+            )
+        return list(zip(bounds, bounds[1:]))
+
+    async def _aqueries(self) -> List[Any]:
+        """Queries of partitions.
+
+        :return: queries
+        """
+        return [
+            self._scan_query(self._range_request_data(bounds))
+            for bounds in await self.apartitions()
+        ]
+
+
+class AsyncChunkedInResponse(AsyncScanResponse, ChunkedInResponse):
+    """Rows of in filter with long list of values.
+
+    :Example:
+
+    >>> async for study in api.Study.get_many(uuids):
+    >>>     print(study.uuid)
+    """
+
+
+ASYNC_SCAN_RESPONSES = {  # NOQA:WPS407
+    PartitionedResponse: AsyncPartitionedResponse,
+    ChunkedInResponse: AsyncChunkedInResponse,
+}
+
+
+class WithPartitions:
+    """With partitioned scan mixin.
+
+    For paginated queries with filtering.
+    """
+
+    partitioned_response_class = PartitionedResponse
+    chunked_in_response_class = ChunkedInResponse
+
+    def partitioned(  # NOQA:WPS211
+        self,
+        field: str,
+        start: Bound,
+        stop: Bound,
+        partitions: int = DEFAULT_PARTITIONS,
+        balance: bool = True,
+        merge: bool = False,
+    ) -> PartitionedResponse:
+        """Scan disjoint ranges of field concurrently.
+
+        :param field: date or number field (e.g. created)
+        :param start: range start
+        :param stop: range stop (not included)
+        :param partitions: number of partitions (concurrent scans)
+        :param balance: balance partitions by count method (if it exists)
+        :param merge: yield rows in order of sort_by of query
+                      (default - in order of arrival)
+        :return: partitioned response
+        """
+        return self.partitioned_response_class(
+            self,
+            field,
+            start,
+            stop,
+            partitions=partitions,
+            balance=balance,
+            merge=merge,
+        )
+
+    def filter_in_chunks(  # NOQA:WPS211
+        self,
+        field: str,
+        values: Iterable[Hashable],
+        chunk_size: int = DEFAULT_IN_CHUNK_SIZE,
+        workers: int = DEFAULT_PARTITIONS,
+        dedupe_field: Optional[str] = 'uuid',
+    ) -> ChunkedInResponse:
+        """Filter by any number of values.
+
+        Values are split into in filters of chunk_size values,
+        chunks are scanned concurrently. Rows are yielded in order
+        of arrival.
+
+        :param field: filtered field
+        :param values: values of field
+        :param chunk_size: maximum number of values in one filter
+        :param workers: number of concurrent scans
+        :param dedupe_field: skip rows with seen value of field
+                             (None - don't skip)
+        :return: chunked in response
+        """
+        return self.chunked_in_response_class(
+            self,
+            field,
+            values,
+            chunk_size=chunk_size,
+            workers=workers,
+            dedupe_field=dedupe_field,
+        )
@@ -0,0 +1,608 @@
+"""Query planner of predicates.
+
+Predicate is a combination of filters (Filter objects, for example
+created by model fields) by & (and), | (or), ~ (not)
+and Where checks of rows in python.
+Planner sends the parts of predicate which server can evaluate
+as filter.* params and checks the rest of predicate on received rows:
+
+* Filters of top level conjunction are server filters
+  (one filter per field and condition).
+* Disjunction of equals and in filters of one field is in filter.
+* Other parts (negations, other disjunctions, Where checks) are local.
+
+If fields of rows are known, only these fields and fields
+of local checks are requested.
+Local checks of filters approximate server conditions
+(values are compared as row values, like supports % and _).
+
+:Example:
+
+>>> rows = api.Study.list().where(
+>>>     (Study.phi_namespace == namespace_id)
+>>>     & ((Study.modality == 'CT') | (Study.modality == 'MR'))
+>>>     & ~Study.patient_name.like('%TEST%'),
+>>>     fields=['uuid', 'study_uid'],
+>>> )
+>>> for study in rows:
+>>>     process(study)
+"""
+
+import json
+import operator
+import re
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ambra_sdk.service.filtering import (
+    Filter,
+    FilterCondition,
+    WithFilter,
+    filter_param,
+)
+
+Operand = Union[Filter, 'Predicate']
+
+# Conditions of filters which can be merged to in filter
+IN_CONDITIONS = frozenset((
+    FilterCondition.equals,
+    FilterCondition.in_condition,
+))
+NULL_CONDITIONS = frozenset((
+    FilterCondition.equals_or_null,
+    FilterCondition.not_equals_or_null,
+    FilterCondition.in_or_null,
+))
+COMPARISONS = {  # NOQA:WPS407
+    FilterCondition.equals: operator.eq,
+    FilterCondition.equals_or_null: operator.eq,
+    FilterCondition.not_equals: operator.ne,
+    FilterCondition.not_equals_or_null: operator.ne,
+    FilterCondition.gt: operator.gt,
+    FilterCondition.ge: operator.ge,
+    FilterCondition.lt: operator.lt,
+    FilterCondition.le: operator.le,
+}
+LIKE_WILDCARDS = {'%': '.*', '_': '.'}  # NOQA:WPS407
+
+
+class Predicate:
+    """Predicate over rows."""
+
+    def __and__(self, other: Operand) -> 'Predicate':
+        """Conjunction.
+
+        :param other: other predicate
+        :return: predicate
+        """
+        return And(self, other)
+
+    def __or__(self, other: Operand) -> 'Predicate':
+        """Disjunction.
+
+        :param other: other predicate
+        :return: predicate
+        """
+        return Or(self, other)
+
+    def __invert__(self) -> 'Predicate':
+        """Negation.
+
+        :return: predicate
+        """
+        return Not(self)
+
+    def matches(self, row) -> bool:
+        """Check row.
+
+        :param row: row object
+        :raises NotImplementedError: Abstract method
+        """
+        raise NotImplementedError
+
+    def fields(self) -> Set[str]:
+        """Fields of rows used by predicate.
+
+        :raises NotImplementedError: Abstract method
+        """
+        raise NotImplementedError
+
+
+class And(Predicate):
+    """All operands are true."""
+
+    def __init__(self, *operands: Operand):
+        """Init.
+
+        :param operands: filters or predicates
+        """
+        self.operands = operands
+
+    def matches(self, row) -> bool:
+        """Check row.
+
+        :param row: row object
+        :return: True if all operands match
+        """
+        return all(matches(operand, row) for operand in self.operands)
+
+    def fields(self) -> Set[str]:
+        """Fields of rows used by predicate.
+
+        :return: field names
+        """
+        return operands_fields(self.operands)
+
+
+class Or(Predicate):
+    """Any operand is true."""
+
+    def __init__(self, *operands: Operand):
+        """Init.
+
+        :param operands: filters or predicates
+        """
+        self.operands = operands
+
+    def matches(self, row) -> bool:
+        """Check row.
+
+        :param row: row object
+        :return: True if any operand matches
+        """
+        return any(matches(operand, row) for operand in self.operands)
+
+    def fields(self) -> Set[str]:
+        """Fields of rows used by predicate.
+
+        :return: field names
+        """
+        return operands_fields(self.operands)
+
+
+class Not(Predicate):
+    """Operand is false."""
+
+    def __init__(self, operand: Operand):
+        """Init.
+
+        :param operand: filter or predicate
+        """
+        self.operand = operand
+
+    def matches(self, row) -> bool:
+        """Check row.
+
+        :param row: row object
+        :return: True if operand doesn't match
+        """
+        return not matches(self.operand, row)
+
+    def fields(self) -> Set[str]:
+        """Fields of rows used by predicate.
+
+        :return: field names
+        """
+        return operands_fields((self.operand,))
+
+
+class Where(Predicate):
+    """Check of rows in python."""
+
+    def __init__(
+        self,
+        check: Callable[[Any], bool],
+        fields: Iterable[str] = (),
+    ):
+        """Init.
+
+        :param check: check of row object
+        :param fields: fields of rows used by check
+        """
+        self.check = check
+        self._fields = set(fields)
+
+    def matches(self, row) -> bool:
+        """Check row.
+
+        :param row: row object
+        :return: result of check
+        """
+        return bool(self.check(row))
+
+    def fields(self) -> Set[str]:
+        """Fields of rows used by predicate.
+
+        :return: field names
+        """
+        return set(self._fields)
+
+
+def row_field_name(field_name: str) -> str:
+    """Name of field in rows.
+
+    Full names of model fields start with model name (Study.uuid).
+
+    :param field_name: filter field name
+    :return: field name (struct.field for fields of structs)
+    """
+    names = field_name.split('.')
+    while len(names) > 1 and names[0][:1].isupper():
+        names.pop(0)
+    return '.'.join(names)
+
+
+def operands_fields(operands: Iterable[Operand]) -> Set[str]:
+    """Fields of rows used by operands.
+
+    :param operands: filters or predicates
+    :return: field names
+    """
+    fields: Set[str] = set()
+    for operand in operands:
+        if isinstance(operand, Filter):
+            fields.add(row_field_name(operand.field_name))
+        else:
+            fields.update(operand.fields())
+    return fields
+
+
+def row_value(row, field_name: str) -> Any:
+    """Value of field (struct.field for fields of structs).
+
+    :param row: row object
+    :param field_name: field name
+    :return: value (None if field is missing)
+    """
+    field_value = row
+    for name in row_field_name(field_name).split('.'):
+        if field_value is None:
+            return None
+        if isinstance(field_value, dict):
+            field_value = field_value.get(name)
+        else:
+            field_value = getattr(field_value, name, None)
+    return field_value
+
+
+@lru_cache(maxsize=128)
+def _like_pattern(pattern: str):
+    """Compile like pattern.
+
+    :param pattern: like pattern
+    :return: regular expression
+    """
+    regex = ''.join(
+        LIKE_WILDCARDS.get(char, re.escape(char)) for char in pattern
+    )
+    return re.compile(regex, re.IGNORECASE | re.DOTALL)
+
+
+def _as_row_type(field_value: Any, filter_value: Any) -> Any:
+    """Convert filter value to type of row value.
+
+    :param field_value: row value
+    :param filter_value: filter value
+    :return: converted filter value
+    """
+    if isinstance(field_value, bool):
+        return str(filter_value).lower() in {'1', 'true'}
+    if isinstance(field_value, (int, float)):
+        try:
+            return type(field_value)(filter_value)
+        except (TypeError, ValueError):
+            return filter_value
+    if isinstance(field_value, str):
+        return str(filter_value)
+    return filter_value
+
+
+def _compare(field_value: Any, condition: FilterCondition, filter_value: Any):
+    """Compare not null row value with filter value.
+
+    :param field_value: row value
+    :param condition: filter condition
+    :param filter_value: filter value
+    :return: result of condition
+    """
+    if condition in {FilterCondition.in_condition, FilterCondition.in_or_null}:
+        if isinstance(filter_value, str):
+            filter_value = json.loads(filter_value)
+        return any(
+            field_value == _as_row_type(field_value, in_value)
+            for in_value in filter_value
+        )
+    if condition == FilterCondition.like:
+        return _like_pattern(str(filter_value)).fullmatch(
+            str(field_value),
+        ) is not None
+    filter_value = _as_row_type(field_value, filter_value)
+    try:
+        return COMPARISONS[condition](field_value, filter_value)
+    except TypeError:
+        # Not comparable values
+        return False
+
+
+def filter_matches(filter_obj: Filter, row) -> bool:
+    """Check row by filter.
+
+    :param filter_obj: filter object
+    :param row: row object
+    :return: True if row matches filter
+    """
+    field_value = row_value(row, filter_obj.field_name)
+    if field_value is None:
+        return filter_obj.condition in NULL_CONDITIONS or (
+            filter_obj.condition == FilterCondition.equals
+            and filter_obj.value is None
+        )
+    return bool(_compare(field_value, filter_obj.condition, filter_obj.value))
+
+
+def matches(operand: Operand, row) -> bool:
+    """Check row by filter or predicate.
+
+    :param operand: filter or predicate
+    :param row: row object
+    :return: True if row matches
+    """
+    if isinstance(operand, Filter):
+        return filter_matches(operand, row)
+    return operand.matches(row)
+
+
+class Plan(NamedTuple):
+    """Plan of predicate."""
+
+    # Server filters
+    filters: Tuple[Filter, ...]
+    # Checked on received rows (None - all rows match)
+    local: Optional[Operand]
+    # Fields for only_top_fields (None - all fields)
+    top_fields: Optional[List[str]]
+    # Fields for only_struct_fields
+    struct_fields: Dict[str, List[str]]
+
+
+def conjuncts(operand: Operand) -> List[Operand]:
+    """Operands of top level conjunction.
+
+    :param operand: filter or predicate
+    :return: operands
+    """
+    if not isinstance(operand, And):
+        return [operand]
+    operands: List[Operand] = []
+    for and_operand in operand.operands:
+        operands.extend(conjuncts(and_operand))
+    return operands
+
+
+def server_filter(operand: Operand) -> Optional[Filter]:
+    """Server filter of operand.
+
+    :param operand: filter or predicate
+    :return: filter (None if server can't evaluate operand)
+    """
+    if isinstance(operand, Filter):
+        return None if operand.value is None else operand
+    if not isinstance(operand, Or):
+        return None
+    field_names = set()
+    in_values: List[Any] = []
+    for or_operand in operand.operands:
+        if not isinstance(or_operand, Filter) or \
+           or_operand.condition not in IN_CONDITIONS or \
+           or_operand.value is None:
+            return None
+        field_names.add(or_operand.field_name)
+        if or_operand.condition == FilterCondition.equals:
+            in_values.append(or_operand.value)
+        else:
+            in_values.extend(json.loads(or_operand.value))  # type: ignore
+    if len(field_names) != 1:
+        return None
+    return Filter(
+        field_name=field_names.pop(),
+        condition=FilterCondition.in_condition,
+        value=json.dumps(in_values),
+    )
+
+
+def only_fields(
+    fields: Iterable[str],
+) -> Tuple[List[str], Dict[str, List[str]]]:
+    """Fields for only methods.
+
+    :param fields: field names (struct.field for fields of structs)
+    :return: top fields and fields of structs
+    """
+    top_fields = set()
+    struct_fields: Dict[str, Set[str]] = {}
+    for field_name in fields:
+        names = field_name.split('.')
+        top_fields.add(names[0])
+        if len(names) > 1:
+            struct_fields.setdefault(names[0], set()).add(names[1])
+    return sorted(top_fields), {
+        struct_name: sorted(struct_fields[struct_name])
+        for struct_name in sorted(struct_fields)
+    }
+
+
+def plan_predicate(
+    predicate: Operand,
+    filterable: bool = True,
+    used_params: Iterable[str] = (),
+    fields: Optional[Iterable[str]] = None,
+) -> Plan:
+    """Split predicate to server filters and local check.
+
+    :param predicate: filter or predicate
+    :param filterable: method supports filtering
+    :param used_params: params of request data
+    :param fields: fields of rows needed by caller (None - all fields)
+    :return: plan
+    """
+    params = set(used_params)
+    filters: List[Filter] = []
+    local: List[Operand] = []
+    for operand in conjuncts(predicate):
+        operand_filter = server_filter(operand) if filterable else None
+        if operand_filter is None or filter_param(operand_filter) in params:
+            local.append(operand)
+            continue
+        params.add(filter_param(operand_filter))
+        filters.append(operand_filter)
+    local_predicate: Optional[Operand] = None
+    if len(local) == 1:
+        local_predicate = local[0]
+    elif local:
+        local_predicate = And(*local)
+    top_fields = None
+    struct_fields: Dict[str, List[str]] = {}
+    if fields is not None:
+        top_fields, struct_fields = only_fields(
+            set(fields) | operands_fields(local),
+        )
+    return Plan(
+        filters=tuple(filters),
+        local=local_predicate,
+        top_fields=top_fields,
+        struct_fields=struct_fields,
+    )
+
+
+class PlannedResponse:
+    """Rows of iterable response checked by local predicate."""
+
+    def __init__(self, response, plan: Plan):
+        """Init.
+
+        :param response: iterable response of planned query
+        :param plan: plan
+        """
+        self.response = response
+        self.plan = plan
+        # Received and matched rows
+        self.scanned = 0
+        self.matched = 0
+
+    def __iter__(self):
+        """Return iterator by matched rows.
+
+        :yields: response object
+        """
+        for row in self.response:
+            if self._matches(row):
+                yield row
+
+    def first(self):
+        """First matched row.
+
+        :return: response object or None
+        """
+        return next(iter(self), None)
+
+    def _matches(self, row) -> bool:
+        """Check received row.
+
+        :param row: response object
+        :return: True if row matches predicate
+        """
+        self.scanned += 1
+        if self.plan.local is not None and not matches(self.plan.local, row):
+            return False
+        self.matched += 1
+        return True
+
+
+class AsyncPlannedResponse(PlannedResponse):
+    """Rows of async iterable response checked by local predicate."""
+
+    def __iter__(self):
+        """Sync iteration is not supported.
+
+        :raises TypeError: Use async for
+        """
+        raise TypeError('Use "async for" with async planned response')
+
+    async def __aiter__(self):
+        """Return async iterator by matched rows.
+
+        :yields: response object
+        """
+        async for row in self.response:
+            if self._matches(row):
+                yield row
+
+    async def first(self):  # type: ignore
+        """First matched row.
+
+        :return: response object or None
+        """
+        rows = self.__aiter__()
+        try:
+            return await rows.__anext__()
+        except StopAsyncIteration:
+            return None
+        finally:
+            await rows.aclose()
+
+
+class WithPlanner:
+    """With query planner mixin.
+
+    For paginated queries.
+    """
+
+    planned_response_class = PlannedResponse
+
+    def where(
+        self,
+        predicate: Operand,
+        fields: Optional[Iterable[str]] = None,
+    ):
+        """Get rows matching predicate.
+
+        Server filters and only fields of plan are added to query.
+
+        :Example:
+
+        >>> studies = api.Study.list().where(
+        >>>     (Study.modality == 'CT') | (Study.modality == 'MR'),
+        >>>     fields=['uuid'],
+        >>> )
+
+        :param predicate: filter or predicate
+        :param fields: fields of rows needed by caller (None - all fields)
+        :return: planned response
+        """
+        plan = plan_predicate(
+            predicate,
+            filterable=isinstance(self, WithFilter),
+            used_params=self.request_data,  # type: ignore
+            fields=fields,
+        )
+        for plan_filter in plan.filters:
+            self.filter_by(plan_filter)  # type: ignore
+        if plan.top_fields is not None:
+            self.only_top_fields(plan.top_fields)  # type: ignore
+        if plan.struct_fields:
+            self.only_struct_fields(plan.struct_fields)  # type: ignore
+        return self.planned_response_class(
+            self.all(),  # type: ignore
+            plan,
+        )
@@ -1,18 +1,33 @@
 """Query objects."""
 
-from typing import Any, Callable, Dict, Generic, Optional
+from functools import partial
+from time import monotonic
+from typing import Any, Callable, Dict, Generic, Optional, Type
 
 from box import Box
 
+from ambra_sdk.deadline import Deadline, DeadlineType, to_deadline
+from ambra_sdk.json_backend import decode_response
+from ambra_sdk.service.auto_only import caller_site
 from ambra_sdk.service.filtering import WithFilter
+from ambra_sdk.service.keyset import WithKeyset
 from ambra_sdk.service.only import WithOnly
+from ambra_sdk.service.page_size import MAX_ROWS_IN_PAGE
+from ambra_sdk.service.partition import (
+    AsyncChunkedInResponse,
+    AsyncPartitionedResponse,
+    WithPartitions,
+)
+from ambra_sdk.service.planner import AsyncPlannedResponse, WithPlanner
 from ambra_sdk.service.response import (
     ERROR_MAPPING,
     RETURN_TYPE,
+    AsyncIterableResponse,
     IterableResponse,
     check_response,
 )
 from ambra_sdk.service.sorting import WithSorting
+from ambra_sdk.service.template import QueryTemplate
 
 DEFAULT_ROWS_IN_PAGINATION_PAGE = 100
 
@@ -44,6 +59,9 @@ class Query(Generic[RETURN_TYPE]):
         self._required_sid = required_sid
         self._errors_mapping = errors_mapping
         self.return_constructor = return_constructor
+        self._deadline: Optional[DeadlineType] = None
+        # Key of automatic only fields profile (default - call site)
+        self._auto_only_site: Optional[Any] = None
 
     @property
     def full_url(self) -> str:
@@ -54,39 +72,108 @@ class Query(Generic[RETURN_TYPE]):
         full_url: str = self._api.service_full_url(self.url)
         return full_url  # NOQA:331
 
-    def get(self) -> RETURN_TYPE:
+    def set_deadline(self, deadline: Optional[DeadlineType]):
+        """Set deadline of query.
+
+        Number is a time budget (seconds) of every request
+        with all its retries (for paginated queries - of every page).
+        Deadline object is shared by all requests.
+        By default time budget is api.service_timeout_for(url).
+
+        :param deadline: deadline object or time budget
+        :return: self object
+        """
+        self._deadline = deadline
+        return self
+
+    def template(self) -> QueryTemplate:
+        """Compile query to reusable template.
+
+        Values of request data can be Bind placeholders.
+
+        :Example:
+
+        >>> template = api.Study.get(uuid=Bind('uuid')).template()
+        >>> study = template.bind(uuid=uuid).get()
+
+        :return: query template
+        """
+        return QueryTemplate(self)
+
+    def get(
+        self,
+        coalesce: bool = True,
+        cache: bool = True,
+    ) -> RETURN_TYPE:
         """Get response object.
 
         If sid problems we try to get new sid
         and retry request.
 
+        :param coalesce: use api coalescer (if coalescing is enabled)
+        :param cache: use api response cache (if cache is enabled)
         :return: response object
         """
+        response_cache = self._api.response_cache
+        if cache and response_cache is not None:
+            cached: RETURN_TYPE = response_cache.get(self)
+            return cached  # NOQA:WPS331
+        coalescer = self._api.coalescer
+        if coalesce and coalescer is not None and coalescer.accepts(self):
+            coalesced: RETURN_TYPE = coalescer.get(self)
+            return coalesced  # NOQA:WPS331
+        deadline = self._new_deadline()
         get_result: RETURN_TYPE = self._api.retry_with_new_sid(
-            self.get_once,
+            partial(self.get_once, deadline=deadline),
+            deadline=deadline,
         )
         return get_result  # NOQA:331
 
-    def get_once(self) -> RETURN_TYPE:
+    def get_once(self, deadline: Optional[Deadline] = None) -> RETURN_TYPE:
         """Get response object.
 
+        :param deadline: request deadline (default - query deadline)
         :return: response object
         """
+        if deadline is None:
+            deadline = self._new_deadline()
         response = self._api.service_post(
             url=self.url,
             required_sid=self._required_sid,
+            deadline=deadline,
             data=self.request_data,
         )
-        response = check_response(response, self._errors_mapping)
-        response_json = response.json()
+        return self._response_object(response)
+
+    def _new_deadline(self) -> Optional[Deadline]:
+        return to_deadline(
+            self._deadline,
+            self._api.service_timeout_for(self.url),
+        )
+
+    def _response_object(self, response) -> RETURN_TYPE:
+        response = check_response(
+            response,
+            self._errors_mapping,
+            self._api.json_backend,
+        )
+        metrics = self._api.metrics
+        start = monotonic()
+        response_json = decode_response(response, self._api.json_backend)
+        decoded = monotonic()
+        metrics.record_json_decode(self.url, decoded - start)
         if 'status' in response_json:
             response_json.pop('status')
-        return self.return_constructor(response_json)
+        response_object = self.return_constructor(response_json)
+        metrics.record_box(self.url, monotonic() - decoded)
+        return response_object
 
 
 class QueryP(Query):
     """Query with pagination."""
 
+    iterable_response_class: Type[IterableResponse] = IterableResponse
+
     def __init__(  # NOQA: WPS211
         self,
         api,
@@ -130,19 +217,28 @@ class QueryP(Query):
         # The default is 100 or 1000 depending on
         # the object type and the maximum is 5000
         rows_in_page = int(rows_in_page)
-        if rows_in_page > 5000:
+        if rows_in_page > MAX_ROWS_IN_PAGE:
             raise ValueError('Max rows in page is 5000')
         if rows_in_page < 0:
             raise ValueError('Negative rows in page')
         self._rows_in_page = rows_in_page
         return self
 
-    def all(self) -> IterableResponse:  # NOQA: A003,WPS125
+    def all(  # NOQA: A003,WPS125
+        self,
+        parallel: int = 0,
+        ordered: bool = True,
+        total: Optional[int] = None,
+    ) -> IterableResponse:
         """Get iterable response.
 
+        :param parallel: number of parallel page requests
+                         (0 - sequential, see IterableResponse.parallel)
+        :param ordered: yield rows of parallel pages in order of pages
+        :param total: known number of rows (for example from count method)
         :returns: iterable response object
         """
-        return IterableResponse(
+        iterable_response = self.iterable_response_class(
             self._api,
             self.url,
             self._required_sid,
@@ -151,7 +247,35 @@ class QueryP(Query):
             self._paginated_field,
             self._rows_in_page,
             self.return_constructor,
+            self._deadline,
         )
+        if parallel:
+            iterable_response.parallel(parallel, ordered=ordered, total=total)
+        auto_only = self._api.auto_only
+        if auto_only is not None and self._tracks_fields():
+            site = self._auto_only_site or caller_site()
+            iterable_response.auto_only(auto_only.profile(self.url, site))
+        return iterable_response
+
+    def _tracks_fields(self) -> bool:
+        """Check that automatic only fields can be used.
+
+        :return: True for Box rows of query with filtering
+                 and without only fields
+        """
+        row_class = self.return_constructor
+        return isinstance(self, WithOnly) and \
+            isinstance(self, WithFilter) and \
+            isinstance(row_class, type) and issubclass(row_class, Box) and \
+            not any(param.startswith('fields.') for param in self.request_data)
+
+    def resume(self, cursor: Dict[str, Any]) -> IterableResponse:
+        """Get iterable response continued from cursor.
+
+        :param cursor: cursor (see IterableResponse.cursor)
+        :returns: iterable response object
+        """
+        return self.all().resume(cursor)
 
     def first(self) -> Optional[RETURN_TYPE]:
         """Get First element of sequence.
@@ -177,11 +301,11 @@ class QueryOSF(QueryOF, WithSorting):
     """Query with filtering ans sorting."""
 
 
-class QueryOP(QueryP, WithOnly):
+class QueryOP(QueryP, WithOnly, WithPlanner):
     """Query with pagination and only fields."""
 
 
-class QueryOPF(QueryOP, WithFilter):
+class QueryOPF(QueryOP, WithFilter, WithPartitions):
     """Query with pagination and filtering."""
 
 
@@ -189,10 +313,145 @@ class QueryOPS(QueryOP, WithSorting):
     """Query with pagination and sorting."""
 
 
-class QueryOPSF(QueryOPS, WithFilter):
+class QueryOPSF(QueryOPS, WithFilter, WithKeyset, WithPartitions):
     """Query with pagination sorting and filtering."""
 
 
+class AsyncQuery(Query[RETURN_TYPE]):
+    """Simple async query."""
+
+    async def get(  # type: ignore
+        self,
+        coalesce: bool = True,
+        cache: bool = True,
+    ) -> RETURN_TYPE:
+        """Get response object.
+
+        If sid problems we try to get new sid
+        and retry request.
+
+        :param coalesce: use api coalescer (if coalescing is enabled)
+        :param cache: use api response cache (if cache is enabled)
+        :return: response object
+        """
+        response_cache = self._api.response_cache
+        if cache and response_cache is not None:
+            cached: RETURN_TYPE = await response_cache.get(self)
+            return cached  # NOQA:WPS331
+        coalescer = self._api.coalescer
+        if coalesce and coalescer is not None and coalescer.accepts(self):
+            coalesced: RETURN_TYPE = await coalescer.get(self)
+            return coalesced  # NOQA:WPS331
+        deadline = self._new_deadline()
+        get_result: RETURN_TYPE = await self._api.retry_with_new_sid(
+            partial(self.get_once, deadline=deadline),
+            deadline=deadline,
+        )
+        return get_result  # NOQA:331
+
+    async def get_once(  # type: ignore
+        self,
+        deadline: Optional[Deadline] = None,
+    ) -> RETURN_TYPE:
+        """Get response object.
+
+        :param deadline: request deadline (default - query deadline)
+        :return: response object
+        """
+        if deadline is None:
+            deadline = self._new_deadline()
+        response = await self._api.service_post(
+            url=self.url,
+            required_sid=self._required_sid,
+            deadline=deadline,
+            data=self.request_data,
+        )
+        return self._response_object(response)
+
+
+class AsyncQueryP(AsyncQuery, QueryP):
+    """Async query with pagination."""
+
+    iterable_response_class = AsyncIterableResponse
+    partitioned_response_class = AsyncPartitionedResponse
+    chunked_in_response_class = AsyncChunkedInResponse
+    planned_response_class = AsyncPlannedResponse
+
+    async def first(self) -> Optional[RETURN_TYPE]:  # type: ignore
+        """Get First element of sequence.
+
+        :returns: Response object
+        """
+        first_element: Optional[RETURN_TYPE] = await self.all().first()
+        return first_element  # NOQA:WPS331
+
+
+class AsyncQueryO(AsyncQuery, WithOnly):
+    """Async query with only fields."""
+
+
+class AsyncQueryOF(AsyncQueryO, WithFilter):
+    """Async query with filtering."""
+
+
+class AsyncQueryOS(AsyncQueryO, WithSorting):
+    """Async query with sorting."""
+
+
+class AsyncQueryOSF(AsyncQueryOF, WithSorting):
+    """Async query with filtering ans sorting."""
+
+
+class AsyncQueryOP(AsyncQueryP, WithOnly, WithPlanner):
+    """Async query with pagination and only fields."""
+
+
+class AsyncQueryOPF(AsyncQueryOP, WithFilter, WithPartitions):
+    """Async query with pagination and filtering."""
+
+
+class AsyncQueryOPS(AsyncQueryOP, WithSorting):
+    """Async query with pagination and sorting."""
+
+
+class AsyncQueryOPSF(
+    AsyncQueryOPS,
+    WithFilter,
+    WithKeyset,
+    WithPartitions,
+):
+    """Async query with pagination sorting and filtering."""
+
+
+ASYNC_QUERIES: Dict[Type[Query], Type[AsyncQuery]] = {
+    Query: AsyncQuery,
+    QueryP: AsyncQueryP,
+    QueryO: AsyncQueryO,
+    QueryOF: AsyncQueryOF,
+    QueryOS: AsyncQueryOS,
+    QueryOSF: AsyncQueryOSF,
+    QueryOP: AsyncQueryOP,
+    QueryOPF: AsyncQueryOPF,
+    QueryOPS: AsyncQueryOPS,
+    QueryOPSF: AsyncQueryOPSF,
+}
+
+
+def to_async_query(query: Query) -> AsyncQuery:
+    """Get async variant of query.
+
+    The new query shares all prepared state (url, request data,
+    errors mapping, pagination settings) with the original one.
+
+    :param query: sync query object
+    :return: async query object
+    """
+    async_query_cls = ASYNC_QUERIES[type(query)]
+    async_query: AsyncQuery = async_query_cls.__new__(async_query_cls)
+    async_query.__dict__.update(vars(query))  # NOQA:WPS609
+    return async_query
+
+
 def get_query_cls_name(
     with_pagination: bool,
     with_filtering: bool,
@@ -1,13 +1,25 @@
 """Response objects."""
 
+import asyncio
+import json
+import logging
+from functools import partial
+from queue import Full, Queue
+from threading import Event, Thread
+from time import monotonic
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Iterator,
+    List,
     Mapping,
     Optional,
+    Sequence,
+    Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
 )
@@ -15,18 +27,47 @@ from typing import (
 from box import Box
 from requests import Response
 
+from ambra_sdk.deadline import Deadline, DeadlineType, to_deadline
 from ambra_sdk.exceptions.service import (
     AmbraResponseException,
     AuthorizationRequired,
     MethodNotAllowed,
     PreconditionFailed,
 )
+from ambra_sdk.json_backend import JsonBackend, decode_response
+from ambra_sdk.service.auto_only import (
+    AUTO_ONLY_KEY,
+    AutoOnlyProfile,
+    PageRow,
+    TrackedPage,
+    full_rows_request_data,
+    tracked_row,
+)
+from ambra_sdk.service.keyset import DEFAULT_KEYSET_FIELDS, Keyset
+from ambra_sdk.service.page_size import (
+    DEFAULT_TARGET_PAGE_BYTES,
+    DEFAULT_TARGET_PAGE_LATENCY,
+    MAX_ROWS_IN_PAGE,
+    MIN_ROWS_IN_PAGE,
+    PageSizer,
+)
+from ambra_sdk.service.pages import (
+    fetch_async_pages,
+    fetch_pages,
+    is_last_page,
+)
+
+logger = logging.getLogger(__name__)
 
 RETURN_TYPE = TypeVar('RETURN_TYPE')
-ERROR_MAPPING = Mapping[
-    Union[Tuple[str, Optional[str]], str],
-    PreconditionFailed,
-]
+# Polling interval of stopped prefetch (seconds)
+PREFETCH_STOP_INTERVAL = 0.1
+CURSOR_VERSION = 1
+
+# Exception class and description (generated entrypoints)
+# or exception instance (hand written mappings)
+ERROR = Union[Tuple[Type[PreconditionFailed], str], PreconditionFailed]
+ERROR_MAPPING = Mapping[Union[Tuple[str, Optional[str]], str], ERROR]
 
 
 class IterableResponse(Generic[RETURN_TYPE]):
@@ -42,6 +83,7 @@ class IterableResponse(Generic[RETURN_TYPE]):
         pagination_field: str,
         rows_in_page: int,
         return_constructor: Callable[..., RETURN_TYPE] = Box,
+        deadline: Optional[DeadlineType] = None,
     ):
         """Respone initialization.
 
@@ -53,6 +95,7 @@ class IterableResponse(Generic[RETURN_TYPE]):
         :param pagination_field: field for pagination
         :param rows_in_page: number of rows in page
         :param return_constructor: constructor for return type
+        :param deadline: deadline or time budget of every page request
         """
         self._api = api
         self._url = url
@@ -62,10 +105,28 @@ class IterableResponse(Generic[RETURN_TYPE]):
         self._pagination_field = pagination_field
         self._rows_in_page = rows_in_page
         self._return_constructor = return_constructor
+        self._deadline = deadline
+        # Number of pages prefetched in background
+        self._prefetch = 0
+        # Parallel page requests (see parallel)
+        self._parallel = 0
+        self._ordered = True
+        self._total: Optional[int] = None
+        self._dedupe_field: Optional[str] = None
+        # Keyset pagination fields (see keyset)
+        self._keyset_fields: Optional[Sequence[str]] = None
+        # Adaptive page size (see adaptive)
+        self._page_sizer: Optional[PageSizer] = None
+        # Keyset of the current iteration
+        self._keyset: Optional[Keyset] = None
+        self._resumed_cursor: Optional[Dict[str, Any]] = None
+        # Profile of automatic only fields (see auto_only)
+        self._auto_only: Optional[AutoOnlyProfile] = None
 
         self._min_row: int = 0
         self._max_row: Optional[int] = None
         self._current_row = None
+        self._stopped = False
 
     def __getitem__(self, key: slice):
         """Set range.
@@ -86,38 +147,30 @@ class IterableResponse(Generic[RETURN_TYPE]):
             raise ValueError('Not implemented slice step')
         return self.set_range(start, stop)
 
-    def __iter__(self):  # NOQA: WPS231
+    def __iter__(self):
         """Return iterator by rows.
 
         :yields: response object
-
-        :raises RuntimeError: Max rows in page diffs from request
         """
         # Reset row pointer
         self._current_row = 0
+        self._stopped = False
+        if self._keyset_fields is not None:
+            yield from self._iter_keyset()
+            return
+        if self._parallel:
+            yield from self._iter_parallel()
+            return
+        if self._prefetch:
+            yield from self._iter_prefetched()
+            return
         while True:
             self._prepare_data()
-            response = self._api.retry_with_new_sid(self._get_response)
-            json = response.json()
-            more = json['page']['more']
-            # maximum rows in page
-            max_rows_in_page = json['page']['rows']
-            if max_rows_in_page != self._rows_in_page:
-                raise RuntimeError(
-                    'The max_rows_in_page parameter was ignored by the server',
-                )
-            # TODO: What about study/list:: template field?!!
-            for row in json[self._pagination_field]:
-                if self._current_row < self._min_row:
-                    self._current_row += 1
-                    continue
-                if self._max_row is not None and \
-                   self._current_row >= self._max_row:
-                    return
-                self._current_row += 1
-                yield self._return_constructor(row)
-            if more == 0:
+            page_json = self._fetch_sized(self._request_data)
+            yield from self._page_rows(page_json)
+            if not self._has_next_page(page_json):
                 break
+            self._resize_page(self._current_row)
 
     def set_range(self, min_row: Optional[int], max_row: Optional[int]):
         """Set range.
@@ -139,6 +192,219 @@ class IterableResponse(Generic[RETURN_TYPE]):
         self._max_row = max_row
         return self
 
+    def cursor(self) -> Dict[str, Any]:
+        """Get json serializable position of iteration.
+
+        Cursor points to the row after the last yielded row.
+
+        :Example:
+
+        >>> response = api.Study.list().all()
+        >>> for study in response:
+        >>>     process(study)
+        >>>     save_checkpoint(json.dumps(response.cursor()))
+        >>> # After restart
+        >>> cursor = json.loads(load_checkpoint())
+        >>> for study in api.Study.list().resume(cursor):
+        >>>     process(study)
+
+        :return: cursor
+
+        :raises ValueError: Rows are yielded not in order
+        """
+        if self._parallel and not self._ordered:
+            raise ValueError('Unordered parallel iteration has no cursor')
+        request_data = {
+            field: field_value
+            for field, field_value in self._request_data.items()
+            # Session id is a credential, it is added by api on request
+            if not field.startswith('page.') and field != 'sid'
+        }
+        keyset_state = None
+        if self._keyset is not None:
+            keyset_state = self._keyset.state()
+        elif self._keyset_fields is not None and \
+                self._resumed_cursor is not None:
+            # Iteration of resumed response is not started
+            keyset_state = self._resumed_cursor.get('keyset')
+        return {
+            'version': CURSOR_VERSION,
+            'url': self._url,
+            'request_data': request_data,
+            'rows_in_page': self._rows_in_page,
+            'row': max(self._current_row or 0, self._min_row),
+            'max_row': self._max_row,
+            'keyset_fields': self._keyset_fields and list(self._keyset_fields),
+            'keyset': keyset_state,
+        }
+
+    def resume(self, cursor: Dict[str, Any]):
+        """Continue iteration from cursor.
+
+        Request data (filters, sorting, fields) and range are taken
+        from cursor.
+
+        :param cursor: cursor (see cursor)
+
+        :return: self object
+
+        :raises ValueError: Cursor of other method or version
+        """
+        if cursor.get('version') != CURSOR_VERSION:
+            raise ValueError('Unknown cursor version')
+        if cursor['url'] != self._url:
+            raise ValueError(
+                'Cursor of {cursor_url} can not be used for {url}'.format(
+                    cursor_url=cursor['url'],
+                    url=self._url,
+                ),
+            )
+        self._request_data = dict(cursor['request_data'])
+        self._rows_in_page = cursor['rows_in_page']
+        if self._page_sizer is not None:
+            self._page_sizer.rows_in_page = self._rows_in_page
+        if cursor['keyset_fields'] is not None:
+            self._keyset_fields = tuple(cursor['keyset_fields'])
+        self._resumed_cursor = cursor
+        return self.set_range(cursor['row'], cursor['max_row'])
+
+    def prefetch(self, depth: int):
+        """Prefetch next pages in background.
+
+        Pages are requested by background thread (task for async response)
+        while rows of the current page are processed.
+        Not more than depth pages wait in memory.
+
+        :Example:
+
+        >>> for study in api.Study.list().all().prefetch(2):
+        >>>     process(study)
+
+        :param depth: number of prefetched pages (0 - without prefetch)
+
+        :return: self object
+
+        :raises ValueError: depth is negative
+        """
+        if depth < 0:
+            raise ValueError('Prefetch depth is negative')
+        self._prefetch = depth
+        return self
+
+    def parallel(
+        self,
+        workers: int,
+        ordered: bool = True,
+        total: Optional[int] = None,
+        dedupe_field: Optional[str] = 'uuid',
+    ):
+        """Request pages in parallel.
+
+        Without total the first page is requested alone
+        and next pages are requested in a window of workers requests
+        until the last page (up to workers - 1 requests after the end).
+        Total (for example from count method) limits requested pages,
+        if rows were added after count, next pages are requested too.
+
+        Rows can shift between pages if objects are added or deleted
+        during the scan. Rows with seen dedupe_field value are skipped,
+        deleted objects can lead to skipped rows (warning is logged).
+
+        :Example:
+
+        >>> query = api.Study.list().filter_by(...)
+        >>> total = api.Study.count().filter_by(...).get().count
+        >>> for study in query.all().parallel(8, total=total):
+        >>>     process(study)
+
+        :param workers: number of parallel page requests (0 - sequential)
+        :param ordered: yield rows in order of pages
+                        (or in order of page completion)
+        :param total: known number of rows
+        :param dedupe_field: field of duplicated rows (None - no check)
+
+        :return: self object
+
+        :raises ValueError: workers is negative
+        """
+        if workers < 0:
+            raise ValueError('Number of workers is negative')
+        self._parallel = workers
+        self._ordered = ordered
+        self._total = total
+        self._dedupe_field = dedupe_field
+        return self
+
+    def adaptive(  # NOQA:WPS211
+        self,
+        target_latency: float = DEFAULT_TARGET_PAGE_LATENCY,
+        target_bytes: int = DEFAULT_TARGET_PAGE_BYTES,
+        min_rows: int = MIN_ROWS_IN_PAGE,
+        max_rows: int = MAX_ROWS_IN_PAGE,
+    ):
+        """Tune page size by latency and response size of pages.
+
+        Page size starts from rows in page of query and is changed
+        toward target latency and size of page
+        (see ambra_sdk.service.page_size).
+        Parallel and prefetched pages have fixed size.
+        Chosen page size is reported in api.metrics (page_rows).
+
+        :param target_latency: target page latency (seconds)
+        :param target_bytes: target page response size
+        :param min_rows: minimum page size
+        :param max_rows: maximum page size
+
+        :return: self object
+        """
+        self._page_sizer = PageSizer(
+            self._rows_in_page,
+            target_latency=target_latency,
+            target_bytes=target_bytes,
+            min_rows=min_rows,
+            max_rows=max_rows,
+        )
+        self._rows_in_page = self._page_sizer.rows_in_page
+        return self
+
+    def keyset(self, fields: Sequence[str] = DEFAULT_KEYSET_FIELDS):
+        """Use keyset (seek) pagination.
+
+        Rows are sorted by fields, every next page is requested with
+        filter by the last seen key instead of page number
+        (see ambra_sdk.service.keyset). Pages are requested sequentially.
+
+        :param fields: (field,) with unique field or (field, unique field)
+
+        :return: self object
+
+        :raises ValueError: Query is sorted
+        """
+        if 'sort_by' in self._request_data:
+            raise ValueError('Keyset pagination sorts rows by keyset fields')
+        Keyset(fields)
+        self._keyset_fields = tuple(fields)
+        return self
+
+    def auto_only(self, profile: AutoOnlyProfile):
+        """Request only fields accessed in rows of profile.
+
+        Fields accessed in rows are recorded in profile,
+        pages are requested with only recorded fields
+        (see ambra_sdk.service.auto_only).
+        Usually profile is set by query if auto only is enabled
+        (api.enable_auto_only).
+
+        :param profile: profile of call site
+        :return: self object
+        :raises ValueError: Rows are not Box objects
+        """
+        row_class = self._return_constructor
+        if not isinstance(row_class, type) or not issubclass(row_class, Box):
+            raise ValueError('Auto only fields are tracked only in Box rows')
+        self._auto_only = profile
+        return self
+
     def first(self) -> Optional[RETURN_TYPE]:
         """First element.
 
@@ -163,23 +429,766 @@ class IterableResponse(Generic[RETURN_TYPE]):
             self._request_data['page.number'] = page_number + 1
             self._current_row = self._rows_in_page * page_number
 
-    def _get_response(self):
+    def _iter_keyset(self):
+        """Iterate by rows of keyset pages.
+
+        :yields: response object
+        """
+        keyset = self._start_keyset()
+        while True:
+            page_json = self._fetch_sized(
+                keyset.request_data(self._request_data, self._rows_in_page),
+            )
+            yield from self._keyset_rows(keyset, page_json)
+            if self._stopped or not keyset.next_page(
+                not is_last_page(page_json),
+            ):
+                return
+            self._resize_page()
+
+    def _start_keyset(self) -> Keyset:
+        """Create keyset of iteration (or restore it from cursor).
+
+        :return: keyset
+        """
+        keyset_state = None
+        if self._resumed_cursor is not None:
+            keyset_state = self._resumed_cursor.get('keyset')
+        if keyset_state is None:
+            self._keyset = Keyset(self._keyset_fields)  # type: ignore
+        else:
+            self._keyset = Keyset.from_state(keyset_state)
+            self._current_row = self._resumed_cursor['row']  # type: ignore
+        return self._keyset
+
+    def _keyset_rows(self, keyset: Keyset, page_json):
+        """Not seen rows of keyset page in the requested range.
+
+        :param keyset: keyset
+        :param page_json: page response json
+        :yields: response object
+        """
+        self._check_page_rows(page_json)
+        for row in page_json[self._pagination_field]:
+            if self._max_row is not None and \
+               self._current_row >= self._max_row:
+                self._stopped = True
+                return
+            if not keyset.add_row(row):
+                continue
+            self._current_row += 1
+            if self._current_row > self._min_row:
+                yield self._row_object(row)
+
+    def _first_page(self) -> int:
+        """Number of the first page of range.
+
+        :return: page number (starts from 1)
+        """
+        return self._min_row // self._rows_in_page + 1
+
+    def _page_numbers(
+        self,
+        first_page: int,
+        max_row: Optional[int],
+    ) -> Iterator[int]:
+        """Numbers of pages in the requested range.
+
+        :param first_page: first page number
+        :param max_row: end row number (None - without end)
+        :yields: page number (starts from 1)
+        """
+        page_number = first_page
+        while max_row is None or \
+                (page_number - 1) * self._rows_in_page < max_row:
+            yield page_number
+            page_number += 1
+
+    def _parallel_max_row(self) -> Optional[int]:
+        """End row of parallel scan.
+
+        :return: end row number (None - without end)
+        """
+        if self._total is None:
+            return self._max_row
+        if self._max_row is None:
+            return self._total
+        return min(self._max_row, self._total)
+
+    def _iter_parallel(self):
+        """Iterate by rows of pages requested in parallel.
+
+        :yields: response object
+        """
+        seen: Optional[Set[Any]] = None
+        if self._dedupe_field is not None:
+            seen = set()
+        next_page = self._first_page()
+        max_row = self._parallel_max_row()
+        if self._total is None:
+            # One page lists don't need parallel requests
+            page_json = self._fetch_page(next_page)
+            yield from self._range_rows(next_page, page_json, seen)
+            if is_last_page(page_json) or self._range_is_done(next_page):
+                return
+            next_page += 1
+        while True:
+            last_page, last_page_json = next_page - 1, None
+            pages = fetch_pages(
+                self._fetch_page,
+                self._page_numbers(next_page, max_row),
+                self._parallel,
+                self._ordered,
+            )
+            for page_number, page_json in pages:
+                yield from self._range_rows(page_number, page_json, seen)
+                if page_number > last_page:
+                    last_page, last_page_json = page_number, page_json
+            if not self._has_more_pages(last_page, last_page_json):
+                return
+            # Rows were added after total was counted
+            next_page, max_row = last_page + 1, self._max_row
+
+    def _has_more_pages(
+        self,
+        last_page: int,
+        last_page_json: Optional[Dict[str, Any]],
+    ) -> bool:
+        """Check that pages after scanned pages are needed.
+
+        :param last_page: number of the last scanned page
+        :param last_page_json: json of the last scanned page
+        :return: True if next pages are needed
+        """
+        if last_page_json is None or is_last_page(last_page_json):
+            return False
+        return not self._range_is_done(last_page)
+
+    def _range_is_done(self, page_number: int) -> bool:
+        """Check that page is the last page of range.
+
+        :param page_number: page number
+        :return: True if range has no rows after page
+        """
+        return self._max_row is not None and \
+            page_number * self._rows_in_page >= self._max_row
+
+    def _range_rows(
+        self,
+        page_number: int,
+        page_json: Dict[str, Any],
+        seen: Optional[Set[Any]],
+    ):
+        """Rows of page in the requested range.
+
+        Unlike _page_rows, rows position is calculated from page number.
+
+        :param page_number: page number
+        :param page_json: page response json
+        :param seen: seen values of dedupe field (None - no check)
+        :yields: response object
+
+        :raises RuntimeError: Max rows in page diffs from request
+        """
+        self._check_page_rows(page_json)
+        rows = page_json[self._pagination_field]
+        if len(rows) < self._rows_in_page and not is_last_page(page_json):
+            logger.warning(
+                'Page %s of %s is not full, rows can be skipped',
+                page_number,
+                self._url,
+            )
+        first_row = (page_number - 1) * self._rows_in_page
+        start = max(self._min_row - first_row, 0)
+        stop = None
+        if self._max_row is not None:
+            stop = max(self._max_row - first_row, 0)
+        for row_index, row in enumerate(rows[start:stop], first_row + start):
+            self._current_row = row_index + 1
+            if seen is not None:
+                row_id = row.get(self._dedupe_field)
+                if row_id is not None:
+                    if row_id in seen:
+                        logger.debug('Duplicated row %s', row_id)
+                        continue
+                    seen.add(row_id)
+            yield self._row_object(row)
+
+    def _page_request_data(self, page_number: int) -> Dict[str, Any]:
+        """Request data of page.
+
+        :param page_number: page number (starts from 1)
+        :return: request data
+        """
+        request_data = dict(self._request_data)
+        request_data['page.rows'] = self._rows_in_page
+        request_data['page.number'] = page_number
+        return request_data
+
+    def _iter_prefetched(self):
+        """Iterate by rows of pages prefetched in background thread.
+
+        :yields: response object
+        :raises exc: Page request error
+        """
+        pages: Queue = Queue(maxsize=self._prefetch)
+        stop = Event()
+        self._current_row = \
+            self._min_row // self._rows_in_page * self._rows_in_page
+        Thread(
+            target=self._prefetch_pages,
+            args=(pages, stop),
+            daemon=True,
+        ).start()
+        try:
+            while True:
+                page_json, exc = pages.get()
+                if exc is not None:
+                    raise exc
+                if page_json is None:
+                    return
+                yield from self._page_rows(page_json)
+                if self._stopped:
+                    return
+        finally:
+            stop.set()
+
+    def _prefetch_pages(self, pages: Queue, stop: Event):
+        """Request pages and put them to queue.
+
+        :param pages: queue of (page json, error), page json is None at end
+        :param stop: consumer stopped iteration
+        """
+        try:
+            page_numbers = self._page_numbers(
+                self._first_page(),
+                self._max_row,
+            )
+            for page_number in page_numbers:
+                page_json = self._fetch_page(page_number)
+                if not self._put_page(pages, stop, (page_json, None)):
+                    return
+                if page_json['page']['more'] == 0:
+                    break
+        except Exception as exc:  # NOQA:B902
+            self._put_page(pages, stop, (None, exc))
+            return
+        self._put_page(pages, stop, (None, None))
+
+    def _put_page(self, pages: Queue, stop: Event, page: Tuple[Any, Any]):
+        """Put page to queue (wait for free space).
+
+        :param pages: queue of pages
+        :param stop: consumer stopped iteration
+        :param page: (page json, error)
+        :return: False if consumer stopped iteration
+        """
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=PREFETCH_STOP_INTERVAL)
+            except Full:
+                continue
+            return True
+        return False
+
+    def _fetch_page(self, page_number: int):
+        """Request page.
+
+        :param page_number: page number (starts from 1)
+        :return: page json
+        """
+        return self._fetch(self._page_request_data(page_number))
+
+    def _fetch(self, request_data: Dict[str, Any]):
+        """Request page by request data.
+
+        :param request_data: page request data
+        :return: page json
+        """
+        request_data, fields = self._project(request_data)
+        return self._track_page(
+            self._page_json(self._request(request_data)),
+            fields,
+        )
+
+    def _fetch_sized(self, request_data: Dict[str, Any]):
+        """Request page and observe it by page sizer.
+
+        :param request_data: page request data
+        :return: page json
+        """
+        request_data, fields = self._project(request_data)
+        start = monotonic()
+        response = self._request(request_data)
+        self._observe_page(request_data, monotonic() - start, response)
+        return self._track_page(self._page_json(response), fields)
+
+    def _project(
+        self,
+        request_data: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+        """Add automatic only fields to page request data.
+
+        :param request_data: page request data
+        :return: request data and requested fields (None - all fields)
+        """
+        if self._auto_only is None:
+            return request_data, None
+        fields = self._auto_only.projection()
+        if fields is None:
+            return request_data, None
+        projected_request_data = dict(request_data)
+        projected_request_data['fields._top'] = json.dumps(fields)
+        return projected_request_data, fields
+
+    def _track_page(self, page_json, fields: Optional[List[str]]):
+        """Mark rows of page for tracking of accessed fields.
+
+        :param page_json: page response json
+        :param fields: requested fields (None - all fields)
+        :return: page json
+        """
+        profile = self._auto_only
+        if profile is None:
+            return page_json
+        rows = page_json[self._pagination_field]
+        if fields is None:
+            profile.observe(rows)
+        if profile.disabled:
+            return page_json
+        page = TrackedPage(
+            self,
+            profile,
+            fields,
+            [row[AUTO_ONLY_KEY] for row in rows],
+        )
+        page_json[self._pagination_field] = [
+            PageRow(row, page) for row in rows
+        ]
+        return page_json
+
+    def full_rows(self, keys: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        """Request rows with all fields.
+
+        :param keys: key values of rows
+        :return: row json by key value
+        """
+        page_json = self._page_json(
+            self._request(full_rows_request_data(self._request_data, keys)),
+        )
+        return {
+            row.get(AUTO_ONLY_KEY): row
+            for row in page_json[self._pagination_field]
+        }
+
+    def _request(self, request_data: Dict[str, Any]):
+        """Request page response.
+
+        :param request_data: page request data
+        :return: checked response
+        """
+        deadline = self._new_deadline()
+        return self._api.retry_with_new_sid(
+            partial(self._get_response, deadline, request_data),
+            deadline=deadline,
+        )
+
+    def _observe_page(
+        self,
+        request_data: Dict[str, Any],
+        latency: float,
+        response,
+    ):
+        """Observe page latency and response size.
+
+        :param request_data: page request data
+        :param latency: page latency (seconds)
+        :param response: page response
+        """
+        if self._page_sizer is not None:
+            self._page_sizer.observe(
+                request_data['page.rows'],
+                latency,
+                len(response.content),
+            )
+
+    def _resize_page(self, requested_rows: Optional[int] = None):
+        """Set page size of the next page.
+
+        :param requested_rows: number of rows in previous pages
+                               (None if pages are not requested by number)
+        """
+        if self._page_sizer is None:
+            return
+        self._rows_in_page = self._page_sizer.next_rows_in_page(
+            requested_rows,
+        )
+        self._api.metrics.record_page_rows(self._url, self._rows_in_page)
+
+    def _page_rows(self, page_json):
+        """Rows of page in the requested range.
+
+        :param page_json: page response json
+        :yields: response object
+
+        :raises RuntimeError: Max rows in page diffs from request
+        """
+        self._check_page_rows(page_json)
+        # TODO: What about study/list:: template field?!!
+        for row in page_json[self._pagination_field]:
+            if self._current_row < self._min_row:
+                self._current_row += 1
+                continue
+            if self._max_row is not None and \
+               self._current_row >= self._max_row:
+                self._stopped = True
+                return
+            self._current_row += 1
+            yield self._row_object(row)
+
+    def _row_object(self, row: Dict[str, Any]) -> RETURN_TYPE:
+        """Construct response object of row.
+
+        :param row: row json
+        :return: response object
+        """
+        start = monotonic()
+        if isinstance(row, PageRow):
+            row_object = tracked_row(
+                self._return_constructor,  # type: ignore
+                row,
+                row.page,
+            )
+        else:
+            row_object = self._return_constructor(row)
+        self._api.metrics.record_box(self._url, monotonic() - start)
+        return row_object
+
+    def _check_page_rows(self, page_json):
+        """Check number of rows in page.
+
+        :param page_json: page response json
+        :raises RuntimeError: Max rows in page diffs from request
+        """
+        if page_json['page']['rows'] != self._rows_in_page:
+            raise RuntimeError(
+                'The max_rows_in_page parameter was ignored by the server',
+            )
+
+    def _page_json(self, response):
+        """Decode page json.
+
+        :param response: page response
+        :return: page json
+        """
+        start = monotonic()
+        page_json = decode_response(response, self._api.json_backend)
+        self._api.metrics.record_json_decode(self._url, monotonic() - start)
+        return page_json
+
+    def _has_next_page(self, page_json) -> bool:
+        """Check that we need to request next page.
+
+        :param page_json: page response json
+        :return: next page flag
+        """
+        return not self._stopped and page_json['page']['more'] != 0
+
+    def _new_deadline(self) -> Optional[Deadline]:
+        return to_deadline(
+            self._deadline,
+            self._api.service_timeout_for(self._url),
+        )
+
+    def _get_response(
+        self,
+        deadline: Optional[Deadline] = None,
+        request_data: Optional[Dict[str, Any]] = None,
+    ):
+        if request_data is None:
+            request_data = self._request_data
         response = self._api.service_post(
             url=self._url,
             required_sid=self._required_sid,
-            data=self._request_data,
+            deadline=deadline,
+            data=request_data,
         )
-        return check_response(response, self._errors_mapping)
+        return check_response(
+            response,
+            self._errors_mapping,
+            self._api.json_backend,
+        )
+
+
+class AsyncIterableResponse(IterableResponse[RETURN_TYPE]):
+    """Async iterable response.
+
+    :Example:
+
+    >>> async for study in api.Study.list().all():
+    >>>     print(study.uuid)
+    """
+
+    def __iter__(self):
+        """Sync iteration is not supported.
+
+        :raises TypeError: Use async for
+        """
+        raise TypeError('Use "async for" with async iterable response')
+
+    def auto_only(self, profile: AutoOnlyProfile):
+        """Automatic only fields are not supported.
+
+        Missing fields of rows can't be requested in sync attribute access.
+
+        :param profile: profile of call site
+        :raises NotImplementedError: Not supported
+        """
+        raise NotImplementedError('Auto only fields require sync Api')
+
+    async def __aiter__(self):
+        """Return async iterator by rows.
+
+        :yields: response object
+        """
+        # Reset row pointer
+        self._current_row = 0
+        self._stopped = False
+        if self._keyset_fields is not None:
+            async for keyset_row in self._aiter_keyset():
+                yield keyset_row
+            return
+        if self._parallel:
+            async for parallel_row in self._aiter_parallel():
+                yield parallel_row
+            return
+        if self._prefetch:
+            async for row in self._aiter_prefetched():
+                yield row
+            return
+        while True:
+            self._prepare_data()
+            page_json = await self._fetch_sized(self._request_data)
+            for row in self._page_rows(page_json):
+                yield row
+            if not self._has_next_page(page_json):
+                break
+            self._resize_page(self._current_row)
+
+    async def first(self) -> Optional[RETURN_TYPE]:  # type: ignore
+        """First element.
+
+        :return: Return first element of seq.
+        """
+        rows = self.__aiter__()
+        try:
+            response_obj: RETURN_TYPE = await rows.__anext__()
+        except StopAsyncIteration:
+            return None
+        finally:
+            await rows.aclose()
+        return response_obj  # NOQA:WPS331
+
+    async def _aiter_keyset(self):
+        """Iterate by rows of keyset pages.
+
+        :yields: response object
+        """
+        keyset = self._start_keyset()
+        while True:
+            page_json = await self._fetch_sized(
+                keyset.request_data(self._request_data, self._rows_in_page),
+            )
+            for row in self._keyset_rows(keyset, page_json):
+                yield row
+            if self._stopped or not keyset.next_page(
+                not is_last_page(page_json),
+            ):
+                return
+            self._resize_page()
+
+    async def _aiter_parallel(self):
+        """Iterate by rows of pages requested concurrently.
+
+        :yields: response object
+        """
+        seen: Optional[Set[Any]] = None
+        if self._dedupe_field is not None:
+            seen = set()
+        next_page = self._first_page()
+        max_row = self._parallel_max_row()
+        if self._total is None:
+            # One page lists don't need parallel requests
+            page_json = await self._fetch_page(next_page)
+            for row in self._range_rows(next_page, page_json, seen):
+                yield row
+            if is_last_page(page_json) or self._range_is_done(next_page):
+                return
+            next_page += 1
+        while True:
+            last_page, last_page_json = next_page - 1, None
+            pages = fetch_async_pages(
+                self._fetch_page,
+                self._page_numbers(next_page, max_row),
+                self._parallel,
+                self._ordered,
+            )
+            async for page_number, page_json in pages:  # NOQA:WPS440
+                for page_row in self._range_rows(page_number, page_json, seen):
+                    yield page_row
+                if page_number > last_page:
+                    last_page, last_page_json = page_number, page_json
+            if not self._has_more_pages(last_page, last_page_json):
+                return
+            # Rows were added after total was counted
+            next_page, max_row = last_page + 1, self._max_row
+
+    async def _aiter_prefetched(self):
+        """Iterate by rows of pages prefetched in background task.
+
+        :yields: response object
+        :raises exc: Page request error
+        """
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self._prefetch)
+        self._current_row = \
+            self._min_row // self._rows_in_page * self._rows_in_page
+        producer = asyncio.ensure_future(self._aprefetch_pages(pages))
+        try:
+            while True:
+                page_json, exc = await pages.get()
+                if exc is not None:
+                    raise exc
+                if page_json is None:
+                    return
+                for row in self._page_rows(page_json):
+                    yield row
+                if self._stopped:
+                    return
+        finally:
+            producer.cancel()
+
+    async def _aprefetch_pages(self, pages: asyncio.Queue):
+        """Request pages and put them to queue.
+
+        :param pages: queue of (page json, error), page json is None at end
+        """
+        try:
+            page_numbers = self._page_numbers(
+                self._first_page(),
+                self._max_row,
+            )
+            for page_number in page_numbers:
+                page_json = await self._fetch_page(page_number)
+                await pages.put((page_json, None))
+                if page_json['page']['more'] == 0:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # NOQA:B902
+            await pages.put((None, exc))
+            return
+        await pages.put((None, None))
+
+    async def _fetch_page(self, page_number: int):  # NOQA:WPS611
+        """Request page.
+
+        :param page_number: page number (starts from 1)
+        :return: page json
+        """
+        return await self._fetch(self._page_request_data(page_number))
+
+    async def _fetch(  # NOQA:WPS611
+        self,
+        request_data: Dict[str, Any],
+    ):
+        """Request page by request data.
+
+        :param request_data: page request data
+        :return: page json
+        """
+        return self._page_json(await self._request(request_data))
+
+    async def _fetch_sized(  # NOQA:WPS611
+        self,
+        request_data: Dict[str, Any],
+    ):
+        """Request page and observe it by page sizer.
+
+        :param request_data: page request data
+        :return: page json
+        """
+        start = monotonic()
+        response = await self._request(request_data)
+        self._observe_page(request_data, monotonic() - start, response)
+        return self._page_json(response)
+
+    async def _request(  # NOQA:WPS611
+        self,
+        request_data: Dict[str, Any],
+    ):
+        """Request page response.
+
+        :param request_data: page request data
+        :return: checked response
+        """
+        deadline = self._new_deadline()
+        return await self._api.retry_with_new_sid(
+            partial(self._get_response, deadline, request_data),
+            deadline=deadline,
+        )
+
+    async def _get_response(  # NOQA:WPS611
+        self,
+        deadline: Optional[Deadline] = None,
+        request_data: Optional[Dict[str, Any]] = None,
+    ):
+        if request_data is None:
+            request_data = self._request_data
+        response = await self._api.service_post(
+            url=self._url,
+            required_sid=self._required_sid,
+            deadline=deadline,
+            data=request_data,
+        )
+        return check_response(
+            response,
+            self._errors_mapping,
+            self._api.json_backend,
+        )
+
+
+def response_exception(
+    error: ERROR,
+    error_subtype: Optional[str],
+    error_data: Any,
+) -> PreconditionFailed:
+    """Create exception of error response.
+
+    Mappings are shared by all queries of method,
+    so every error gets a new exception.
+
+    :param error: errors mapping value
+    :param error_subtype: error subtype
+    :param error_data: error data
+    :return: exception
+    """
+    if isinstance(error, PreconditionFailed):
+        exception_class, description = type(error), error.description
+    else:
+        exception_class, description = error
+    return exception_class(description, error_subtype, error_data)
 
 
 def check_response(  # NOQA:WPS231
     response: Response,
     errors_mapping: ERROR_MAPPING,
+    json_backend: Optional[JsonBackend] = None,
 ):
     """Check response on errors.
 
     :param response: response obj
     :param errors_mapping: map of error name and exception
+    :param json_backend: decoder of error response (None - stdlib json)
 
     :return: response object
 
@@ -193,7 +1202,10 @@ def check_response(  # NOQA:WPS231
     if response.status_code == 200:
         return response
     elif response.status_code == 412:
-        json = response.json()
+        if json_backend is None:
+            json = response.json()
+        else:
+            json = decode_response(response, json_backend)
         if json['status'] != 'ERROR':
             raise RuntimeError('Wrong respone')
         error_type: str = json.get('error_type')
@@ -209,8 +1221,7 @@ def check_response(  # NOQA:WPS231
         if not exception and error_subtype is None:
             exception = errors_mapping.get(error_type)
         if exception:
-            exception.set_additional_info(error_subtype, error_data)
-            raise exception
+            raise response_exception(exception, error_subtype, error_data)
         raise PreconditionFailed()
     elif response.status_code == 401:
         raise AuthorizationRequired()
@@ -0,0 +1,171 @@
+"""Background session refresher."""
+
+import logging
+from threading import Event, Thread
+from time import time
+from typing import Optional
+
+from ambra_sdk.exceptions.base import AmbraException
+from ambra_sdk.exceptions.service import (
+    AuthorizationRequired,
+    Expired,
+    ValidationFailed,
+)
+
+logger = logging.getLogger(__name__)
+
+# Renew session if it has less than this number of seconds to live
+DEFAULT_REFRESH_MARGIN = 120
+# Check session ttl at least once in this number of seconds
+DEFAULT_MAX_CHECK_INTERVAL = 15 * 60
+# Wait before next attempt if refresh failed (network errors, etc.)
+DEFAULT_RETRY_INTERVAL = 30
+
+
+class SessionRefresher:
+    """Session refresher.
+
+    Refresher checks sid ttl (/session/ttl) and renews session
+    (/session/login with validate_session) or gets new sid
+    before the session expires.
+
+    :Example:
+
+    >>> refresher = api.start_session_refresher(margin=120)
+    >>> print(refresher.next_refresh_time)
+    >>> api.stop_session_refresher()
+    """
+
+    def __init__(
+        self,
+        api,
+        margin: float = DEFAULT_REFRESH_MARGIN,
+        max_check_interval: float = DEFAULT_MAX_CHECK_INTERVAL,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+    ):
+        """Init.
+
+        :param api: Api instance
+        :param margin: renew session if ttl (seconds) less than margin
+        :param max_check_interval: max interval between ttl checks
+        :param retry_interval: interval before retry of failed refresh
+        """
+        self._api = api
+        self._margin = margin
+        self._max_check_interval = max_check_interval
+        self._retry_interval = retry_interval
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self._next_refresh_time: Optional[float] = None
+
+    @property
+    def next_refresh_time(self) -> Optional[float]:
+        """Time of the next ttl check or refresh (unix timestamp).
+
+        :return: timestamp or None if refresher is not started
+        """
+        return self._next_refresh_time
+
+    @property
+    def running(self) -> bool:
+        """Is refresher running.
+
+        :return: running flag
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start refresher thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = Thread(
+            target=self._run,
+            name='ambra-sdk-session-refresher',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop refresher thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        self._next_refresh_time = None
+
+    def refresh(self) -> float:
+        """Check sid ttl and renew session if needed.
+
+        :return: seconds before next check
+        """
+        sid = self._api.sid
+        ttl = self._ttl()
+        if ttl is not None and ttl > self._margin:
+            return self._schedule(ttl - self._margin)
+
+        if self._api._creds is None:  # NOQA:WPS437
+            # We can not renew session without credentials
+            logger.warning('Session expires and credentials are missed')
+            return self._schedule(self._retry_interval)
+
+        if ttl is not None and self._renew(sid):
+            ttl = self._ttl()
+            if ttl is not None and ttl > self._margin:
+                return self._schedule(ttl - self._margin)
+
+        logger.debug('Replace stale sid')
+        self._api.refresh_sid(sid)
+        ttl = self._ttl()
+        if ttl is None:
+            return self._schedule(self._retry_interval)
+        return self._schedule(max(ttl - self._margin, self._retry_interval))
+
+    def _run(self):
+        delay = 0.0
+        while not self._stop_event.wait(timeout=delay):
+            try:
+                delay = self.refresh()
+            except (AmbraException, OSError) as exc:
+                logger.warning('Session refresh failed: %s', exc)
+                delay = self._schedule(self._retry_interval)
+            except Exception:  # NOQA:B902
+                # Thread should not die: api relies on running refresher
+                logger.exception('Unexpected session refresh error')
+                delay = self._schedule(self._retry_interval)
+
+    def _schedule(self, delay: float) -> float:
+        delay = min(delay, self._max_check_interval)
+        self._next_refresh_time = time() + delay
+        return delay
+
+    def _ttl(self) -> Optional[float]:
+        """Get session ttl in seconds.
+
+        :return: ttl or None if session is expired
+        """
+        try:
+            ttl_response = self._api.Session.ttl().get_once()
+        except (AuthorizationRequired, Expired):
+            return None
+        # Server returns ttl in minutes
+        return float(ttl_response.ttl) * 60
+
+    def _renew(self, sid: str) -> bool:
+        """Renew session by session validation.
+
+        :param sid: session id
+        :return: True if session is valid
+        """
+        creds = self._api._creds  # NOQA:WPS437
+        if creds is None:
+            return False
+        try:
+            self._api.Session.login(
+                login=creds.username,
+                password=creds.password,
+                validate_session=sid,
+            ).get_once()
+        except (AuthorizationRequired, ValidationFailed):
+            return False
+        return True
@@ -0,0 +1,133 @@
+"""Query templates.
+
+Query template is a frozen request skeleton of configured query
+(method arguments, filters, sorting and only fields).
+Variable values of the skeleton are Bind placeholders,
+every bind creates a new query with own request data,
+so one template can be used by many threads and polling iterations
+without rebuilding and serializing the same request data.
+
+:Example:
+
+>>> template = api.Study.list() \
+>>>     .only([Study.uuid, Study.updated]) \
+>>>     .filter_by(Study.phi_namespace == Bind('namespace')) \
+>>>     .filter_by(Study.updated > Bind('since')) \
+>>>     .sort_by(Study.updated.asc()) \
+>>>     .template()
+>>> for study in template.bind(namespace=namespace_id, since=since).all():
+>>>     process(study)
+"""
+
+from itertools import count
+from types import MappingProxyType
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+
+class _Required:
+    """Bind without default value."""
+
+    def __repr__(self):
+        """Get string representation.
+
+        :return: repr
+        """
+        return 'REQUIRED'
+
+
+REQUIRED = _Required()
+# Keys of templates in automatic only fields profiles
+_template_keys = count(1)
+
+
+class Bind(NamedTuple):
+    """Placeholder of bound value."""
+
+    name: str
+    default: Any = REQUIRED
+    # Request value of bound value (for example date formatting of field)
+    convert: Optional[Callable[[Any], Any]] = None
+
+
+class QueryTemplate:
+    """Frozen request skeleton of query."""
+
+    def __init__(self, query):
+        """Init.
+
+        :param query: configured query (it is not changed by template)
+        """
+        self._query_class = type(query)
+        query_vars = dict(vars(query))
+        request_data = query_vars.pop('request_data')
+        if query_vars.get('_auto_only_site') is None:
+            # Queries of template share fields profile
+            query_vars['_auto_only_site'] = ('template', next(_template_keys))
+        self._query_vars = MappingProxyType(query_vars)
+        self._skeleton = MappingProxyType(dict(request_data))
+        self._binds: Tuple[Tuple[str, Bind], ...] = tuple(
+            (param, param_value)
+            for param, param_value in request_data.items()
+            if isinstance(param_value, Bind)
+        )
+        self.names = frozenset(bind.name for _, bind in self._binds)
+
+    @property
+    def url(self) -> str:
+        """Method url.
+
+        :return: url
+        """
+        url: str = self._query_vars['url']
+        return url  # NOQA:WPS331
+
+    @property
+    def request_data(self) -> MappingProxyType:
+        """Request data with Bind placeholders.
+
+        :return: frozen request data
+        """
+        return self._skeleton
+
+    def bind(self, **values):
+        """Create query with bound values.
+
+        :param values: values of Bind placeholders by name
+        :return: new query
+        :raises TypeError: Unknown or missing values
+        """
+        unknown = values.keys() - self.names
+        if unknown:
+            raise TypeError(
+                'Unknown bound values: {names}'.format(
+                    names=', '.join(sorted(unknown)),
+                ),
+            )
+        request_data: Dict[str, Any] = dict(self._skeleton)
+        for param, bind in self._binds:
+            request_data[param] = self._bound_value(bind, values)
+        query = self._query_class.__new__(self._query_class)
+        query.__dict__.update(self._query_vars)  # NOQA:WPS609
+        query.request_data = request_data
+        return query
+
+    def _bound_value(self, bind: Bind, values: Dict[str, Any]) -> Any:
+        """Request value of placeholder.
+
+        :param bind: placeholder
+        :param values: bound values
+        :return: request value
+        :raises TypeError: Value is missing
+        """
+        if bind.name not in values:
+            if bind.default is REQUIRED:
+                raise TypeError(
+                    'Missing bound value: {name}'.format(name=bind.name),
+                )
+            bound_value = bind.default
+        else:
+            bound_value = values[bind.name]
+        if bind.convert is not None and bound_value is not None:
+            return bind.convert(bound_value)
+        return bound_value
+
@@ -2,7 +2,6 @@
 
 import asyncio
 import hashlib
-import json
 import logging
 import sys
 from asyncio import events
@@ -10,10 +9,12 @@ from contextlib import contextmanager
 from queue import Empty, Queue
 from threading import Thread
 from time import monotonic
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional
 
 import aiohttp
 
+from ambra_sdk.json_backend import JsonBackend, get_json_backend
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,12 +77,16 @@ class WSManager:  # NOQA:WPS214
     >>> ws.stop()
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, json_backend: Optional[JsonBackend] = None):
         """Init.
 
         :param url: websocket channel url
+        :param json_backend: messages json backend (None - fastest installed)
         """
         self._url = url
+        if json_backend is None:
+            json_backend = get_json_backend()
+        self._json_backend = json_backend
         self._requests: Queue = Queue()
         self._responses: Queue = Queue(maxsize=100)
         self._subscribe_wait_timeout = 10
@@ -138,7 +143,7 @@ class WSManager:  # NOQA:WPS214
         def _is_ready(msg):  # NOQA:WPS430
             if msg.type != aiohttp.WSMsgType.TEXT:
                 return False
-            msg_json = msg.json()
+            msg_json = msg.json(loads=self._json_backend.loads)
             msg_event = msg_json.get('event')
             msg_channel = msg_json.get('channel')
             msg_sid_md5 = msg_json.get('sid_md5')
@@ -169,7 +174,7 @@ class WSManager:  # NOQA:WPS214
         def _is_subscribed(msg):  # NOQA:WPS430
             if msg.type != aiohttp.WSMsgType.TEXT:
                 return False
-            msg_json = msg.json()
+            msg_json = msg.json(loads=self._json_backend.loads)
             status = msg_json.get('status')
             msg_channel = msg_json.get('channel')
             if status is not None \
@@ -203,6 +208,7 @@ class WSManager:  # NOQA:WPS214
             url=self._url,
             responses=self._responses,
             requests=self._requests,
+            json_backend=self._json_backend,
         )
         self._manager_thread = Thread(
             target=asyncio_run,
@@ -298,13 +304,18 @@ class WS:  # NOQA: WPS214
         url: str,
         responses: Queue,
         requests: Queue,
+        json_backend: Optional[JsonBackend] = None,
     ):
         """Init.
 
         :param url: websocket url
         :param responses: responses queue
         :param requests: requests queue
+        :param json_backend: messages json backend (None - fastest installed)
         """
+        if json_backend is None:
+            json_backend = get_json_backend()
+        self._json_backend = json_backend
         self._url = url
         self._channels: Dict[str, str] = {}
         self._session = None
@@ -406,7 +417,7 @@ class WS:  # NOQA: WPS214
     async def _subscribe(self, sid, channel):
         logger.debug('Subscribe %s', channel)
         self._channels[channel] = sid
-        sub_request = json.dumps(
+        sub_request = self._json_backend.dumps(
             {
                 'action': 'subscribe',
                 'channel': channel,
@@ -424,7 +435,7 @@ class WS:  # NOQA: WPS214
     async def _unsubscribe(self, channel):
         logger.debug('Unsubscribe %s', channel)
         self._channels.pop(channel)
-        close_request = json.dumps(
+        close_request = self._json_backend.dumps(
             {
                 'action': 'unsubscribe',
                 'channel': channel,
@@ -441,7 +452,7 @@ class WS:  # NOQA: WPS214
             self._last_ping = now
         if now - self._last_ping >= self._ping_interval:
             logger.debug('Ping')
-            ping_request = json.dumps({'action': 'ping'})
+            ping_request = self._json_backend.dumps({'action': 'ping'})
             ws = await self._get_ws()
             await ws.send_str(ping_request)
             self._last_ping = now
@@ -0,0 +1,409 @@
+"""Storage engines health.
+
+Every storage engine (engine_fqdn) has circuit breaker:
+
+- closed: requests are sent, results are recorded in a time window
+- open: engine is unhealthy, requests fail fast with EngineUnavailable
+- half open: after open_timeout some probe requests are sent,
+  success closes the breaker, failure opens it again
+"""
+
+from collections import deque
+from enum import Enum
+from threading import Lock
+from time import monotonic
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlparse
+
+from ambra_sdk.exceptions.base import AmbraResponseException
+from ambra_sdk.exceptions.storage import EngineUnavailable
+
+# Time window of request results (seconds)
+DEFAULT_WINDOW = 60
+# Min number of requests in window for error rate check
+DEFAULT_MIN_REQUESTS = 10
+# Open breaker if error rate in window is not less than threshold
+DEFAULT_ERROR_RATE_THRESHOLD = 0.5
+# Open breaker after this number of consecutive failures
+DEFAULT_MAX_CONSECUTIVE_FAILURES = 5
+# Time before probe requests to open engine (seconds)
+DEFAULT_OPEN_TIMEOUT = 30
+# Number of concurrent probe requests in half open state
+DEFAULT_HALF_OPEN_REQUESTS = 1
+# Max number of results in window
+MAX_WINDOW_SIZE = 1000
+
+
+class CircuitState(Enum):
+    """Circuit breaker state."""
+
+    closed = 'closed'
+    open = 'open'  # NOQA:WPS125
+    half_open = 'half_open'
+
+
+class EngineStats(NamedTuple):
+    """Engine health stats."""
+
+    engine_fqdn: str
+    state: CircuitState
+    # Requests and failures in window
+    requests: int
+    failures: int
+    error_rate: float
+    # Latency of requests in window (seconds)
+    latency_avg: Optional[float]
+    latency_p95: Optional[float]
+    consecutive_failures: int
+    # Seconds before probe requests (for open breaker)
+    retry_after: Optional[float]
+
+    @property
+    def available(self) -> bool:
+        """Can requests be sent to engine.
+
+        :return: available flag
+        """
+        return self.state != CircuitState.open or self.retry_after == 0
+
+
+class EngineBreaker:  # NOQA:WPS230
+    """Circuit breaker of one engine.
+
+    Breaker is not thread safe, StorageHealth synchronizes access.
+    """
+
+    def __init__(  # NOQA:WPS211
+        self,
+        engine_fqdn: str,
+        window: float = DEFAULT_WINDOW,
+        min_requests: int = DEFAULT_MIN_REQUESTS,
+        error_rate_threshold: float = DEFAULT_ERROR_RATE_THRESHOLD,
+        max_consecutive_failures: int = DEFAULT_MAX_CONSECUTIVE_FAILURES,
+        open_timeout: float = DEFAULT_OPEN_TIMEOUT,
+        half_open_requests: int = DEFAULT_HALF_OPEN_REQUESTS,
+    ):
+        """Init.
+
+        :param engine_fqdn: engine
+        :param window: time window of results (seconds)
+        :param min_requests: min requests in window for error rate check
+        :param error_rate_threshold: error rate for opening breaker
+        :param max_consecutive_failures: failures for opening breaker
+        :param open_timeout: time before probe requests (seconds)
+        :param half_open_requests: number of concurrent probe requests
+        """
+        self.engine_fqdn = engine_fqdn
+        self._window = window
+        self._min_requests = min_requests
+        self._error_rate_threshold = error_rate_threshold
+        self._max_consecutive_failures = max_consecutive_failures
+        self._open_timeout = open_timeout
+        self._half_open_requests = half_open_requests
+
+        self.state = CircuitState.closed
+        # (time, success, latency)
+        self._results: Deque[Tuple[float, bool, float]] = deque(
+            maxlen=MAX_WINDOW_SIZE,
+        )
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def allow_request(self) -> bool:
+        """Check that request can be sent.
+
+        :return: True if request is allowed
+        """
+        if self.state == CircuitState.open:
+            if self._retry_after() > 0:
+                return False
+            self.state = CircuitState.half_open
+            self._probes = 0
+        if self.state == CircuitState.half_open:
+            if self._probes >= self._half_open_requests:
+                return False
+            self._probes += 1
+        return True
+
+    def cancel(self):
+        """Cancel allowed request without result."""
+        if self.state == CircuitState.half_open and self._probes > 0:
+            self._probes -= 1
+
+    def record(self, success: bool, latency: float):
+        """Record result of request.
+
+        :param success: request success
+        :param latency: request latency (seconds)
+        """
+        now = monotonic()
+        self._results.append((now, success, latency))
+        self._trim(now)
+        if success:
+            self._consecutive_failures = 0
+            if self.state == CircuitState.half_open:
+                self._close()
+            return
+
+        self._consecutive_failures += 1
+        if self.state == CircuitState.half_open:
+            self._open(now)
+        elif self.state == CircuitState.closed and self._should_open():
+            self._open(now)
+
+    def stats(self) -> EngineStats:
+        """Get engine stats.
+
+        :return: engine stats
+        """
+        self._trim(monotonic())
+        requests = len(self._results)
+        failures = sum(1 for _, success, _ in self._results if not success)
+        latencies = sorted(latency for _, _, latency in self._results)
+        retry_after = None
+        if self.state == CircuitState.open:
+            retry_after = self._retry_after()
+        return EngineStats(
+            engine_fqdn=self.engine_fqdn,
+            state=self.state,
+            requests=requests,
+            failures=failures,
+            error_rate=failures / requests if requests else 0,
+            latency_avg=sum(latencies) / requests if requests else None,
+            latency_p95=latencies[int(0.95 * (requests - 1))]
+            if requests else None,
+            consecutive_failures=self._consecutive_failures,
+            retry_after=retry_after,
+        )
+
+    def _should_open(self) -> bool:
+        if self._consecutive_failures >= self._max_consecutive_failures:
+            return True
+        requests = len(self._results)
+        if requests < self._min_requests:
+            return False
+        failures = sum(1 for _, success, _ in self._results if not success)
+        return failures / requests >= self._error_rate_threshold
+
+    def _open(self, now: float):
+        self.state = CircuitState.open
+        self._opened_at = now
+
+    def _close(self):
+        self.state = CircuitState.closed
+        self._results.clear()
+        self._consecutive_failures = 0
+
+    def _retry_after(self) -> float:
+        return max(self._opened_at + self._open_timeout - monotonic(), 0)
+
+    def _trim(self, now: float):
+        window_start = now - self._window
+        while self._results and self._results[0][0] < window_start:
+            self._results.popleft()
+
+
+class StorageHealth:
+    """Health of storage engines.
+
+    :Example:
+
+    >>> health = api.Storage.health
+    >>> engines = health.healthy(['engine1.ambrahealth.com', 'engine2...'])
+    >>> for engine_fqdn, stats in health.table().items():
+    >>>     print(engine_fqdn, stats.state, stats.error_rate)
+    """
+
+    def __init__(self, **breaker_params):
+        """Init.
+
+        :param breaker_params: EngineBreaker parameters
+        """
+        self._breaker_params = breaker_params
+        self._breakers: Dict[str, EngineBreaker] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def engine_from_url(cls, url: str) -> str:
+        """Get engine from storage url.
+
+        :param url: storage request url
+        :return: engine fqdn
+        """
+        return urlparse(url).netloc
+
+    def track(self, url: str) -> 'RequestTracker':
+        """Track request to storage.
+
+        :Example:
+
+        >>> with health.track(url) as tracker:
+        >>>     response = session.get(url)
+        >>>     tracker.response(response)
+
+        :param url: storage request url
+        :return: request tracker (context manager)
+        """
+        return RequestTracker(self, self.engine_from_url(url))
+
+    def before_request(self, engine_fqdn: str):
+        """Check that request to engine can be sent.
+
+        :param engine_fqdn: engine
+        :raises EngineUnavailable: Engine breaker is open
+        """
+        with self._lock:
+            breaker = self._breaker(engine_fqdn)
+            if breaker.allow_request():
+                return
+            retry_after = breaker.stats().retry_after
+        raise EngineUnavailable(engine_fqdn, retry_after)
+
+    def record(self, engine_fqdn: str, success: bool, latency: float):
+        """Record result of request.
+
+        :param engine_fqdn: engine
+        :param success: request success (no transport or 5xx errors)
+        :param latency: request latency (seconds)
+        """
+        with self._lock:
+            self._breaker(engine_fqdn).record(success, latency)
+
+    def cancel(self, engine_fqdn: str):
+        """Cancel allowed request without result.
+
+        :param engine_fqdn: engine
+        """
+        with self._lock:
+            self._breaker(engine_fqdn).cancel()
+
+    def stats(self, engine_fqdn: str) -> EngineStats:
+        """Get engine stats.
+
+        :param engine_fqdn: engine
+        :return: engine stats
+        """
+        with self._lock:
+            return self._breaker(engine_fqdn).stats()
+
+    def table(self) -> Dict[str, EngineStats]:
+        """Get stats of all known engines.
+
+        :return: engine fqdn -> stats
+        """
+        with self._lock:
+            return {
+                engine_fqdn: breaker.stats()
+                for engine_fqdn, breaker in self._breakers.items()
+            }
+
+    def is_available(self, engine_fqdn: str) -> bool:
+        """Check engine availability.
+
+        :param engine_fqdn: engine
+        :return: False if requests to engine fail fast
+        """
+        return self.stats(engine_fqdn).available
+
+    def healthy(self, engines: Iterable[str]) -> List[str]:
+        """Get available engines.
+
+        Engines are sorted by error rate and latency.
+
+        :param engines: engine fqdns
+        :return: available engines
+        """
+        engines_stats = [
+            self.stats(engine_fqdn) for engine_fqdn in engines
+        ]
+        return [
+            engine_stats.engine_fqdn
+            for engine_stats in sorted(
+                engines_stats,
+                key=lambda engine_stats: (
+                    engine_stats.error_rate,
+                    engine_stats.latency_avg or 0,
+                ),
+            )
+            if engine_stats.available
+        ]
+
+    def reset(self, engine_fqdn: Optional[str] = None):
+        """Reset engine health.
+
+        :param engine_fqdn: engine (None - all engines)
+        """
+        with self._lock:
+            if engine_fqdn is None:
+                self._breakers.clear()
+            else:
+                self._breakers.pop(engine_fqdn, None)
+
+    def _breaker(self, engine_fqdn: str) -> EngineBreaker:
+        breaker = self._breakers.get(engine_fqdn)
+        if breaker is None:
+            breaker = EngineBreaker(engine_fqdn, **self._breaker_params)
+            self._breakers[engine_fqdn] = breaker
+        return breaker
+
+
+class RequestTracker:
+    """Tracker of one storage request.
+
+    Transport errors and 5xx responses are engine failures.
+    Ambra response errors (for example, sid problems) are not
+    problems of engine and are not recorded.
+    """
+
+    def __init__(self, health: StorageHealth, engine_fqdn: str):
+        """Init.
+
+        :param health: storage health
+        :param engine_fqdn: engine
+        """
+        self._health = health
+        self.engine_fqdn = engine_fqdn
+        self._success = True
+        self._start = 0.0
+
+    def __enter__(self) -> 'RequestTracker':
+        """Start request.
+
+        :return: tracker
+        """
+        self._health.before_request(self.engine_fqdn)
+        self._start = monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Record request result.
+
+        :param exc_type: exception type
+        :param exc_value: exception
+        :param traceback: traceback
+        """
+        latency = monotonic() - self._start
+        if exc_value is None:
+            self._health.record(self.engine_fqdn, self._success, latency)
+        elif isinstance(exc_value, Exception) and \
+                not isinstance(exc_value, AmbraResponseException):
+            self._health.record(self.engine_fqdn, False, latency)
+        else:
+            self._health.cancel(self.engine_fqdn)
+
+    def response(self, response: Any):
+        """Set response of request.
+
+        :param response: response
+        """
+        self._success = response.status_code < 500
@@ -59,15 +59,16 @@ class Image:
             storage_=self._storage,
             method=StorageMethod.post,
             url=url,
+            url_template=url_template,
             params=request_data,
             data=opened_file,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-        if use_box is True:
-            return Box(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=Box if use_box is True else None,
+        )
 
     # TODO: What to do with tags?
     def wrap(
@@ -137,6 +138,7 @@ class Image:
                 storage_=self._storage,
                 method=StorageMethod.post,
                 url=url,
+                url_template=url_template,
                 errors_mapping=errors_mapping,
                 params=request_data,
                 files=files,
@@ -148,6 +150,7 @@ class Image:
                 storage_=self._storage,
                 method=StorageMethod.post,
                 url=url,
+                url_template=url_template,
                 errors_mapping=errors_mapping,
                 params=request_data,
                 files=files,
@@ -205,6 +208,7 @@ class Image:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
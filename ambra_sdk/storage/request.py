@@ -4,8 +4,8 @@ from typing import TYPE_CHECKING, Any, Dict, Mapping, NamedTuple, Optional
 
 from requests import Response
 
+from ambra_sdk.deadline import DeadlineType
 from ambra_sdk.exceptions.storage import AmbraResponseException
-from ambra_sdk.storage.response import check_response
 
 if TYPE_CHECKING:
     from ambra_sdk.storage.storage import Storage  # NOQA:WPS433
@@ -35,6 +35,25 @@ class PreparedRequest(NamedTuple):
     headers: Optional[Dict[str, str]] = None
     data: Optional[Any] = None  # NOQA:WPS110
     stream: Optional[bool] = None
+    # Url template of storage method (for method settings)
+    url_template: Optional[str] = None
+    # Deadline or time budget (see with_deadline)
+    deadline: Optional[DeadlineType] = None
+
+    def with_deadline(
+        self,
+        deadline: Optional[DeadlineType],
+    ) -> 'PreparedRequest':
+        """Get prepared request with deadline.
+
+        Number is a time budget (seconds) of request with all its retries.
+        Deadline object can be shared by several requests.
+        By default time budget is api.storage_timeout_for(url_template).
+
+        :param deadline: deadline object or time budget
+        :return: new prepared request
+        """
+        return self._replace(deadline=deadline)
 
     def execute(self) -> Response:
         """Execute prepared request.
@@ -42,18 +61,27 @@ class PreparedRequest(NamedTuple):
         If sid problems we try to get new sid
         and retry request.
 
+        For async storage this method returns awaitable.
+
         :return: response object
         """
-        response: Response = self.storage_.retry_with_new_sid(
-            self.execute_once,
-        )
+        response: Response = self.storage_.execute(self)
         return response  # NOQA:WPS331
 
     def execute_once(self) -> Response:
         """Execute prepared request.
 
+        For async storage this method returns awaitable.
+
         :return: response object
-        :raises RuntimeError: Unknown request method
+        """
+        response: Response = self.storage_.execute_once(self)
+        return response  # NOQA:WPS331
+
+    def request_kwargs(self) -> Dict[str, Any]:
+        """Get request arguments.
+
+        :return: request arguments
         """
         request_kwargs: Dict[str, Any] = {}
         if self.params is not None:
@@ -70,25 +98,4 @@ class PreparedRequest(NamedTuple):
 
         if self.stream is not None:
             request_kwargs['stream'] = self.stream
-
-        if self.method == StorageMethod.get:
-            response = self.storage_.get(self.url, **request_kwargs)
-
-        elif self.method == StorageMethod.post:
-            response = self.storage_.post(self.url, **request_kwargs)
-
-        elif self.method == StorageMethod.delete:
-            response = self.storage_.delete(self.url, **request_kwargs)
-
-        else:
-            raise RuntimeError(
-                'Unknown storage request method: {method}'.format(
-                    method=self.method,
-                ),
-            )
-
-        return check_response(
-            response,
-            self.url,
-            errors_mapping=self.errors_mapping,
-        )
+        return request_kwargs
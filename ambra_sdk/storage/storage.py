@@ -1,10 +1,17 @@
 """Storage Api namespace."""
 
-from typing import Any, Dict, Set, Tuple
+from functools import partial
+from time import monotonic
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 from requests import Response
 
+from ambra_sdk.deadline import Deadline, to_deadline
+from ambra_sdk.json_backend import decode_response
+from ambra_sdk.storage.health import StorageHealth
 from ambra_sdk.storage.image import Image
+from ambra_sdk.storage.request import PreparedRequest, StorageMethod
+from ambra_sdk.storage.response import check_response
 from ambra_sdk.storage.study import Study
 
 STORAGE_API_VERSION = 'LBL0038 v8.0 2019-07-17'
@@ -21,6 +28,8 @@ class Storage:
         :param api: base api
         """
         self._base_api = api
+        # Health of engines with circuit breakers
+        self.health = StorageHealth()
         self._init_entrypoints()
 
     def format_url(self, url_template: str, **kwargs) -> str:
@@ -65,13 +74,18 @@ class Storage:
         }
         return url, request_data
 
-    def retry_with_new_sid(self, fn):
+    def retry_with_new_sid(
+        self,
+        fn: Callable[..., Any],
+        deadline: Optional[Deadline] = None,
+    ):
         """Retry with new sid.
 
         :param fn: callable method
+        :param deadline: deadline of fn (checked before retry)
         :return: fn result
         """
-        return self._base_api.retry_with_new_sid(fn)
+        return self._base_api.retry_with_new_sid(fn, deadline=deadline)
 
     def delete(self, url, **kwargs) -> Response:
         """Delete from storage.
@@ -115,7 +129,237 @@ class Storage:
         )
         return response  # NOQA:WPS331
 
+    def execute(
+        self,
+        prepared_request: PreparedRequest,
+        box_class: Optional[Callable[..., Any]] = None,
+    ) -> Any:
+        """Execute prepared request.
+
+        If sid problems we try to get new sid
+        and retry request.
+
+        :param prepared_request: prepared request
+        :param box_class: box class for response json (None - raw response)
+        :return: response object
+        """
+        deadline = self.request_deadline(prepared_request)
+        response = self.retry_with_new_sid(
+            partial(self.execute_once, prepared_request, deadline),
+            deadline=deadline,
+        )
+        return self._response_object(
+            response,
+            prepared_request.url_template,
+            box_class,
+        )
+
+    def execute_once(
+        self,
+        prepared_request: PreparedRequest,
+        deadline: Optional[Deadline] = None,
+    ) -> Response:
+        """Execute prepared request.
+
+        :param prepared_request: prepared request
+        :param deadline: request deadline (default - prepared request one)
+        :return: response object
+        :raises EngineUnavailable: Engine is unhealthy
+        """
+        if deadline is None:
+            deadline = self.request_deadline(prepared_request)
+        request_method = self._request_method(prepared_request.method)
+        with self.health.track(prepared_request.url) as tracker:
+            response = request_method(
+                prepared_request.url,
+                deadline=deadline,
+                url_template=prepared_request.url_template,
+                **prepared_request.request_kwargs(),
+            )
+            tracker.response(response)
+        return check_response(
+            response,
+            prepared_request.url,
+            errors_mapping=prepared_request.errors_mapping,
+        )
+
+    def request_deadline(
+        self,
+        prepared_request: PreparedRequest,
+    ) -> Optional[Deadline]:
+        """Get deadline of prepared request.
+
+        :param prepared_request: prepared request
+        :return: deadline (None - request without deadline)
+        """
+        return to_deadline(
+            prepared_request.deadline,
+            self._base_api.storage_timeout_for(prepared_request.url_template),
+        )
+
+    def _response_object(
+        self,
+        response: Response,
+        url_template: Optional[str],
+        box_class: Optional[Callable[..., Any]],
+    ) -> Any:
+        """Get response object.
+
+        :param response: response
+        :param url_template: storage method url template (for metrics)
+        :param box_class: box class for response json (None - raw response)
+        :return: response object
+        """
+        if box_class is None:
+            return response
+        metrics = self._base_api.metrics
+        start = monotonic()
+        response_json = decode_response(
+            response,
+            self._base_api.json_backend,
+        )
+        decoded = monotonic()
+        metrics.record_json_decode(url_template, decoded - start)
+        response_object = box_class(response_json)
+        metrics.record_box(url_template, monotonic() - decoded)
+        return response_object
+
+    def _request_method(self, method: StorageMethod) -> Callable[..., Any]:
+        """Get request function by storage method.
+
+        :param method: storage method
+        :return: request function
+        :raises RuntimeError: Unknown request method
+        """
+        if method == StorageMethod.get:
+            return self.get
+        elif method == StorageMethod.post:
+            return self.post
+        elif method == StorageMethod.delete:
+            return self.delete
+        raise RuntimeError(
+            'Unknown storage request method: {method}'.format(
+                method=method,
+            ),
+        )
+
     def _init_entrypoints(self):
         """Init entrypoint namespaces."""
         self.Study = Study(self)
         self.Image = Image(self)
+
+
+class AsyncStorage(Storage):
+    """Async storage api namespace.
+
+    All storage methods return awaitables.
+    """
+
+    async def retry_with_new_sid(  # NOQA:WPS611
+        self,
+        fn: Callable[..., Any],
+        deadline: Optional[Deadline] = None,
+    ):
+        """Retry with new sid.
+
+        :param fn: callable method
+        :param deadline: deadline of fn (checked before retry)
+        :return: fn result
+        """
+        return await self._base_api.retry_with_new_sid(fn, deadline=deadline)
+
+    async def delete(self, url, **kwargs) -> Response:  # NOQA:WPS611
+        """Delete from storage.
+
+        :param url: url
+        :param kwargs: delete kwargs
+        :return: response obj
+        """
+        response: Response = await self._base_api.storage_delete(
+            url,
+            required_sid=True,
+            **kwargs,
+        )
+        return response  # NOQA:WPS331
+
+    async def get(self, url, **kwargs) -> Response:  # NOQA:WPS611
+        """Get from storage.
+
+        :param url: url
+        :param kwargs: delete kwargs
+        :return: response obj
+        """
+        response: Response = await self._base_api.storage_get(
+            url,
+            required_sid=True,
+            **kwargs,
+        )
+        return response  # NOQA:WPS331
+
+    async def post(self, url, **kwargs) -> Response:  # NOQA:WPS611
+        """Post To storage.
+
+        :param url: url
+        :param kwargs: delete kwargs
+        :return: response obj
+        """
+        response: Response = await self._base_api.storage_post(
+            url,
+            required_sid=True,
+            **kwargs,
+        )
+        return response  # NOQA:WPS331
+
+    async def execute(  # NOQA:WPS611
+        self,
+        prepared_request: PreparedRequest,
+        box_class: Optional[Callable[..., Any]] = None,
+    ) -> Any:
+        """Execute prepared request.
+
+        If sid problems we try to get new sid
+        and retry request.
+
+        :param prepared_request: prepared request
+        :param box_class: box class for response json (None - raw response)
+        :return: response object
+        """
+        deadline = self.request_deadline(prepared_request)
+        response = await self.retry_with_new_sid(
+            partial(self.execute_once, prepared_request, deadline),
+            deadline=deadline,
+        )
+        return self._response_object(
+            response,
+            prepared_request.url_template,
+            box_class,
+        )
+
+    async def execute_once(  # NOQA:WPS611
+        self,
+        prepared_request: PreparedRequest,
+        deadline: Optional[Deadline] = None,
+    ) -> Response:
+        """Execute prepared request.
+
+        :param prepared_request: prepared request
+        :param deadline: request deadline (default - prepared request one)
+        :return: response object
+        :raises EngineUnavailable: Engine is unhealthy
+        """
+        if deadline is None:
+            deadline = self.request_deadline(prepared_request)
+        request_method = self._request_method(prepared_request.method)
+        with self.health.track(prepared_request.url) as tracker:
+            response = await request_method(
+                prepared_request.url,
+                deadline=deadline,
+                url_template=prepared_request.url_template,
+                **prepared_request.request_kwargs(),
+            )
+            tracker.response(response)
+        return check_response(
+            response,
+            prepared_request.url,
+            errors_mapping=prepared_request.errors_mapping,
+        )
@@ -172,16 +172,16 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             errors_mapping=errors_mapping,
             params=request_data,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-
-        if use_box is True:
-            return Box(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=Box if use_box is True else None,
+        )
 
     def delete(
         self,
@@ -226,6 +226,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.delete,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
@@ -272,6 +273,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.delete,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
@@ -326,14 +328,15 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-        if use_box is True:
-            return Box(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=Box if use_box is True else None,
+        )
 
     def tag(
         self,
@@ -373,14 +376,15 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-        if use_box is True:
-            return Box(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=Box if use_box is True else None,
+        )
 
     def attribute(
         self,
@@ -447,14 +451,15 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-        if use_box is True:
-            return Box(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=Box if use_box is True else None,
+        )
 
     def image_phi(
         self,
@@ -501,14 +506,15 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-        if use_box is True:
-            return Box(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=Box if use_box is True else None,
+        )
 
     def phi(
         self,
@@ -545,14 +551,15 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-        if use_box is True:
-            return Box(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=Box if use_box is True else None,
+        )
 
     def thumbnail(
         self,
@@ -610,6 +617,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
@@ -677,6 +685,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
@@ -747,6 +756,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
             stream=True,
         )
@@ -814,6 +824,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
             stream=True,
         )
@@ -868,6 +879,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             errors_mapping=errors_mapping,
             params=request_data,
             stream=True,
@@ -937,14 +949,15 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-        if use_box is True:
-            return ImageJsonBox(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=ImageJsonBox if use_box is True else None,
+        )
 
     def json(
         self,
@@ -1019,14 +1032,15 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
             return prepared_request
-        response = prepared_request.execute()
-        if use_box is True:
-            return JsonBox(response.json())
-        return response
+        return self._storage.execute(
+            prepared_request,
+            box_class=JsonBox if use_box is True else None,
+        )
 
     def attachment(
         self,
@@ -1074,6 +1088,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
             stream=True,
         )
@@ -1124,6 +1139,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             params=request_data,
             stream=True,
         )
@@ -1225,6 +1241,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.post,
             url=url,
+            url_template=url_template,
             params=request_data,
             files=files,
         )
@@ -1320,6 +1337,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             errors_mapping=errors_mapping,
             params=request_data,
             stream=True,
@@ -1376,6 +1394,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.delete,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
@@ -1434,6 +1453,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             errors_mapping=errors_mapping,
             params=request_data,
             stream=True,
@@ -1497,6 +1517,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.post,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
@@ -1568,6 +1589,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.get,
             url=url,
+            url_template=url_template,
             errors_mapping=errors_mapping,
             params=request_data,
         )
@@ -1645,6 +1667,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.post,
             url=url,
+            url_template=url_template,
             errors_mapping=errors_mapping,
             params=request_data,
             headers=headers,
@@ -1726,6 +1749,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.post,
             url=url,
+            url_template=url_template,
             errors_mapping=errors_mapping,
             params=request_data,
             headers=headers,
@@ -1770,6 +1794,7 @@ class Study:
             storage_=self._storage,
             method=StorageMethod.delete,
             url=url,
+            url_template=url_template,
             params=request_data,
         )
         if only_prepare is True:
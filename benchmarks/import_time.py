@@ -0,0 +1,122 @@
+"""Import time and memory of ambra_sdk modules.
+
+Every measurement is made in a new interpreter.
+
+Compare two revisions:
+
+    git worktree add /tmp/sdk-before <revision>
+    python benchmarks/import_time.py --path /tmp/sdk-before --path .
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess  # NOQA:S404
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Modules which should not be loaded by import of api
+HEAVY_MODULES = (
+    'pydicom',
+    'aiohttp',
+    'ambra_sdk.models.generated',
+    'ambra_sdk.service.entrypoints.generated',
+)
+
+MEASURE_SCRIPT = """
+import json
+import resource
+import sys
+from time import perf_counter
+
+
+def rss():
+    try:
+        with open('/proc/self/status') as status_file:
+            for line in status_file:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+rss_before = rss()
+start = perf_counter()
+__import__({module!r})
+wall_time = perf_counter() - start
+print(json.dumps({{
+    'wall_time': wall_time,
+    'rss': rss() - rss_before,
+    'modules': sorted(sys.modules),
+}}))
+"""
+
+
+def measure(path: Path, module: str) -> Dict[str, Any]:
+    """Measure import of module in new interpreter.
+
+    :param path: sdk checkout
+    :param module: imported module
+    :return: wall time (seconds), rss increase (bytes) and loaded modules
+    """
+    env = dict(os.environ, PYTHONPATH=str(path.resolve()))
+    output = subprocess.check_output(  # NOQA:S603
+        [sys.executable, '-c', MEASURE_SCRIPT.format(module=module)],
+        env=env,
+        cwd=str(path),
+    )
+    return json.loads(output)
+
+
+def heavy_modules(modules: List[str]) -> List[str]:
+    """Get loaded heavy modules.
+
+    :param modules: loaded modules
+    :return: heavy modules (packages)
+    """
+    return [
+        heavy_module for heavy_module in HEAVY_MODULES
+        if any(
+            module == heavy_module or module.startswith(heavy_module + '.')
+            for module in modules
+        )
+    ]
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--path',
+        action='append',
+        type=Path,
+        help='sdk checkout (can be repeated), default is current directory',
+    )
+    parser.add_argument('--module', default='ambra_sdk.api')
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    for path in args.path or [Path('.')]:
+        results = [measure(path, args.module) for _ in range(args.runs)]
+        print(  # NOQA:WPS421
+            '{path}: import {module} wall {wall:.1f} ms, '
+            'rss {rss:.1f} MiB, modules {modules}, heavy: {heavy}'.format(
+                path=path,
+                module=args.module,
+                wall=statistics.median(
+                    result['wall_time'] for result in results
+                ) * 1000,
+                rss=statistics.median(
+                    result['rss'] for result in results
+                ) / 2 ** 20,
+                modules=len(results[0]['modules']),
+                heavy=', '.join(heavy_modules(results[0]['modules'])) or '-',
+            ),
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Decode cost of /study/list page by JSON backends.
+
+    python benchmarks/json_decode.py --rows 5000
+"""
+
+import argparse
+import json
+import statistics
+from time import perf_counter
+from typing import Any, Dict, List
+
+from box import Box
+
+from ambra_sdk.json_backend import JSON_BACKENDS_ORDER, get_json_backend
+
+
+def study_row(row_number: int) -> Dict[str, Any]:
+    """Study row like in /study/list response.
+
+    :param row_number: row number
+    :return: study row
+    """
+    uid = '1.2.840.113619.2.55.3.{number}'.format(number=row_number)
+    return {
+        'uuid': '{number:08d}-aaaa-bbbb-cccc-dddddddddddd'.format(
+            number=row_number,
+        ),
+        'study_uid': uid,
+        'study_date': '20200715',
+        'study_time': '101010.000',
+        'study_description': 'CT CHEST W/O CONTRAST',
+        'patient_name': 'Doe^John',
+        'patientid': 'PID{number}'.format(number=row_number),
+        'patient_birth_date': '19700101',
+        'patient_sex': 'M',
+        'modality': 'CT',
+        'accession_number': 'ACC{number}'.format(number=row_number),
+        'image_count': row_number % 500,
+        'size': row_number * 1024,
+        'phi_namespace': 'namespace-uuid',
+        'storage_namespace': 'namespace-uuid',
+        'engine_fqdn': 'engine.ambrahealth.com',
+        'created': '2020-07-15 10:10:10.123456-04',
+        'updated': '2020-07-15 10:10:10.123456-04',
+        'phantom': 0,
+        'customfields': [
+            {'uuid': 'customfield-uuid', 'name': 'field', 'value': 'value'},
+        ],
+    }
+
+
+def page_body(rows: int) -> bytes:
+    """Encoded /study/list page.
+
+    :param rows: rows in page
+    :return: response body
+    """
+    return json.dumps({
+        'status': 'OK',
+        'page': {'rows': rows, 'more': 1, 'number': 1},
+        'studies': [study_row(row_number) for row_number in range(rows)],
+    }).encode('utf-8')
+
+
+def measure(fn, runs: int) -> float:
+    """Median time of fn.
+
+    :param fn: measured function
+    :param runs: number of runs
+    :return: seconds
+    """
+    times: List[float] = []
+    for _ in range(runs):
+        start = perf_counter()
+        fn()
+        times.append(perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    body = page_body(args.rows)
+    print(  # NOQA:WPS421
+        'page: {rows} rows, {size:.1f} KiB'.format(
+            rows=args.rows,
+            size=len(body) / 1024,
+        ),
+    )
+    page_json = json.loads(body)
+    box_time = measure(
+        lambda: [Box(row) for row in page_json['studies']],
+        args.runs,
+    )
+    for backend_name in JSON_BACKENDS_ORDER:
+        try:
+            backend = get_json_backend(backend_name)
+        except ImportError:
+            print(  # NOQA:WPS421
+                '{name}: not installed'.format(name=backend_name),
+            )
+            continue
+        decode_time = measure(lambda: backend.loads(body), args.runs)
+        print(  # NOQA:WPS421
+            '{name}: decode {decode:.2f} ms/page, '
+            '{per_row:.2f} us/row'.format(
+                name=backend_name,
+                decode=decode_time * 1000,
+                per_row=decode_time / args.rows * 1e6,
+            ),
+        )
+    print(  # NOQA:WPS421
+        'Box rows: {box:.2f} ms/page'.format(box=box_time * 1000),
+    )
+
+
+if __name__ == '__main__':
+    main()
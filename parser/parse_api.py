@@ -240,24 +240,30 @@ def generate_namespaces(
     templates_path,
     generated_api_dir,
 ):
-    template = Environment(
+    environment = Environment(
         loader=FileSystemLoader(str(templates_path)),
         autoescape=True,
-    ).get_template('namespace')
+    )
+    # Module with endpoint specs and stub with methods for IDEs
+    templates = {
+        '.py': environment.get_template('namespace'),
+        '.pyi': environment.get_template('namespace_stub'),
+    }
     for namespace_name, namespace in api_namespaces.items():
         apis = namespace['apis']
         exceptions = namespace['exceptions']
         query_class_names = namespace['query_class_names']
-        rendered_namespace = template.render(
-            namespace=namespace_name,
-            apis=apis,
-            exceptions=sorted(exceptions),
-            query_class_names=sorted(query_class_names),
-            request_type=RequestParameterType,
-        )
-        generated_api_dir \
-            .joinpath('{namespace}.py'.format(namespace=namespace_name.lower())) \
-            .write_text(rendered_namespace)
+        for suffix, template in templates.items():
+            rendered_namespace = template.render(
+                namespace=namespace_name,
+                apis=apis,
+                exceptions=sorted(exceptions),
+                query_class_names=sorted(query_class_names),
+                request_type=RequestParameterType,
+            )
+            generated_api_dir \
+                .joinpath(namespace_name.lower() + suffix) \
+                .write_text(rendered_namespace)
 
 
 def generate_user_namespaces(
@@ -0,0 +1,151 @@
+import json
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.async_api import AsyncApi
+from ambra_sdk.models import Study
+from ambra_sdk.service.entrypoints.study import CustomFieldsList, StudyBox
+from ambra_sdk.service.template import Bind
+
+API_URL = 'http://127.0.0.1'
+STUDIES = [
+    {
+        'uuid': str(study_id),
+        'study_uid': 'uid{id}'.format(id=study_id),
+        'patient_name': 'patient{id}'.format(id=study_id),
+        'phi_namespace': 'ns',
+        'customfields': [{'name': 'field', 'value': study_id}],
+    }
+    for study_id in range(6)
+]
+
+
+def study_list(request, context):
+    """Study list with only fields and in filter."""
+    form = {
+        param: param_values[0]
+        for param, param_values in parse_qs(request.text).items()
+    }
+    studies = STUDIES
+    if 'filter.uuid.in' in form:
+        uuids = json.loads(form['filter.uuid.in'])
+        studies = [study for study in studies if study['uuid'] in uuids]
+    if 'fields._top' in form:
+        fields = json.loads(form['fields._top'])
+        studies = [
+            {field: study[field] for field in fields if field in study}
+            for study in studies
+        ]
+    rows = int(form['page.rows'])
+    start = (int(form['page.number']) - 1) * rows
+    return {
+        'status': 'OK',
+        'studies': studies[start:start + rows],
+        'page': {'more': int(start + rows < len(studies)), 'rows': rows},
+    }
+
+
+class TestAutoOnly:
+    """Test automatic only fields."""
+
+    @pytest.fixture
+    def api(self, requests_mock):
+        """Api with auto only fields."""
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json=study_list,
+        )
+        api = Api.with_sid(API_URL, 'sid')
+        api.enable_auto_only()
+        return api
+
+    def _requests(self, requests_mock):
+        """Request data of list requests."""
+        requested = [
+            parse_qs(request.text)
+            for request in requests_mock.request_history
+        ]
+        requests_mock.reset_mock()
+        return [
+            (
+                request_data.get('fields._top', [None])[0],
+                request_data.get('filter.uuid.in', [None])[0],
+            )
+            for request_data in requested
+        ]
+
+    def _scan(self, api, *fields):
+        """Read fields of studies."""
+        return [
+            tuple(getattr(study, field) for field in fields)
+            for study in api.Study.list().set_rows_in_page(2).all()
+        ]
+
+    def test_projection(self, api, requests_mock):
+        """Test later pages and scans request only accessed fields."""
+        assert self._scan(api, 'study_uid')[:2] == [('uid0',), ('uid1',)]
+        only = '["study_uid", "uuid"]'
+        assert self._requests(requests_mock) == [
+            (None, None), (only, None), (only, None),
+        ]
+        assert len(self._scan(api, 'study_uid')) == 6
+        assert self._requests(requests_mock) == [(only, None)] * 3
+        profile, = api.auto_only.profiles
+        assert profile.url == '/study/list'
+        assert profile.fallbacks == 0
+
+    def test_missing_field(self, api, requests_mock):
+        """Test new field is requested on access."""
+        for _ in range(2):
+            self._scan(api, 'study_uid')
+        requests_mock.reset_mock()
+        studies = self._scan(api, 'study_uid', 'patient_name')
+        assert studies[5] == ('uid5', 'patient5')
+        only = '["study_uid", "uuid"]'
+        full_only = '["patient_name", "study_uid", "uuid"]'
+        assert self._requests(requests_mock) == [
+            (only, None),
+            (None, '["0", "1"]'),
+            (full_only, None),
+            (full_only, None),
+        ]
+
+    def test_study_box(self, api):
+        """Test rows are StudyBox objects."""
+        studies = []
+        for study in api.Study.list().set_rows_in_page(3).all():
+            assert study.uuid
+            studies.append(study)
+        study = studies[4]
+        assert 'customfields' not in study.keys()
+        assert isinstance(study, StudyBox)
+        assert isinstance(study.customfields, CustomFieldsList)
+        assert study.customfields.get_by_name('field').value == 4
+        assert api.auto_only.profiles[0].fallbacks == 1
+
+    def test_template(self, api, requests_mock):
+        """Test queries of template share profile."""
+        template = api.Study.list() \
+            .filter_by(Study.phi_namespace == Bind('namespace')) \
+            .set_rows_in_page(6) \
+            .template()
+        for namespace in ('ns', 'ns'):
+            for study in template.bind(namespace=namespace).all():
+                assert study.study_uid
+        assert self._requests(requests_mock) == [
+            (None, None), ('["study_uid", "uuid"]', None),
+        ]
+
+    def test_only_query(self, api, requests_mock):
+        """Test queries with only fields are not tracked."""
+        for _ in range(2):
+            rows = api.Study.list().only('uuid').set_rows_in_page(6).all()
+            assert [study.uuid for study in rows]
+        assert api.auto_only.profiles == []
+
+    def test_async_api(self):
+        """Test async api doesn't support auto only fields."""
+        with pytest.raises(NotImplementedError):
+            AsyncApi.with_sid(API_URL, 'sid').enable_auto_only()
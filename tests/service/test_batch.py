@@ -0,0 +1,59 @@
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.exceptions.service import NotFound
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestBatch:
+    """Test batch execution of queries."""
+
+    @pytest.fixture
+    def api(self, requests_mock):
+        """Api with mocked study/get."""
+        def study_get(request, context):  # NOQA: WPS430
+            uuid = parse_qs(request.text)['uuid'][0]
+            if uuid == 'missing':
+                context.status_code = 412
+                return {'status': 'ERROR', 'error_type': 'NOT_FOUND'}
+            return {'status': 'OK', 'uuid': uuid}
+
+        requests_mock.post(
+            '{api_url}/study/get'.format(api_url=API_URL),
+            json=study_get,
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    def test_ordered_batch(self, api):
+        """Test ordered results with collected exceptions."""
+        uuids = [str(uuid) for uuid in range(20)]
+        uuids[3] = 'missing'
+        queries = [api.Study.get(uuid=uuid) for uuid in uuids]
+        batch_results = list(api.batch(queries, concurrency=4))
+        assert [batch_result.index for batch_result in batch_results] == \
+            list(range(20))
+        assert not batch_results[3].ok
+        assert isinstance(batch_results[3].exception, NotFound)
+        assert batch_results[3].query is queries[3]
+        assert [
+            batch_result.result.uuid
+            for batch_result in batch_results
+            if batch_result.ok
+        ] == [uuid for uuid in uuids if uuid != 'missing']
+
+    def test_unordered_batch(self, api):
+        """Test results in order of completion."""
+        queries = [api.Study.get(uuid=str(uuid)) for uuid in range(10)]
+        batch_results = list(api.batch(queries, concurrency=3, ordered=False))
+        assert sorted(
+            batch_result.index for batch_result in batch_results
+        ) == list(range(10))
+        assert all(batch_result.ok for batch_result in batch_results)
+
+    def test_wrong_concurrency(self, api):
+        """Test wrong concurrency."""
+        with pytest.raises(ValueError):
+            list(api.batch([], concurrency=0))
@@ -0,0 +1,103 @@
+from unittest.mock import patch
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.service.cache import ResponseCache
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestResponseCache:
+    """Test response cache."""
+
+    @pytest.fixture
+    def api(self, requests_mock):
+        """Api with mocked role methods."""
+        for url in ('/role/get', '/role/set', '/session/user', '/setting/set'):
+            requests_mock.post(
+                '{api_url}{url}'.format(api_url=API_URL, url=url),
+                json={'status': 'OK', 'uuid': 'role'},
+            )
+        api = Api.with_sid(API_URL, 'sid')
+        api.enable_response_cache(max_size=2)
+        return api
+
+    def _requested(self, requests_mock, url):
+        """Number of requests of url."""
+        return sum(
+            request.path == url
+            for request in requests_mock.request_history
+        )
+
+    def test_hit(self, api, requests_mock):
+        """Test cached response is returned."""
+        role = api.Role.get(uuid='role').get()
+        role.uuid = 'changed'
+        assert api.Role.get(uuid='role').get().uuid == 'role'
+        assert self._requested(requests_mock, '/role/get') == 1
+        stats = api.response_cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_key(self, api, requests_mock):
+        """Test responses are cached by request data."""
+        api.Role.get(uuid='role').get()
+        api.Role.get(uuid='other').get()
+        api.Role.get(uuid='role').get(cache=False)
+        assert self._requested(requests_mock, '/role/get') == 3
+
+    def test_ttl(self, api, requests_mock):
+        """Test expired response is requested again."""
+        api.Role.get(uuid='role').get()
+        with patch('ambra_sdk.service.cache.monotonic', return_value=1e12):
+            api.Role.get(uuid='role').get()
+        assert self._requested(requests_mock, '/role/get') == 2
+
+    def test_lru(self, api, requests_mock):
+        """Test least recently used response is evicted."""
+        api.Role.get(uuid='1').get()
+        api.Role.get(uuid='2').get()
+        api.Role.get(uuid='1').get()
+        api.Role.get(uuid='3').get()
+        assert api.response_cache.stats.evictions == 1
+        api.Role.get(uuid='1').get()
+        assert self._requested(requests_mock, '/role/get') == 3
+        api.Role.get(uuid='2').get()
+        assert self._requested(requests_mock, '/role/get') == 4
+
+    def test_mutation(self, api, requests_mock):
+        """Test mutation invalidates responses of resource."""
+        api.Role.get(uuid='role').get()
+        api.Session.user().get()
+        api.Role.set(uuid='role', name='name').get()
+        api.Role.set(uuid='role', name='name').get()
+        api.Role.get(uuid='role').get()
+        api.Session.user().get()
+        assert self._requested(requests_mock, '/role/get') == 2
+        assert self._requested(requests_mock, '/role/set') == 2
+        assert self._requested(requests_mock, '/session/user') == 1
+
+    def test_related_mutation(self, api, requests_mock):
+        """Test mutation invalidates related reads of other resources."""
+        api.Session.user().get()
+        api.Setting.set(key='theme', value='dark').get()
+        api.Session.user().get()
+        assert self._requested(requests_mock, '/session/user') == 2
+
+    def test_invalidate(self, api):
+        """Test explicit invalidation."""
+        api.Role.get(uuid='1').get()
+        api.Role.get(uuid='2').get()
+        cache = api.response_cache
+        assert cache.invalidate('/role/get', {'uuid': '1'}) == 1
+        assert cache.invalidate('/role/get') == 1
+        assert cache.stats.size == 0
+
+    def test_wrong_ttls(self):
+        """Test mutation methods can't be cached."""
+        with pytest.raises(ValueError):
+            ResponseCache(ttls={'/role/set': 10})
+        with pytest.raises(ValueError):
+            ResponseCache(ttls={'/namespace/settings': 10})
+        with pytest.raises(ValueError):
+            ResponseCache(max_size=0)
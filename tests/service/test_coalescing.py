@@ -0,0 +1,151 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.exceptions.service import NotFound
+from ambra_sdk.service.coalescing import Coalescer
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestCoalescing:
+    """Test coalescing of concurrent get queries."""
+
+    @pytest.fixture
+    def studies(self):
+        """Studies on server."""
+        return {
+            str(study_id): {'uuid': str(study_id)}
+            for study_id in range(5)
+        }
+
+    @pytest.fixture
+    def requests(self):
+        """Requested urls and forms."""
+        return []
+
+    @pytest.fixture
+    def api(self, requests_mock, studies, requests):
+        """Api with mocked study/get and study/list."""
+        lock = Lock()
+
+        def study_get(request, context):  # NOQA: WPS430
+            form = parse_qs(request.text)
+            with lock:
+                requests.append(('/study/get', form))
+            study = studies.get(form['uuid'][0])
+            if study is None:
+                context.status_code = 412
+                return {'status': 'ERROR', 'error_type': 'NOT_FOUND'}
+            return dict(study, status='OK')
+
+        def study_list(request, context):  # NOQA: WPS430
+            form = parse_qs(request.text)
+            with lock:
+                requests.append(('/study/list', form))
+            uuids = json.loads(form['filter.uuid.in'][0])
+            return {
+                'status': 'OK',
+                'studies': [
+                    studies[uuid] for uuid in uuids if uuid in studies
+                ],
+                'page': {'more': 0},
+            }
+
+        requests_mock.post(
+            '{api_url}/study/get'.format(api_url=API_URL),
+            json=study_get,
+        )
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json=study_list,
+        )
+        api = Api.with_sid(API_URL, 'sid')
+        api.enable_coalescing(window=0.05, batch=True)
+        return api
+
+    def _get_all(self, api, uuids):
+        """Get studies in concurrent threads."""
+        def get_study(uuid):  # NOQA: WPS430
+            return api.Study.get(uuid=uuid).get()
+
+        with ThreadPoolExecutor(max_workers=len(uuids)) as executor:
+            return list(executor.map(get_study, uuids))
+
+    def test_batch(self, api, requests):
+        """Test distinct keys are requested by one list query."""
+        studies = self._get_all(api, ['0', '1', '2', '0'])
+        assert [study.uuid for study in studies] == ['0', '1', '2', '0']
+        urls = [url for url, _ in requests]
+        assert urls == ['/study/list']
+        form = requests[0][1]
+        assert sorted(json.loads(form['filter.uuid.in'][0])) == [
+            '0', '1', '2',
+        ]
+        stats = api.coalescer.stats
+        assert stats.queries == 4
+        assert stats.shared + stats.batched == 4
+        assert stats.batches == 1
+
+    def test_not_found(self, api, requests):
+        """Test missing keys are requested by get."""
+        with pytest.raises(NotFound):
+            self._get_all(api, ['1', 'missing'])
+        urls = sorted(url for url, _ in requests)
+        assert urls == ['/study/get', '/study/list']
+
+    def test_max_batch(self, api, requests):
+        """Test batch size is limited."""
+        api.enable_coalescing(window=0.05, max_batch=2, batch=True)
+        self._get_all(api, ['0', '1', '2', '3'])
+        batch_sizes = sorted(
+            len(json.loads(form['filter.uuid.in'][0]))
+            for _, form in requests
+        )
+        assert sum(batch_sizes) == 4
+        assert max(batch_sizes) <= 2
+
+    def test_batch_opt_in(self, api, requests):
+        """Test gets are not batched by default."""
+        api.enable_coalescing(window=0.05)
+        studies = self._get_all(api, ['0', '1', '0'])
+        assert [study.uuid for study in studies] == ['0', '1', '0']
+        assert {url for url, _ in requests} == {'/study/get'}
+        assert api.coalescer.stats.batches == 0
+
+    def test_failed_batch(self, api, requests, requests_mock, caplog):
+        """Test keys of failed list query are requested by get."""
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            status_code=500,
+        )
+        studies = self._get_all(api, ['0', '1'])
+        assert [study.uuid for study in studies] == ['0', '1']
+        assert 'Batch request of /study/list failed' in caplog.text
+
+    def test_not_batched(self, api, requests):
+        """Test queries with other fields are not batched."""
+        api.Study.get(uuid='1', phi_namespace='ns').get()
+        assert [url for url, _ in requests] == ['/study/get']
+
+    def test_not_coalesced(self, api, requests):
+        """Test coalescing can be disabled."""
+        api.disable_coalescing()
+        api.Study.get(uuid='1').get()
+        assert api.coalescer is None
+        assert [url for url, _ in requests] == ['/study/get']
+
+    def test_accepts(self, api):
+        """Test only read queries are coalesced."""
+        coalescer = Coalescer()
+        assert coalescer.accepts(api.Study.get(uuid='1'))
+        assert not coalescer.accepts(api.Study.delete(uuid='1'))
+
+    def test_wrong_window(self):
+        """Test negative window."""
+        with pytest.raises(ValueError):
+            Coalescer(window=-1)
@@ -0,0 +1,105 @@
+import json
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.service.filtering import Filter, FilterCondition
+
+API_URL = 'http://127.0.0.1'
+STUDIES = [{'uuid': str(study_id)} for study_id in range(23)]
+
+
+class TestCursor:
+    """Test checkpoint and resume of iteration."""
+
+    @pytest.fixture
+    def forms(self):
+        """Request forms."""
+        return []
+
+    @pytest.fixture
+    def api(self, requests_mock, forms):
+        """Api with mocked study/list."""
+        def study_list(request, context):  # NOQA: WPS430
+            form = parse_qs(request.text)
+            forms.append(form)
+            rows = int(form['page.rows'][0])
+            number = int(form['page.number'][0])
+            start = (number - 1) * rows
+            return {
+                'status': 'OK',
+                'studies': STUDIES[start:start + rows],
+                'page': {
+                    'more': int(start + rows < len(STUDIES)),
+                    'rows': rows,
+                    'number': number,
+                },
+            }
+
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json=study_list,
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    def interrupt(self, response, rows_number):
+        """Iterate and save cursor after rows.
+
+        :param response: iterable response
+        :param rows_number: number of rows before interrupt
+        :return: (uuids, serialized cursor)
+        """
+        uuids = []
+        for study in response:
+            uuids.append(study.uuid)
+            if len(uuids) == rows_number:
+                return uuids, json.dumps(response.cursor())
+        raise AssertionError('Iteration is not interrupted')
+
+    def test_resume(self, api, forms):
+        """Test resumed iteration continues after the last row."""
+        query = api.Study.list().set_rows_in_page(5).filter_by(
+            Filter('phantom', FilterCondition.equals, 0),
+        )
+        uuids, cursor = self.interrupt(query.all()[2:20], 7)
+        forms.clear()
+        # New process
+        resumed = api.Study.list().resume(json.loads(cursor))
+        uuids.extend(study.uuid for study in resumed)
+        assert uuids == [str(study_id) for study_id in range(2, 20)]
+        assert forms[0]['page.number'] == ['2']
+        assert forms[0]['page.rows'] == ['5']
+        assert forms[0]['filter.phantom.equals'] == ['0']
+
+    def test_not_started(self, api):
+        """Test cursor of not started iteration."""
+        cursor = api.Study.list().all()[3:].cursor()
+        resumed = api.Study.list().resume(cursor)
+        assert [study.uuid for study in resumed][0] == '3'
+
+    def test_parallel(self, api):
+        """Test cursor of ordered parallel iteration."""
+        query = api.Study.list().set_rows_in_page(5)
+        uuids, cursor = self.interrupt(query.all(parallel=3), 12)
+        resumed = api.Study.list().resume(json.loads(cursor))
+        uuids.extend(study.uuid for study in resumed)
+        assert uuids == [study['uuid'] for study in STUDIES]
+
+    def test_unordered(self, api):
+        """Test unordered parallel iteration has no cursor."""
+        response = api.Study.list().all(parallel=3, ordered=False)
+        with pytest.raises(ValueError):
+            response.cursor()
+
+    def test_other_method(self, api):
+        """Test cursor of other method."""
+        cursor = api.Study.list().all().cursor()
+        with pytest.raises(ValueError):
+            api.Account.list().resume(cursor)
+
+    def test_no_sid(self, api):
+        """Test cursor doesn't contain session id."""
+        response = api.Study.list().set_rows_in_page(5).all()
+        _, cursor = self.interrupt(response, 7)
+        assert 'sid' not in json.loads(cursor)['request_data']
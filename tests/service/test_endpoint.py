@@ -0,0 +1,125 @@
+import inspect
+
+import pytest
+
+from ambra_sdk.service.endpoint import LazyMethod, Namespace
+from ambra_sdk.service.query import QueryO, QueryOPSF
+
+
+class Thing(Namespace):
+    """Namespace of test endpoints."""
+
+    ENDPOINTS = (
+        (
+            'add',
+            '/thing/add',
+            'QueryO',
+            'Add.',
+            (
+                ('name', 'Name', False, None, None),
+                ('global_param', 'Global flag', True, 'global', None),
+                ('customfield_param', 'Custom fields', True, None, 'cf-'),
+                ('account_id', 'Account id', True, None, None),
+            ),
+            ('Custom fields are cf-UUID params',),
+            (('NOT_FOUND', None, 'NotFound', 'Account not found'),),
+            True,
+            None,
+        ),
+        (
+            'list',
+            '/thing/list',
+            'QueryOPSF',
+            'List.',
+            (),
+            (),
+            (),
+            False,
+            'things',
+        ),
+    )
+
+
+class HandWrittenThing(Thing):
+    """Namespace with hand written method."""
+
+    def list(self):  # NOQA:A003
+        """List.
+
+        :return: query
+        """
+        query = super().list()
+        query.request_data['hand'] = 1
+        return query
+
+
+class TestEndpoint:
+    """Test namespaces created from endpoint specs."""
+
+    def test_query(self):
+        """Test query of method."""
+        query = Thing(api=None).add(
+            'thing',
+            global_param=1,
+            customfield_param={'uuid': 'value'},
+        )
+        assert isinstance(query, QueryO)
+        assert query.url == '/thing/add'
+        assert list(query.request_data.items()) == [
+            ('account_id', None),
+            ('global', 1),
+            ('name', 'thing'),
+            ('cf-uuid', 'value'),
+        ]
+        assert query._required_sid
+        exception_class, description = query._errors_mapping[
+            ('NOT_FOUND', None)
+        ]
+        assert exception_class.__name__ == 'NotFound'
+        assert description == 'Account not found'
+
+    def test_paginated_query(self):
+        """Test paginated query of method."""
+        query = Thing(api=None).list()
+        assert isinstance(query, QueryOPSF)
+        assert query._paginated_field == 'things'
+        assert not query._required_sid
+
+    def test_signature(self):
+        """Test signature and docstring of method."""
+        signature = inspect.signature(Thing.add)
+        assert str(signature) == (
+            '(self, name, global_param=None, '
+            'customfield_param=None, account_id=None)'
+        )
+        assert Thing.add.__doc__.startswith('Add.\n\n:param name: Name\n')
+        assert 'Notes:\nCustom fields are cf-UUID params' in Thing.add.__doc__
+        assert Thing.add.__qualname__ == 'Thing.add'
+
+    @pytest.mark.parametrize(('args', 'kwargs', 'message'), [
+        ((), {}, "missing required arguments: 'name'"),
+        (('a', 1, 2, 3, 4), {}, 'takes 4 positional arguments'),
+        ((), {'name': 'a', 'other': 1}, "unexpected keyword argument 'oth"),
+        (('a',), {'name': 'a'}, "multiple values for argument 'name'"),
+    ])
+    def test_wrong_arguments(self, args, kwargs, message):
+        """Test wrong arguments of method."""
+        with pytest.raises(TypeError, match=message):
+            Thing(api=None).add(*args, **kwargs)
+
+    def test_lazy_method(self):
+        """Test method is created on first access."""
+
+        class LazyThing(Namespace):
+            ENDPOINTS = Thing.ENDPOINTS
+
+        assert isinstance(LazyThing.__dict__['add'], LazyMethod)
+        method = LazyThing.add
+        assert not isinstance(LazyThing.__dict__['add'], LazyMethod)
+        assert LazyThing.add is method
+
+    def test_hand_written_method(self):
+        """Test hand written method of subclass."""
+        query = HandWrittenThing(api=None).list()
+        assert query.request_data == {'hand': 1}
+        assert HandWrittenThing(api=None).add('a').url == '/thing/add'
@@ -0,0 +1,58 @@
+from types import MappingProxyType
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.exceptions.service import NotFound
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestErrorsMapping:
+    """Test errors mapping of service methods."""
+
+    @pytest.fixture
+    def api(self, requests_mock):
+        """Api with study/get returning NOT_FOUND error."""
+        requests_mock.post(
+            '{api_url}/study/get'.format(api_url=API_URL),
+            status_code=412,
+            json={
+                'status': 'ERROR',
+                'error_type': 'NOT_FOUND',
+                'error_data': {'uuid': 'missing'},
+            },
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    def test_frozen_tables(self, api):
+        """Test generated errors mappings are shared frozen tables."""
+        errors_mapping = api.Study.get(uuid='missing')._errors_mapping
+        assert isinstance(errors_mapping, MappingProxyType)
+        assert api.Study.get(uuid='other')._errors_mapping is errors_mapping
+        exception_class, description = errors_mapping[('NOT_FOUND', None)]
+        assert exception_class is NotFound
+        assert description
+
+    def test_new_exceptions(self, api):
+        """Test every error raises a new exception."""
+        exceptions = []
+        for _ in range(2):
+            with pytest.raises(NotFound) as exc_info:
+                api.Study.get(uuid='missing').get()
+            exceptions.append(exc_info.value)
+        first, second = exceptions
+        assert first is not second
+        assert first.error_subtype is None
+        assert first.error_data == {'uuid': 'missing'}
+        assert first.description == second.description
+
+    def test_exception_instance(self, api):
+        """Test hand written mapping with exception instance."""
+        query = api.Study.get(uuid='missing')
+        query._errors_mapping = {'NOT_FOUND': NotFound('Not found')}
+        with pytest.raises(NotFound) as exc_info:
+            query.get()
+        assert exc_info.value is not query._errors_mapping['NOT_FOUND']
+        assert exc_info.value.description == 'Not found'
+        assert exc_info.value.error_data == {'uuid': 'missing'}
@@ -0,0 +1,153 @@
+import json
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.service.filtering import Filter, FilterCondition
+from ambra_sdk.service.keyset import Keyset
+from ambra_sdk.service.sorting import Sorter
+
+API_URL = 'http://127.0.0.1'
+
+FILTERS = {  # NOQA:WPS407
+    'equals': lambda value, key: value == key,
+    'gt': lambda value, key: value > key,
+    'ge': lambda value, key: value >= key,
+}
+
+
+def study(created, uuid):
+    """Study row.
+
+    :param created: created field
+    :param uuid: uuid field
+    :return: study json
+    """
+    return {'created': created, 'uuid': uuid}
+
+
+class TestKeyset:
+    """Test keyset pagination."""
+
+    @pytest.fixture
+    def studies(self):
+        """Studies on server."""
+        # Seven studies are created at the same time
+        return [
+            study('2020-01-0{day}'.format(day=day % 3 + 1), str(uuid).zfill(2))
+            for day, uuid in zip([0] * 2 + [1] * 7 + [2] * 3, range(12))
+        ]
+
+    @pytest.fixture
+    def requests(self):
+        """Request forms."""
+        return []
+
+    @pytest.fixture
+    def api(self, requests_mock, studies, requests):
+        """Api with mocked study/list."""
+        def study_list(request, context):  # NOQA: WPS430
+            form = {
+                field: values[0]
+                for field, values in parse_qs(request.text).items()
+            }
+            requests.append(form)
+            rows = [
+                row for row in studies
+                if all(
+                    FILTERS[param.split('.')[2]](
+                        row[param.split('.')[1]],
+                        form_value,
+                    )
+                    for param, form_value in form.items()
+                    if param.startswith('filter.')
+                )
+            ]
+            assert form['sort_by'] in {'created-asc,uuid-asc', 'uuid-asc'}
+            rows.sort(
+                key=lambda row: [
+                    row[sort.split('-')[0]]
+                    for sort in form['sort_by'].split(',')
+                ],
+            )
+            page_rows = int(form['page.rows'])
+            start = (int(form['page.number']) - 1) * page_rows
+            return {
+                'status': 'OK',
+                'studies': rows[start:start + page_rows],
+                'page': {
+                    'more': int(start + page_rows < len(rows)),
+                    'rows': page_rows,
+                    'number': int(form['page.number']),
+                },
+            }
+
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json=study_list,
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    @pytest.mark.parametrize('rows_in_page', [1, 2, 3, 5, 20])
+    def test_keyset(self, api, studies, requests, rows_in_page):
+        """Test all rows are returned once."""
+        query = api.Study.list().set_rows_in_page(rows_in_page)
+        uuids = [row.uuid for row in query.all_by_keyset()]
+        assert uuids == [row['uuid'] for row in studies]
+        assert {form['page.number'] for form in requests} == {'1'}
+
+    def test_single_field(self, api, studies, requests):
+        """Test keyset by unique field."""
+        query = api.Study.list().set_rows_in_page(5)
+        uuids = [row.uuid for row in query.all_by_keyset(['uuid'])]
+        assert uuids == [row['uuid'] for row in studies]
+        assert len(requests) == 3
+        assert requests[-1]['filter.uuid.gt'] == '09'
+
+    def test_user_filter(self, api):
+        """Test query filters are kept."""
+        query = api.Study.list().set_rows_in_page(2).filter_by(
+            Filter('created', FilterCondition.equals, '2020-01-02'),
+        )
+        uuids = [row.uuid for row in query.all_by_keyset()]
+        assert uuids == [str(uuid).zfill(2) for uuid in range(2, 9)]
+
+    def test_range(self, api):
+        """Test rows of range."""
+        query = api.Study.list().set_rows_in_page(3)
+        uuids = [row.uuid for row in query.all_by_keyset()[3:8]]
+        assert uuids == [str(uuid).zfill(2) for uuid in range(3, 8)]
+
+    def test_inserted_rows(self, api, studies):
+        """Test rows inserted before the last key don't shift pages."""
+        query = api.Study.list().set_rows_in_page(3)
+        rows = iter(query.all_by_keyset())
+        uuids = [next(rows).uuid for _ in range(4)]
+        studies.insert(0, study('2019-12-31', 'new'))
+        uuids.extend(row.uuid for row in rows)
+        assert uuids == [str(uuid).zfill(2) for uuid in range(12)]
+
+    @pytest.mark.parametrize('rows_number', [1, 3, 5, 8])
+    def test_resume(self, api, studies, rows_number):
+        """Test keyset iteration continues from cursor."""
+        response = api.Study.list().set_rows_in_page(3).all_by_keyset()
+        uuids = []
+        for row in response:
+            uuids.append(row.uuid)
+            if len(uuids) == rows_number:
+                break
+        cursor = json.loads(json.dumps(response.cursor()))
+        uuids.extend(row.uuid for row in api.Study.list().resume(cursor))
+        assert uuids == [row['uuid'] for row in studies]
+
+    def test_sorted_query(self, api):
+        """Test keyset can't be used with sorting."""
+        query = api.Study.list().sort_by(Sorter('created'))
+        with pytest.raises(ValueError):
+            query.all_by_keyset()
+
+    def test_wrong_fields(self):
+        """Test wrong number of fields."""
+        with pytest.raises(ValueError):
+            Keyset(['created', 'updated', 'uuid'])
@@ -0,0 +1,97 @@
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.service.page_size import PageSizer
+
+API_URL = 'http://127.0.0.1'
+STUDIES = [{'uuid': str(study_id).zfill(4)} for study_id in range(1000)]
+
+
+class TestPageSize:
+    """Test adaptive page size."""
+
+    @pytest.fixture
+    def pages(self):
+        """Requested (page number, rows in page)."""
+        return []
+
+    @pytest.fixture
+    def api(self, requests_mock, pages):
+        """Api with mocked study/list."""
+        def study_list(request, context):  # NOQA: WPS430
+            form = parse_qs(request.text)
+            rows = int(form['page.rows'][0])
+            number = int(form['page.number'][0])
+            pages.append((number, rows))
+            start = (number - 1) * rows
+            return {
+                'status': 'OK',
+                'studies': STUDIES[start:start + rows],
+                'page': {
+                    'more': int(start + rows < len(STUDIES)),
+                    'rows': rows,
+                    'number': number,
+                },
+            }
+
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json=study_list,
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    def test_grow(self, api, pages):
+        """Test page size grows up to max rows."""
+        query = api.Study.list().set_rows_in_page(10)
+        response = query.all().adaptive(max_rows=200)
+        uuids = [study.uuid for study in response]
+        assert uuids == [study['uuid'] for study in STUDIES]
+        sizes = [rows for _, rows in pages]
+        # 20 rows page can't start after 10 rows
+        assert sizes[:4] == [10, 10, 20, 40]
+        assert max(sizes) == 200
+        metrics = api.metrics.snapshot()['endpoints']['/study/list']
+        assert metrics['page_rows'] == sizes[-1]
+
+    def test_shrink(self, api, pages):
+        """Test page size shrinks if pages are bigger than target."""
+        query = api.Study.list().set_rows_in_page(400)
+        response = query.all()[:700].adaptive(target_bytes=2000)
+        uuids = [study.uuid for study in response]
+        assert uuids == [study['uuid'] for study in STUDIES[:700]]
+        sizes = [rows for _, rows in pages]
+        assert sizes[:3] == [400, 200, 100]
+
+    def test_not_aligned(self):
+        """Test page size of keyset pages."""
+        sizer = PageSizer(30, min_rows=10)
+        sizer.observe(30, latency=1.5, response_bytes=100)
+        assert sizer.next_rows_in_page() == 20
+        sizer.observe(20, latency=0.8, response_bytes=100)
+        assert sizer.next_rows_in_page() == 25
+
+    def test_aligned(self):
+        """Test next page number is integer."""
+        sizer = PageSizer(30, min_rows=10)
+        sizer.observe(30, latency=0.1, response_bytes=100)
+        # 90 rows are requested by 3 pages of 30 rows
+        assert sizer.next_rows_in_page(90) == 45
+        sizer.observe(45, latency=0.6, response_bytes=100)
+        # 45 * 2 / 0.6 * 0.1 = 75, 135 rows are requested
+        assert sizer.next_rows_in_page(135) == 45
+
+    @pytest.mark.parametrize('rows_in_page', [25, 101])
+    def test_no_divisor(self, rows_in_page):
+        """Test page size without divisor in limits is not changed."""
+        sizer = PageSizer(rows_in_page, min_rows=10)
+        sizer.observe(rows_in_page, latency=1.5, response_bytes=100)
+        assert sizer.next_rows_in_page(rows_in_page) == rows_in_page
+
+    def test_limits(self):
+        """Test wrong limits."""
+        with pytest.raises(ValueError):
+            PageSizer(100, min_rows=100, max_rows=10)
+        with pytest.raises(ValueError):
+            PageSizer(100, max_rows=10000)
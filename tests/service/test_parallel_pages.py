@@ -0,0 +1,112 @@
+from threading import Lock
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.service.pages import fetch_pages
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestParallelPages:
+    """Test parallel page requests."""
+
+    @pytest.fixture
+    def studies(self):
+        """Studies on server."""
+        return [{'uuid': str(study_id)} for study_id in range(23)]
+
+    @pytest.fixture
+    def pages(self):
+        """Requested page numbers."""
+        return []
+
+    @pytest.fixture
+    def api(self, requests_mock, studies, pages):
+        """Api with mocked study/list."""
+        lock = Lock()
+
+        def study_list(request, context):  # NOQA: WPS430
+            form = parse_qs(request.text)
+            rows = int(form['page.rows'][0])
+            number = int(form['page.number'][0])
+            with lock:
+                pages.append(number)
+                start = (number - 1) * rows
+                return {
+                    'status': 'OK',
+                    'studies': studies[start:start + rows],
+                    'page': {
+                        'more': int(start + rows < len(studies)),
+                        'rows': rows,
+                        'number': number,
+                    },
+                }
+
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json=study_list,
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    def test_ordered(self, api, studies, pages):
+        """Test rows in order of pages."""
+        query = api.Study.list().set_rows_in_page(5)
+        uuids = [study.uuid for study in query.all(parallel=3)]
+        assert uuids == [study['uuid'] for study in studies]
+        # Pages after the last page are requested speculatively
+        assert set(pages) >= {1, 2, 3, 4, 5}
+        assert max(pages) <= 5 + 2
+
+    def test_unordered(self, api, studies):
+        """Test rows in order of page completion."""
+        query = api.Study.list().set_rows_in_page(5)
+        uuids = [study.uuid for study in query.all(parallel=3, ordered=False)]
+        assert sorted(uuids) == sorted(study['uuid'] for study in studies)
+
+    def test_range(self, api, pages):
+        """Test rows of range."""
+        query = api.Study.list().set_rows_in_page(5)
+        uuids = [study.uuid for study in query.all(parallel=4)[7:16]]
+        assert uuids == [str(study_id) for study_id in range(7, 16)]
+        assert sorted(pages) == [2, 3, 4]
+
+    def test_total(self, api, studies, pages):
+        """Test pages are limited by total."""
+        query = api.Study.list().set_rows_in_page(5)
+        uuids = [study.uuid for study in query.all(parallel=8, total=23)]
+        assert uuids == [study['uuid'] for study in studies]
+        assert sorted(pages) == [1, 2, 3, 4, 5]
+
+    def test_rows_added_after_count(self, api, studies):
+        """Test rows after total are requested too."""
+        query = api.Study.list().set_rows_in_page(5)
+        uuids = [study.uuid for study in query.all(parallel=2, total=10)]
+        assert uuids == [study['uuid'] for study in studies]
+
+    def test_shifted_pages(self, api, studies, pages):
+        """Test duplicated rows of shifted pages are skipped."""
+        query = api.Study.list().set_rows_in_page(5)
+        rows = iter(query.all(parallel=1))
+        uuids = [next(rows).uuid]
+        # New study shifts rows to the next pages
+        studies.insert(0, {'uuid': 'new'})
+        uuids.extend(study.uuid for study in rows)
+        assert uuids == [str(study_id) for study_id in range(23)]
+
+    def test_one_page(self, api, pages):
+        """Test one page list is requested once."""
+        query = api.Study.list().set_rows_in_page(100)
+        assert len(list(query.all(parallel=4))) == 23
+        assert pages == [1]
+
+    def test_fetch_pages_error(self):
+        """Test page error is raised."""
+        def fetch_page(page_number):  # NOQA: WPS430
+            if page_number == 2:
+                raise ValueError
+            return {'page': {'more': 1}}
+
+        with pytest.raises(ValueError):
+            list(fetch_pages(fetch_page, range(1, 10), workers=2))
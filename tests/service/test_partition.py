@@ -0,0 +1,227 @@
+import json
+from datetime import date, datetime
+from threading import Lock, active_count
+from time import sleep
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.exceptions.service import FilterNotFound
+from ambra_sdk.service.partition import (
+    balance_bounds,
+    chunk_values,
+    split_range,
+)
+from ambra_sdk.service.sorting import Sorter, SortingOrder
+
+API_URL = 'http://127.0.0.1'
+# Most of studies are created in the last days of month
+STUDIES = [
+    {
+        'uuid': str(study_id).zfill(3),
+        'created': '2020-01-{day:02d} 12:00:00'.format(
+            day=min(study_id // 10 + 1, 28),
+        ),
+    }
+    for study_id in range(300)
+]
+
+
+def filtered(form):
+    """Studies of form filters.
+
+    :param form: request form
+    :return: studies
+    """
+    conditions = {
+        'ge': lambda row_value, value: row_value >= value,
+        'lt': lambda row_value, value: row_value < value,
+        'in': lambda row_value, value: row_value in json.loads(value),
+    }
+    return [
+        study for study in STUDIES
+        if all(
+            conditions[param.split('.')[2]](
+                study[param.split('.')[1]],
+                form_values[0],
+            )
+            for param, form_values in form.items()
+            if param.startswith('filter.')
+        )
+    ]
+
+
+class TestPartition:
+    """Test partitioned scans."""
+
+    @pytest.fixture
+    def forms(self):
+        """Request forms by url."""
+        return {'/study/list': [], '/study/count': []}
+
+    @pytest.fixture
+    def api(self, requests_mock, forms):
+        """Api with mocked study/list and study/count."""
+        lock = Lock()
+
+        def study_list(request, context):  # NOQA: WPS430
+            form = parse_qs(request.text)
+            with lock:
+                forms['/study/list'].append(form)
+            if 'filter.phantom.ge' in form:
+                context.status_code = 412
+                return {'status': 'ERROR', 'error_type': 'FILTER_NOT_FOUND'}
+            studies = filtered(form)
+            sort_by = form.get('sort_by', ['uuid-asc'])[0]
+            sort_field, _, order = sort_by.rpartition('-')
+            studies.sort(
+                key=lambda study: study[sort_field],
+                reverse=order == 'desc',
+            )
+            rows = int(form['page.rows'][0])
+            number = int(form['page.number'][0])
+            start = (number - 1) * rows
+            return {
+                'status': 'OK',
+                'studies': studies[start:start + rows],
+                'page': {
+                    'more': int(start + rows < len(studies)),
+                    'rows': rows,
+                    'number': number,
+                },
+            }
+
+        def study_count(request, context):  # NOQA: WPS430
+            form = parse_qs(request.text)
+            with lock:
+                forms['/study/count'].append(form)
+            return {'status': 'OK', 'count': len(filtered(form))}
+
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json=study_list,
+        )
+        requests_mock.post(
+            '{api_url}/study/count'.format(api_url=API_URL),
+            json=study_count,
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    def test_split_range(self):
+        """Test ranges of equal width."""
+        assert split_range(0, 10, 4) == [0, 2, 5, 7, 10]
+        assert split_range(0, 2, 4) == [0, 1, 2]
+        assert split_range(date(2020, 1, 1), date(2020, 1, 3), 2) == [
+            date(2020, 1, 1),
+            date(2020, 1, 2),
+            date(2020, 1, 3),
+        ]
+        with pytest.raises(ValueError):
+            split_range(10, 0, 4)
+
+    def test_balance_bounds(self):
+        """Test slices are grouped by number of rows."""
+        bounds = [0, 1, 2, 3, 4, 5, 6, 7, 8]
+        counts = [1, 1, 1, 1, 1, 1, 10, 10]
+        assert balance_bounds(bounds, counts, 3) == [0, 6, 7, 8]
+
+    def test_balanced(self, api, forms):
+        """Test partitions are balanced by count method."""
+        response = api.Study.list().set_rows_in_page(20).partitioned(
+            'created',
+            datetime(2020, 1, 1),
+            datetime(2020, 2, 1),
+            partitions=4,
+        )
+        partitions = response.partitions()
+        assert len(forms['/study/count']) == 16
+        sizes = [
+            len(filtered({
+                'filter.created.ge': [partition_start.strftime('%Y-%m-%d')],
+                'filter.created.lt': [partition_stop.strftime('%Y-%m-%d')],
+            }))
+            for partition_start, partition_stop in partitions
+        ]
+        assert sum(sizes) == len(STUDIES)
+        # Equal width partitions would have 130, 70, 70 and 30 rows
+        assert max(sizes) < 130
+        uuids = [study.uuid for study in response]
+        assert sorted(uuids) == [study['uuid'] for study in STUDIES]
+
+    def test_merge(self, api, forms):
+        """Test rows of partitions are merged in sort order."""
+        query = api.Study.list().set_rows_in_page(25)
+        response = query.sort_by(Sorter('uuid', SortingOrder.descending))
+        uuids = [
+            study.uuid
+            for study in response.partitioned(
+                'created',
+                date(2020, 1, 1),
+                date(2020, 2, 1),
+                balance=False,
+                merge=True,
+            )
+        ]
+        assert uuids == sorted(
+            (study['uuid'] for study in STUDIES),
+            reverse=True,
+        )
+        assert not forms['/study/count']
+        assert {
+            form['filter.created.lt'][0] for form in forms['/study/list']
+        } == {'2020-01-08', '2020-01-16', '2020-01-24', '2020-02-01'}
+
+    def test_error(self, api, forms):
+        """Test partition error is raised after workers are stopped."""
+        threads = active_count()
+        response = api.Study.list().partitioned('phantom', 0, 8, balance=False)
+        with pytest.raises(FilterNotFound):
+            list(response)
+        assert active_count() == threads
+        requested = len(forms['/study/list'])
+        sleep(0.05)
+        assert len(forms['/study/list']) == requested
+
+    def test_chunk_values(self):
+        """Test values are split by number and size."""
+        values = ['a', 'b', 'a', 'c', 'd', 'e']
+        assert list(chunk_values(values, 2)) == [['a', 'b'], ['c', 'd'], ['e']]
+        # '["a", "b"]' has 10 bytes
+        assert list(chunk_values(values, 10, max_bytes=10)) == [
+            ['a', 'b'],
+            ['c', 'd'],
+            ['e'],
+        ]
+
+    def test_filter_in_chunks(self, api, forms):
+        """Test rows of long in filter."""
+        uuids = [str(study_id).zfill(3) for study_id in range(0, 300, 2)]
+        response = api.Study.list().set_rows_in_page(30).filter_in_chunks(
+            'uuid',
+            uuids + ['missing'],
+            chunk_size=40,
+        )
+        found = [study.uuid for study in response]
+        assert sorted(found) == uuids
+        chunks = {
+            form['filter.uuid.in'][0] for form in forms['/study/list']
+        }
+        assert len(chunks) == 4
+        assert max(len(json.loads(chunk)) for chunk in chunks) == 40
+
+    def test_dedupe(self, api):
+        """Test rows of overlapping filters are yielded once."""
+        response = api.Study.list().filter_in_chunks(
+            'created',
+            ['2020-01-01 12:00:00', '2020-01-02 12:00:00'],
+            chunk_size=1,
+            dedupe_field='created',
+        )
+        assert len(list(response)) == 2
+
+    def test_get_many(self, api, forms):
+        """Test studies are requested by list method."""
+        studies = api.Study.get_many(['001', '005', '001'], chunk_size=1)
+        assert sorted(study.uuid for study in studies) == ['001', '005']
+        assert len(forms['/study/list']) == 2
@@ -0,0 +1,113 @@
+from urllib.parse import parse_qs
+
+import pytest
+from box import Box
+
+from ambra_sdk.api import Api
+from ambra_sdk.models import Study
+from ambra_sdk.service.filtering import Filter, FilterCondition
+from ambra_sdk.service.planner import Not, Where, matches, plan_predicate
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestPlanner:
+    """Test query planner."""
+
+    def test_server_filters(self):
+        """Test top level filters are server filters."""
+        predicate = (Study.phi_namespace == 'ns') & (Study.id > 10)
+        plan = plan_predicate(predicate)
+        assert plan.filters == (
+            Filter('phi_namespace', FilterCondition.equals, 'ns'),
+            Filter('id', FilterCondition.gt, 10),
+        )
+        assert plan.local is None
+        assert plan.top_fields is None
+
+    def test_in_filter(self):
+        """Test disjunction of one field is in filter."""
+        predicate = (Study.modality == 'CT') | \
+            Study.modality.in_condition(['MR', 'US'])
+        plan = plan_predicate(predicate)
+        assert plan.filters == (
+            Filter(
+                'modality',
+                FilterCondition.in_condition,
+                '["CT", "MR", "US"]',
+            ),
+        )
+
+    def test_local(self):
+        """Test parts which server can't evaluate are local."""
+        other_field = (Study.modality == 'CT') | (Study.patient_name == 'A')
+        negation = ~Study.patient_name.like('%TEST%')
+        plan = plan_predicate(
+            (Study.modality == 'CT') & (Study.modality == 'MR')
+            & other_field & negation,
+            fields=['uuid', 'patient.name'],
+        )
+        assert plan.filters == (
+            Filter('modality', FilterCondition.equals, 'CT'),
+        )
+        assert plan.local.operands[1:] == (other_field, negation)
+        assert isinstance(negation, Not)
+        assert plan.top_fields == [
+            'modality', 'patient', 'patient_name', 'uuid',
+        ]
+        assert plan.struct_fields == {'patient': ['name']}
+
+    def test_not_filterable(self):
+        """Test all filters are local for methods without filtering."""
+        plan = plan_predicate(Study.uuid == 'a', filterable=False)
+        assert plan.filters == ()
+        assert plan.local == (Study.uuid == 'a')
+
+    @pytest.mark.parametrize(('predicate', 'expected'), [
+        (Study.id > 9, True),
+        (Study.id >= 11, False),
+        (Study.modality.in_condition(['CT', 'MR']), True),
+        (Study.patient_name.like('%smith'), True),
+        (Study.patient_name.like('smith'), False),
+        (Filter('updated', FilterCondition.equals_or_null, 'x'), True),
+        (Filter('updated', FilterCondition.equals, 'x'), False),
+        (Filter('patient.sex', FilterCondition.equals, 'F'), True),
+        (~(Study.modality == 'CT') | (Study.id < 11), True),
+        (Where(lambda row: row.id % 2, ['id']), False),
+    ])
+    def test_matches(self, predicate, expected):
+        """Test local check of rows."""
+        row = Box({
+            'id': 10,
+            'modality': 'CT',
+            'patient_name': 'John Smith',
+            'updated': None,
+            'patient': {'sex': 'F'},
+        })
+        assert matches(predicate, row) is expected
+
+    def test_where(self, requests_mock):
+        """Test planned query."""
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json={
+                'status': 'OK',
+                'studies': [
+                    {'uuid': 'a', 'patient_name': 'TEST'},
+                    {'uuid': 'b', 'patient_name': 'Smith'},
+                ],
+                'page': {'more': 0, 'rows': 100},
+            },
+        )
+        api = Api.with_sid(API_URL, 'sid')
+        rows = api.Study.list().where(
+            ((Study.modality == 'CT') | (Study.modality == 'MR'))
+            & ~Study.patient_name.like('TEST%'),
+            fields=['uuid'],
+        )
+        assert [row.uuid for row in rows] == ['b']
+        assert (rows.scanned, rows.matched) == (2, 1)
+        request_data = parse_qs(requests_mock.last_request.text)
+        assert request_data['filter.modality.in'] == ['["CT", "MR"]']
+        assert 'filter.Study.patient_name.like' not in request_data
+        assert request_data['fields._top'] == ['["patient_name", "uuid"]']
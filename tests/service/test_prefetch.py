@@ -0,0 +1,96 @@
+from time import monotonic, sleep
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.exceptions.service import FilterNotFound
+
+API_URL = 'http://127.0.0.1'
+STUDIES = [{'uuid': str(study_id)} for study_id in range(10)]
+
+
+class TestPrefetch:
+    """Test background page prefetching."""
+
+    @pytest.fixture
+    def pages(self):
+        """Requested page numbers."""
+        return []
+
+    @pytest.fixture
+    def api(self, requests_mock, pages):
+        """Api with mocked study/list."""
+        def study_list(request, context):  # NOQA: WPS430
+            form = parse_qs(request.text)
+            rows = int(form['page.rows'][0])
+            number = int(form['page.number'][0])
+            pages.append(number)
+            if rows == 2 and number == 2:
+                context.status_code = 412
+                return {'status': 'ERROR', 'error_type': 'FILTER_NOT_FOUND'}
+            start = (number - 1) * rows
+            return {
+                'status': 'OK',
+                'studies': STUDIES[start:start + rows],
+                'page': {
+                    'more': int(start + rows < len(STUDIES)),
+                    'rows': rows,
+                    'number': number,
+                },
+            }
+
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json=study_list,
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    def test_prefetch(self, api, pages):
+        """Test rows of prefetched pages."""
+        query = api.Study.list().set_rows_in_page(3)
+        studies = [study.uuid for study in query.all().prefetch(2)]
+        assert studies == [study['uuid'] for study in STUDIES]
+        assert pages == [1, 2, 3, 4]
+
+    def test_prefetch_range(self, api, pages):
+        """Test only pages of range are requested."""
+        query = api.Study.list().set_rows_in_page(3)
+        studies = [study.uuid for study in query.all()[4:7].prefetch(3)]
+        assert studies == ['4', '5', '6']
+        assert pages == [2, 3]
+
+    def test_early_stop(self, api, pages):
+        """Test producer stops if consumer stopped iteration."""
+        query = api.Study.list().set_rows_in_page(1)
+        rows = iter(query.all().prefetch(1))
+        assert next(rows).uuid == '0'
+        rows.close()
+        # Current page, page in queue and page waiting for queue
+        assert len(pages) <= 3
+
+    def test_error(self, api):
+        """Test page error is raised in consumer after previous rows."""
+        query = api.Study.list().set_rows_in_page(2)
+        studies = []
+        with pytest.raises(FilterNotFound):
+            for study in query.all().prefetch(2):
+                studies.append(study.uuid)
+        assert studies == ['0', '1']
+
+    def test_overlap(self, api, pages):
+        """Test next page is requested while page rows are processed."""
+        query = api.Study.list().set_rows_in_page(5)
+        rows = iter(query.all().prefetch(1))
+        assert next(rows).uuid == '0'
+        start = monotonic()
+        while len(pages) < 2 and monotonic() - start < 5:
+            sleep(0.01)
+        assert pages == [1, 2]
+        assert [study.uuid for study in rows] == \
+            [study['uuid'] for study in STUDIES[1:]]
+
+    def test_negative_depth(self, api):
+        """Test negative prefetch depth."""
+        with pytest.raises(ValueError):
+            api.Study.list().all().prefetch(-1)
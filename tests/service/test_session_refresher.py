@@ -0,0 +1,109 @@
+from threading import Event
+from time import time
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.service.session_refresher import SessionRefresher
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestSessionRefresher:
+    """Test background session refresher."""
+
+    @pytest.fixture
+    def server(self, requests_mock):
+        """Mock session endpoints."""
+        state = {'ttl': 60, 'logins': [], 'sid': 'sid1'}
+
+        def ttl(request, context):  # NOQA: WPS430
+            if 'sid={sid}'.format(sid=state['sid']) not in request.text:
+                context.status_code = 412
+                return {'status': 'ERROR', 'error_type': 'EXPIRED'}
+            return {'status': 'OK', 'ttl': state['ttl']}
+
+        def login(request, context):  # NOQA: WPS430
+            state['logins'].append(request.text)
+            if 'validate_session' in request.text:
+                state['ttl'] = 60
+            else:
+                state['sid'] = 'sid2'
+            return {'status': 'OK', 'sid': state['sid']}
+
+        requests_mock.post(
+            '{api_url}/session/ttl'.format(api_url=API_URL),
+            json=ttl,
+        )
+        requests_mock.post(
+            '{api_url}/session/login'.format(api_url=API_URL),
+            json=login,
+        )
+        return state
+
+    @pytest.fixture
+    def api(self):
+        """Api with credentials and sid."""
+        api = Api.with_creds(API_URL, 'user', 'pass')
+        api._sid = 'sid1'
+        return api
+
+    def test_fresh_session(self, api, server):
+        """Test session with long ttl."""
+        refresher = SessionRefresher(api, margin=120, max_check_interval=3600)
+        delay = refresher.refresh()
+        assert delay == 60 * 60 - 120
+        assert refresher.next_refresh_time == pytest.approx(
+            time() + delay,
+            abs=1,
+        )
+        assert server['logins'] == []
+
+    def test_renew_session(self, api, server):
+        """Test session renew before expiration."""
+        server['ttl'] = 1
+        refresher = SessionRefresher(api, margin=120)
+        refresher.refresh()
+        assert len(server['logins']) == 1
+        assert 'validate_session=sid1' in server['logins'][0]
+        assert api._sid == 'sid1'
+
+    def test_replace_expired_session(self, api, server):
+        """Test getting new sid for expired session."""
+        api._sid = 'expired sid'
+        refresher = SessionRefresher(api, margin=120)
+        refresher.refresh()
+        assert api._sid == 'sid2'
+        assert api.sid_refreshes == 1
+
+    def test_start_stop(self, api, server):
+        """Test refresher thread."""
+        assert api.next_sid_refresh is None
+        refresher = api.start_session_refresher(margin=120)
+        assert refresher.running
+        assert api.session_refresher is refresher
+        api.stop_session_refresher()
+        assert not refresher.running
+        assert api.session_refresher is None
+
+    def test_unexpected_error(self, api, caplog):
+        """Test refresher thread survives unexpected errors."""
+        refreshed = Event()
+        calls = []
+
+        def refresh():  # NOQA: WPS430
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError('Unexpected')
+            refreshed.set()
+            return 3600
+
+        refresher = SessionRefresher(api, retry_interval=0)
+        refresher.refresh = refresh
+        refresher.start()
+        try:  # NOQA:WPS501
+            assert refreshed.wait(timeout=5)
+            assert refresher.running
+        finally:
+            refresher.stop()
+        assert 'Unexpected session refresh error' in caplog.text
@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.models import Study
+from ambra_sdk.service.filtering import Filter, FilterCondition
+from ambra_sdk.service.query import QueryOPSF
+from ambra_sdk.service.sorting import Sorter
+from ambra_sdk.service.template import Bind
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestQueryTemplate:
+    """Test query templates."""
+
+    @pytest.fixture
+    def api(self, requests_mock):
+        """Api with mocked study methods."""
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json={
+                'status': 'OK',
+                'studies': [{'uuid': 'study'}],
+                'page': {'more': 0, 'rows': 100},
+            },
+        )
+        requests_mock.post(
+            '{api_url}/study/get'.format(api_url=API_URL),
+            json={'status': 'OK', 'uuid': 'study'},
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    @pytest.fixture
+    def template(self, api):
+        """Template of study list."""
+        return api.Study.list() \
+            .only(['uuid', 'updated']) \
+            .filter_by(Study.phi_namespace == Bind('namespace')) \
+            .filter_by(Study.id > Bind('since_id', default=0)) \
+            .filter_by(Study.uuid.in_condition(Bind('uuids', None))) \
+            .sort_by(Sorter('updated')) \
+            .template()
+
+    def test_bind(self, template):
+        """Test bound query."""
+        query = template.bind(namespace='ns', since_id='10', uuids=['a'])
+        assert isinstance(query, QueryOPSF)
+        assert query.url == '/study/list'
+        request_items = [
+            (param, param_value)
+            for param, param_value in query.request_data.items()
+            if param_value is not None
+        ]
+        assert request_items == [
+            ('fields._top', '["uuid", "updated"]'),
+            ('filter.phi_namespace.equals', 'ns'),
+            ('filter.id.gt', 10),
+            ('filter.uuid.in', '["a"]'),
+            ('sort_by', 'updated-asc'),
+        ]
+        assert template.names == {'namespace', 'since_id', 'uuids'}
+
+    def test_defaults(self, template):
+        """Test default values of not bound placeholders."""
+        request_data = template.bind(namespace='ns').request_data
+        assert request_data['filter.id.gt'] == 0
+        assert request_data['filter.uuid.in'] is None
+
+    def test_converted_defaults(self, api):
+        """Test default values are converted as bound values."""
+        template = api.Study.list() \
+            .filter_by(Study.uuid.in_condition(Bind('uuids', ['a', 'b']))) \
+            .filter_by(Study.id > Bind('since_id', '10')) \
+            .template()
+        request_data = template.bind().request_data
+        assert request_data['filter.uuid.in'] == '["a", "b"]'
+        assert request_data['filter.id.gt'] == 10
+
+    def test_wrong_values(self, template):
+        """Test missing and unknown values."""
+        with pytest.raises(TypeError, match='Missing bound value: namespace'):
+            template.bind()
+        with pytest.raises(TypeError, match='Unknown bound values: other'):
+            template.bind(namespace='ns', other=1)
+
+    def test_frozen(self, template):
+        """Test bound queries don't change template."""
+        query = template.bind(namespace='ns')
+        query.filter_by(
+            Filter('name', FilterCondition.equals, 'name'),
+        ).set_rows_in_page(10)
+        other = template.bind(namespace='other')
+        assert 'filter.name.equals' not in other.request_data
+        assert other._rows_in_page != 10
+        assert isinstance(
+            template.request_data['filter.phi_namespace.equals'],
+            Bind,
+        )
+        with pytest.raises(TypeError):
+            template.request_data['sort_by'] = 'name'
+
+    def test_requests(self, api, template, requests_mock):
+        """Test requests of bound queries from threads."""
+        def namespace_studies(namespace):  # NOQA:WPS430
+            return list(template.bind(namespace=namespace).all())
+
+        with ThreadPoolExecutor(4) as pool:
+            studies = list(pool.map(
+                namespace_studies,
+                ['ns1', 'ns2', 'ns3', 'ns4'],
+            ))
+        assert [len(rows) for rows in studies] == [1, 1, 1, 1]
+        namespaces = sorted(
+            parse_qs(request.text)['filter.phi_namespace.equals'][0]
+            for request in requests_mock.request_history
+        )
+        assert namespaces == ['ns1', 'ns2', 'ns3', 'ns4']
+
+    def test_method_arguments(self, api):
+        """Test placeholders of method arguments."""
+        template = api.Study.get(uuid=Bind('uuid')).template()
+        assert template.bind(uuid='study').get().uuid == 'study'
+        assert template.bind(uuid='other').request_data['uuid'] == 'other'
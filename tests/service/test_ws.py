@@ -0,0 +1,70 @@
+import asyncio
+import json
+from queue import Queue
+
+from ambra_sdk.json_backend import get_json_backend
+from ambra_sdk.service.ws import WS
+
+
+class FakeSocket:
+    """Websocket connection which records sent messages."""
+
+    def __init__(self):
+        """Init."""
+        self.sent = []
+
+    async def send_str(self, message):
+        """Record message.
+
+        :param message: message
+        """
+        self.sent.append(json.loads(message))
+
+
+class TestWS:
+    """Test websocket requests."""
+
+    def _ws(self, **kwargs):
+        """WS with fake connection."""
+        ws = WS(
+            url='ws://127.0.0.1',
+            responses=Queue(),
+            requests=Queue(),
+            **kwargs,
+        )
+        ws.socket = FakeSocket()
+
+        async def get_ws():  # NOQA:WPS430
+            return ws.socket
+
+        ws._get_ws = get_ws
+        return ws
+
+    def test_requests(self):
+        """Test subscribe, ping and unsubscribe messages."""
+        ws = self._ws()
+
+        async def send():  # NOQA:WPS430
+            await ws._subscribe('sid', 'channel')
+            ws._ping_interval = 0
+            await ws._ping()
+            await ws._unsubscribe('channel')
+
+        asyncio.run(send())
+        assert ws.socket.sent == [
+            {'action': 'subscribe', 'channel': 'channel', 'sid': 'sid'},
+            {'action': 'ping'},
+            {
+                'action': 'unsubscribe',
+                'channel': 'channel',
+                'sid': 'NOT NEEDED!',
+            },
+        ]
+
+    def test_json_backend(self):
+        """Test messages are encoded by json backend."""
+        backend = get_json_backend('json')
+        ws = self._ws(json_backend=backend)
+        assert ws._json_backend is backend
+        asyncio.run(ws._subscribe('sid', 'channel'))
+        assert ws.socket.sent[0]['action'] == 'subscribe'
@@ -0,0 +1,97 @@
+from time import sleep
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.exceptions.storage import EngineUnavailable
+from ambra_sdk.storage.health import CircuitState, StorageHealth
+
+SCHEMA_URL = 'https://{engine_fqdn}/api/v3/storage/study/ns/uid/schema'
+
+
+class TestStorageHealth:
+    """Test storage engines health."""
+
+    @pytest.fixture
+    def api(self):
+        """Api with sid."""
+        return Api.with_sid('http://127.0.0.1', 'sid')
+
+    def schema(self, api, engine_fqdn):
+        """Get study schema.
+
+        :param api: api
+        :param engine_fqdn: engine
+        :return: schema
+        """
+        return api.Storage.Study.schema(
+            engine_fqdn=engine_fqdn,
+            namespace='ns',
+            study_uid='uid',
+        )
+
+    def test_breaker(self):
+        """Test circuit breaker states."""
+        health = StorageHealth(max_consecutive_failures=2, open_timeout=0.1)
+        for _ in range(2):
+            health.before_request('engine')
+            health.record('engine', success=False, latency=0.1)
+        assert health.stats('engine').state == CircuitState.open
+        with pytest.raises(EngineUnavailable):
+            health.before_request('engine')
+
+        sleep(0.1)
+        assert health.is_available('engine')
+        # Only one probe request in half open state
+        health.before_request('engine')
+        assert health.stats('engine').state == CircuitState.half_open
+        with pytest.raises(EngineUnavailable):
+            health.before_request('engine')
+        health.record('engine', success=True, latency=0.1)
+        assert health.stats('engine').state == CircuitState.closed
+
+    def test_error_rate(self):
+        """Test breaker opens by error rate."""
+        health = StorageHealth(min_requests=4, error_rate_threshold=0.5)
+        for success in (True, False, True, False):
+            health.record('engine', success=success, latency=0.2)
+        engine_stats = health.stats('engine')
+        assert engine_stats.state == CircuitState.open
+        assert engine_stats.error_rate == 0.5
+        assert engine_stats.latency_avg == pytest.approx(0.2)
+
+    def test_fail_fast(self, api, requests_mock):
+        """Test storage requests to unhealthy engine fail fast."""
+        bad = requests_mock.get(
+            SCHEMA_URL.format(engine_fqdn='bad'),
+            status_code=503,
+        )
+        requests_mock.get(
+            SCHEMA_URL.format(engine_fqdn='good'),
+            json={'study_uid': 'uid'},
+        )
+        for _ in range(5):
+            with pytest.raises(Exception) as exc_info:
+                self.schema(api, 'bad')
+            assert not isinstance(exc_info.value, EngineUnavailable)
+        with pytest.raises(EngineUnavailable):
+            self.schema(api, 'bad')
+        assert bad.call_count == 5
+
+        assert self.schema(api, 'good').study_uid == 'uid'
+        table = api.Storage.health.table()
+        assert table['bad'].state == CircuitState.open
+        assert table['good'].state == CircuitState.closed
+        assert api.Storage.health.healthy(['bad', 'good']) == ['good']
+
+    def test_sid_errors(self, api, requests_mock):
+        """Test permission errors are not engine failures."""
+        requests_mock.get(
+            SCHEMA_URL.format(engine_fqdn='engine'),
+            status_code=403,
+        )
+        api._creds = None
+        for _ in range(10):
+            with pytest.raises(Exception):
+                self.schema(api, 'engine')
+        assert api.Storage.health.stats('engine').failures == 0
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+
 import pytest
 import requests
 from dynaconf import settings
@@ -94,3 +97,42 @@ class TestApi:
         url = '/some_url'
         requests_mock.add_matcher(matcher)
         api.service_post(url, {'a': 1})
+
+    def test_single_flight_sid_refresh(self, requests_mock):
+        """Test that concurrent callers share one sid refresh."""
+        api_url = 'http://127.0.0.1'
+        logins = []
+
+        def login(request, context):  # NOQA: WPS430
+            logins.append(request)
+            sleep(0.2)
+            return {'status': 'OK', 'sid': 'new sid'}
+
+        def user(request, context):  # NOQA: WPS430
+            if 'sid=new+sid' not in request.text:
+                context.status_code = 401
+                return {'status': 'ERROR'}
+            return {'status': 'OK', 'name': 'user'}
+
+        requests_mock.post(
+            '{api_url}/session/login'.format(api_url=api_url),
+            json=login,
+        )
+        requests_mock.post(
+            '{api_url}/session/user'.format(api_url=api_url),
+            json=user,
+        )
+        api = Api.with_creds(api_url, 'user', 'pass')
+        api._sid = 'Expired sid'
+        workers = 8
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            users = list(
+                executor.map(
+                    lambda _: api.Session.user().get(),
+                    range(workers),
+                ),
+            )
+        assert [user_info.name for user_info in users] == ['user'] * workers
+        assert len(logins) == 1
+        assert api.sid_refreshes == 1
+        assert api.sid_refreshes_coalesced == workers - 1
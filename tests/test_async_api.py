@@ -0,0 +1,428 @@
+import asyncio
+import json
+from collections import Counter
+
+import pytest
+from aiohttp import web
+
+from ambra_sdk import async_api
+from ambra_sdk.async_api import AsyncApi
+from ambra_sdk.exceptions.base import DeadlineExceeded
+from ambra_sdk.exceptions.service import NotFound
+from ambra_sdk.models import Study
+from ambra_sdk.service.entrypoints.study import StudyBox
+from ambra_sdk.service.query import AsyncQueryOPSF
+from ambra_sdk.service.sorting import Sorter, SortingOrder
+
+VALID_SID = 'valid sid'
+STUDIES = [{'uuid': str(study_id), 'id': study_id} for study_id in range(7)]
+DOWNLOAD_BODY = bytes(range(256)) * 1024
+
+
+async def login(request):
+    """Login handler."""
+    return web.json_response({'status': 'OK', 'sid': VALID_SID})
+
+
+async def user(request):
+    """Session user handler."""
+    form = await request.post()
+    if form.get('sid') != VALID_SID:
+        return web.json_response({'status': 'ERROR'}, status=401)
+    return web.json_response({'status': 'OK', 'name': 'user'})
+
+
+async def study_list(request):
+    """Study list handler."""
+    form = await request.post()
+    rows = int(form['page.rows'])
+    number = int(form['page.number'])
+    start = (number - 1) * rows
+    studies = [
+        study for study in STUDIES
+        if int(form.get('filter.id.ge', 0)) <= study['id'] <
+        int(form.get('filter.id.lt', len(STUDIES)))
+    ]
+    if 'filter.uuid.in' in form:
+        uuids = json.loads(form['filter.uuid.in'])
+        studies = [study for study in studies if study['uuid'] in uuids]
+    if form.get('sort_by') == 'id-desc':
+        studies.reverse()
+    page = studies[start:start + rows]
+    more = int(start + rows < len(studies))
+    return web.json_response(
+        {
+            'status': 'OK',
+            'studies': page,
+            'page': {'more': more, 'rows': rows, 'number': number},
+        },
+    )
+
+
+async def study_get(request):
+    """Study get handler."""
+    form = await request.post()
+    if form.get('uuid') != 'missing':
+        return web.json_response({'status': 'OK', 'uuid': form['uuid']})
+    return web.json_response(
+        {'status': 'ERROR', 'error_type': 'NOT_FOUND'},
+        status=412,
+    )
+
+
+async def study_count(request):
+    """Slow study count handler."""
+    await asyncio.sleep(1)
+    return web.json_response({'status': 'OK', 'count': 1})
+
+
+async def unavailable(request):
+    """Unavailable service handler."""
+    request.app['hits'][request.path] += 1
+    return web.Response(status=503, headers={'Retry-After': '0'})
+
+
+async def storage_schema(request):
+    """Storage schema handler."""
+    if request.query.get('sid') != VALID_SID:
+        return web.Response(status=403)
+    return web.json_response({'study_uid': request.match_info['study_uid']})
+
+
+async def storage_download(request):
+    """Storage study download handler."""
+    return web.Response(body=DOWNLOAD_BODY)
+
+
+class TestAsyncApi:
+    """Test asyncio API."""
+
+    @pytest.fixture
+    def server_url(self):
+        """Run local ambra like server."""
+        loop = asyncio.new_event_loop()
+        app = web.Application()
+        app['hits'] = Counter()
+        app.router.add_post('/study/add', unavailable)
+        app.router.add_post('/user/get', unavailable)
+        app.router.add_post('/session/login', login)
+        app.router.add_post('/session/user', user)
+        app.router.add_post('/study/list', study_list)
+        app.router.add_post('/study/get', study_get)
+        app.router.add_post('/study/count', study_count)
+        app.router.add_get(
+            '/api/v3/storage/study/{namespace}/{study_uid}/schema',
+            storage_schema,
+        )
+        app.router.add_get(
+            '/api/v3/storage/study/{namespace}/{study_uid}/download',
+            storage_download,
+        )
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        loop.run_until_complete(site.start())
+        port = site._server.sockets[0].getsockname()[1]
+        self.hits = app['hits']
+        yield loop, '127.0.0.1:{port}'.format(port=port)
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
+
+    def test_namespaces(self):
+        """Test api namespaces."""
+        api = AsyncApi.with_sid('url', 'sid')
+        query = api.Study.list()
+        assert isinstance(query, AsyncQueryOPSF)
+        assert query.url == '/study/list'
+        assert query.return_constructor is StudyBox
+        assert api.Storage.Study is not None
+
+    def test_get_with_new_sid(self, server_url):
+        """Test get with retry on new sid."""
+        loop, host = server_url
+
+        async def get_user():  # NOQA:WPS430
+            api = AsyncApi.with_creds(
+                'http://{host}'.format(host=host),
+                'user',
+                'pass',
+            )
+            api._sid = 'Wrong sid'
+            async with api:
+                return await api.Session.user().get()
+
+        user_info = loop.run_until_complete(get_user())
+        assert user_info.name == 'user'
+
+    def test_request_bytes(self, server_url):
+        """Test metrics measure url encoded form."""
+        loop, host = server_url
+
+        async def get_study():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                await api.Study.get(uuid='1').get()
+            return api.metrics.snapshot()
+
+        metrics_snapshot = loop.run_until_complete(get_study())
+        study_get = metrics_snapshot['endpoints']['/study/get']
+        assert study_get['request_bytes'] == len('uuid=1&sid=sid')
+
+    def test_iterable_response(self, server_url):
+        """Test async iteration over pages."""
+        loop, host = server_url
+
+        async def list_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                query = api.Study.list().set_rows_in_page(3)
+                studies = [study.uuid async for study in query.all()]
+                sliced = [study.uuid async for study in query.all()[2:5]]
+                first = await query.first()
+            return studies, sliced, first
+
+        studies, sliced, first = loop.run_until_complete(list_studies())
+        assert studies == [study['uuid'] for study in STUDIES]
+        assert sliced == ['2', '3', '4']
+        assert first.uuid == '0'
+
+    def test_prefetch(self, server_url):
+        """Test async iteration over prefetched pages."""
+        loop, host = server_url
+
+        async def list_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                query = api.Study.list().set_rows_in_page(2)
+                studies = [
+                    study.uuid async for study in query.all().prefetch(2)
+                ]
+                sliced = [
+                    study.uuid
+                    async for study in query.all()[3:6].prefetch(1)
+                ]
+            return studies, sliced
+
+        studies, sliced = loop.run_until_complete(list_studies())
+        assert studies == [study['uuid'] for study in STUDIES]
+        assert sliced == ['3', '4', '5']
+
+    def test_parallel_pages(self, server_url):
+        """Test async iteration over pages requested concurrently."""
+        loop, host = server_url
+
+        async def list_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                query = api.Study.list().set_rows_in_page(2)
+                studies = [
+                    study.uuid async for study in query.all(parallel=3)
+                ]
+                unordered = [
+                    study.uuid
+                    async for study in query.all(parallel=2, ordered=False)
+                ]
+                sliced = [
+                    study.uuid
+                    async for study in query.all(parallel=2, total=7)[1:4]
+                ]
+            return studies, unordered, sliced
+
+        studies, unordered, sliced = loop.run_until_complete(list_studies())
+        assert studies == [study['uuid'] for study in STUDIES]
+        assert sorted(unordered) == sorted(study['uuid'] for study in STUDIES)
+        assert sliced == ['1', '2', '3']
+
+    def test_partitioned(self, server_url):
+        """Test async partitioned scan."""
+        loop, host = server_url
+
+        async def list_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                query = api.Study.list().set_rows_in_page(2)
+                unordered = [
+                    study.uuid
+                    async for study in query.partitioned(
+                        'id', 0, 7, partitions=3, balance=False,
+                    )
+                ]
+                query.sort_by(Sorter('id', SortingOrder.descending))
+                merged = [
+                    study.uuid
+                    async for study in query.partitioned(
+                        'id', 0, 7, partitions=3, balance=False, merge=True,
+                    )
+                ]
+            return unordered, merged
+
+        unordered, merged = loop.run_until_complete(list_studies())
+        assert sorted(unordered) == sorted(study['uuid'] for study in STUDIES)
+        assert merged == [study['uuid'] for study in reversed(STUDIES)]
+
+    def test_get_many(self, server_url):
+        """Test async get of many studies."""
+        loop, host = server_url
+
+        async def get_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                return [
+                    study.uuid
+                    async for study in api.Study.get_many(
+                        ['1', '3', '5', '9'],
+                        chunk_size=2,
+                    )
+                ]
+
+        assert sorted(loop.run_until_complete(get_studies())) == ['1', '3', '5']
+
+    def test_where(self, server_url):
+        """Test async planned query."""
+        loop, host = server_url
+
+        async def list_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                rows = api.Study.list().where(
+                    (Study.id >= 2) & ~(Study.uuid == '4'),
+                )
+                return [study.uuid async for study in rows], rows.scanned
+
+        uuids, scanned = loop.run_until_complete(list_studies())
+        assert uuids == ['2', '3', '5', '6']
+        assert scanned == 5
+
+    def test_coalescing(self, server_url):
+        """Test async coalescing of concurrent gets."""
+        loop, host = server_url
+
+        async def get_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            api.enable_coalescing(batch=True)
+            async with api:
+                studies = await asyncio.gather(
+                    *[
+                        api.Study.get(uuid=uuid).get()
+                        for uuid in ('1', '3', '1', 'missing')
+                    ],
+                    return_exceptions=True,
+                )
+                return studies, api.coalescer.stats
+
+        studies, stats = loop.run_until_complete(get_studies())
+        assert [study.uuid for study in studies[:3]] == ['1', '3', '1']
+        assert isinstance(studies[3], NotFound)
+        assert stats.shared == 1
+        assert stats.batched == 2
+        assert stats.batches == 1
+
+    def test_sync_iteration(self):
+        """Test sync iteration of async response."""
+        api = AsyncApi.with_sid('url', 'sid')
+        with pytest.raises(TypeError):
+            list(api.Study.list().all())
+
+    def test_errors_mapping(self, server_url):
+        """Test errors mapping."""
+        loop, host = server_url
+
+        async def get_study():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                return await api.Study.get(uuid='missing').get()
+
+        with pytest.raises(NotFound):
+            loop.run_until_complete(get_study())
+
+    def test_storage(self, server_url):
+        """Test storage request with retry on new sid."""
+        loop, host = server_url
+
+        async def get_schema():  # NOQA:WPS430
+            api = AsyncApi.with_creds(
+                'http://{host}'.format(host=host),
+                'user',
+                'pass',
+            )
+            api._sid = 'Wrong sid'
+            api.Storage.STORAGE_BASE_URL = 'http://{engine_fqdn}/api/v3/storage'
+            async with api:
+                return await api.Storage.Study.schema(
+                    engine_fqdn=host,
+                    namespace='namespace',
+                    study_uid='study_uid',
+                )
+
+        schema = loop.run_until_complete(get_schema())
+        assert schema.study_uid == 'study_uid'
+
+    def test_storage_stream(self, server_url, monkeypatch):
+        """Test streamed storage response is not held in memory."""
+        loop, host = server_url
+        monkeypatch.setattr(async_api, 'STREAM_SPOOL_SIZE', 1024)
+
+        async def download():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            api.Storage.STORAGE_BASE_URL = 'http://{engine_fqdn}/api/v3/storage'
+            async with api:
+                return await api.Storage.Study.download(
+                    engine_fqdn=host,
+                    namespace='namespace',
+                    study_uid='study_uid',
+                    bundle='dicom',
+                )
+
+        response = loop.run_until_complete(download())
+        assert response.raw._rolled
+        assert b''.join(response.iter_content(4096)) == DOWNLOAD_BODY
+
+    def test_batch(self, server_url):
+        """Test concurrent batch of queries."""
+        loop, host = server_url
+
+        async def get_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                queries = [
+                    api.Study.get(uuid=uuid)
+                    for uuid in ('1', 'missing', '3')
+                ]
+                return [
+                    batch_result
+                    async for batch_result in api.batch(queries, concurrency=2)
+                ]
+
+        batch_results = loop.run_until_complete(get_studies())
+        assert [batch_result.ok for batch_result in batch_results] == \
+            [True, False, True]
+        assert batch_results[2].result.uuid == '3'
+        assert isinstance(batch_results[1].exception, NotFound)
+
+    def test_deadline(self, server_url):
+        """Test deadline of query."""
+        loop, host = server_url
+
+        async def count_studies():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            async with api:
+                return await api.Study.count().set_deadline(0.2).get()
+
+        with pytest.raises(DeadlineExceeded):
+            loop.run_until_complete(count_studies())
+
+    def test_retry_policy(self, server_url):
+        """Test retries of idempotent methods only."""
+        loop, host = server_url
+
+        async def post():  # NOQA:WPS430
+            api = AsyncApi.with_sid('http://{host}'.format(host=host), 'sid')
+            api.service_retry_params['backoff_factor'] = 0
+            async with api:
+                for url in ('/study/add', '/user/get'):
+                    response = await api.service_post(url, required_sid=False)
+                    assert response.status_code == 503
+
+        loop.run_until_complete(post())
+        assert self.hits['/study/add'] == 1
+        assert self.hits['/user/get'] == 6
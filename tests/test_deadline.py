@@ -0,0 +1,136 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from time import monotonic, sleep
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.deadline import Deadline, DeadlineTimeout, to_deadline
+from ambra_sdk.exceptions.base import DeadlineExceeded
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Handler which responds after deadline."""
+
+    def do_POST(self):  # NOQA:N802
+        """Handle post."""
+        sleep(1)
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b'{"status": "OK"}')
+
+    def log_message(self, *args):
+        """Be quiet."""
+
+
+class RetryLaterHandler(BaseHTTPRequestHandler):
+    """Handler which asks to retry after long time."""
+
+    def do_POST(self):  # NOQA:N802
+        """Handle post."""
+        self.send_response(503)
+        self.send_header('Retry-After', '8')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        """Be quiet."""
+
+
+def run_server(handler):
+    """Run local server.
+
+    :param handler: request handler class
+    :yields: server url
+    """
+    server = HTTPServer(('127.0.0.1', 0), handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:{port}'.format(port=server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+class TestDeadline:
+    """Test deadlines."""
+
+    @pytest.fixture
+    def slow_server_url(self):
+        """Run server which responds slowly."""
+        yield from run_server(SlowHandler)
+
+    @pytest.fixture
+    def retry_later_server_url(self):
+        """Run server which asks to retry after 8 seconds."""
+        yield from run_server(RetryLaterHandler)
+
+    def test_deadline(self):
+        """Test deadline object."""
+        deadline = Deadline(10)
+        assert 9 < deadline.remaining <= 10
+        assert not deadline.expired
+        deadline.check()
+        timeout = deadline.request_timeout(connect_timeout=1)
+        assert timeout.connect_timeout == 1
+        assert isinstance(timeout.clone(), DeadlineTimeout)
+
+        expired = Deadline(0)
+        assert expired.expired
+        with pytest.raises(DeadlineExceeded):
+            expired.check()
+        with pytest.raises(DeadlineExceeded):
+            expired.request_timeout()
+
+    def test_to_deadline(self):
+        """Test deadline from number or default timeout."""
+        deadline = Deadline(5)
+        assert to_deadline(deadline, 10) is deadline
+        assert to_deadline(1, 10).timeout == 1
+        assert to_deadline(None, 10).timeout == 10
+        assert to_deadline(None, None) is None
+
+    def test_default_timeouts(self):
+        """Test per endpoint default timeouts."""
+        api = Api.with_sid('http://127.0.0.1', 'sid')
+        assert api.service_timeout_for('/study/get') < \
+            api.service_timeout_for('/study/list')
+        download = api.Storage.Study.download(
+            engine_fqdn='engine',
+            namespace='namespace',
+            study_uid='study_uid',
+            bundle='dicom',
+            only_prepare=True,
+        )
+        assert download.url_template == \
+            '/study/{namespace}/{study_uid}/download'
+        assert api.storage_timeout_for(download.url_template) > \
+            api.storage_timeout_for(None)
+        assert api.Storage.request_deadline(
+            download.with_deadline(7),
+        ).timeout == 7
+
+    def test_query_timeout(self, requests_mock):
+        """Test query passes deadline timeout to requests."""
+        requests_mock.post('http://127.0.0.1/study/get', json={})
+        api = Api.with_sid('http://127.0.0.1', 'sid')
+        api.Study.get(uuid='uuid').set_deadline(5).get()
+        timeout = requests_mock.last_request.timeout
+        assert isinstance(timeout, DeadlineTimeout)
+        assert timeout.total <= 5
+
+    def test_deadline_exceeded(self, slow_server_url):
+        """Test deadline bounds query with all retries."""
+        api = Api.with_sid(slow_server_url, 'sid')
+        start = monotonic()
+        with pytest.raises(DeadlineExceeded):
+            api.Study.get(uuid='uuid').set_deadline(0.3).get()
+        # Without deadline urllib3 makes 5 read retries
+        assert monotonic() - start < 1
+
+    def test_retry_after_deadline(self, retry_later_server_url):
+        """Test retry wait longer than remaining time is not slept."""
+        api = Api.with_sid(retry_later_server_url, 'sid')
+        start = monotonic()
+        with pytest.raises(DeadlineExceeded):
+            api.Study.get(uuid='uuid').set_deadline(2).get()
+        assert monotonic() - start < 1
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.exceptions.service import NotFound
+from ambra_sdk.json_backend import JsonBackend, get_json_backend
+
+API_URL = 'http://127.0.0.1'
+
+
+class CountingBackend:
+    """Stdlib json backend with decode counter."""
+
+    def __init__(self):
+        """Init."""
+        self.decoded = []
+        self.backend = JsonBackend(
+            name='counting',
+            loads=self.loads,
+            dumps=json.dumps,
+        )
+
+    def loads(self, body):
+        """Decode body.
+
+        :param body: json body
+        :return: decoded json
+        """
+        self.decoded.append(body)
+        return json.loads(body)
+
+
+class TestJsonBackend:
+    """Test JSON backends."""
+
+    @pytest.fixture
+    def api(self, requests_mock):
+        """Api with mocked endpoints."""
+        requests_mock.post(
+            '{api_url}/study/get'.format(api_url=API_URL),
+            json={'status': 'OK', 'uuid': 'uuid'},
+        )
+        requests_mock.post(
+            '{api_url}/study/list'.format(api_url=API_URL),
+            json={
+                'status': 'OK',
+                'page': {'rows': 100, 'more': 0},
+                'studies': [{'uuid': 'uuid1'}, {'uuid': 'uuid2'}],
+            },
+        )
+        requests_mock.post(
+            '{api_url}/user/get'.format(api_url=API_URL),
+            status_code=412,
+            json={'status': 'ERROR', 'error_type': 'NOT_FOUND'},
+        )
+        requests_mock.get(
+            'https://engine/api/v3/storage/study/ns/uid/schema',
+            json={'study_uid': 'uid'},
+        )
+        return Api.with_sid(API_URL, 'sid')
+
+    @pytest.mark.parametrize('backend_name', ['json', 'orjson', 'ujson'])
+    def test_backends(self, backend_name):
+        """Test backends decode and encode json."""
+        try:
+            backend = get_json_backend(backend_name)
+        except ImportError:
+            pytest.skip('{name} is not installed'.format(name=backend_name))
+        assert backend.name == backend_name
+        decoded = backend.loads(b'{"a": [1, 2.5, "\\u0444", null]}')
+        assert decoded == {'a': [1, 2.5, 'ф', None]}
+        assert isinstance(backend.dumps(decoded), str)
+        assert json.loads(backend.dumps(decoded)) == decoded
+
+    def test_default_backend(self):
+        """Test default backend is the fastest installed."""
+        backend_name = get_json_backend().name
+        assert backend_name in {'orjson', 'ujson', 'json'}
+        assert Api.with_sid(API_URL, 'sid').json_backend.name == backend_name
+
+    def test_unknown_backend(self):
+        """Test unknown backend."""
+        with pytest.raises(ValueError):
+            get_json_backend('unknown')
+
+    def test_api_backend(self, api):
+        """Test service and storage responses are decoded by api backend."""
+        counting = CountingBackend()
+        api.json_backend = counting.backend
+        assert api.Study.get(uuid='uuid').get().uuid == 'uuid'
+        assert [
+            study.uuid for study in api.Study.list().all()
+        ] == ['uuid1', 'uuid2']
+        with pytest.raises(NotFound):
+            api.User.get().get()
+        schema = api.Storage.Study.schema(
+            engine_fqdn='engine',
+            namespace='ns',
+            study_uid='uid',
+        )
+        assert schema.study_uid == 'uid'
+        assert len(counting.decoded) == 4
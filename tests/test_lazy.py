@@ -0,0 +1,105 @@
+import json
+import subprocess  # NOQA:S404
+import sys
+
+from ambra_sdk.api import Api
+from ambra_sdk.async_api import AsyncApi, AsyncNamespace, AsyncSession
+from ambra_sdk.service.entrypoints.study import Study
+from ambra_sdk.storage.storage import AsyncStorage, Storage
+
+# Import time of ambra_sdk.api (seconds)
+IMPORT_TIME_BUDGET = 1.5
+
+IMPORT_SCRIPT = """
+import json
+import sys
+from time import perf_counter
+
+start = perf_counter()
+from ambra_sdk.api import Api
+import_time = perf_counter() - start
+
+def generated_modules():
+    return sorted(
+        module for module in sys.modules
+        if module.startswith('ambra_sdk.service.entrypoints.generated.')
+    )
+
+after_import = generated_modules()
+api = Api.with_sid('http://127.0.0.1', 'sid')
+after_init = generated_modules()
+api.Study
+after_study = generated_modules()
+print(json.dumps({
+    'import_time': import_time,
+    'heavy_modules': [
+        module for module in ('pydicom', 'aiohttp', 'ambra_sdk.service.ws')
+        if module in sys.modules
+    ],
+    'after_import': after_import,
+    'after_init': after_init,
+    'after_study': after_study,
+}))
+"""
+
+
+def run_import_script():
+    """Import api in new interpreter.
+
+    :return: import stats
+    """
+    output = subprocess.check_output(  # NOQA:S603
+        [sys.executable, '-c', IMPORT_SCRIPT],
+    )
+    return json.loads(output)
+
+
+class TestLazyNamespaces:
+    """Test lazy api namespaces."""
+
+    def test_import(self):
+        """Test generated modules are imported on namespace access."""
+        import_stats = run_import_script()
+        assert import_stats['after_import'] == []
+        assert import_stats['after_init'] == []
+        assert 'ambra_sdk.service.entrypoints.generated.study' in \
+            import_stats['after_study']
+        assert 'ambra_sdk.service.entrypoints.generated.user' not in \
+            import_stats['after_study']
+
+    def test_heavy_modules(self):
+        """Test pydicom and aiohttp are not imported with api."""
+        import_stats = run_import_script()
+        assert import_stats['heavy_modules'] == []
+
+    def test_import_time_budget(self):
+        """Test import time of api."""
+        import_stats = run_import_script()
+        assert import_stats['import_time'] < IMPORT_TIME_BUDGET
+
+    def test_namespace_is_cached(self):
+        """Test namespace is created once."""
+        api = Api.with_sid('http://127.0.0.1', 'sid')
+        assert 'Study' not in api.__dict__
+        study = api.Study
+        assert isinstance(study, Study)
+        assert api.Study is study
+        assert api.Study._api is api
+        assert isinstance(api.Storage, Storage)
+        assert api.Storage is api.Storage
+        assert Api.Study is not None
+
+    def test_namespaces_are_not_shared(self):
+        """Test every api has own namespaces."""
+        api1 = Api.with_sid('http://127.0.0.1', 'sid1')
+        api2 = Api.with_sid('http://127.0.0.1', 'sid2')
+        assert api1.Study is not api2.Study
+        assert api1.Storage.health is not api2.Storage.health
+
+    def test_async_namespaces(self):
+        """Test async api namespaces."""
+        api = AsyncApi.with_sid('http://127.0.0.1', 'sid')
+        assert isinstance(api.Study, AsyncNamespace)
+        assert isinstance(api.Session, AsyncSession)
+        assert isinstance(api.Storage, AsyncStorage)
+        assert api.Study is api.Study
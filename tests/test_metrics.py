@@ -0,0 +1,103 @@
+import pytest
+import requests
+
+from ambra_sdk.api import Api
+from ambra_sdk.metrics import Histogram
+
+API_URL = 'http://127.0.0.1'
+
+
+class TestMetrics:
+    """Test api metrics and hooks."""
+
+    @pytest.fixture
+    def api(self, requests_mock):
+        """Api with mocked endpoints."""
+        requests_mock.post(
+            '{api_url}/study/get'.format(api_url=API_URL),
+            json={'status': 'OK', 'uuid': 'uuid'},
+        )
+        requests_mock.post(
+            '{api_url}/study/delete'.format(api_url=API_URL),
+            exc=requests.exceptions.ConnectionError,
+        )
+        requests_mock.post(
+            '{api_url}/session/login'.format(api_url=API_URL),
+            json={'status': 'OK', 'sid': 'sid'},
+        )
+        requests_mock.get(
+            'https://engine/api/v3/storage/study/ns/uid/schema',
+            json={'study_uid': 'uid'},
+        )
+        return Api.with_creds(API_URL, 'user', 'pass')
+
+    def test_histogram(self):
+        """Test histogram."""
+        histogram = Histogram(buckets=(1, 2, 3))
+        assert histogram.quantile(0.5) is None
+        for histogram_value in (0.5, 0.5, 1.5, 2.5, 10):
+            histogram.observe(histogram_value)
+        assert histogram.quantile(0.5) == 2
+        assert histogram.quantile(0.99) == 10
+        histogram_snapshot = histogram.snapshot()
+        assert histogram_snapshot['count'] == 5
+        assert histogram_snapshot['min'] == 0.5
+        assert histogram_snapshot['buckets'][float('inf')] == 1
+
+    def test_service_metrics(self, api):
+        """Test service endpoint metrics."""
+        api.Study.get(uuid='uuid').get()
+        metrics_snapshot = api.metrics.snapshot()
+        assert metrics_snapshot['sid_refreshes'] == 1
+        study_get = metrics_snapshot['endpoints']['/study/get']
+        assert study_get['requests'] == 1
+        assert study_get['errors'] == 0
+        assert study_get['request_bytes'] > 0
+        assert study_get['response_bytes'] > 0
+        assert study_get['latency']['count'] == 1
+        assert study_get['json_decode']['count'] == 1
+        assert study_get['box']['count'] == 1
+
+    def test_storage_metrics(self, api):
+        """Test storage metrics by url template."""
+        api.Storage.Study.schema(
+            engine_fqdn='engine',
+            namespace='ns',
+            study_uid='uid',
+        )
+        endpoints = api.metrics.snapshot()['endpoints']
+        schema = endpoints['/study/{namespace}/{study_uid}/schema']
+        assert schema['requests'] == 1
+        assert schema['box']['count'] == 1
+
+    def test_hooks(self, api):
+        """Test request hooks."""
+        events = []
+        api.metrics.add_hook('on_request', events.append)
+        api.metrics.add_hook('on_response', events.append)
+        api.metrics.add_hook('on_error', events.append)
+        api.metrics.add_hook('on_response', lambda event: 1 / 0)
+
+        api.Study.get(uuid='uuid').get()
+        with pytest.raises(requests.exceptions.ConnectionError):
+            api.Study.delete(uuid='uuid').get()
+
+        assert [
+            (event.url_template, event.response is not None)
+            for event in events
+        ] == [
+            ('/session/login', False),
+            ('/session/login', True),
+            ('/study/get', False),
+            ('/study/get', True),
+            ('/study/delete', False),
+            ('/study/delete', False),
+        ]
+        assert isinstance(
+            events[-1].exception,
+            requests.exceptions.ConnectionError,
+        )
+        assert api.metrics.snapshot()['endpoints']['/study/delete']['errors'] == 1
+
+        with pytest.raises(ValueError):
+            api.metrics.add_hook('on_something', events.append)
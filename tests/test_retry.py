@@ -0,0 +1,117 @@
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pytest
+
+from ambra_sdk.api import Api
+from ambra_sdk.retry import RetryBudget, RetryPolicy
+from ambra_sdk.service.coalescing import is_read_url
+
+
+class UnavailableHandler(BaseHTTPRequestHandler):
+    """Handler which always responds 503."""
+
+    hits: Counter = Counter()
+
+    def do_POST(self):  # NOQA:N802
+        """Handle post."""
+        self.hits[self.path] += 1
+        self.send_response(503)
+        self.send_header('Retry-After', '0')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        """Be quiet."""
+
+
+class TestRetryPolicy:
+    """Test retry policy."""
+
+    @pytest.fixture
+    def api(self):
+        """Api of unavailable server."""
+        UnavailableHandler.hits.clear()
+        server = HTTPServer(('127.0.0.1', 0), UnavailableHandler)
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        api = Api.with_sid(
+            'http://127.0.0.1:{port}'.format(port=server.server_port),
+            'sid',
+        )
+        api.service_retry_params['backoff_factor'] = 0
+        yield api
+        server.shutdown()
+        server.server_close()
+
+    def test_idempotent(self):
+        """Test idempotent requests."""
+        policy = RetryPolicy()
+        assert policy.is_idempotent('POST', 'http://host/api/v3/study/get')
+        assert policy.is_idempotent('POST', 'http://host/api/v3/study/list')
+        assert policy.is_idempotent('GET', 'http://host/storage/study/x')
+        assert not policy.is_idempotent('POST', 'http://host/api/v3/study/add')
+        assert not policy.is_idempotent('POST', 'http://host/storage/image')
+        assert policy.is_idempotent(
+            'POST', 'http://host/api/v3/study/status/locks',
+        )
+
+    @pytest.mark.parametrize('url', [
+        '/order/sps/status',
+        '/namespace/settings',
+        '/destination/search',
+    ])
+    def test_read_looking_mutations(self, url):
+        """Test mutations with read looking actions are not idempotent."""
+        policy = RetryPolicy()
+        full_url = 'http://host/api/v3{url}'.format(url=url)
+        assert not policy.is_idempotent('POST', full_url)
+        assert not is_read_url(url)
+
+    def test_backoff(self):
+        """Test full jitter backoff."""
+        policy = RetryPolicy(backoff_factor=1)
+        assert policy.backoff_time(0) == 0
+        backoffs = [policy.backoff_time(3) for _ in range(100)]
+        assert all(0 <= backoff <= 8 for backoff in backoffs)
+        assert len(set(backoffs)) > 1
+        assert policy.backoff_time(100) <= policy.BACKOFF_MAX
+
+    def test_budget(self):
+        """Test retry budget."""
+        budget = RetryBudget(
+            ratio=0.5,
+            min_retries_per_second=0,
+            max_balance=2,
+        )
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+        assert budget.requests == 2
+        assert budget.retries == 3
+        assert budget.rejected == 1
+
+    def test_retry_idempotent(self, api):
+        """Test retries of idempotent method."""
+        response = api.service_session.post(api.service_full_url('/study/get'))
+        assert response.status_code == 503
+        assert UnavailableHandler.hits['/study/get'] == \
+            api.service_retry_params['status'] + 1
+
+    def test_no_retry_mutation(self, api):
+        """Test mutations are not replayed."""
+        response = api.service_session.post(api.service_full_url('/study/add'))
+        assert response.status_code == 503
+        assert UnavailableHandler.hits['/study/add'] == 1
+
+    def test_retry_budget(self, api):
+        """Test retries are limited by budget."""
+        api.retry_budget = RetryBudget(min_retries_per_second=0, max_balance=1)
+        response = api.service_session.post(api.service_full_url('/study/get'))
+        assert response.status_code == 503
+        assert UnavailableHandler.hits['/study/get'] == 2
+        assert api.retry_budget.rejected == 1